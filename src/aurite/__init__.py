@@ -4,23 +4,49 @@ Aurite Framework
 
 This is the main package for the Aurite framework.
 It exposes the core classes and functions for users to build and run AI agents.
+
+The exports below are loaded on first access, so `import aurite` (and every
+CLI command, which imports a submodule of it) does not pay for LiteLLM,
+Langfuse, SQLAlchemy and the MCP client stack until they are actually used.
 """
 
-# Core classes for users
-from .aurite import Aurite
-from .execution.aurite_engine import AuriteEngine
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# Import the models module as 'types' for convenient access
-from .lib import models as types
+if TYPE_CHECKING:
+    from .aurite import Aurite
+    from .execution.aurite_engine import AuriteEngine
+    from .lib import models as types
+    from .lib.models import *  # noqa: F403
 
-# Import all models for backward compatibility
-from .lib.models import *
+_LAZY_EXPORTS = {
+    # Core classes for users
+    "Aurite": (".aurite", "Aurite"),
+    "AuriteEngine": (".execution.aurite_engine", "AuriteEngine"),
+    # The models module as 'types' for convenient access
+    "types": (".lib.models", None),
+}
 
 __all__ = [
     "Aurite",
     "AuriteEngine",
     "types",
-    # All model classes are automatically available via the import above
+    # All model classes are also available as attributes, see __getattr__
 ]
 
 __version__ = "0.2.0"  # Keep in sync with pyproject.toml
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        module_name, attribute = _LAZY_EXPORTS[name]
+        module = importlib.import_module(module_name, __name__)
+        value = getattr(module, attribute) if attribute else module
+    else:
+        # All models, for backward compatibility
+        models = importlib.import_module(".lib.models", __name__)
+        if name.startswith("_") or not hasattr(models, name):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = getattr(models, name)
+    globals()[name] = value
+    return value
@@ -19,7 +19,6 @@ if sys.version_info < (3, 11):
 else:
     pass
 
-from langfuse import Langfuse
 from termcolor import colored
 
 from .execution.aurite_engine import AuriteEngine
@@ -66,6 +65,8 @@ class AuriteKernel:
         self.host = MCPHost()
         self.storage_manager: Optional["StorageManager"] = None
         if os.getenv("LANGFUSE_ENABLED", "false").lower() == "true":
+            from langfuse import Langfuse
+
             self.langfuse = Langfuse(
                 secret_key=os.getenv("LANGFUSE_SECRET_KEY"),
                 public_key=os.getenv("LANGFUSE_PUBLIC_KEY"),
@@ -253,13 +254,39 @@ class Aurite:
                 await self.kernel.host.unregister_client(server_name)
         return result
 
-    async def run_linear_workflow(self, workflow_name: str, initial_input: Any) -> LinearWorkflowExecutionResult:
+    async def run_linear_workflow(
+        self,
+        workflow_name: str,
+        initial_input: Any,
+        session_id: Optional[str] = None,
+        resume: bool = False,
+        resumable: bool = False,
+    ) -> LinearWorkflowExecutionResult:
         await self._ensure_initialized()
-        return await self.kernel.execution.run_linear_workflow(workflow_name=workflow_name, initial_input=initial_input)
+        return await self.kernel.execution.run_linear_workflow(
+            workflow_name=workflow_name,
+            initial_input=initial_input,
+            session_id=session_id,
+            resume=resume,
+            resumable=resumable,
+        )
 
-    async def run_graph_workflow(self, workflow_name: str, initial_input: Any) -> GraphWorkflowExecutionResult:
+    async def run_graph_workflow(
+        self,
+        workflow_name: str,
+        initial_input: Any,
+        session_id: Optional[str] = None,
+        resume: bool = False,
+        resumable: bool = False,
+    ) -> GraphWorkflowExecutionResult:
         await self._ensure_initialized()
-        return await self.kernel.execution.run_graph_workflow(workflow_name=workflow_name, initial_input=initial_input)
+        return await self.kernel.execution.run_graph_workflow(
+            workflow_name=workflow_name,
+            initial_input=initial_input,
+            session_id=session_id,
+            resume=resume,
+            resumable=resumable,
+        )
 
     async def run_custom_workflow(
         self, workflow_name: str, initial_input: Any, session_id: Optional[str] = None
@@ -290,6 +317,30 @@ class Aurite:
         ):
             yield event
 
+    async def stream_linear_workflow(
+        self, workflow_name: str, initial_input: Any, session_id: Optional[str] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Runs a linear workflow and streams its step and agent events as they happen.
+        """
+        await self._ensure_initialized()
+        async for event in self.kernel.execution.stream_linear_workflow(
+            workflow_name=workflow_name, initial_input=initial_input, session_id=session_id
+        ):
+            yield event
+
+    async def stream_graph_workflow(
+        self, workflow_name: str, initial_input: Any, session_id: Optional[str] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Runs a graph workflow and streams its node and agent events as they happen.
+        """
+        await self._ensure_initialized()
+        async for event in self.kernel.execution.stream_graph_workflow(
+            workflow_name=workflow_name, initial_input=initial_input, session_id=session_id
+        ):
+            yield event
+
     # Allow the wrapper to be used as a context manager for users who
     # prefer explicit resource management over relying on the __del__ finalizer.
     async def __aenter__(self):
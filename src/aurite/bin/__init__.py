@@ -1,4 +1,10 @@
-from .dependencies import get_api_key, get_aurite, get_config_manager, get_execution_facade, get_host
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_imports import lazy_exports
+
+# The API dependencies load the whole framework, so they are only imported when used
+if TYPE_CHECKING:
+    from .dependencies import get_api_key, get_aurite, get_config_manager, get_execution_facade, get_host
 
 __all__ = [
     "get_api_key",
@@ -7,3 +13,5 @@ __all__ = [
     "get_config_manager",
     "get_execution_facade",
 ]
+
+__getattr__ = lazy_exports(__name__, dict.fromkeys(__all__, ".dependencies"))
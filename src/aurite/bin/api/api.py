@@ -29,6 +29,7 @@ from ...utils.errors import (
 # Import shared dependencies (relative to parent directory - src/bin)
 from ..dependencies import (
     get_server_config,  # Re-import ServerConfig if needed locally, or remove if only used in dependencies.py
+    shutdown_security_engine,
 )
 from ..studio.static_server import setup_studio_routes_with_static
 
@@ -68,6 +69,7 @@ async def lifespan(app: FastAPI):
 
     yield  # Server runs here
 
+    await shutdown_security_engine()
     logger.info("Shutting down Aurite...")
     # The __aexit__ will handle the graceful shutdown.
     await aurite_instance.__aexit__(None, None, None)
@@ -476,6 +476,18 @@ async def refresh_configs(
         ) from e
 
 
+@router.get("/context", response_model=Dict[str, Optional[str]])
+async def get_context(
+    api_key: str = Security(get_api_key),
+    config_manager: ConfigManager = Depends(get_config_manager),
+):
+    """
+    Get the root directory of the project or workspace the server runs in.
+    """
+    context_paths = config_manager.context_paths
+    return {"context_root": str(context_paths[0].parent) if context_paths else None}
+
+
 # Project Management Operations
 @router.get("/projects", response_model=List[ProjectInfo])
 async def list_projects(
@@ -20,6 +20,7 @@ from ....lib.models import (
 )
 from ....lib.storage.sessions.session_manager import SessionManager
 from ....utils.errors import ConfigurationError, MaxIterationsReachedError, WorkflowExecutionError
+from ....utils.latency import get_latency_histograms
 from ...dependencies import (
     get_api_key,
     get_config_manager,
@@ -53,6 +54,17 @@ async def get_facade_status(
     return {"status": "active"}
 
 
+@router.get("/metrics/latency")
+async def get_latency_metrics(
+    _api_key: str = Security(get_api_key),
+):
+    """
+    Get the latency distribution of each execution phase (config resolution, MCP registration,
+    LLM time-to-first-token and total, tool calls, session persistence) since the server started.
+    """
+    return get_latency_histograms()
+
+
 @router.post("/agents/{agent_name}/run")
 async def run_agent(
     agent_name: str,
@@ -74,6 +86,7 @@ async def run_agent(
             messages=request.messages,
             system_prompt=request.system_prompt,
             session_id=request.session_id,
+            include_latency=request.include_latency,
         )
         if result.status == "success":
             agent_config_dict = config_manager.get_config("agent", agent_name)
@@ -324,6 +337,8 @@ async def run_linear_workflow(
             workflow_name=workflow_name,
             initial_input=request.initial_input,
             session_id=request.session_id,
+            resume=request.resume,
+            resumable=request.resumable,
         )
         return result.model_dump()
     except ConfigurationError as e:
@@ -369,6 +384,8 @@ async def run_graph_workflow(
             workflow_name=workflow_name,
             initial_input=request.initial_input,
             session_id=request.session_id,
+            resume=request.resume,
+            resumable=request.resumable,
         )
         return result.model_dump()
     except ConfigurationError as e:
@@ -382,6 +399,72 @@ async def run_graph_workflow(
         raise HTTPException(status_code=500, detail="An unexpected error occurred during workflow execution") from e
 
 
+def _stream_workflow_response(events) -> StreamingResponse:
+    """Wraps a workflow event stream in a server-sent events response."""
+
+    async def event_generator():
+        async for event in events:
+            yield f"data: {json.dumps(event, default=str)}\n\n"
+
+    headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "Access-Control-Expose-Headers": "Content-Type",
+        "X-Accel-Buffering": "no",  # Disable nginx buffering
+    }
+    return StreamingResponse(event_generator(), media_type="text/event-stream", headers=headers)
+
+
+@router.post("/workflows/linear/{workflow_name}/stream")
+async def stream_linear_workflow(
+    workflow_name: str,
+    request: WorkflowRunRequest,
+    api_key: str = Security(get_api_key),
+    engine: AuriteEngine = Depends(get_execution_facade),
+    config_manager: ConfigManager = Depends(get_config_manager),
+):
+    """
+    Execute a linear workflow by name and stream step events and agent output as they happen.
+    """
+    if not config_manager.get_config("linear_workflow", workflow_name):
+        raise HTTPException(status_code=404, detail=f"Linear Workflow '{workflow_name}' not found.")
+
+    return _stream_workflow_response(
+        engine.stream_linear_workflow(
+            workflow_name=workflow_name,
+            initial_input=request.initial_input,
+            session_id=request.session_id,
+            resume=request.resume,
+            resumable=request.resumable,
+        )
+    )
+
+
+@router.post("/workflows/graph/{workflow_name}/stream")
+async def stream_graph_workflow(
+    workflow_name: str,
+    request: WorkflowRunRequest,
+    api_key: str = Security(get_api_key),
+    engine: AuriteEngine = Depends(get_execution_facade),
+    config_manager: ConfigManager = Depends(get_config_manager),
+):
+    """
+    Execute a graph workflow by name and stream node events and agent output as they happen.
+    """
+    if not config_manager.get_config("graph_workflow", workflow_name):
+        raise HTTPException(status_code=404, detail=f"Graph Workflow '{workflow_name}' not found.")
+
+    return _stream_workflow_response(
+        engine.stream_graph_workflow(
+            workflow_name=workflow_name,
+            initial_input=request.initial_input,
+            session_id=request.session_id,
+            resume=request.resume,
+            resumable=request.resumable,
+        )
+    )
+
+
 @router.post("/workflows/custom/{workflow_name}/run")
 async def run_custom_workflow(
     workflow_name: str,
@@ -609,11 +609,17 @@ async def comprehensive_health_check(
     try:
         if aurite.kernel.host:
             host = aurite.kernel.host
+            server_health = host.get_all_server_health()
+            unhealthy_servers = [name for name, health in server_health.items() if not health.is_healthy]
             components["mcp_host"] = {
-                "status": "healthy",
+                "status": "degraded" if unhealthy_servers else "healthy",
                 "registered_servers": len(host.registered_server_names),
                 "available_tools": len(host.tools),
+                "servers": {name: health.to_dict() for name, health in server_health.items()},
             }
+            for name in unhealthy_servers:
+                health = server_health[name]
+                issues.append(f"MCP server '{name}' is {health.status}: {health.last_error}")
         else:
             components["mcp_host"] = {
                 "status": "degraded",
@@ -5,16 +5,19 @@ This module provides API endpoints for QA testing and security assessments
 of Aurite components (agents, workflows, LLMs, etc.).
 """
 
+import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Security
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from ....execution.aurite_engine import AuriteEngine
 from ....lib.config.config_manager import ConfigManager
 from ....lib.models import EvaluationRequest
+from ....testing.qa.qa_benchmark import compare_benchmarks
 from ....testing.qa.qa_engine import QAEngine
 from ....testing.security.security_engine import SecurityEngine
 from ....testing.security.security_models import (
@@ -156,6 +159,33 @@ async def evaluate_component(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.post("/evaluate/stream")
+async def stream_evaluation(
+    request: EvaluationRequest,
+    api_key: str = Security(get_api_key),
+    qa_engine: QAEngine = Depends(get_qa_engine),
+    engine: AuriteEngine = Depends(get_execution_facade),
+):
+    """
+    Run QA evaluation and stream progress as server-sent events.
+
+    A `case_complete` event is sent as each test case finishes and a `case_retry` event when a case
+    is retried after a transient error, each with the running totals of the evaluation. The last
+    event is `evaluation_complete`, whose `data` is the same result `/evaluate` returns, or `error`.
+    """
+
+    async def event_generator():
+        async for event in qa_engine.stream_evaluation(request, engine):
+            yield f"data: {json.dumps(event, default=str)}\n\n"
+
+    headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "X-Accel-Buffering": "no",  # Disable nginx buffering
+    }
+    return StreamingResponse(event_generator(), media_type="text/event-stream", headers=headers)
+
+
 @router.post("/evaluate/{evaluation_config_id}")
 async def evaluate_component_by_config(
     evaluation_config_id: str,
@@ -472,3 +502,34 @@ async def list_qa_test_results(
     except Exception as e:
         logger.error(f"Failed to list QA test results: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.get("/qa/benchmarks/compare")
+async def compare_benchmark_results(
+    result_ids: List[str] = Query(..., description="IDs of benchmark QA results to compare; the first is the baseline"),
+    api_key: str = Security(get_api_key),
+    engine: AuriteEngine = Depends(get_execution_facade),
+):
+    """
+    Compare the benchmark statistics of stored QA test results.
+
+    Returns one row per result with its latency percentiles, time to first token, mean tokens and
+    tool calls and throughput, and the change of each metric from the first result in percent.
+    """
+    try:
+        if not hasattr(engine, "_session_manager") or not engine._session_manager:
+            raise HTTPException(status_code=500, detail="Session manager not available")
+
+        results = []
+        for result_id in result_ids:
+            result_data = engine._session_manager.get_qa_test_result(result_id)
+            if not result_data:
+                raise HTTPException(status_code=404, detail=f"QA test result '{result_id}' not found")
+            results.append(result_data)
+
+        return compare_benchmarks(results)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to compare benchmark results: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e)) from e
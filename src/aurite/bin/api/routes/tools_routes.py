@@ -55,6 +55,7 @@ async def list_registered_servers(api_key: str = Security(get_api_key), host: MC
     - Transport type
     - Number of tools provided
     - Registration time
+    - Health (last ping, last error, reconnect count)
     """
     servers = []
     for server_name in host.registered_server_names:
@@ -72,13 +73,15 @@ async def list_registered_servers(api_key: str = Security(get_api_key), host: MC
             elif hasattr(session, "_http_client"):
                 transport_type = "http_stream"
 
+            health = host.get_server_health(server_name)
             servers.append(
                 ServerRuntimeInfo(
                     name=server_name,
-                    status="active",
+                    status="active" if health is None or health.is_healthy else health.status,
                     transport_type=transport_type,
                     tools_count=tools_count,
                     registration_time=_server_registration_times.get(server_name, datetime.now()),
+                    health=health.to_dict() if health else None,
                 )
             )
 
@@ -95,6 +98,7 @@ async def get_server_status(server_name: str, api_key: str = Security(get_api_ke
     - Transport type
     - List of tool names provided by this server
     - Session status
+    - Health (last ping, last error, reconnect count)
     """
     is_registered = server_name in host.registered_server_names
 
@@ -126,14 +130,20 @@ async def get_server_status(server_name: str, api_key: str = Security(get_api_ke
         elif hasattr(session, "_http_client"):
             transport_type = "http_stream"
 
+    health = host.get_server_health(server_name)
+    status = "active" if session_active else "inactive"
+    if session_active and health and not health.is_healthy:
+        status = health.status
+
     return ServerDetailedStatus(
         name=server_name,
         registered=True,
-        status="active" if session_active else "inactive",
+        status=status,
         transport_type=transport_type,
         tools=server_tools,
         registration_time=_server_registration_times.get(server_name),
         session_active=session_active,
+        health=health.to_dict() if health else None,
     )
 
 
@@ -1,6 +1,7 @@
 import asyncio
 import os
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
 
 import typer
 from dotenv import load_dotenv
@@ -12,18 +13,9 @@ except ImportError:
     # Python < 3.8
     from importlib_metadata import version
 
-# Relative imports from within the bin directory
-from ...lib.config import ConfigManager
-from ...lib.storage import StorageManager
-from ...utils.cli.fast_loader import list_component_names
-from ..studio import start_studio
-from ..tui.apps.edit import AuriteEditTUI
+# Relative imports from within the bin directory. Commands import their modules when they
+# run, so `aurite --help`, shell completion and light commands skip the framework imports.
 from .commands.docker import docker_command
-from .commands.init import init_project, init_workspace, interactive_init
-from .commands.list import list_all, list_components_by_type, list_index, list_workflows
-from .commands.migrate import migrate_database, migrate_from_env
-from .commands.run import run_component
-from .commands.show import show_components
 
 console = Console()
 logger = console.print
@@ -40,6 +32,26 @@ def version_callback(value: bool):
         raise typer.Exit()
 
 
+def profile_import_callback(value: bool):
+    """Callback function to display the import-time startup report."""
+    if value:
+        from rich.table import Table
+
+        from ...utils.cli.import_profile import STARTUP_MODULES, profile_import
+
+        table = Table(title="Import Time (cold start)")
+        table.add_column("Module", style="cyan")
+        table.add_column("Wall time", justify="right")
+        table.add_column("Import time", justify="right")
+        table.add_column("Heaviest packages")
+        for module in STARTUP_MODULES:
+            profile = profile_import(module)
+            heaviest = profile.error or ", ".join(f"{name} {seconds:.2f}s" for name, seconds in profile.packages[:5])
+            table.add_row(module, f"{profile.wall_time:.2f}s", f"{profile.import_time:.2f}s", heaviest)
+        console.print(table)
+        raise typer.Exit()
+
+
 app = typer.Typer(
     name="aurite",
     help="A framework for building, testing, and running AI agents.",
@@ -53,6 +65,13 @@ def main(
     version: Optional[bool] = typer.Option(
         None, "--version", "-v", callback=version_callback, is_eager=True, help="Show version and exit."
     ),
+    profile_import: Optional[bool] = typer.Option(
+        None,
+        "--profile-import",
+        callback=profile_import_callback,
+        is_eager=True,
+        help="Show how long Aurite's entry points take to import and exit.",
+    ),
 ):
     """A framework for building, testing, and running AI agents."""
     # Load environment variables from .env file in current working directory
@@ -74,6 +93,8 @@ def list_main(ctx: typer.Context):
     Display the component index if no subcommand is specified.
     """
     if ctx.invoked_subcommand is None:
+        from .commands.list import list_index
+
         list_index()
 
 
@@ -89,6 +110,8 @@ def init(
         logger("[bold red]Error:[/bold red] Cannot initialize a project and a workspace at the same time.")
         raise typer.Exit(code=1)
 
+    from .commands.init import init_project, init_workspace, interactive_init
+
     if project:
         init_project(name)
     elif workspace:
@@ -122,6 +145,7 @@ def studio(
     providing a unified development experience with automatic dependency
     management and graceful shutdown handling.
     """
+    from ..studio import start_studio
 
     async def main_studio():
         success = await start_studio(rebuild_fresh=rebuild_fresh)
@@ -131,6 +155,60 @@ def studio(
     asyncio.run(main_studio())
 
 
+@app.command()
+def loadtest(
+    target: List[str] = typer.Option(
+        ...,
+        "--target",
+        "-t",
+        help="What to call, as <kind>:<name>: agent, agent_stream, linear, linear_stream, graph, graph_stream, "
+        'custom or tool (with JSON arguments after "=", e.g. \'tool:weather_lookup={"location": "London"}\'). '
+        "Repeat to mix targets.",
+    ),
+    url: Optional[str] = typer.Option(
+        None, "--url", help="API server URL. Defaults to AURITE_API_URL or localhost:$PORT."
+    ),
+    concurrency: int = typer.Option(10, "--concurrency", "-c", min=1, help="Number of concurrent virtual users."),
+    duration: float = typer.Option(30.0, "--duration", "-d", min=0, help="Test duration in seconds."),
+    ramp_up: float = typer.Option(0.0, "--ramp-up", min=0, help="Seconds over which the users start."),
+    message: str = typer.Option(
+        "What is the weather in London?", "--message", "-m", help="Input sent to agents and workflows."
+    ),
+    register_server: List[str] = typer.Option(
+        [], "--register-server", help="MCP server to register before the test, for tool targets."
+    ),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write the JSON report to this file."),
+    max_error_rate: Optional[float] = typer.Option(
+        None, "--max-error-rate", help="Exit with an error if the error rate (0-1) is higher."
+    ),
+    max_p95_ms: Optional[float] = typer.Option(
+        None, "--max-p95-ms", help="Exit with an error if the p95 latency in milliseconds is higher."
+    ),
+):
+    """
+    Load-tests a running Aurite API server and reports throughput, latency percentiles, error rates
+    and event-loop lag.
+    """
+    from .commands.loadtest import run_loadtest
+
+    passed = asyncio.run(
+        run_loadtest(
+            target,
+            url,
+            concurrency,
+            duration,
+            ramp_up,
+            message,
+            register_server,
+            output,
+            max_error_rate,
+            max_p95_ms,
+        )
+    )
+    if not passed:
+        raise typer.Exit(code=1)
+
+
 # Register the docker command from the imported module
 app.command("docker")(docker_command)
 
@@ -140,6 +218,8 @@ def edit(component_name: Optional[str] = typer.Argument(None, help="The name of
     """
     Starts the Aurite configuration editor TUI.
     """
+    from ..tui.apps.edit import AuriteEditTUI
+
     app = AuriteEditTUI(component_name=component_name)
     app.run()
 
@@ -151,6 +231,8 @@ def show(
     short: bool = typer.Option(False, "--short", "-s", help="Display a short summary."),
 ):
     """Displays the configuration for a component or all components of a type."""
+    from .commands.show import show_components
+
     show_components(name, full=full, short=short)
 
 
@@ -171,6 +253,8 @@ def migrate(
         aurite migrate --from-env          # Migrate from current DB to opposite type
         aurite migrate --source-type sqlite --target-type postgresql
     """
+    from .commands.migrate import migrate_database, migrate_from_env
+
     if from_env:
         migrate_from_env()
     else:
@@ -190,6 +274,9 @@ def export():
     This command reads from the local config files and upserts them into the DB.
     """
     logger("[bold green]Starting configuration export to database...[/bold green]")
+    from ...lib.config import ConfigManager
+    from ...lib.storage import StorageManager
+
     try:
         # 1. First, ensure database tables exist
         logger("Initializing database...")
@@ -236,48 +323,64 @@ def export():
 @list_app.command("all")
 def list_all_cmd():
     """Lists all available component configurations, grouped by type."""
+    from .commands.list import list_all
+
     list_all()
 
 
 @list_app.command("agents")
 def list_agents_cmd():
     """Lists all available agent configurations."""
+    from .commands.list import list_components_by_type
+
     list_components_by_type("agent")
 
 
 @list_app.command("llms")
 def list_llms_cmd():
     """Lists all available LLM configurations."""
+    from .commands.list import list_components_by_type
+
     list_components_by_type("llm")
 
 
 @list_app.command("mcp_servers")
 def list_mcp_servers_cmd():
     """Lists all available MCP server configurations."""
+    from .commands.list import list_components_by_type
+
     list_components_by_type("mcp_server")
 
 
 @list_app.command("linear_workflows")
 def list_linear_workflows_cmd():
     """Lists all available linear workflow configurations."""
+    from .commands.list import list_components_by_type
+
     list_components_by_type("linear_workflow")
 
 
 @list_app.command("custom_workflows")
 def list_custom_workflows_cmd():
     """Lists all available custom workflow configurations."""
+    from .commands.list import list_components_by_type
+
     list_components_by_type("custom_workflow")
 
 
 @list_app.command("workflows")
 def list_workflows_cmd():
     """Lists all available workflow configurations."""
+    from .commands.list import list_workflows
+
     list_workflows()
 
 
 @list_app.command("index")
 def list_index_cmd():
     """Prints the entire component index as a formatted JSON."""
+    from .commands.list import list_index
+
     list_index()
 
 
@@ -296,6 +399,8 @@ def complete_runnable_component_name(incomplete: str):
     """Provides completion for runnable component names."""
     # This is a simplified example. A real implementation would use the
     # config manager to get a list of all runnable components.
+    from ...utils.cli.fast_loader import list_component_names
+
     all_names = []
     for comp_type in ["agent", "linear_workflow", "custom_workflow"]:
         all_names.extend(list_component_names(comp_type))
@@ -329,6 +434,8 @@ def run(
             console.print("[bold yellow]Interactive agent selection is not yet implemented.[/bold yellow]")
             console.print("Please provide an agent name to run.")
             return
+        from .commands.run import run_component
+
         await run_component(name, user_message, system_prompt, session_id, short, debug)
 
     asyncio.run(main_run())
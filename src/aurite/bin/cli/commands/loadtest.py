@@ -0,0 +1,104 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from ....utils.cli.load_test import LoadTarget, LoadTestConfig, run_load_test
+
+console = Console()
+logger = console.print
+
+
+def _ms(distribution: Optional[Dict[str, float]], key: str) -> str:
+    return f"{distribution[key]:.0f}" if distribution else "-"
+
+
+def _print_report(report: Dict[str, Any]):
+    table = Table(title=f"Load Test ({report['settings']['concurrency']} users, {report['elapsed_seconds']:.0f}s)")
+    table.add_column("Target", style="cyan")
+    table.add_column("Requests", justify="right")
+    table.add_column("Errors", justify="right")
+    table.add_column("Req/s", justify="right")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("p99 ms", justify="right")
+    table.add_column("First event p50 ms", justify="right")
+
+    rows = list(report["targets"].items()) + [("overall", report["overall"])]
+    for label, stats in rows:
+        table.add_row(
+            label,
+            str(stats["requests"]),
+            f"{stats['errors']} ({stats['error_rate']:.1%})",
+            f"{stats['throughput_per_second'] or 0:.2f}",
+            _ms(stats["latency_ms"], "p50"),
+            _ms(stats["latency_ms"], "p95"),
+            _ms(stats["latency_ms"], "p99"),
+            _ms(stats["first_event_ms"], "p50"),
+        )
+    console.print(table)
+
+    lag = report["event_loop_lag_ms"]
+    logger(
+        f"Event-loop lag: generator p99 {_ms(lag['generator'], 'p99')} ms, "
+        f"server /health p50 {_ms(lag['server_health'], 'p50')} ms / p99 {_ms(lag['server_health'], 'p99')} ms"
+    )
+    if report["overall"]["errors_by_reason"]:
+        logger(f"[bold yellow]Errors:[/bold yellow] {report['overall']['errors_by_reason']}")
+
+
+async def run_loadtest(
+    targets: List[str],
+    url: Optional[str],
+    concurrency: int,
+    duration: float,
+    ramp_up: float,
+    message: str,
+    register_servers: List[str],
+    output: Optional[Path],
+    max_error_rate: Optional[float],
+    max_p95_ms: Optional[float],
+) -> bool:
+    """
+    Runs a load test against a running API server and prints its report. Returns False if the
+    error rate or p95 latency exceeds the given limits.
+    """
+    try:
+        config = LoadTestConfig(
+            targets=[LoadTarget.parse(spec) for spec in targets],
+            base_url=url or os.getenv("AURITE_API_URL") or f"http://localhost:{os.getenv('PORT', '8000')}",
+            api_key=os.getenv("API_KEY"),
+            concurrency=concurrency,
+            duration=duration,
+            ramp_up=ramp_up,
+            message=message,
+            register_servers=register_servers,
+        )
+    except ValueError as e:
+        logger(f"[bold red]Error:[/bold red] {e}")
+        return False
+
+    logger(
+        f"Running {concurrency} users against {config.base_url} for {duration:.0f}s "
+        f"(ramp-up {ramp_up:.0f}s): {', '.join(t.label for t in config.targets)}"
+    )
+    report = await run_load_test(config)
+    _print_report(report)
+
+    if output:
+        output.write_text(json.dumps(report, indent=2))
+        logger(f"Report written to {output}")
+
+    passed = True
+    overall = report["overall"]
+    if max_error_rate is not None and overall["error_rate"] > max_error_rate:
+        logger(f"[bold red]Error rate {overall['error_rate']:.1%} exceeds {max_error_rate:.1%}[/bold red]")
+        passed = False
+    p95 = overall["latency_ms"]["p95"] if overall["latency_ms"] else None
+    if max_p95_ms is not None and (p95 is None or p95 > max_p95_ms):
+        logger(f"[bold red]p95 latency {p95} ms exceeds {max_p95_ms:.0f} ms[/bold red]")
+        passed = False
+    return passed
@@ -7,7 +7,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
-from ....aurite import Aurite
+from ....utils.cli.api_client import ApiClient
 from ....utils.cli.ui_presenter import RunPresenter
 from ....utils.errors import AuriteError
 
@@ -23,6 +23,9 @@ _aurite_instance = None
 async def get_aurite_instance():
     global _aurite_instance
     if _aurite_instance is None:
+        # Imported here so runs through a running API server skip loading the framework
+        from ....aurite import Aurite
+
         _aurite_instance = Aurite(start_dir=Path.cwd())
         await _aurite_instance._ensure_initialized()
     return _aurite_instance
@@ -38,6 +41,8 @@ async def run_component(
 ):
     """
     Finds a component by name, infers its type, and executes it with rich UI rendering.
+    Single-shot runs go through a local `aurite api` server for the same project when one
+    is running, and build an in-process Aurite kernel otherwise.
     """
     os.environ["AURITE_CONFIG_FORCE_REFRESH"] = "false"
     output_mode = "default"
@@ -48,23 +53,32 @@ async def run_component(
 
     aurite = None
     try:
-        aurite = await get_aurite_instance()
-
-        component_index = aurite.kernel.config_manager.get_component_index()
-        found_components = [item for item in component_index if item["name"] == name]
-
-        if not found_components:
-            logger(f"Component '{name}' not found.")
-            return
-
-        component_to_run = next(
-            (
-                comp
-                for comp in found_components
-                if comp["component_type"] in ["agent", "linear_workflow", "custom_workflow"]
-            ),
-            found_components[0],
-        )
+        client = ApiClient.connect(Path.cwd()) if user_message else None
+        if client:
+            runner = client
+            component_to_run = await client.find_component(name)
+            if not component_to_run:
+                logger(f"Component '{name}' not found.")
+                return
+        else:
+            aurite = await get_aurite_instance()
+            runner = aurite
+
+            component_index = aurite.kernel.config_manager.get_component_index()
+            found_components = [item for item in component_index if item["name"] == name]
+
+            if not found_components:
+                logger(f"Component '{name}' not found.")
+                return
+
+            component_to_run = next(
+                (
+                    comp
+                    for comp in found_components
+                    if comp["component_type"] in ["agent", "linear_workflow", "custom_workflow"]
+                ),
+                found_components[0],
+            )
 
         component_type = component_to_run["component_type"]
 
@@ -97,7 +111,7 @@ async def run_component(
             else:
                 # Single-shot mode
                 presenter = RunPresenter(mode=output_mode)
-                stream = aurite.stream_agent(
+                stream = runner.stream_agent(
                     agent_name=name,
                     user_message=user_message,
                     system_prompt=system_prompt,
@@ -112,22 +126,31 @@ async def run_component(
                 return
 
             async def workflow_streamer():
+                if component_type == "linear_workflow":
+                    async for event in runner.stream_linear_workflow(
+                        workflow_name=name, initial_input=user_message, session_id=session_id
+                    ):
+                        yield event
+                    return
+                if component_type == "graph_workflow":
+                    async for event in runner.stream_graph_workflow(
+                        workflow_name=name, initial_input=user_message, session_id=session_id
+                    ):
+                        yield event
+                    return
+
+                # Custom workflows run as a single opaque step
                 yield {"type": "workflow_step_start", "data": {"name": name}}
                 try:
-                    if component_type == "linear_workflow":
-                        result = await aurite.run_linear_workflow(workflow_name=name, initial_input=user_message)
-                    elif component_type == "graph_workflow":
-                        result = await aurite.run_graph_workflow(workflow_name=name, initial_input=user_message)
-                    else:
-                        try:
-                            parsed_input = json.loads(user_message)
-                        except json.JSONDecodeError:
-                            parsed_input = user_message
-                        result = await aurite.run_custom_workflow(
-                            workflow_name=name,
-                            initial_input=parsed_input,
-                            session_id=session_id,
-                        )
+                    try:
+                        parsed_input = json.loads(user_message)
+                    except json.JSONDecodeError:
+                        parsed_input = user_message
+                    result = await runner.run_custom_workflow(
+                        workflow_name=name,
+                        initial_input=parsed_input,
+                        session_id=session_id,
+                    )
                     yield {"type": "tool_output", "data": {"name": "Workflow Result", "output": str(result)}}
                 except Exception as e:
                     yield {"type": "error", "data": {"message": str(e)}}
@@ -119,7 +119,11 @@ def _format_linear_workflow_details(component: dict, level: str) -> str:
     else:
         content += "[bold blue]Steps:[/bold blue]\n"
         for i, step in enumerate(steps):
-            if isinstance(step, dict):
+            if isinstance(step, dict) and "parallel" in step:
+                members = [m.get("name") if isinstance(m, dict) else m for m in step["parallel"]]
+                names = ", ".join(str(member) for member in members if member is not None)
+                content += f"  {i + 1}. parallel: {names} (merge: {step.get('merge', 'json')})\n"
+            elif isinstance(step, dict):
                 content += f"  {i + 1}. {step.get('name')} ({step.get('type')})\n"
             else:
                 content += f"  {i + 1}. {step}\n"
@@ -329,3 +329,15 @@ async def get_security_engine(
         logger.info("SecurityEngine instance created")
 
     return _security_engine_instance
+
+
+async def shutdown_security_engine() -> None:
+    """
+    Shuts down the SecurityEngine instance, if one was created, releasing the worker
+    pools of its component testers.
+    """
+    global _security_engine_instance
+
+    if _security_engine_instance is not None:
+        await _security_engine_instance.shutdown()
+        _security_engine_instance = None
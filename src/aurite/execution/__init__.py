@@ -3,7 +3,20 @@
 Execution layer responsible for running agents and workflows via a unified engine.
 """
 
-from .aurite_engine import AuriteEngine
-from .mcp_host import MCPHost
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .aurite_engine import AuriteEngine
+    from .mcp_host import MCPHost
 
 __all__ = ["AuriteEngine", "MCPHost"]  # Explicitly define what 'from aurite.execution import *' imports
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "AuriteEngine": ".aurite_engine",
+        "MCPHost": ".mcp_host",
+    },
+)
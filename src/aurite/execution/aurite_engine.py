@@ -2,19 +2,20 @@
 Provides a unified engine for executing Agents, Linear Workflows, and Custom Workflows.
 """
 
+import asyncio
 import logging
 import os
 import uuid
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Coroutine, Dict, List, Optional, Tuple, Union
 
-from langfuse import Langfuse
 from termcolor import colored
 
 # Import Component Classes
 from ..lib.components.agent.agent import Agent
 from ..lib.components.llm.litellm_client import LiteLLMClient
-from ..lib.components.workflows.custom_workflow import CustomWorkflowExecutor
-from ..lib.components.workflows.graph_workflow import GraphWorkflowExecutor
+from ..lib.components.workflows import events as workflow_events
+from ..lib.components.workflows.checkpoint import WorkflowCheckpoint
+from ..lib.components.workflows.custom_workflow import CustomWorkflowCache
 from ..lib.components.workflows.linear_workflow import LinearWorkflowExecutor
 
 # Import Config Manager
@@ -40,12 +41,15 @@ from ..lib.models.config.components import (
 from ..lib.storage.db.db_manager import StorageManager
 from ..lib.storage.sessions.cache_manager import CacheManager
 from ..lib.storage.sessions.session_manager import SessionManager
+from ..lib.storage.step_result_cache import StepResultCache, create_step_result_cache
 from ..utils.errors import AgentExecutionError, ConfigurationError, WorkflowExecutionError
+from ..utils.latency import timed, track_latency
 
 # Import Host
 from .mcp_host.mcp_host import MCPHost
 
 if TYPE_CHECKING:
+    from langfuse import Langfuse
     from langfuse.client import StatefulTraceClient
 
 logger = logging.getLogger(__name__)
@@ -64,6 +68,7 @@ class AuriteEngine:
         storage_manager: Optional["StorageManager"] = None,
         cache_manager: Optional["CacheManager"] = None,
         langfuse: Optional["Langfuse"] = None,
+        step_result_cache: Optional[StepResultCache] = None,
     ):
         if not config_manager:
             raise ValueError("ConfigManager instance is required for AuriteEngine.")
@@ -87,6 +92,9 @@ class AuriteEngine:
         else:
             self._session_manager = None
         self._llm_client_cache: Dict[str, "LiteLLMClient"] = {}
+        self._custom_workflow_cache = CustomWorkflowCache()
+        # Created on first use by a memoized workflow step
+        self._step_result_cache_instance = step_result_cache
         self.langfuse = langfuse
         logger.debug(f"AuriteEngine initialized (StorageManager {'present' if storage_manager else 'absent'}).")
 
@@ -96,6 +104,16 @@ class AuriteEngine:
 
     # --- Private Helper Methods ---
 
+    @property
+    def _step_result_cache(self) -> StepResultCache:
+        """The cache used by workflow steps with `memoize` enabled."""
+        if self._step_result_cache_instance is None:
+            self._step_result_cache_instance = create_step_result_cache(
+                storage_manager=self._storage_manager,
+                cache_dir=self._cache_manager.get_cache_dir() if self._cache_manager else None,
+            )
+        return self._step_result_cache_instance
+
     def _should_enable_logging(
         self,
         component_config: Union["AgentConfig", "WorkflowConfig", "GraphWorkflowConfig"],
@@ -126,54 +144,57 @@ class AuriteEngine:
         session_id: Optional[str] = None,
         force_include_history: Optional[bool] = None,
     ) -> Tuple[Agent, List[str]]:
-        agent_config_dict = self._config_manager.get_config("agent", agent_name)
-        if not agent_config_dict:
-            raise ConfigurationError(f"Agent configuration '{agent_name}' not found.")
+        with timed("config_resolution"):
+            agent_config_dict = self._config_manager.get_config("agent", agent_name)
+            if not agent_config_dict:
+                raise ConfigurationError(f"Agent configuration '{agent_name}' not found.")
 
-        if not user_message and not messages:
-            raise ValueError("Parameters user_message and messages cannot both be None")
+            if not user_message and not messages:
+                raise ValueError("Parameters user_message and messages cannot both be None")
 
-        agent_config_for_run = AgentConfig(**agent_config_dict)
+            agent_config_for_run = AgentConfig(**agent_config_dict)
         dynamically_registered_servers: List[str] = []
 
         # JIT Registration of MCP Servers
         if agent_config_for_run.mcp_servers:
             for server_name in agent_config_for_run.mcp_servers:
                 if server_name not in self._host.registered_server_names:
-                    server_config_dict = self._config_manager.get_config("mcp_server", server_name)
-                    if not server_config_dict:
-                        raise ConfigurationError(
-                            f"MCP Server '{server_name}' required by agent '{agent_name}' not found."
-                        )
-                    server_config = ClientConfig(**server_config_dict)
-                    await self._host.register_client(server_config)
+                    with timed("mcp_registration", server=server_name):
+                        server_config_dict = self._config_manager.get_config("mcp_server", server_name)
+                        if not server_config_dict:
+                            raise ConfigurationError(
+                                f"MCP Server '{server_name}' required by agent '{agent_name}' not found."
+                            )
+                        server_config = ClientConfig(**server_config_dict)
+                        await self._host.register_client(server_config)
                     dynamically_registered_servers.append(server_name)
 
-        llm_config_id = agent_config_for_run.llm_config_id
-        if not llm_config_id:
-            logger.warning(f"Agent '{agent_name}' does not have an llm_config_id. Trying to use 'default' LLM.")
-            llm_config_id = "default"
-
-        llm_config_dict = self._config_manager.get_config("llm", llm_config_id)
-
-        if not llm_config_dict:
-            if llm_config_id == "default":
-                logger.warning("No 'default' LLM config found. Falling back to hardcoded OpenAI GPT-4.")
-                llm_config_dict = {
-                    "name": "default_openai_fallback",
-                    "provider": "openai",
-                    "model": "gpt-4-turbo-preview",
-                    "temperature": 0.7,
-                    "max_tokens": 4000,
-                    "default_system_prompt": "You are a helpful OpenAI assistant.",
-                    "api_key_env_var": "OPENAI_API_KEY",
-                }
-            else:
-                raise ConfigurationError(f"LLM configuration '{llm_config_id}' not found.")
+        with timed("config_resolution"):
+            llm_config_id = agent_config_for_run.llm_config_id
+            if not llm_config_id:
+                logger.warning(f"Agent '{agent_name}' does not have an llm_config_id. Trying to use 'default' LLM.")
+                llm_config_id = "default"
+
+            llm_config_dict = self._config_manager.get_config("llm", llm_config_id)
+
+            if not llm_config_dict:
+                if llm_config_id == "default":
+                    logger.warning("No 'default' LLM config found. Falling back to hardcoded OpenAI GPT-4.")
+                    llm_config_dict = {
+                        "name": "default_openai_fallback",
+                        "provider": "openai",
+                        "model": "gpt-4-turbo-preview",
+                        "temperature": 0.7,
+                        "max_tokens": 4000,
+                        "default_system_prompt": "You are a helpful OpenAI assistant.",
+                        "api_key_env_var": "OPENAI_API_KEY",
+                    }
+                else:
+                    raise ConfigurationError(f"LLM configuration '{llm_config_id}' not found.")
 
-        base_llm_config = LLMConfig(**llm_config_dict)
-        if not base_llm_config:
-            raise ConfigurationError(f"Could not determine LLM configuration for Agent '{agent_name}'.")
+            base_llm_config = LLMConfig(**llm_config_dict)
+            if not base_llm_config:
+                raise ConfigurationError(f"Could not determine LLM configuration for Agent '{agent_name}'.")
 
         # Handle force_include_history override from workflow
         effective_include_history = agent_config_for_run.include_history
@@ -184,7 +205,8 @@ class AuriteEngine:
 
         initial_messages: List[Dict[str, Any]] = []
         if effective_include_history and session_id and self._session_manager:
-            history = self._session_manager.get_session_history(session_id)
+            with timed("session_load"):
+                history = self._session_manager.get_session_history(session_id)
             if history:
                 initial_messages.extend(history)
 
@@ -199,11 +221,12 @@ class AuriteEngine:
         # Immediately update the history with the current user message
         # so the agent can reference it as part of the conversation history
         if effective_include_history and session_id and self._session_manager:
-            self._session_manager.add_message_to_history(
-                session_id=session_id,
-                message=current_user_message,
-                agent_name=agent_name,
-            )
+            with timed("session_persistence"):
+                self._session_manager.add_message_to_history(
+                    session_id=session_id,
+                    message=current_user_message,
+                    agent_name=agent_name,
+                )
 
         if system_prompt_override:
             agent_config_for_run.system_prompt = system_prompt_override
@@ -315,11 +338,12 @@ class AuriteEngine:
             if agent_instance and agent_instance.config.include_history and session_id and self._session_manager:
                 # This is a streaming run, so we don't have a full result object yet.
                 # We save the conversation history for now.
-                self._session_manager.save_conversation_history(
-                    session_id=session_id,
-                    conversation=agent_instance.conversation_history,
-                    agent_name=agent_name,
-                )
+                with timed("session_persistence"):
+                    self._session_manager.save_conversation_history(
+                        session_id=session_id,
+                        conversation=agent_instance.conversation_history,
+                        agent_name=agent_name,
+                    )
                 logger.info(
                     f"Facade: Saved {len(agent_instance.conversation_history)} history turns for agent '{agent_name}', session '{session_id}'."
                 )
@@ -362,6 +386,43 @@ class AuriteEngine:
         base_session_id: Optional[str] = None,  # New parameter
         force_logging: Optional[bool] = None,
         trace: Optional["StatefulTraceClient"] = None,
+        include_latency: Optional[bool] = None,
+    ) -> AgentRunResult:
+        """
+        Runs an agent to completion. With `include_latency` (or AURITE_LATENCY_BREAKDOWN=true),
+        the result carries the time spent in each phase of the run.
+        """
+        if include_latency is None:
+            include_latency = os.getenv("AURITE_LATENCY_BREAKDOWN", "false").lower() == "true"
+
+        with track_latency() as breakdown:
+            with timed("agent_run", agent=agent_name):
+                run_result = await self._run_agent(
+                    agent_name=agent_name,
+                    user_message=user_message,
+                    messages=messages,
+                    system_prompt=system_prompt,
+                    session_id=session_id,
+                    force_include_history=force_include_history,
+                    base_session_id=base_session_id,
+                    force_logging=force_logging,
+                    trace=trace,
+                )
+        if include_latency:
+            run_result.latency = breakdown.to_dict()
+        return run_result
+
+    async def _run_agent(
+        self,
+        agent_name: str,
+        user_message: Optional[str],
+        messages: Optional[list[dict[str, Any]]],
+        system_prompt: Optional[str],
+        session_id: Optional[str],
+        force_include_history: Optional[bool],
+        base_session_id: Optional[str],
+        force_logging: Optional[bool],
+        trace: Optional["StatefulTraceClient"],
     ) -> AgentRunResult:
         if os.getenv("AURITE_CONFIG_FORCE_REFRESH", "false").lower() == "true":
             self._config_manager.refresh()
@@ -431,7 +492,11 @@ class AuriteEngine:
                     attrs=["bold"],
                 )
             )
-            run_result = await agent_instance.run_conversation()
+            if workflow_events.is_streaming():
+                # Part of a streamed workflow: forward token deltas and tool calls as they happen
+                run_result = await agent_instance.run_conversation_streaming(workflow_events.forward)
+            else:
+                run_result = await agent_instance.run_conversation()
             if trace and run_result.final_response:
                 trace.update(output=run_result.final_response.content)
             logger.info(
@@ -451,9 +516,10 @@ class AuriteEngine:
 
             # Save complete execution result regardless of the outcome, as it's valuable for debugging.
             if agent_instance and agent_instance.config.include_history and final_session_id and self._session_manager:
-                self._session_manager.save_agent_result(
-                    session_id=final_session_id, agent_result=run_result, base_session_id=final_base_session_id
-                )
+                with timed("session_persistence"):
+                    self._session_manager.save_agent_result(
+                        session_id=final_session_id, agent_result=run_result, base_session_id=final_base_session_id
+                    )
                 logger.info(
                     f"Facade: Saved complete execution result for agent '{agent_name}', session '{final_session_id}'."
                 )
@@ -482,6 +548,8 @@ class AuriteEngine:
         initial_input: Any,
         session_id: Optional[str] = None,
         force_logging: Optional[bool] = None,
+        resume: bool = False,
+        resumable: bool = False,
     ) -> LinearWorkflowExecutionResult:
         if os.getenv("AURITE_CONFIG_FORCE_REFRESH", "false").lower() == "true":
             self._config_manager.refresh()
@@ -534,6 +602,9 @@ class AuriteEngine:
                 session_id=final_session_id,
                 base_session_id=base_session_id,
                 force_logging=enable_logging if workflow_config.include_logging is not None else None,
+                checkpoint=self._workflow_checkpoint(
+                    final_session_id, workflow_name, "linear_workflow", resume, resumable
+                ),
             )
             if trace:
                 trace.update(output=result.final_output)
@@ -563,6 +634,8 @@ class AuriteEngine:
         initial_input: Any,
         session_id: Optional[str] = None,
         force_logging: Optional[bool] = None,
+        resume: bool = False,
+        resumable: bool = False,
     ) -> GraphWorkflowExecutionResult:
         if os.getenv("AURITE_CONFIG_FORCE_REFRESH", "false").lower() == "true":
             self._config_manager.refresh()
@@ -605,6 +678,9 @@ class AuriteEngine:
                     logger.info(f"Auto-generated session_id for workflow '{workflow_name}': {final_session_id}")
             # --- End Session ID Management ---
 
+            # Imported on first use, it loads networkx
+            from ..lib.components.workflows.graph_workflow import GraphWorkflowExecutor
+
             workflow_executor = GraphWorkflowExecutor(
                 config=workflow_config,
                 engine=self,
@@ -615,6 +691,9 @@ class AuriteEngine:
                 session_id=final_session_id,
                 base_session_id=base_session_id,
                 force_logging=enable_logging if workflow_config.include_logging is not None else None,
+                checkpoint=self._workflow_checkpoint(
+                    final_session_id, workflow_name, "graph_workflow", resume, resumable
+                ),
             )
             if trace:
                 trace.update(output=result.final_output)
@@ -638,6 +717,89 @@ class AuriteEngine:
             logger.error(f"Facade: {error_msg}", exc_info=True)
             raise WorkflowExecutionError(error_msg) from e
 
+    async def stream_linear_workflow(
+        self,
+        workflow_name: str,
+        initial_input: Any,
+        session_id: Optional[str] = None,
+        resume: bool = False,
+        resumable: bool = False,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Runs a linear workflow and streams its execution events as they happen:
+        step start/end, and the token deltas and tool calls of agent steps, each
+        tagged with the `node_id` of its step. The last event is `workflow_complete`
+        with the full result, or `error`.
+        """
+        async for event in self._stream_workflow(
+            self.run_linear_workflow(
+                workflow_name=workflow_name,
+                initial_input=initial_input,
+                session_id=session_id,
+                resume=resume,
+                resumable=resumable,
+            )
+        ):
+            yield event
+
+    async def stream_graph_workflow(
+        self,
+        workflow_name: str,
+        initial_input: Any,
+        session_id: Optional[str] = None,
+        resume: bool = False,
+        resumable: bool = False,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Runs a graph workflow and streams its execution events. Events of nodes
+        running in parallel are interleaved and tagged with their `node_id`.
+        """
+        async for event in self._stream_workflow(
+            self.run_graph_workflow(
+                workflow_name=workflow_name,
+                initial_input=initial_input,
+                session_id=session_id,
+                resume=resume,
+                resumable=resumable,
+            )
+        ):
+            yield event
+
+    async def _stream_workflow(
+        self, run: Coroutine[Any, Any, Union[LinearWorkflowExecutionResult, GraphWorkflowExecutionResult]]
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Runs a workflow in a background task and yields the events it emits."""
+        queue: asyncio.Queue[Optional[Dict[str, Any]]] = asyncio.Queue()
+        # The task copies the current context, so everything it runs sends its events to the queue
+        with workflow_events.event_sink(queue.put_nowait):
+            task = asyncio.create_task(run)
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while (event := await queue.get()) is not None:
+                yield event
+            result = task.result()
+            yield {"type": "workflow_complete", "data": result.model_dump(mode="json", fallback=str)}
+        except Exception as e:
+            logger.error(f"Facade: Error while streaming workflow: {e}")
+            yield {"type": "error", "data": {"message": str(e)}}
+        finally:
+            # The consumer stopped early (e.g. the client disconnected)
+            if not task.done():
+                task.cancel()
+
+    def _workflow_checkpoint(
+        self, session_id: Optional[str], workflow_name: str, workflow_type: str, resume: bool, resumable: bool
+    ) -> Optional[WorkflowCheckpoint]:
+        """
+        Creates the per-step checkpoint of a workflow run that resumes or may be resumed later.
+        Other runs are not checkpointed, as each recorded step rewrites the checkpoint.
+        """
+        if (resume or resumable) and not session_id:
+            raise ValueError(f"Resumable runs of workflow '{workflow_name}' require a session_id")
+        if not (resume or resumable) or not session_id or not self._session_manager:
+            return None
+        return WorkflowCheckpoint(self._session_manager, session_id, workflow_name, workflow_type, resume=resume)
+
     async def run_custom_workflow(
         self, workflow_name: str, initial_input: Any, session_id: Optional[str] = None
     ) -> Any:
@@ -653,7 +815,7 @@ class AuriteEngine:
 
             workflow_config = CustomWorkflowConfig(**workflow_config_dict)
 
-            workflow_executor = CustomWorkflowExecutor(config=workflow_config)
+            workflow_executor = self._custom_workflow_cache.get_executor(workflow_config)
 
             result = await workflow_executor.execute(initial_input=initial_input, executor=self, session_id=session_id)
             logger.info(f"Facade: Custom Workflow '{workflow_name}' execution finished.")
@@ -675,8 +837,8 @@ class AuriteEngine:
 
             workflow_config = CustomWorkflowConfig(**workflow_config_dict)
 
-            workflow_executor = CustomWorkflowExecutor(config=workflow_config)
-            return workflow_executor.get_input_type()
+            workflow_executor = self._custom_workflow_cache.get_executor(workflow_config)
+            return await workflow_executor.get_input_type()
         except ConfigurationError as e:
             raise e
         except Exception as e:
@@ -695,8 +857,8 @@ class AuriteEngine:
 
             workflow_config = CustomWorkflowConfig(**workflow_config_dict)
 
-            workflow_executor = CustomWorkflowExecutor(config=workflow_config)
-            return workflow_executor.get_output_type()
+            workflow_executor = self._custom_workflow_cache.get_executor(workflow_config)
+            return await workflow_executor.get_output_type()
         except ConfigurationError as e:
             raise e
         except Exception as e:
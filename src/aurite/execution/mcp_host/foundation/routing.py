@@ -4,7 +4,7 @@ Registry for mapping tools and prompts to the clients that provide them.
 
 import logging
 from collections import defaultdict  # Import defaultdict
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +56,19 @@ class MessageRouter:
 
         logger.debug(f"Registered tool '{tool_name}' for client '{client_id}'")
 
+    async def unregister_tool(self, tool_name: str, client_id: str):
+        """
+        Remove the route from a tool to a specific client.
+        """
+        routes = self._tool_routes.get(tool_name)
+        if routes and client_id in routes:
+            routes.remove(client_id)
+            if not routes:
+                del self._tool_routes[tool_name]
+        self._client_tools.get(client_id, set()).discard(tool_name)
+
+        logger.debug(f"Unregistered tool '{tool_name}' for client '{client_id}'")
+
     async def register_prompt(self, prompt_name: str, client_id: str):
         """Register that a specific client provides a given prompt."""
         # Append client_id to the list for this prompt_name, ensuring no duplicates per prompt
@@ -119,7 +132,19 @@ class MessageRouter:
             f"Registered server '{server_id}' with weight {weight} and capabilities: {capabilities}"
         )
 
-    # Removed select_server_for_tool method
+    async def get_server_weight(self, server_id: str) -> float:
+        """Get the routing weight for a server (client). Unregistered servers have weight 0."""
+        return self._server_weights.get(server_id, 0.0)
+
+    async def select_client_for_tool(self, tool_name: str) -> Optional[str]:
+        """
+        Select the client with the highest routing weight among those providing a tool.
+        Ties go to the client registered first. Returns None if no client provides the tool.
+        """
+        client_ids = self._tool_routes.get(tool_name)
+        if not client_ids:
+            return None
+        return max(client_ids, key=lambda client_id: self._server_weights.get(client_id, 0.0))
 
     async def shutdown(self):
         """Shutdown the message router and clear registry data."""
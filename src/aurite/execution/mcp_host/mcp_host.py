@@ -8,7 +8,7 @@ import os
 import re
 from contextlib import AsyncExitStack
 from datetime import timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import mcp
 import mcp.types as types
@@ -17,10 +17,13 @@ from mcp.client.session_group import StreamableHttpParameters
 from mcp.client.stdio import StdioServerParameters, stdio_client
 from mcp.client.streamable_http import streamablehttp_client
 
-from ...lib.models.config.components import AgentConfig, ClientConfig
+from ...lib.models.config.components import AgentConfig, ClientConfig, ToolRetrievalConfig
 from ...utils.errors import MCPServerTimeoutError
+from ...utils.latency import timed
 from .filtering import FilteringManager
 from .foundation import MessageRouter, RootManager, SecurityManager
+from .session_supervisor import ServerHealth, SessionSupervisor, is_connection_error, is_idempotent_tool
+from .tool_retrieval import ToolIndex
 
 logger = logging.getLogger(__name__)
 
@@ -43,12 +46,19 @@ class MCPHost:
         self._filtering_manager = FilteringManager()
 
         # Direct session and component management
-        self._sessions: Dict[str, ClientSession] = {}
-        self._session_exit_stacks: Dict[str, AsyncExitStack] = {}
+        self._sessions: Dict[str, ClientSession] = {}  # server -> primary session (replica 0)
+        self._session_exit_stacks: Dict[str, List[AsyncExitStack]] = {}  # server -> one stack per replica
+        self._replica_sessions: Dict[str, List[ClientSession]] = {}  # server -> all replica sessions
+        self._outstanding_requests: Dict[str, int] = {}  # replica id -> in-flight tool calls
         self._tools: Dict[str, types.Tool] = {}
         self._prompts: Dict[str, types.Prompt] = {}
         self._resources: Dict[str, types.Resource] = {}
         self._tool_to_session: Dict[str, ClientSession] = {}
+        self._tool_index = ToolIndex()
+
+        # Session health monitoring and reconnection
+        self._client_configs: Dict[str, ClientConfig] = {}
+        self._supervisor = SessionSupervisor(self)
 
     @property
     def prompts(self) -> dict[str, types.Prompt]:
@@ -76,6 +86,7 @@ class MCPHost:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         logger.debug("Shutting down MCP Host...")
+        await self._supervisor.aclose()
         server_names = list(self._sessions.keys())
         for server_name in server_names:
             await self.unregister_client(server_name)
@@ -84,7 +95,13 @@ class MCPHost:
     async def call_tool(
         self, name: str, args: dict[str, Any], agent_config: Optional[AgentConfig] = None
     ) -> types.CallToolResult:
-        """Executes a tool given its name and arguments."""
+        """
+        Executes a tool given its name and arguments.
+
+        If the call fails because the server's transport is gone, a reconnect is
+        requested. Tools annotated as read-only or idempotent are retried once
+        the server is back; other tools re-raise the original error.
+        """
         if name not in self._tool_to_session:
             raise KeyError(f"Tool '{name}' not found or its server is not registered.")
 
@@ -98,8 +115,6 @@ class MCPHost:
                     f"from server '{server_name}'. Allowed servers: {agent_config.mcp_servers}"
                 )
 
-        session = self._tool_to_session[name]
-
         tool = self._tools[name]
 
         # get the actual tool name without prepended server name
@@ -108,18 +123,90 @@ class MCPHost:
         if not actual_name:
             raise KeyError(f"Tool '{name}' does not have a valid title.")
 
-        if not tool.meta or "timeout" not in tool.meta:
-            # no timeout, just return
-            return await session.call_tool(actual_name, args)
+        server_name = name[: -len(actual_name) - 1]
+
+        with timed("tool_call", tool=name):
+            try:
+                return await self._call_session_tool(name, actual_name, args)
+            except Exception as e:
+                if not is_connection_error(e) or server_name not in self._client_configs:
+                    raise
+                logger.warning(f"MCP server '{server_name}' connection lost during tool call '{actual_name}': {e!r}")
+                self._supervisor.record_failure(server_name, e)
+                reconnect = self._supervisor.request_reconnect(server_name)
+                if not (self._client_configs[server_name].retry_idempotent_calls and is_idempotent_tool(tool)):
+                    raise
+                if not await asyncio.shield(reconnect):
+                    raise
+                logger.info(f"Retrying idempotent tool call '{actual_name}' after reconnecting to '{server_name}'.")
+                return await self._call_session_tool(name, actual_name, args)
+
+    async def _call_session_tool(self, name: str, actual_name: str, args: dict[str, Any]) -> types.CallToolResult:
+        """Calls a tool on one of its server's replicas, applying the tool's timeout."""
+        server_name = name[: -len(actual_name) - 1]
+        session, replica_id = await self._acquire_replica(server_name, name)
+        tool = self._tools[name]
 
         try:
-            return await asyncio.wait_for(session.call_tool(actual_name, args), timeout=tool.meta["timeout"])
-        except asyncio.TimeoutError:
-            logger.error(f"Tool call '{actual_name}' timed out after {tool.meta['timeout']} seconds")
-            server_name = name[: -len(actual_name) - 1]
-            raise MCPServerTimeoutError(
-                server_name=server_name, timeout_seconds=tool.meta["timeout"], operation="tool_call"
-            ) from asyncio.TimeoutError
+            if not tool.meta or "timeout" not in tool.meta:
+                # no timeout, just return
+                return await session.call_tool(actual_name, args)
+
+            try:
+                return await asyncio.wait_for(session.call_tool(actual_name, args), timeout=tool.meta["timeout"])
+            except asyncio.TimeoutError:
+                logger.error(f"Tool call '{actual_name}' timed out after {tool.meta['timeout']} seconds")
+                raise MCPServerTimeoutError(
+                    server_name=server_name, timeout_seconds=tool.meta["timeout"], operation="tool_call"
+                ) from asyncio.TimeoutError
+        finally:
+            if replica_id:
+                await self._release_replica(replica_id)
+
+    @staticmethod
+    def _replica_id(server_name: str, index: int) -> str:
+        return f"{server_name}#{index}"
+
+    async def _acquire_replica(self, server_name: str, tool_name: str) -> Tuple[ClientSession, Optional[str]]:
+        """
+        Picks the session to run a tool call on.
+
+        Servers with a single session use the tool's bound session. For replicated
+        servers, the MessageRouter returns the replica with the highest weight, and
+        weights are kept at 1 / (1 + outstanding requests), so this is
+        least-outstanding-requests balancing.
+
+        Returns:
+            The session and the replica id to release after the call (None if unbalanced).
+        """
+        replicas = self._replica_sessions.get(server_name, [])
+        if len(replicas) <= 1:
+            return self._tool_to_session[tool_name], None
+
+        replica_id = await self._message_router.select_client_for_tool(tool_name)
+        if replica_id is None:
+            return self._tool_to_session[tool_name], None
+
+        index = int(replica_id.rsplit("#", 1)[1])
+        outstanding = self._outstanding_requests.get(replica_id, 0) + 1
+        self._outstanding_requests[replica_id] = outstanding
+        await self._message_router.update_server_weight(replica_id, 1.0 / (1 + outstanding))
+        return replicas[index], replica_id
+
+    async def _release_replica(self, replica_id: str):
+        if replica_id not in self._outstanding_requests:
+            return  # Server was unregistered during the call
+        outstanding = max(self._outstanding_requests[replica_id] - 1, 0)
+        self._outstanding_requests[replica_id] = outstanding
+        await self._message_router.update_server_weight(replica_id, 1.0 / (1 + outstanding))
+
+    def get_server_health(self, server_name: str) -> Optional[ServerHealth]:
+        """Returns the health record of a registered server, or None if it is not registered."""
+        return self._supervisor.get_health(server_name)
+
+    def get_all_server_health(self) -> Dict[str, ServerHealth]:
+        """Returns the health records of all registered servers."""
+        return self._supervisor.get_all_health()
 
     async def register_client(self, config: ClientConfig):
         """
@@ -131,6 +218,34 @@ class MCPHost:
             logger.warning(f"Client '{config.name}' is already registered.")
             return
 
+        # Each replica is its own session (and, for stdio/local, its own server process)
+        results = await asyncio.gather(*(self._connect(config) for _ in range(config.replicas)), return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        connections = [result for result in results if not isinstance(result, BaseException)]
+        if errors:
+            for _, session_stack, _ in connections:
+                await self._close_stack(config.name, session_stack)
+            raise errors[0]
+
+        session, _, tools = connections[0]
+        self._bind_tools(config, session, tools)
+        self._sessions[config.name] = session
+        self._replica_sessions[config.name] = [connection[0] for connection in connections]
+        self._session_exit_stacks[config.name] = [connection[1] for connection in connections]
+        self._client_configs[config.name] = config
+        await self._register_replica_routes(config)
+        self._supervisor.track(config.name, config.health_check_interval)
+
+        logger.info(f"Client '{config.name}' dynamically registered successfully.")
+
+    async def _connect(self, config: ClientConfig) -> Tuple[ClientSession, AsyncExitStack, Optional[List[types.Tool]]]:
+        """
+        Opens the transport and session for a client and lists its tools.
+
+        Returns:
+            The initialized session, the exit stack owning it, and the server's tools
+            (None if they could not be fetched).
+        """
         session_stack = AsyncExitStack()
 
         async def _registration_process():
@@ -183,24 +298,14 @@ class MCPHost:
                 await session.initialize()
 
                 # Aggregate components
+                tools = None
                 try:
                     tools_response = await session.list_tools()
-                    for tool in tools_response.tools:
-                        # include the mcp server name
-                        tool.title = tool.name
-                        tool.name = f"{config.name}-{tool.name}"
-                        if not tool.meta:
-                            tool.meta = {}
-                        tool.meta["timeout"] = config.timeout
-                        self._tools[tool.name] = tool
-                        self._tool_to_session[tool.name] = session
+                    tools = tools_response.tools
                 except Exception as e:
                     logger.warning(f"Could not fetch tools from '{config.name}': {e}")
 
-                self._sessions[config.name] = session
-                self._session_exit_stacks[config.name] = session_stack
-
-                logger.info(f"Client '{config.name}' dynamically registered successfully.")
+                return session, tools
 
             except Exception as e:
                 logger.error(
@@ -214,7 +319,7 @@ class MCPHost:
         registration_task = asyncio.create_task(_registration_process())
 
         try:
-            await asyncio.wait_for(registration_task, timeout=config.registration_timeout)
+            session, tools = await asyncio.wait_for(registration_task, timeout=config.registration_timeout)
         except asyncio.TimeoutError:
             logger.error(
                 f"Registration of client '{config.name}' timed out after {config.registration_timeout} seconds"
@@ -239,24 +344,142 @@ class MCPHost:
                 server_name=config.name, timeout_seconds=config.registration_timeout, operation="registration"
             ) from asyncio.TimeoutError
 
+        return session, session_stack, tools
+
+    def _bind_tools(
+        self,
+        config: ClientConfig,
+        session: ClientSession,
+        tools: Optional[List[types.Tool]],
+        previous_session: Optional[ClientSession] = None,
+    ):
+        """
+        Registers a server's tools against its session.
+
+        On reconnect, tools already registered for the server are re-pointed at the
+        new session. If the server's tool list could be fetched, tools it no longer
+        provides are removed.
+        """
+        previous_tools = [name for name, sess in self._tool_to_session.items() if sess is previous_session]
+        for tool_name in previous_tools:
+            self._tool_to_session[tool_name] = session
+
+        if tools is None:
+            return
+
+        current_names = set()
+        for tool in tools:
+            # include the mcp server name
+            tool.title = tool.name
+            tool.name = f"{config.name}-{tool.name}"
+            if not tool.meta:
+                tool.meta = {}
+            tool.meta["timeout"] = config.timeout
+            self._tools[tool.name] = tool
+            self._tool_to_session[tool.name] = session
+            self._tool_index.add_tool(tool)
+            current_names.add(tool.name)
+
+        for tool_name in previous_tools:
+            if tool_name not in current_names:
+                del self._tools[tool_name]
+                del self._tool_to_session[tool_name]
+                self._tool_index.remove_tool(tool_name)
+
+    async def _register_replica_routes(self, config: ClientConfig, indices: Optional[List[int]] = None):
+        """
+        Registers replicas of a server (all of them by default) with the MessageRouter, weighted by
+        their outstanding requests, and routes the server's current tools to every replica. Routes
+        to tools the server no longer provides are removed.
+        """
+        tool_names = {name for name, session in self._tool_to_session.items() if session is self._sessions[config.name]}
+        replica_indices = range(len(self._replica_sessions[config.name]))
+        for index in replica_indices if indices is None else indices:
+            replica_id = self._replica_id(config.name, index)
+            outstanding = self._outstanding_requests.setdefault(replica_id, 0)
+            await self._message_router.register_server(
+                replica_id, set(config.capabilities), weight=1.0 / (1 + outstanding)
+            )
+        for index in replica_indices:
+            replica_id = self._replica_id(config.name, index)
+            for tool_name in await self._message_router.get_tools_for_client(replica_id) - tool_names:
+                await self._message_router.unregister_tool(tool_name, replica_id)
+            for tool_name in tool_names:
+                await self._message_router.register_tool(tool_name, replica_id)
+
+    async def _close_stack(self, server_name: str, session_stack: AsyncExitStack):
+        try:
+            await session_stack.aclose()
+        except (asyncio.CancelledError, Exception) as e:
+            logger.debug(f"Error during session cleanup for '{server_name}': {e}")
+
+    async def _ping_server(self, server_name: str):
+        """Pings every replica of a registered server, raising if any does not answer within its timeout."""
+        config = self._client_configs[server_name]
+        for session in self._replica_sessions[server_name]:
+            await asyncio.wait_for(session.send_ping(), timeout=config.timeout)
+
+    async def _reopen_session(self, server_name: str):
+        """
+        Replaces a server's dead replicas with freshly connected sessions, keeping its tools registered.
+        Called by the SessionSupervisor when a session has died. Replicas that still answer a ping
+        are left alone so their in-flight calls are not interrupted.
+        """
+        config = self._client_configs[server_name]
+        pings = await asyncio.gather(
+            *(
+                asyncio.wait_for(session.send_ping(), timeout=config.timeout)
+                for session in self._replica_sessions[server_name]
+            ),
+            return_exceptions=True,
+        )
+        for index, ping in enumerate(pings):
+            if isinstance(ping, BaseException):
+                await self._reopen_replica(config, index)
+
+    async def _reopen_replica(self, config: ClientConfig, index: int):
+        server_name = config.name
+        sessions = self._replica_sessions[server_name]
+        stacks = self._session_exit_stacks[server_name]
+        old_session = sessions[index]
+        await self._close_stack(server_name, stacks[index])
+
+        session, session_stack, tools = await self._connect(config)
+        if self._replica_sessions.get(server_name) is not sessions:
+            # Unregistered while reconnecting
+            await session_stack.aclose()
+            return
+
+        sessions[index] = session
+        stacks[index] = session_stack
+        if index == 0:
+            self._bind_tools(config, session, tools, previous_session=old_session)
+            self._sessions[server_name] = session
+            await self._register_replica_routes(config, indices=[index])
+
     async def unregister_client(self, server_name: str):
         """Dynamically unregisters a client and cleans up its resources."""
         logger.info(f"Attempting to dynamically unregister client: {server_name}")
+        self._client_configs.pop(server_name, None)
+        await self._supervisor.untrack(server_name)
         session_to_remove = self._sessions.pop(server_name, None)
-        session_stack = self._session_exit_stacks.pop(server_name, None)
+        session_stacks = self._session_exit_stacks.pop(server_name, [])
+        replicas = self._replica_sessions.pop(server_name, [])
+        for index in range(len(replicas)):
+            replica_id = self._replica_id(server_name, index)
+            self._outstanding_requests.pop(replica_id, None)
+            await self._message_router.unregister_server(replica_id)
 
         if session_to_remove:
             tools_to_remove = [name for name, session in self._tool_to_session.items() if session == session_to_remove]
             for tool_name in tools_to_remove:
                 del self._tools[tool_name]
                 del self._tool_to_session[tool_name]
+                self._tool_index.remove_tool(tool_name)
 
-        if session_stack:
-            try:
-                await session_stack.aclose()
-            except (asyncio.CancelledError, Exception) as e:
-                logger.debug(f"Error during session cleanup for '{server_name}': {e}")
-                # Don't re-raise during shutdown - we want to continue cleaning up other clients
+        # Don't re-raise cleanup errors during shutdown - we want to continue cleaning up other clients
+        for session_stack in session_stacks:
+            await self._close_stack(server_name, session_stack)
 
         logger.info(f"Client '{server_name}' dynamically unregistered successfully.")
 
@@ -264,9 +487,14 @@ class MCPHost:
         self,
         agent_config: Optional[AgentConfig] = None,
         tool_names: Optional[List[str]] = None,
+        query: Optional[str] = None,
+        pinned_tools: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Gets the list of tools formatted for LLM use, applying agent-specific filtering.
+
+        If the agent has tool retrieval enabled and a `query` (the recent conversation) is
+        given, only the tools most relevant to the query are returned, plus any pinned tools.
         """
         all_tools = list(self.tools.values())
 
@@ -293,6 +521,44 @@ class MCPHost:
 
         if agent_config:
             # Apply additional filtering based on exclude_components
-            return self._filtering_manager.filter_component_list(formatted_tools, agent_config)
+            formatted_tools = self._filtering_manager.filter_component_list(formatted_tools, agent_config)
+            if query:
+                formatted_tools = self._select_relevant_tools(formatted_tools, agent_config, query, pinned_tools)
 
         return formatted_tools
+
+    def _select_relevant_tools(
+        self,
+        formatted_tools: List[Dict[str, Any]],
+        agent_config: AgentConfig,
+        query: str,
+        pinned_tools: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Narrows an agent's tool list to the tools most relevant to the query."""
+        retrieval = agent_config.tool_retrieval
+        if retrieval is None and agent_config.auto:
+            retrieval = ToolRetrievalConfig()
+        if retrieval is None or not retrieval.enabled:
+            return formatted_tools
+
+        pinned = set(retrieval.pinned_tools) | set(pinned_tools or [])
+        is_pinned = [tool["name"] in pinned or tool.get("title") in pinned for tool in formatted_tools]
+        candidates = [tool["name"] for tool, keep in zip(formatted_tools, is_pinned, strict=True) if not keep]
+        if len(candidates) <= retrieval.top_k:
+            return formatted_tools
+
+        selected = set(
+            self._tool_index.search(query, candidates=candidates, top_k=retrieval.top_k, min_score=retrieval.min_score)
+        )
+        if not selected and retrieval.fallback_to_all:
+            logger.debug(f"No relevant tools found for agent '{agent_config.name}', sending all tools.")
+            return formatted_tools
+
+        relevant_tools = [
+            tool for tool, keep in zip(formatted_tools, is_pinned, strict=True) if keep or tool["name"] in selected
+        ]
+        logger.debug(
+            f"Tool retrieval for agent '{agent_config.name}' selected {len(relevant_tools)} "
+            f"of {len(formatted_tools)} tools."
+        )
+        return relevant_tools
@@ -0,0 +1,219 @@
+"""
+Session health monitoring and reconnection for the MCP Host.
+
+A stdio MCP subprocess can crash and an http_stream server can drop its
+connection while the ClientSession that talked to it stays registered in the
+host. The SessionSupervisor keeps a health record per registered server,
+pings each session periodically, and reconnects dead sessions with
+exponential backoff. Tool calls that fail on a closed transport request a
+reconnect through the same supervisor, so concurrent failures share a single
+reconnect attempt.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import anyio
+import mcp.types as types
+from mcp.shared.exceptions import McpError
+
+if TYPE_CHECKING:
+    from .mcp_host import MCPHost
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for the delay between two reconnect attempts.
+MAX_RECONNECT_DELAY = 30.0
+
+_CONNECTION_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+    EOFError,
+)
+
+
+def is_connection_error(error: BaseException) -> bool:
+    """Returns True if the error means the session's transport is gone (process exit, dropped connection)."""
+    if isinstance(error, McpError):
+        return error.error.code == types.CONNECTION_CLOSED
+    if isinstance(error, _CONNECTION_ERRORS):
+        return True
+    # httpx is only present for http_stream transports; match its transport errors by name.
+    return any(cls.__name__ in ("TransportError", "RemoteProtocolError") for cls in type(error).__mro__)
+
+
+def is_idempotent_tool(tool: types.Tool) -> bool:
+    """Returns True if the tool's annotations say it can safely be called twice with the same arguments."""
+    annotations = tool.annotations
+    if annotations is None:
+        return False
+    return bool(annotations.readOnlyHint or annotations.idempotentHint)
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float = MAX_RECONNECT_DELAY) -> float:
+    """Exponential backoff with full jitter for the given (1-based) reconnect attempt."""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** (attempt - 1))))
+
+
+@dataclass
+class ServerHealth:
+    """Health record for a registered MCP server."""
+
+    name: str
+    status: str = "healthy"  # "healthy", "reconnecting", "unhealthy"
+    last_check: Optional[datetime] = None
+    last_error: Optional[str] = None
+    consecutive_failures: int = 0
+    reconnect_count: int = 0
+    last_reconnect: Optional[datetime] = None
+
+    @property
+    def is_healthy(self) -> bool:
+        return self.status == "healthy"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "last_check": self.last_check.isoformat() if self.last_check else None,
+            "last_error": self.last_error,
+            "consecutive_failures": self.consecutive_failures,
+            "reconnect_count": self.reconnect_count,
+            "last_reconnect": self.last_reconnect.isoformat() if self.last_reconnect else None,
+        }
+
+
+class SessionSupervisor:
+    """
+    Tracks the health of every session registered with an MCPHost and
+    reconnects the ones that die.
+
+    Each server gets a monitor task that pings its session every
+    ``health_check_interval`` seconds (when configured). A failed ping or a
+    tool call that fails on a closed transport triggers a reconnect, which the
+    host performs with `MCPHost._reopen_session` while keeping the server's
+    tools registered.
+    """
+
+    def __init__(self, host: "MCPHost"):
+        self._host = host
+        self._health: Dict[str, ServerHealth] = {}
+        self._monitors: Dict[str, asyncio.Task] = {}
+        self._reconnects: Dict[str, asyncio.Task] = {}
+
+    def get_health(self, server_name: str) -> Optional[ServerHealth]:
+        """Returns the health record for a server, or None if it is not tracked."""
+        return self._health.get(server_name)
+
+    def get_all_health(self) -> Dict[str, ServerHealth]:
+        """Returns the health records of all tracked servers."""
+        return dict(self._health)
+
+    def track(self, server_name: str, health_check_interval: Optional[float]) -> None:
+        """Starts tracking a newly registered server."""
+        self._health[server_name] = ServerHealth(name=server_name, last_check=datetime.now())
+        if health_check_interval and health_check_interval > 0:
+            self._monitors[server_name] = asyncio.create_task(
+                self._monitor(server_name, health_check_interval), name=f"mcp-health-{server_name}"
+            )
+
+    async def untrack(self, server_name: str) -> None:
+        """Stops monitoring a server and forgets its health record."""
+        self._health.pop(server_name, None)
+        tasks = [self._monitors.pop(server_name, None), self._reconnects.pop(server_name, None)]
+        for task in tasks:
+            if task and task is not asyncio.current_task():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+
+    async def aclose(self) -> None:
+        """Stops monitoring all servers."""
+        for server_name in list(self._health):
+            await self.untrack(server_name)
+
+    def record_success(self, server_name: str) -> None:
+        health = self._health.get(server_name)
+        if health:
+            health.status = "healthy"
+            health.last_check = datetime.now()
+            health.last_error = None
+            health.consecutive_failures = 0
+
+    def record_failure(self, server_name: str, error: BaseException | str) -> None:
+        health = self._health.get(server_name)
+        if health:
+            health.last_check = datetime.now()
+            health.last_error = str(error) or type(error).__name__
+            health.consecutive_failures += 1
+
+    def request_reconnect(self, server_name: str) -> "asyncio.Future[bool]":
+        """
+        Starts reconnecting a server unless a reconnect is already running.
+
+        Returns:
+            A future that resolves to True once the server is connected again, or
+            False if every attempt failed. Callers awaiting it share one reconnect.
+        """
+        task = self._reconnects.get(server_name)
+        if task is None or task.done():
+            task = asyncio.create_task(self._reconnect(server_name), name=f"mcp-reconnect-{server_name}")
+            self._reconnects[server_name] = task
+        return task
+
+    async def _monitor(self, server_name: str, interval: float) -> None:
+        while server_name in self._health:
+            await asyncio.sleep(interval)
+            if server_name in self._reconnects and not self._reconnects[server_name].done():
+                continue
+            try:
+                await self._host._ping_server(server_name)
+            except Exception as e:
+                logger.warning(f"Health check for MCP server '{server_name}' failed: {e!r}")
+                self.record_failure(server_name, e)
+                await asyncio.shield(self.request_reconnect(server_name))
+            else:
+                self.record_success(server_name)
+
+    async def _reconnect(self, server_name: str) -> bool:
+        health = self._health.get(server_name)
+        config = self._host._client_configs.get(server_name)
+        if health is None or config is None:
+            return False
+
+        health.status = "reconnecting"
+        for attempt in range(1, config.max_reconnect_attempts + 1):
+            if attempt > 1:
+                await asyncio.sleep(backoff_delay(attempt - 1, config.reconnect_backoff))
+            if server_name not in self._health:
+                return False  # Unregistered while we were waiting
+            try:
+                await self._host._reopen_session(server_name)
+            except Exception as e:
+                logger.warning(
+                    f"Reconnect attempt {attempt}/{config.max_reconnect_attempts} "
+                    f"for MCP server '{server_name}' failed: {e}"
+                )
+                self.record_failure(server_name, e)
+                continue
+
+            health.reconnect_count += 1
+            health.last_reconnect = datetime.now()
+            self.record_success(server_name)
+            logger.info(f"Reconnected to MCP server '{server_name}' after {attempt} attempt(s).")
+            return True
+
+        health.status = "unhealthy"
+        logger.error(
+            f"Could not reconnect to MCP server '{server_name}' after {config.max_reconnect_attempts} attempts."
+        )
+        return False
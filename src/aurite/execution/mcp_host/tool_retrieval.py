@@ -0,0 +1,157 @@
+"""
+Semantic tool retrieval for the MCP Host.
+
+This module provides a ToolIndex that embeds every registered tool once, at
+registration time, and selects the tools most relevant to a conversation at
+request time. Agents with many MCP servers can then send the LLM a short,
+relevant tool list instead of every available tool on every turn.
+
+Embeddings are sparse TF-IDF vectors over the tool's name, description and
+input schema (property names and descriptions), compared with cosine
+similarity. This keeps the index in-process, deterministic and free of any
+model download or network call.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+import mcp.types as types
+
+_TOKEN_PATTERN = re.compile(r"[A-Za-z][a-z]+|[A-Z]+(?![a-z])|\d+")
+
+# Very common words that carry no signal for tool selection
+_STOPWORDS = frozenset(
+    "an and are as at be by can do for from get has have in is it me my of on or please "
+    "that the this to use what with you".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits text (including snake_case, kebab-case and camelCase identifiers) into lowercase tokens."""
+    return [token.lower() for token in _TOKEN_PATTERN.findall(text) if token.lower() not in _STOPWORDS]
+
+
+def _schema_text(schema: Optional[Dict[str, Any]]) -> Iterable[str]:
+    """Yields property names and descriptions from a JSON schema."""
+    if not isinstance(schema, dict):
+        return
+    if description := schema.get("description"):
+        yield str(description)
+    for name, prop in (schema.get("properties") or {}).items():
+        yield str(name)
+        yield from _schema_text(prop)
+    if isinstance(schema.get("items"), dict):
+        yield from _schema_text(schema["items"])
+
+
+def tool_document(tool: types.Tool) -> str:
+    """Builds the text that represents a tool in the index."""
+    parts = [tool.title or tool.name, tool.name, tool.description or ""]
+    parts.extend(_schema_text(tool.inputSchema))
+    return " ".join(parts)
+
+
+class ToolIndex:
+    """
+    In-process vector index over registered tools.
+
+    Term frequencies are computed once per tool when it is added. Inverse
+    document frequencies depend on the whole corpus and are recomputed lazily
+    the first time the index is searched after a tool was added or removed.
+    """
+
+    def __init__(self):
+        self._term_counts: Dict[str, Counter] = {}
+        self._document_frequency: Counter = Counter()
+        self._vectors: Dict[str, Dict[str, float]] = {}
+        self._idf: Dict[str, float] = {}
+        self._stale = False
+
+    def __contains__(self, tool_name: str) -> bool:
+        return tool_name in self._term_counts
+
+    def __len__(self) -> int:
+        return len(self._term_counts)
+
+    def add_tool(self, tool: types.Tool) -> None:
+        """Embeds a tool and adds it to the index, replacing any previous entry with the same name."""
+        self.remove_tool(tool.name)
+        counts = Counter(tokenize(tool_document(tool)))
+        self._term_counts[tool.name] = counts
+        self._document_frequency.update(counts.keys())
+        self._stale = True
+
+    def remove_tool(self, tool_name: str) -> None:
+        """Removes a tool from the index if present."""
+        counts = self._term_counts.pop(tool_name, None)
+        if counts is None:
+            return
+        self._document_frequency.subtract(counts.keys())
+        self._document_frequency += Counter()  # drop zero counts
+        self._vectors.pop(tool_name, None)
+        self._stale = True
+
+    def _refresh(self) -> None:
+        if not self._stale:
+            return
+        total = len(self._term_counts)
+        self._idf = {
+            term: math.log((1 + total) / (1 + frequency)) + 1.0 for term, frequency in self._document_frequency.items()
+        }
+        self._vectors = {name: self._weigh(counts) for name, counts in self._term_counts.items()}
+        self._stale = False
+
+    def _weigh(self, counts: Counter) -> Dict[str, float]:
+        """Turns term counts into a unit-length TF-IDF vector (unknown terms are dropped)."""
+        vector = {
+            term: (1.0 + math.log(count)) * self._idf[term] for term, count in counts.items() if term in self._idf
+        }
+        norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+        if not norm:
+            return {}
+        return {term: weight / norm for term, weight in vector.items()}
+
+    def search(
+        self,
+        query: str,
+        candidates: Optional[Iterable[str]] = None,
+        top_k: int = 8,
+        min_score: float = 0.0,
+    ) -> List[str]:
+        """
+        Returns the names of the tools most similar to ``query``.
+
+        Args:
+            query: Free text describing what the agent is trying to do.
+            candidates: Restrict the search to these tool names (e.g. an agent's allowed tools).
+            top_k: Maximum number of tools to return.
+            min_score: Minimum cosine similarity for a tool to be returned.
+
+        Returns:
+            Tool names ordered by decreasing similarity. Empty if nothing scored above ``min_score``.
+        """
+        self._refresh()
+        query_vector = self._weigh(Counter(tokenize(query)))
+        if not query_vector or top_k <= 0:
+            return []
+
+        names = self._vectors.keys() if candidates is None else [n for n in candidates if n in self._vectors]
+        scored = []
+        for name in names:
+            vector = self._vectors[name]
+            score = sum(weight * vector.get(term, 0.0) for term, weight in query_vector.items())
+            if score > min_score:
+                scored.append((score, name))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [name for _, name in scored[:top_k]]
+
+    def clear(self) -> None:
+        """Removes every tool from the index."""
+        self._term_counts.clear()
+        self._document_frequency.clear()
+        self._vectors.clear()
+        self._idf.clear()
+        self._stale = False
@@ -5,9 +5,21 @@ Aurite Library Module
 This module contains the core library components for the Aurite framework.
 """
 
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_imports import lazy_exports
+
 # Export the models module for convenient access
-from . import models
+if TYPE_CHECKING:
+    from . import models
 
 __all__ = [
     "models",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "models": ".models",
+    },
+)
@@ -1,6 +1,11 @@
-from .agent import Agent
-from .llm import LiteLLMClient
-from .workflows import CustomWorkflowExecutor, LinearWorkflowExecutor
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .agent import Agent
+    from .llm import LiteLLMClient
+    from .workflows import CustomWorkflowExecutor, LinearWorkflowExecutor
 
 __all__ = [
     "Agent",
@@ -8,3 +13,13 @@ __all__ = [
     "CustomWorkflowExecutor",
     "LinearWorkflowExecutor",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "Agent": ".agent",
+        "LiteLLMClient": ".llm",
+        "CustomWorkflowExecutor": ".workflows",
+        "LinearWorkflowExecutor": ".workflows",
+    },
+)
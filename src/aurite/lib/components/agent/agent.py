@@ -4,7 +4,7 @@ Manages the multi-turn conversation loop for an Agent.
 
 import json
 import logging
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Dict, List, Literal, Optional
 
 from openai.types.chat import (
     ChatCompletionMessage,
@@ -15,6 +15,7 @@ from openai.types.chat.chat_completion_message_tool_call import (
 )
 
 from ....execution.mcp_host.mcp_host import MCPHost
+from ....utils.latency import timed
 from ...models.api.responses import AgentRunResult
 from ...models.config.components import AgentConfig, LLMConfig
 from ..llm.litellm_client import LiteLLMClient
@@ -74,7 +75,15 @@ class Agent:
 
     def _create_turn_processor(self) -> AgentTurnProcessor:
         """Creates and configures an AgentTurnProcessor for the current turn."""
-        tools_data = self.host.get_formatted_tools(agent_config=self.config)
+        with timed("tool_selection"):
+            if self.config.tool_retrieval or self.config.auto:
+                tools_data = self.host.get_formatted_tools(
+                    agent_config=self.config,
+                    query=self._build_tool_query(),
+                    pinned_tools=self._get_used_tool_names(),
+                )
+            else:
+                tools_data = self.host.get_formatted_tools(agent_config=self.config)
         return AgentTurnProcessor(
             config=self.config,
             llm_client=self.llm,
@@ -85,6 +94,30 @@ class Agent:
             trace=self.trace,
         )
 
+    def _build_tool_query(self) -> str:
+        """Builds the tool retrieval query from the text of the most recent messages."""
+        query_messages = self.config.tool_retrieval.query_messages if self.config.tool_retrieval else 3
+        texts: List[str] = []
+        for message in self.conversation_history[-query_messages:]:
+            content = message.get("content")
+            if isinstance(content, str):
+                texts.append(content)
+            elif isinstance(content, list):
+                texts.extend(part.get("text", "") for part in content if isinstance(part, dict))
+        return "\n".join(text for text in texts if text)
+
+    def _get_used_tool_names(self) -> List[str]:
+        """Returns the tools already called in this conversation, so they stay available to the LLM."""
+        names = []
+        for message in self.conversation_history:
+            for tool_call in message.get("tool_calls") or []:
+                if not isinstance(tool_call, dict):
+                    continue
+                name = (tool_call.get("function") or {}).get("name")
+                if name and name not in names:
+                    names.append(name)
+        return names
+
     async def run_conversation(self) -> AgentRunResult:
         """
         Runs the agent's conversation loop until a final response is generated
@@ -162,6 +195,37 @@ class Agent:
             exception=None,
         )
 
+    async def run_conversation_streaming(self, on_event: Callable[[Dict[str, Any]], None]) -> AgentRunResult:
+        """
+        Runs the conversation through `stream_conversation`, passing every event to
+        `on_event`, and returns the same kind of result as `run_conversation`.
+        Used when an agent runs as a step of a streamed workflow.
+        """
+        status: Literal["success", "error", "max_iterations_reached"] = "success"
+        error_message = None
+        async for event in self.stream_conversation():
+            on_event(event)
+            if event["type"] == "error":
+                status = "error"
+                error_message = event["data"].get("message")
+            elif event["type"] == "llm_response_stop" and event["data"].get("reason") == "turn_limit_reached":
+                status = "max_iterations_reached"
+                error_message = f"Agent stopped after reaching the maximum of {self.config.max_iterations} iterations."
+
+        last_message = self.conversation_history[-1] if self.conversation_history else {}
+        if status == "success" and last_message.get("role") == "assistant" and not last_message.get("tool_calls"):
+            self.final_response = ChatCompletionMessage(role="assistant", content=last_message.get("content"))
+
+        return AgentRunResult(
+            agent_name=self.config.name,
+            status=status,
+            final_response=self.final_response,
+            conversation_history=self.conversation_history,
+            error_message=error_message,
+            session_id=self.session_id,
+            exception=None,
+        )
+
     async def stream_conversation(self) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Streams the agent's conversation, handling multiple turns and tool executions.
@@ -184,7 +248,10 @@ class Agent:
             try:
                 is_tool_turn = False
                 tool_results = []
-                current_tool_name = None
+                # One assistant message holds all the tool calls of the turn
+                tool_call_message: Dict[str, Any] = {"role": "assistant", "tool_calls": []}
+                tool_names: Dict[str, str] = {}
+                conversation_complete = False
 
                 async for event in turn_processor.stream_turn_response():
                     # --- Event Translation Logic ---
@@ -206,6 +273,8 @@ class Agent:
                         event_type = event["type"]
 
                         if event_type == "tool_complete":
+                            if not is_tool_turn:
+                                self.conversation_history.append(tool_call_message)
                             is_tool_turn = True
                             current_tool_name = event.get("name")
                             if not current_tool_name:
@@ -218,6 +287,7 @@ class Agent:
                             except json.JSONDecodeError:
                                 tool_args = {"raw_arguments": tool_args_str}
 
+                            tool_names[event["tool_id"]] = current_tool_name
                             yield {"type": "tool_call", "data": {"name": current_tool_name, "input": tool_args}}
 
                             # Update history for the next turn
@@ -226,28 +296,35 @@ class Agent:
                                 "function": {"name": current_tool_name, "arguments": tool_args_str},
                                 "type": "function",
                             }
-                            message = {
-                                "role": "assistant",
-                                "tool_calls": [tool_call_param],
-                            }
-                            self.conversation_history.append(message)
+                            tool_call_message["tool_calls"].append(tool_call_param)
 
                         elif event_type == "tool_result":
                             tool_results.append(event)  # Collect for history
                             yield {
                                 "type": "tool_output",
-                                "data": {"name": current_tool_name, "output": event.get("result")},
+                                "data": {"name": tool_names.get(event["tool_id"]), "output": event.get("result")},
                             }
 
                         elif event_type == "message_complete":
                             content = event.get("content", "")
-                            self.conversation_history.append({"role": "assistant", "content": content})
+                            if is_tool_turn:
+                                if content:
+                                    tool_call_message["content"] = content
+                            else:
+                                self.conversation_history.append({"role": "assistant", "content": content})
+                                if not event.get("validated", True):
+                                    # Like run_conversation, ask again for a response matching the schema
+                                    logger.debug("Streamed response failed schema validation. Continuing.")
+                                    continue
                             yield {
                                 "type": "llm_response_stop",
                                 "data": {"status": "success", "reason": "message_complete"},
                             }
-                            if not is_tool_turn:
-                                return  # End of conversation
+                            # End of conversation, once the turn's stream (and its usage) is read to the end
+                            conversation_complete = not is_tool_turn
+
+                if conversation_complete:
+                    return
 
                 # After the turn, append all tool results to history
                 if tool_results:
@@ -19,6 +19,7 @@ if TYPE_CHECKING:
     from langfuse.client import StatefulTraceClient
 
 from ....execution.mcp_host.mcp_host import MCPHost
+from ....utils.latency import timed
 from ...models.config.components import AgentConfig
 from ..llm.litellm_client import LiteLLMClient
 
@@ -139,6 +140,12 @@ class AgentTurnProcessor:
 
     async def process_turn(
         self,
+    ) -> Tuple[Optional[ChatCompletionMessage], Optional[List[Dict[str, Any]]], bool]:
+        with timed("agent_turn", agent=self.config.name):
+            return await self._process_turn()
+
+    async def _process_turn(
+        self,
     ) -> Tuple[Optional[ChatCompletionMessage], Optional[List[Dict[str, Any]]], bool]:
         logger.debug("Processing conversation turn...")
 
@@ -246,7 +253,9 @@ class AgentTurnProcessor:
                             tool_use_end, tool_result, tool_execution_error, stream_end.
         """
         self._tool_uses_this_turn = []
-        current_tool_call: Optional[Dict[str, Any]] = None
+        # Tool calls of this message in order; their deltas refer to them by index
+        pending_tool_calls: List[Dict[str, Any]] = []
+        tool_calls_by_index: Dict[int, Dict[str, Any]] = {}
         current_text_buffer = ""
         current_message_id = None
 
@@ -300,96 +309,38 @@ class AgentTurnProcessor:
                     for tool_call in delta.tool_calls:
                         # New tool call starting
                         if tool_call.id and tool_call.function and tool_call.function.name:
-                            current_tool_call = {
+                            tool_calls_by_index[tool_call.index] = {
                                 "id": tool_call.id,
                                 "name": tool_call.function.name,
                                 "arguments": "",
                             }
+                            pending_tool_calls.append(tool_calls_by_index[tool_call.index])
 
                         # Accumulate tool arguments
-                        if tool_call.function and tool_call.function.arguments and current_tool_call:
-                            current_tool_call["arguments"] += tool_call.function.arguments
+                        target = tool_calls_by_index.get(tool_call.index)
+                        if tool_call.function and tool_call.function.arguments and target:
+                            target["arguments"] += tool_call.function.arguments
 
                 # Handle completion, allow finish_reason to be stop for gemini
-                if chunk_choice.finish_reason in ["tool_calls", "stop"] and current_tool_call:
-                    # Parse and execute tool
-                    try:
-                        tool_id = current_tool_call.get("id")
-                        tool_name = current_tool_call.get("name")
-                        tool_input_str = current_tool_call.get("arguments", "")
-                        logger.debug(
-                            f"Executing tool '{tool_name}' (ID: {tool_id}) from stream with input: {tool_input_str}"
-                        )
-
-                        yield {
-                            "internal": True,
-                            "type": "tool_complete",
-                            "tool_id": tool_id,
-                            "name": tool_name,
-                            "arguments": tool_input_str,
-                            "message_id": current_message_id,
-                        }
-
-                        if tool_name and tool_id:
-                            function_obj = SimpleNamespace(name=tool_name, arguments=tool_input_str)
-                            tool_call_obj = SimpleNamespace(id=tool_id, function=function_obj, type="function")
-                            current_tool_calls = [tool_call_obj]
-
-                            tool_results_for_next_turn = await self._process_tool_calls(current_tool_calls)
-
-                            if tool_results_for_next_turn:
-                                serializable_output = tool_results_for_next_turn[0].get("content")
-
-                                yield {
-                                    "role": "tool",
-                                    "tool_call_id": current_tool_call["id"],
-                                    "content": serializable_output,
-                                }
-                                yield {
-                                    "internal": True,
-                                    "type": "tool_result",
-                                    "tool_id": current_tool_call["id"],
-                                    "result": serializable_output,
-                                    "status": "success",
-                                }
-                            else:
-                                yield {
-                                    "internal": True,
-                                    "type": "tool_result",
-                                    "tool_id": current_tool_call["id"],
-                                    "error": "Error executing tool.",
-                                    "status": "error",
-                                }
-                        else:
-                            logger.error(f"Tool name missing for tool use event. Tool ID: {tool_id}")
-                            yield {
-                                "internal": True,
-                                "type": "tool_result",
-                                "tool_id": current_tool_call["id"],
-                                "error": "LLM did not provide a tool name for a tool_use block.",
-                                "status": "error",
-                            }
-
-                    except Exception as e:
-                        yield {
-                            "internal": True,
-                            "type": "tool_result",
-                            "tool_id": current_tool_call["id"],
-                            "error": str(e),
-                            "status": "error",
-                        }
-                    current_tool_call = None
+                if chunk_choice.finish_reason in ["tool_calls", "stop"] and pending_tool_calls:
+                    async for event in self._stream_tool_calls(pending_tool_calls, current_message_id):
+                        yield event
+                    pending_tool_calls = []
+                    tool_calls_by_index = {}
 
                 # Handle final completion
                 if chunk_choice.finish_reason in ["stop", "length"]:
+                    final_message = ChatCompletionMessage(role="assistant", content=current_text_buffer)
+                    self._last_llm_response = final_message
                     yield {
                         "internal": True,
                         "type": "message_complete",
                         "content": current_text_buffer,
                         "stop_reason": chunk_choice.finish_reason,
                         "message_id": current_message_id,
+                        "validated": self._handle_final_response(final_message) is not None,
                     }
-                    break
+                    # Keep reading: the chunk with the usage of the call comes after the last choice
 
         except Exception as e:
             if self.span:
@@ -442,6 +393,60 @@ class AgentTurnProcessor:
                     pass
             logger.debug("Finished streaming conversation turn.")
 
+    async def _stream_tool_calls(
+        self, tool_calls: List[Dict[str, Any]], message_id: Optional[str]
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Executes the tool calls of a streamed message, yielding an event for each call and each result."""
+        for tool_call in tool_calls:
+            logger.debug(
+                f"Executing tool '{tool_call['name']}' (ID: {tool_call['id']}) from stream "
+                f"with input: {tool_call['arguments']}"
+            )
+            yield {
+                "internal": True,
+                "type": "tool_complete",
+                "tool_id": tool_call["id"],
+                "name": tool_call["name"],
+                "arguments": tool_call["arguments"],
+                "message_id": message_id,
+            }
+
+        calls = [
+            SimpleNamespace(
+                id=tool_call["id"],
+                function=SimpleNamespace(name=tool_call["name"], arguments=tool_call["arguments"]),
+                type="function",
+            )
+            for tool_call in tool_calls
+        ]
+        error = "Error executing tool."
+        try:
+            results = await self._process_tool_calls(calls)  # type: ignore[arg-type]
+        except Exception as e:
+            results = []
+            error = str(e)
+        results_by_id = {result["tool_call_id"]: result for result in results}
+
+        for tool_call in tool_calls:
+            result = results_by_id.get(tool_call["id"])
+            if result:
+                yield {"role": "tool", "tool_call_id": tool_call["id"], "content": result.get("content")}
+                yield {
+                    "internal": True,
+                    "type": "tool_result",
+                    "tool_id": tool_call["id"],
+                    "result": result.get("content"),
+                    "status": "success",
+                }
+            else:
+                yield {
+                    "internal": True,
+                    "type": "tool_result",
+                    "tool_id": tool_call["id"],
+                    "error": error,
+                    "status": "error",
+                }
+
     async def _process_tool_calls(
         self, tool_calls: Optional[List[ChatCompletionMessageToolCall]]
     ) -> List[Dict[str, Any]]:
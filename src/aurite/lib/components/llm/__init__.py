@@ -1,5 +1,22 @@
-from .litellm_client import LiteLLMClient
+from typing import TYPE_CHECKING
+
+from ....utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .litellm_client import LiteLLMClient
+    from .usage import UsageTracker, track_usage
 
 __all__ = [
     "LiteLLMClient",
+    "UsageTracker",
+    "track_usage",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "LiteLLMClient": ".litellm_client",
+        "UsageTracker": ".usage",
+        "track_usage": ".usage",
+    },
+)
@@ -5,16 +5,19 @@ LLM Client for interacting with models via the LiteLLM library.
 import json
 import logging
 import os
+import time
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Union
 
-import litellm
 from openai import OpenAIError
 from openai.types.chat import (
     ChatCompletionChunk,
     ChatCompletionMessage,
 )
 
+from ....utils.latency import record_latency, timed
 from ...models.config.components import LLMConfig
+from .mock_provider import MOCK_PROVIDER, MockLLM
+from .usage import record_usage
 
 if TYPE_CHECKING:
     from langfuse.client import StatefulSpanClient, StatefulTraceClient
@@ -34,10 +37,16 @@ class LiteLLMClient:
             raise ValueError("LLM provider and model must be specified in the config.")
 
         self.config = config
-        litellm.drop_params = True  # Automatically drops unsupported params rather than throwing an error
+        # The mock provider answers locally, without LiteLLM or network access
+        self._mock = MockLLM(config) if config.provider == MOCK_PROVIDER else None
+        if self._mock is None:
+            # LiteLLM takes seconds to import, so it is loaded with the first client rather than with the module
+            import litellm
 
-        self.litellm_logger = logging.getLogger("LiteLLM")
-        self.litellm_logger.setLevel(logging.ERROR)
+            litellm.drop_params = True  # Automatically drops unsupported params rather than throwing an error
+
+            self.litellm_logger = logging.getLogger("LiteLLM")
+            self.litellm_logger.setLevel(logging.ERROR)
 
         # Handle provider-specific setup if necessary
         if self.config.provider == "gemini":
@@ -145,6 +154,14 @@ class LiteLLMClient:
 
         return request_params
 
+    async def _acompletion(self, **request_params: Any) -> Any:
+        if self._mock is not None:
+            return await self._mock.acompletion(**request_params)
+
+        import litellm
+
+        return await litellm.acompletion(**request_params)
+
     async def create_message(
         self,
         messages: List[Dict[str, Any]],
@@ -180,8 +197,10 @@ class LiteLLMClient:
                 logger.warning(f"Failed to create Langfuse generation: {e}")
 
         try:
-            completion: Any = await litellm.acompletion(**request_params)
+            with timed("llm_total", model=f"{self.config.provider}/{self.config.model}"):
+                completion: Any = await self._acompletion(**request_params)
             response_message = completion.choices[0].message
+            record_usage(completion, cost=0.0 if self._mock else None)
 
             # Update generation with output and usage if available
             if generation:
@@ -246,6 +265,8 @@ class LiteLLMClient:
     ) -> AsyncGenerator[ChatCompletionChunk, None]:
         request_params = self._build_request_params(messages, tools, system_prompt_override, schema)
         request_params["stream"] = True
+        # Streams only report usage when asked to; LiteLLM adds the usage chunk for every provider
+        request_params["stream_options"] = {"include_usage": True}
 
         logger.debug(f"Making LiteLLM streaming call with params: {request_params}")
 
@@ -273,7 +294,12 @@ class LiteLLMClient:
                 logger.warning(f"Failed to create Langfuse generation for streaming: {e}")
 
         try:
-            response_stream: Any = await litellm.acompletion(**request_params)
+            # Provider time only: the time the consumer spends on each chunk (e.g. running tools) is excluded
+            model = f"{self.config.provider}/{self.config.model}"
+            started_at = resumed_at = time.perf_counter()
+            provider_time = 0.0
+            first_chunk = True
+            response_stream: Any = await self._acompletion(**request_params)
 
             # Collect chunks for the final output
             collected_chunks = []
@@ -284,12 +310,18 @@ class LiteLLMClient:
             finish_reason = None
             model_name_from_response = None
             has_tool_calls_in_stream = False  # Track if this stream actually contains tool calls
+            usage_chunk = None
 
             async for chunk in response_stream:
+                provider_time += time.perf_counter() - resumed_at
+                if first_chunk:
+                    record_latency("llm_ttft", started_at, provider_time, model=model)
+                    first_chunk = False
                 collected_chunks.append(chunk)
                 # Count tokens if available
                 if hasattr(chunk, "usage") and chunk.usage:
                     total_tokens = chunk.usage.total_tokens
+                    usage_chunk = chunk
 
                 # Capture model name from response
                 if hasattr(chunk, "model") and chunk.model:
@@ -329,11 +361,18 @@ class LiteLLMClient:
                                     current_tool_call["function"]["arguments"] += tool_call_delta.function.arguments
 
                 yield chunk
+                resumed_at = time.perf_counter()
+
+            provider_time += time.perf_counter() - resumed_at
+            record_latency("llm_total", started_at, provider_time, model=model)
 
             # Add the last tool call if any
             if current_tool_call:
                 tool_calls.append(current_tool_call)
 
+            if usage_chunk is not None:
+                record_usage(usage_chunk, cost=0.0 if self._mock else None)
+
         except OpenAIError as e:
             logger.error(f"LiteLLM streaming call failed with specific error: {type(e).__name__}: {e}")
             raise  # Re-raise the specific, informative exception
@@ -386,8 +425,13 @@ class LiteLLMClient:
         Returns:
             (bool): True if valid to run, otherwise raises error
         """
+        if self._mock is not None:
+            return True
+
         messages = [{"role": "user", "content": "Hello"}]
         try:
+            import litellm
+
             litellm.completion(model=f"{self.config.provider}/{self.config.model}", messages=messages, max_tokens=10)
             return True
         except Exception:
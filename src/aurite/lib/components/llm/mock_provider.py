@@ -0,0 +1,232 @@
+"""
+A local, deterministic LLM provider for offline testing and benchmarking.
+
+LLM configs with `"provider": "mock"` are answered by MockLLM instead of a call
+through LiteLLM, so agents, workflows, QA evaluations and load tests run without
+network access and with reproducible timing. The model selects how replies are
+produced:
+
+- `echo`: repeats the last user message.
+- `scripted`: answers the n-th assistant turn of a conversation with the n-th
+  entry of `mock.responses` (the last entry once they run out). An entry is a
+  string, or an object with `content` and/or `tool_calls`, each tool call given
+  as `{"name": ..., "arguments": {...}}`.
+- any other name: `mock.response_tokens` words chosen by a random generator
+  seeded with `mock.seed` and the conversation, so the same input always gets
+  the same reply.
+
+Timing follows `mock.first_token_ms` (time until the first token) and
+`mock.tokens_per_second` (generation rate, unlimited if unset), with an
+optional seeded `mock.jitter` fraction. Streamed replies arrive in chunks of
+`mock.chunk_tokens` tokens. Token counts are estimated at four characters per
+token and reported as usage, like a provider's (for streams, only when
+`stream_options.include_usage` is set).
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+import time
+import uuid
+from typing import Any, AsyncGenerator, Dict, List, Literal, Optional, Union
+
+from openai.types.chat import (
+    ChatCompletion,
+    ChatCompletionChunk,
+    ChatCompletionMessage,
+    ChatCompletionMessageToolCallUnion,
+)
+from openai.types.chat.chat_completion import Choice
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice
+from openai.types.chat.chat_completion_chunk import ChoiceDelta, ChoiceDeltaToolCall, ChoiceDeltaToolCallFunction
+from openai.types.chat.chat_completion_message_tool_call import ChatCompletionMessageFunctionToolCall, Function
+from openai.types.completion_usage import CompletionUsage
+from pydantic import BaseModel, Field
+
+from ...models.config.components import LLMConfig
+
+MOCK_PROVIDER = "mock"
+
+FinishReason = Literal["stop", "length", "tool_calls", "content_filter", "function_call"]
+
+WORDS = (
+    "the agent checked the forecast and found clear skies with light wind so the plan stays on schedule "
+    "while the team reviews the results and prepares a short summary of the next steps for tomorrow"
+).split()
+
+
+class MockToolCall(BaseModel):
+    name: str
+    arguments: Dict[str, Any] = Field(default_factory=dict)
+
+
+class MockResponse(BaseModel):
+    content: Optional[str] = None
+    tool_calls: List[MockToolCall] = Field(default_factory=list)
+
+
+class MockLLMSettings(BaseModel):
+    """The `mock` object of an LLM config with `"provider": "mock"`."""
+
+    responses: List[Union[str, MockResponse]] = Field(default_factory=list)
+    seed: int = 0
+    response_tokens: int = Field(default=32, ge=1)
+    first_token_ms: float = Field(default=0.0, ge=0)
+    tokens_per_second: Optional[float] = Field(default=None, gt=0)
+    jitter: float = Field(default=0.0, ge=0, le=1)
+    chunk_tokens: int = Field(default=4, ge=1)
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / 4)
+
+
+class MockLLM:
+    """Answers chat completion requests locally, see the module docstring."""
+
+    def __init__(self, config: LLMConfig):
+        self.config = config
+        self.settings = MockLLMSettings.model_validate(getattr(config, "mock", None) or {})
+
+    def _conversation_seed(self, messages: List[Dict[str, Any]]) -> int:
+        digest = hashlib.sha256(json.dumps(messages, sort_keys=True, default=str).encode()).digest()
+        return self.settings.seed ^ int.from_bytes(digest[:8], "big")
+
+    def _reply(self, messages: List[Dict[str, Any]]) -> MockResponse:
+        if self.config.model == "echo":
+            user_messages = [m for m in messages if m.get("role") == "user"]
+            content = user_messages[-1].get("content") if user_messages else ""
+            return MockResponse(content=content if isinstance(content, str) else json.dumps(content))
+
+        if self.config.model == "scripted":
+            if not self.settings.responses:
+                raise ValueError("The scripted mock model needs at least one entry in mock.responses")
+            turn = sum(1 for m in messages if m.get("role") == "assistant")
+            reply = self.settings.responses[min(turn, len(self.settings.responses) - 1)]
+            return MockResponse(content=reply) if isinstance(reply, str) else reply
+
+        rng = random.Random(self._conversation_seed(messages))
+        return MockResponse(content=" ".join(rng.choice(WORDS) for _ in range(self.settings.response_tokens)))
+
+    def _delay(self, rng: random.Random, milliseconds: float) -> float:
+        if self.settings.jitter:
+            milliseconds *= 1 + rng.uniform(-self.settings.jitter, self.settings.jitter)
+        return max(0.0, milliseconds) / 1000
+
+    def _generation_time(self, rng: random.Random, tokens: int) -> float:
+        if not self.settings.tokens_per_second:
+            return 0.0
+        return self._delay(rng, tokens / self.settings.tokens_per_second * 1000)
+
+    def _usage(self, request_params: Dict[str, Any], reply: MockResponse) -> CompletionUsage:
+        prompt = json.dumps(request_params.get("messages", []), default=str)
+        if request_params.get("tools"):
+            prompt += json.dumps(request_params["tools"])
+        completion = (reply.content or "") + "".join(call.model_dump_json() for call in reply.tool_calls)
+        prompt_tokens = estimate_tokens(prompt)
+        completion_tokens = estimate_tokens(completion)
+        return CompletionUsage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
+
+    async def acompletion(
+        self, **request_params: Any
+    ) -> Union[ChatCompletion, AsyncGenerator[ChatCompletionChunk, None]]:
+        """Takes the parameters of `litellm.acompletion` and answers like it."""
+        messages = request_params.get("messages", [])
+        reply = self._reply(messages)
+        rng = random.Random(self._conversation_seed(messages) + 1)
+        if request_params.get("stream"):
+            return self._stream(request_params, reply, rng)
+
+        usage = self._usage(request_params, reply)
+        await asyncio.sleep(
+            self._delay(rng, self.settings.first_token_ms) + self._generation_time(rng, usage.completion_tokens)
+        )
+        tool_calls: List[ChatCompletionMessageToolCallUnion] = [
+            ChatCompletionMessageFunctionToolCall(
+                id=f"call_{uuid.uuid4().hex[:24]}",
+                type="function",
+                function=Function(name=call.name, arguments=json.dumps(call.arguments)),
+            )
+            for call in reply.tool_calls
+        ]
+        return ChatCompletion(
+            id=f"chatcmpl-mock-{uuid.uuid4().hex}",
+            object="chat.completion",
+            created=int(time.time()),
+            model=self.config.model,
+            choices=[
+                Choice(
+                    index=0,
+                    finish_reason="tool_calls" if tool_calls else "stop",
+                    message=ChatCompletionMessage(
+                        role="assistant", content=reply.content, tool_calls=tool_calls or None
+                    ),
+                )
+            ],
+            usage=usage,
+        )
+
+    async def _stream(
+        self, request_params: Dict[str, Any], reply: MockResponse, rng: random.Random
+    ) -> AsyncGenerator[ChatCompletionChunk, None]:
+        completion_id = f"chatcmpl-mock-{uuid.uuid4().hex}"
+        created = int(time.time())
+
+        def chunk(
+            delta: Optional[ChoiceDelta], finish_reason: Optional[FinishReason] = None, **extra: Any
+        ) -> ChatCompletionChunk:
+            choices = [ChunkChoice(index=0, delta=delta, finish_reason=finish_reason)] if delta is not None else []
+            return ChatCompletionChunk(
+                id=completion_id,
+                object="chat.completion.chunk",
+                created=created,
+                model=self.config.model,
+                choices=choices,
+                **extra,
+            )
+
+        await asyncio.sleep(self._delay(rng, self.settings.first_token_ms))
+        yield chunk(ChoiceDelta(role="assistant", content=""))
+
+        words = (reply.content or "").split(" ")
+        step = self.settings.chunk_tokens
+        for start in range(0, len(words) if reply.content else 0, step):
+            text = " ".join(words[start : start + step])
+            if start:
+                text = " " + text
+            await asyncio.sleep(self._generation_time(rng, estimate_tokens(text)))
+            yield chunk(ChoiceDelta(content=text))
+
+        for index, call in enumerate(reply.tool_calls):
+            arguments = json.dumps(call.arguments)
+            await asyncio.sleep(self._generation_time(rng, estimate_tokens(call.name + arguments)))
+            yield chunk(
+                ChoiceDelta(
+                    tool_calls=[
+                        ChoiceDeltaToolCall(
+                            index=index,
+                            id=f"call_{uuid.uuid4().hex[:24]}",
+                            type="function",
+                            function=ChoiceDeltaToolCallFunction(name=call.name, arguments=""),
+                        )
+                    ]
+                )
+            )
+            yield chunk(
+                ChoiceDelta(
+                    tool_calls=[
+                        ChoiceDeltaToolCall(index=index, function=ChoiceDeltaToolCallFunction(arguments=arguments))
+                    ]
+                )
+            )
+
+        yield chunk(ChoiceDelta(), finish_reason="tool_calls" if reply.tool_calls else "stop")
+        # Like OpenAI, usage comes in a final chunk without choices, and only if requested
+        if (request_params.get("stream_options") or {}).get("include_usage"):
+            yield chunk(None, usage=self._usage(request_params, reply))
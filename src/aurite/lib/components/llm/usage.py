@@ -0,0 +1,90 @@
+"""
+Token and cost accounting for LLM calls.
+
+Code that needs to know how much an operation spent (e.g. a graph workflow
+enforcing a token budget) wraps it in `track_usage()`. Every LLM call made by a
+LiteLLMClient inside that context, including calls made from asyncio tasks
+started within it, is added to the returned UsageTracker. Trackers nest: usage
+recorded in an inner context is also added to the enclosing one.
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class UsageTracker:
+    """Accumulated token usage and cost of the LLM calls made within a `track_usage()` context."""
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    cost: float = 0.0
+    calls: int = 0
+    parent: Optional["UsageTracker"] = None
+
+    def add(self, prompt_tokens: int, completion_tokens: int, total_tokens: int, cost: float):
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.total_tokens += total_tokens
+        self.cost += cost
+        self.calls += 1
+        if self.parent:
+            self.parent.add(prompt_tokens, completion_tokens, total_tokens, cost)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "cost": self.cost,
+            "calls": self.calls,
+        }
+
+
+_current_tracker: ContextVar[Optional[UsageTracker]] = ContextVar("aurite_llm_usage_tracker", default=None)
+
+
+@contextmanager
+def track_usage() -> Iterator[UsageTracker]:
+    """Collects the usage of all LLM calls made within the context."""
+    tracker = UsageTracker(parent=_current_tracker.get())
+    token = _current_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current_tracker.reset(token)
+
+
+def record_usage(response: Any, cost: Optional[float] = None):
+    """
+    Adds the usage reported in a LiteLLM completion (or final stream chunk) to the
+    active tracker. Does nothing if no `track_usage()` context is active. The cost is
+    looked up by LiteLLM unless given.
+    """
+    tracker = _current_tracker.get()
+    usage = getattr(response, "usage", None)
+    if tracker is None or not usage:
+        return
+
+    if cost is None:
+        import litellm
+
+        try:
+            cost = float(litellm.completion_cost(completion_response=response) or 0.0)
+        except Exception as e:
+            # Unknown models have no pricing information
+            logger.debug(f"Could not compute LLM call cost: {e}")
+            cost = 0.0
+
+    tracker.add(
+        prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+        completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
+        total_tokens=getattr(usage, "total_tokens", 0) or 0,
+        cost=cost,
+    )
@@ -1,7 +1,10 @@
-from .custom_workflow import CustomWorkflowExecutor
+from .checkpoint import WorkflowCheckpoint
+from .custom_workflow import CustomWorkflowCache, CustomWorkflowExecutor
 from .linear_workflow import LinearWorkflowExecutor
 
 __all__ = [
     "LinearWorkflowExecutor",
     "CustomWorkflowExecutor",
+    "CustomWorkflowCache",
+    "WorkflowCheckpoint",
 ]
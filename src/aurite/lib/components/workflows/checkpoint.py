@@ -0,0 +1,111 @@
+"""
+Per-step checkpoints for linear and graph workflows.
+
+After every completed step (or graph node) the executor records the step's
+input, output and their content hashes, and the checkpoint is persisted through
+the SessionManager. A later run of the same workflow under the same session ID
+with `resume=True` reuses the stored output of every step whose input hash is
+unchanged instead of executing it again.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from ...storage.sessions.session_manager import SessionManager
+
+logger = logging.getLogger(__name__)
+
+
+def to_jsonable(value: Any) -> Any:
+    """Converts pydantic models (e.g. nested workflow results) into JSON-compatible data."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return value
+
+
+def content_hash(value: Any) -> str:
+    """Stable SHA-256 hash of a step input or output."""
+    encoded = json.dumps(to_jsonable(value), sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class WorkflowCheckpoint:
+    """
+    The checkpoint of one workflow run, keyed by step (or node) id.
+    """
+
+    def __init__(
+        self,
+        session_manager: "SessionManager",
+        session_id: str,
+        workflow_name: str,
+        workflow_type: str,
+        resume: bool = False,
+    ):
+        """
+        Args:
+            session_manager: Used to persist the checkpoint after every step.
+            session_id: The workflow session the checkpoint belongs to.
+            workflow_name: The name of the workflow.
+            workflow_type: "linear_workflow" or "graph_workflow".
+            resume: Load the steps completed by a previous run of this session.
+                Otherwise the run starts from an empty checkpoint.
+        """
+        self._session_manager = session_manager
+        self.session_id = session_id
+        self.workflow_name = workflow_name
+        self.workflow_type = workflow_type
+        self.steps: Dict[str, Dict[str, Any]] = {}
+
+        if resume:
+            existing = session_manager.get_workflow_checkpoint(session_id, workflow_name)
+            if existing and existing.get("workflow_type") == workflow_type:
+                self.steps = dict(existing.get("steps", {}))
+                logger.info(
+                    f"Resuming workflow '{workflow_name}' (session {session_id}) with {len(self.steps)} completed steps"
+                )
+
+    def lookup(self, step_id: str, step_input: Any) -> Optional[Dict[str, Any]]:
+        """
+        Returns the recorded entry of a completed step if it ran with the same input,
+        otherwise None. The entry holds the step's `output` and `output_text`.
+        """
+        entry = self.steps.get(step_id)
+        if entry and entry.get("input_hash") == content_hash(step_input):
+            return entry
+        return None
+
+    def record(self, step_id: str, step_input: Any, output: Any, output_text: Any):
+        """
+        Records a completed step and persists the checkpoint.
+
+        Args:
+            step_id: The step (or node) id.
+            step_input: The input the step ran with.
+            output: The full step result.
+            output_text: The value passed on to the following step(s).
+        """
+        output = to_jsonable(output)
+        self.steps[step_id] = {
+            "input": to_jsonable(step_input),
+            "input_hash": content_hash(step_input),
+            "output": output,
+            "output_text": to_jsonable(output_text),
+            "output_hash": content_hash(output),
+            "completed_at": datetime.utcnow().isoformat(),
+        }
+        self._session_manager.save_workflow_checkpoint(self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "workflow_name": self.workflow_name,
+            "workflow_type": self.workflow_type,
+            "steps": self.steps,
+        }
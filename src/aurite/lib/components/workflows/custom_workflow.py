@@ -5,7 +5,10 @@ Executor for Custom Python-based Workflows.
 import importlib.util
 import inspect
 import logging
-from typing import TYPE_CHECKING, Any, Optional  # Added Optional
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple  # Added Optional
 
 # Relative imports assuming this file is in src/workflows/
 from ...models.config.components import CustomWorkflowConfig  # Updated import path
@@ -28,12 +31,14 @@ class CustomWorkflowExecutor:
     """
 
     # Removed host_instance from __init__ as it's passed via engine in execute
-    def __init__(self, config: CustomWorkflowConfig):
+    def __init__(self, config: CustomWorkflowConfig, workflow_instance: Optional[Any] = None):
         """
         Initializes the CustomWorkflowExecutor.
 
         Args:
             config: The configuration for the specific custom workflow to execute.
+            workflow_instance: An already loaded instance of the workflow class (e.g. from a
+                CustomWorkflowCache). If omitted, the module is imported and the class instantiated.
         """
         if not isinstance(config, CustomWorkflowConfig):
             raise TypeError("config must be an instance of CustomWorkflowConfig")
@@ -60,7 +65,7 @@ class CustomWorkflowExecutor:
             },
         ]
 
-        self.workflow_instance, self.methods = self._load_methods(methods_to_load)
+        self.workflow_instance, self.methods = self._load_methods(methods_to_load, workflow_instance)
 
     # Changed signature to accept executor (AuriteEngine) and session_id
     async def execute(
@@ -149,12 +154,13 @@ class CustomWorkflowExecutor:
 
         return None
 
-    def _load_methods(self, methods_to_load):
+    def _load_methods(self, methods_to_load, workflow_instance: Optional[Any] = None):
         """
         Dynamically loads the methods
 
         Args:
             methods_to_load: List of method objects with "name", "is_async", and "optional" attributes
+            workflow_instance: Instance to bind the methods from. Loaded from the module if omitted.
 
         Raises:
             FileNotFoundError: If the configured module path does not exist.
@@ -171,39 +177,8 @@ class CustomWorkflowExecutor:
         logger.debug(f"Config: path={module_path}, class={class_name}")  # Already DEBUG
 
         try:
-            # 1. Security Check & Path Validation
-            # The PROJECT_ROOT_DIR check is removed.
-            # module_path is expected to be an absolute path, validated by ProjectManager/Aurite
-            # against current_project_root before this executor is called.
-
-            if not module_path.exists():
-                logger.error(f"Custom workflow module file not found: {module_path}")
-                raise FileNotFoundError(f"Custom workflow module file not found: {module_path}")
-
-            # 2. Dynamic Import
-            spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
-            if spec is None or spec.loader is None:
-                raise ImportError(f"Could not create module spec for {module_path}")
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            logger.debug(f"Dynamically imported module: {module_path}")  # Already DEBUG
-
-            # 3. Get Class
-            WorkflowClass = getattr(module, class_name, None)
-            if WorkflowClass is None:
-                logger.error(f"Class '{class_name}' not found in module {module_path}")
-                raise AttributeError(f"Class '{class_name}' not found in module {module_path}")
-
-            # 4. Instantiate Workflow Class
-            try:
-                workflow_instance = WorkflowClass()
-                logger.debug(f"Instantiated workflow class '{class_name}'")  # Already DEBUG
-            except Exception as init_err:
-                logger.error(
-                    f"Error instantiating workflow class '{class_name}' from {module_path}: {init_err}",
-                    exc_info=True,
-                )
-                raise TypeError(f"Failed to instantiate workflow class '{class_name}': {init_err}") from init_err
+            if workflow_instance is None:
+                workflow_instance = instantiate_workflow_class(self.config, load_workflow_class(self.config))
 
             loaded_methods = {}
             for method in methods_to_load:
@@ -266,3 +241,121 @@ class CustomWorkflowExecutor:
             raise RuntimeError(
                 f"Exception raised while loading methods for custom workflow '{workflow_name}': {e}"
             ) from e
+
+
+def load_workflow_class(config: CustomWorkflowConfig) -> type:
+    """
+    Imports the module of a custom workflow and returns its workflow class.
+
+    Raises:
+        FileNotFoundError: If the configured module path does not exist.
+        ImportError: If the module cannot be imported.
+        AttributeError: If the specified class is not found.
+    """
+    module_path = config.module_path
+    class_name = config.class_name
+
+    # 1. Security Check & Path Validation
+    # The PROJECT_ROOT_DIR check is removed.
+    # module_path is expected to be an absolute path, validated by ProjectManager/Aurite
+    # against current_project_root before this executor is called.
+
+    if not module_path.exists():
+        logger.error(f"Custom workflow module file not found: {module_path}")
+        raise FileNotFoundError(f"Custom workflow module file not found: {module_path}")
+
+    # 2. Dynamic Import
+    spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not create module spec for {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    logger.debug(f"Dynamically imported module: {module_path}")  # Already DEBUG
+
+    # 3. Get Class
+    WorkflowClass = getattr(module, class_name, None)
+    if WorkflowClass is None:
+        logger.error(f"Class '{class_name}' not found in module {module_path}")
+        raise AttributeError(f"Class '{class_name}' not found in module {module_path}")
+
+    return WorkflowClass
+
+
+def instantiate_workflow_class(config: CustomWorkflowConfig, WorkflowClass: type) -> Any:
+    """
+    Instantiates a custom workflow class.
+
+    Raises:
+        TypeError: If class instantiation fails.
+    """
+    # 4. Instantiate Workflow Class
+    try:
+        workflow_instance = WorkflowClass()
+        logger.debug(f"Instantiated workflow class '{config.class_name}'")  # Already DEBUG
+        return workflow_instance
+    except Exception as init_err:
+        logger.error(
+            f"Error instantiating workflow class '{config.class_name}' from {config.module_path}: {init_err}",
+            exc_info=True,
+        )
+        raise TypeError(f"Failed to instantiate workflow class '{config.class_name}': {init_err}") from init_err
+
+
+@dataclass
+class _CachedWorkflow:
+    workflow_class: type
+    fingerprint: Tuple[int, int]
+    instance: Optional[Any] = None
+
+
+class CustomWorkflowCache:
+    """
+    Caches loaded custom workflow classes so that running a custom workflow does not
+    re-execute its module (and all of its imports) every time.
+
+    Entries are keyed by (module_path, class_name) and validated against the module
+    file's modification time and size on every lookup. Editing the file therefore
+    reloads it on the next run (hot reload). Workflows configured with
+    `reuse_instance` also keep a single, long-lived instance of their class.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[Path, str], _CachedWorkflow] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_executor(self, config: CustomWorkflowConfig) -> CustomWorkflowExecutor:
+        """Returns an executor for the workflow, importing its module only if it is new or changed."""
+        key = (config.module_path, config.class_name)
+        try:
+            stat = os.stat(config.module_path)
+        except FileNotFoundError:
+            self._entries.pop(key, None)
+            logger.error(f"Custom workflow module file not found: {config.module_path}")
+            raise FileNotFoundError(f"Custom workflow module file not found: {config.module_path}") from None
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._entries.get(key)
+        if entry is None or entry.fingerprint != fingerprint:
+            if entry is not None:
+                logger.info(f"Custom workflow module changed, reloading: {config.module_path}")
+            entry = _CachedWorkflow(workflow_class=load_workflow_class(config), fingerprint=fingerprint)
+            self._entries[key] = entry
+
+        if config.reuse_instance:
+            if entry.instance is None:
+                entry.instance = instantiate_workflow_class(config, entry.workflow_class)
+            workflow_instance = entry.instance
+        else:
+            workflow_instance = instantiate_workflow_class(config, entry.workflow_class)
+
+        return CustomWorkflowExecutor(config=config, workflow_instance=workflow_instance)
+
+    def invalidate(self, module_path: Optional[Path] = None):
+        """Drops cached workflows, either all of them or those loaded from `module_path`."""
+        if module_path is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == module_path]:
+            del self._entries[key]
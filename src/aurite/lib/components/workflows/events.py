@@ -0,0 +1,65 @@
+"""
+Execution events for streaming linear and graph workflows.
+
+`AuriteEngine.stream_linear_workflow` and `stream_graph_workflow` run the
+workflow inside `event_sink()`. While a sink is active, the executors emit
+step/node start and end events, and agents run through their streaming path so
+their token deltas and tool calls are forwarded as well. Every event carries the
+`node_id` of the step that produced it; steps of nested workflows are prefixed
+with their parent's id (e.g. `"1-ingest/0-fetch"`). Without a sink, `emit` is a
+no-op and workflows run exactly as before.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+EventSink = Callable[[Dict[str, Any]], None]
+
+_event_sink: ContextVar[Optional[EventSink]] = ContextVar("aurite_workflow_event_sink", default=None)
+_current_node: ContextVar[Optional[str]] = ContextVar("aurite_workflow_node", default=None)
+
+
+@contextmanager
+def event_sink(sink: EventSink) -> Iterator[None]:
+    """Sends the events emitted within the context (and by tasks started in it) to `sink`."""
+    token = _event_sink.set(sink)
+    try:
+        yield
+    finally:
+        _event_sink.reset(token)
+
+
+def is_streaming() -> bool:
+    return _event_sink.get() is not None
+
+
+def _qualify(node_id: str) -> str:
+    parent = _current_node.get()
+    return f"{parent}/{node_id}" if parent else node_id
+
+
+@contextmanager
+def node_scope(node_id: str) -> Iterator[None]:
+    """Tags the events emitted within the context with `node_id`."""
+    token = _current_node.set(_qualify(node_id))
+    try:
+        yield
+    finally:
+        _current_node.reset(token)
+
+
+def emit(event_type: str, data: Dict[str, Any], node_id: Optional[str] = None):
+    """
+    Sends an event to the active sink, if any. The event is tagged with the current
+    node, or with `node_id` (relative to the current node) when given.
+    """
+    sink = _event_sink.get()
+    if sink is None:
+        return
+    sink({"type": event_type, "data": data, "node_id": _qualify(node_id) if node_id else _current_node.get()})
+
+
+def forward(event: Dict[str, Any]):
+    """Sends an agent stream event to the active sink, tagged with the current node."""
+    emit(event["type"], event.get("data", {}))
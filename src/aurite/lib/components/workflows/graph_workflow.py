@@ -3,9 +3,11 @@ Executor for Graph Workflows with parallel node execution.
 """
 
 import asyncio
+import heapq
 import json
 import logging
 import uuid
+from collections import Counter
 from typing import TYPE_CHECKING, Optional
 
 import networkx as nx
@@ -13,7 +15,11 @@ import networkx as nx
 from ...models.api.responses import AgentRunResult, GraphWorkflowExecutionResult, GraphWorkflowNodeResult
 
 # Relative imports assuming this file is in src/workflows/
-from ...models.config.components import GraphWorkflowConfig
+from ...models.config.components import GraphWorkflowConfig, GraphWorkflowNode
+from ..llm.usage import UsageTracker, track_usage
+from . import events as workflow_events
+from .checkpoint import WorkflowCheckpoint, to_jsonable
+from .memoization import lookup_step_result, store_step_result
 
 # Import LLM client and Facade for type hinting only
 if TYPE_CHECKING:
@@ -79,20 +85,42 @@ class GraphWorkflowExecutor:
         if not nx.is_directed_acyclic_graph(self.graph):
             raise ValueError("Graph workflow is not acyclic")
 
+        for node_type, limit in (self.config.max_parallel_per_type or {}).items():
+            if limit < 1:
+                raise ValueError(f"max_parallel_per_type for '{node_type}' must be at least 1")
+
+        # Scheduling order: longest path (in nodes) from each node to a sink, and topological position
+        topological_order = list(nx.topological_sort(self.graph))
+        self._order = {node_id: index for index, node_id in enumerate(topological_order)}
+        self._critical_path: dict[str, int] = {}
+        for node_id in reversed(topological_order):
+            self._critical_path[node_id] = 1 + max(
+                (self._critical_path[successor] for successor in self.graph.successors(node_id)), default=0
+            )
+
     async def execute(
         self,
         initial_input: str,
         session_id: Optional[str] = None,
         base_session_id: Optional[str] = None,
         force_logging: Optional[bool] = None,
+        checkpoint: Optional[WorkflowCheckpoint] = None,
     ) -> GraphWorkflowExecutionResult:
         """
         Executes the configured graph workflow.
 
+        Nodes start as soon as all of their predecessors have completed, subject to the
+        workflow's `max_parallel` and `max_parallel_per_type` limits. When more nodes are
+        ready than may run, the ones with the highest `priority`, then the longest path
+        to the end of the graph (the critical path), start first. If a token or cost
+        budget is configured and exceeded, running nodes are cancelled and the workflow fails.
+        Nodes recorded in the checkpoint with an unchanged input are not run again.
+
         Args:
             initial_input: The initial input message for the initial node(s).
             session_id: Optional session ID to use for conversation history tracking.
             base_session_id: The original, user-provided session ID for the workflow.
+            checkpoint: Optional checkpoint to record each completed node in.
 
         Returns:
             A GraphWorkflowExecutionResult object containing the final status,
@@ -106,142 +134,195 @@ class GraphWorkflowExecutor:
 
         logger.info(f"Executing graph workflow: '{workflow_name}' with session_id: {session_id}")
 
-        try:
-            # Store full_node_results for detailed node_results in output, and simple_node_results for passing to agents and creating final output
-            full_node_results: dict[str, GraphWorkflowNodeResult] = {}
-            simple_node_results: dict[str, str] = {}
-
-            # Create a mapping from node_id to node config for easy lookup
-            node_config_map = {node.node_id: node for node in self.config.nodes}
-
-            # Track which nodes are ready to execute (all predecessors completed)
-            completed_nodes = set()
-            running_tasks = {}  # node_id -> asyncio.Task
-
-            # Find all nodes with in degree 0 and start them as asyncio tasks
-            start_nodes = [node_id for node_id in self.graph.nodes if self.graph.in_degree[node_id] == 0]
-
-            if not start_nodes:
-                raise ValueError("Graph workflow has no start nodes (nodes with in-degree 0)")
-
-            logger.debug(f"Starting execution of {len(start_nodes)} initial nodes: {start_nodes}")
-
-            # Start initial nodes
-            for node_id in start_nodes:
-                node_config = node_config_map[node_id]
-                task = asyncio.create_task(
-                    self._execute_node(node_config, initial_input, session_id, base_session_id, force_logging)
+        # Store full_node_results for detailed node_results in output, and simple_node_results for passing to agents and creating final output
+        full_node_results: dict[str, GraphWorkflowNodeResult] = {}
+        simple_node_results: dict[str, str] = {}
+
+        with track_usage() as usage:
+
+            def _failed(error: str) -> GraphWorkflowExecutionResult:
+                return GraphWorkflowExecutionResult(
+                    workflow_name=workflow_name,
+                    status="failed",
+                    node_results=full_node_results,
+                    final_output=None,
+                    error=error,
+                    session_id=session_id,
+                    usage=usage.to_dict(),
                 )
-                running_tasks[node_id] = task
-
-            # Process nodes as they complete
-            while running_tasks or len(completed_nodes) < len(self.graph.nodes):
-                if not running_tasks:
-                    # No tasks running but not all nodes completed - this shouldn't happen in a valid DAG
-                    remaining_nodes = set(self.graph.nodes) - completed_nodes
-                    raise ValueError(f"Workflow execution stalled. Remaining nodes: {remaining_nodes}")
-
-                # Wait for at least one task to complete
-                done, pending = await asyncio.wait(running_tasks.values(), return_when=asyncio.FIRST_COMPLETED)
-
-                # Process completed tasks
-                for task in done:
-                    # Find which node this task belongs to
-                    completed_node_id = None
-                    for node_id, node_task in running_tasks.items():
-                        if node_task == task:
-                            completed_node_id = node_id
+
+            running_tasks: dict[asyncio.Task, str] = {}  # task -> node_id
+            try:
+                # Create a mapping from node_id to node config for easy lookup
+                node_config_map = {node.node_id: node for node in self.config.nodes}
+
+                # A node is ready once its count of unfinished predecessors drops to 0
+                remaining_predecessors = {node_id: self.graph.in_degree[node_id] for node_id in self.graph.nodes}
+                ready: list[tuple[tuple[int, int, int], str]] = []
+                running_per_type: Counter = Counter()
+                max_parallel = self.config.max_parallel
+                max_parallel_per_type = self.config.max_parallel_per_type or {}
+                node_inputs: dict[str, str] = {}
+
+                def _complete(node_id: str, full_result: dict, str_result: str, cache_hit: Optional[bool] = None):
+                    node_config = node_config_map[node_id]
+                    full_node_results[node_id] = GraphWorkflowNodeResult(
+                        name=node_config.name, type=node_config.type, result=full_result, cache_hit=cache_hit
+                    )
+                    simple_node_results[node_id] = str_result
+
+                    # Check if this completion enables any new nodes to run
+                    for successor_node_id in self.graph.successors(node_id):
+                        remaining_predecessors[successor_node_id] -= 1
+                        if remaining_predecessors[successor_node_id] == 0:
+                            successor_config = node_config_map[successor_node_id]
+                            heapq.heappush(ready, (self._schedule_key(successor_config), successor_node_id))
+
+                # Find all nodes with in degree 0 and start them as asyncio tasks
+                start_nodes = [node_id for node_id in self.graph.nodes if remaining_predecessors[node_id] == 0]
+
+                if not start_nodes:
+                    raise ValueError("Graph workflow has no start nodes (nodes with in-degree 0)")
+
+                logger.debug(f"Starting execution of {len(start_nodes)} initial nodes: {start_nodes}")
+                for node_id in start_nodes:
+                    heapq.heappush(ready, (self._schedule_key(node_config_map[node_id]), node_id))
+
+                while ready or running_tasks:
+                    # Start as many ready nodes as the concurrency limits allow
+                    deferred = []
+                    while ready and (max_parallel is None or len(running_tasks) < max_parallel):
+                        entry = heapq.heappop(ready)
+                        node_id = entry[1]
+                        node_config = node_config_map[node_id]
+
+                        predecessors = list(self.graph.predecessors(node_id))
+                        if predecessors:
+                            node_input = json.dumps({pred: simple_node_results[pred] for pred in predecessors})
+                        else:
+                            node_input = initial_input
+                        restored = checkpoint.lookup(node_id, node_input) if checkpoint else None
+                        if restored:
+                            logger.info(f"Node '{node_id}' unchanged since the checkpoint, reusing its output")
+                            _complete(node_id, restored["output"], restored["output_text"])
+                            workflow_events.emit(
+                                "workflow_step_end",
+                                {"name": node_config.name, "status": "completed", "restored": True},
+                                node_id=node_id,
+                            )
+                            continue
+
+                        type_limit = max_parallel_per_type.get(node_config.type)
+                        if type_limit is not None and running_per_type[node_config.type] >= type_limit:
+                            deferred.append(entry)
+                            continue
+
+                        if predecessors:
+                            logger.info(f"Started node '{node_id}' with input from predecessors: {predecessors}")
+                        node_inputs[node_id] = node_input
+                        workflow_events.emit(
+                            "workflow_step_start", {"name": node_config.name, "type": node_config.type}, node_id=node_id
+                        )
+                        task = asyncio.create_task(
+                            self._execute_node(node_config, node_input, session_id, base_session_id, force_logging)
+                        )
+                        running_tasks[task] = node_id
+                        running_per_type[node_config.type] += 1
+                    for entry in deferred:
+                        heapq.heappush(ready, entry)
+
+                    if not running_tasks:
+                        if not ready:
+                            # Every remaining node was restored from the checkpoint
                             break
+                        # Ready nodes exist but none could start - this shouldn't happen with valid limits
+                        remaining_nodes = set(self.graph.nodes) - set(simple_node_results)
+                        raise ValueError(f"Workflow execution stalled. Remaining nodes: {remaining_nodes}")
 
-                    if completed_node_id is None:
-                        raise RuntimeError("Could not identify completed task")
+                    # Wait for at least one task to complete
+                    done, _ = await asyncio.wait(running_tasks.keys(), return_when=asyncio.FIRST_COMPLETED)
 
-                    # Get the result and handle any exceptions
-                    try:
-                        full_result, str_result = await task
+                    # Process completed tasks
+                    for task in done:
+                        completed_node_id = running_tasks.pop(task)
                         node_config = node_config_map[completed_node_id]
-
-                        # Store the result
-                        full_node_results[completed_node_id] = GraphWorkflowNodeResult(
-                            name=node_config.name, type=node_config.type, result=full_result
-                        )
-                        simple_node_results[completed_node_id] = str_result
-
-                        completed_nodes.add(completed_node_id)
-                        del running_tasks[completed_node_id]
+                        running_per_type[node_config.type] -= 1
+
+                        # Get the result and handle any exceptions
+                        try:
+                            full_result, str_result, cache_hit = task.result()
+                        except Exception as e:
+                            logger.error(f"Node '{completed_node_id}' failed with error: {e}")
+                            workflow_events.emit(
+                                "workflow_step_end",
+                                {"name": node_config.name, "status": "failed", "error": str(e)},
+                                node_id=completed_node_id,
+                            )
+                            # Clean up remaining tasks
+                            await self._cancel_tasks(running_tasks)
+                            return _failed(f"Node '{completed_node_id}' failed: {str(e)}")
 
                         logger.debug(f"Node '{completed_node_id}' completed successfully")
-
-                        # Check if this completion enables any new nodes to run
-                        for successor_node_id in self.graph.successors(completed_node_id):
-                            if successor_node_id not in completed_nodes and successor_node_id not in running_tasks:
-                                # Check if all predecessors of this successor are completed
-                                predecessors = list(self.graph.predecessors(successor_node_id))
-                                if all(pred in completed_nodes for pred in predecessors):
-                                    # All predecessors completed, we can start this node
-
-                                    pred_dict = {node_id: simple_node_results[node_id] for node_id in predecessors}
-
-                                    # Start the successor node
-                                    successor_config = node_config_map[successor_node_id]
-                                    task = asyncio.create_task(
-                                        self._execute_node(
-                                            successor_config,
-                                            json.dumps(pred_dict),
-                                            session_id,
-                                            base_session_id,
-                                            force_logging,
-                                        )
-                                    )
-                                    running_tasks[successor_node_id] = task
-                                    logger.info(
-                                        f"Started node '{successor_node_id}' with input from predecessors: {predecessors}"
-                                    )
-
-                    except Exception as e:
-                        logger.error(f"Node '{completed_node_id}' failed with error: {e}")
-                        # Clean up remaining tasks
-                        for remaining_task in running_tasks.values():
-                            remaining_task.cancel()
-
-                        return GraphWorkflowExecutionResult(
-                            workflow_name=workflow_name,
-                            status="failed",
-                            node_results=full_node_results,
-                            final_output=None,
-                            error=f"Node '{completed_node_id}' failed: {str(e)}",
-                            session_id=session_id,
+                        if checkpoint:
+                            checkpoint.record(
+                                completed_node_id, node_inputs.pop(completed_node_id), full_result, str_result
+                            )
+                        _complete(completed_node_id, full_result, str_result, cache_hit)
+                        workflow_events.emit(
+                            "workflow_step_end",
+                            {"name": node_config.name, "status": "completed", "cache_hit": cache_hit},
+                            node_id=completed_node_id,
                         )
 
-            # All nodes completed successfully
-            # Find final output nodes (nodes with out-degree 0) and combine their results
-            final_outputs = {
-                node_id: simple_node_results[node_id]
-                for node_id in self.graph.nodes
-                if self.graph.out_degree[node_id] == 0
-            }
-
-            logger.info(f"Graph workflow '{workflow_name}' completed successfully")
-
-            return GraphWorkflowExecutionResult(
-                workflow_name=workflow_name,
-                status="completed",
-                node_results=full_node_results,
-                final_output=final_outputs,
-                error=None,
-                session_id=session_id,
-            )
+                    budget_error = self._check_budget(usage)
+                    if budget_error:
+                        logger.warning(f"Graph workflow '{workflow_name}' stopped early: {budget_error}")
+                        await self._cancel_tasks(running_tasks)
+                        return _failed(budget_error)
+
+                # All nodes completed successfully
+                # Find final output nodes (nodes with out-degree 0) and combine their results
+                final_outputs = {
+                    node_id: simple_node_results[node_id]
+                    for node_id in self.graph.nodes
+                    if self.graph.out_degree[node_id] == 0
+                }
+
+                logger.info(f"Graph workflow '{workflow_name}' completed successfully")
+
+                return GraphWorkflowExecutionResult(
+                    workflow_name=workflow_name,
+                    status="completed",
+                    node_results=full_node_results,
+                    final_output=final_outputs,
+                    error=None,
+                    session_id=session_id,
+                    usage=usage.to_dict(),
+                )
 
-        except Exception as e:
-            logger.error(f"Error within graph workflow execution: {e}")
-            return GraphWorkflowExecutionResult(
-                workflow_name=workflow_name,
-                status="failed",
-                node_results=full_node_results,
-                final_output=None,
-                error=f"Workflow setup error: {str(e)}",
-                session_id=session_id,
-            )
+            except Exception as e:
+                logger.error(f"Error within graph workflow execution: {e}")
+                await self._cancel_tasks(running_tasks)
+                return _failed(f"Workflow setup error: {str(e)}")
+
+    def _schedule_key(self, node_config: GraphWorkflowNode) -> tuple[int, int, int]:
+        """Heap key for a ready node: highest priority first, then longest path to the end, then graph order."""
+        return (-node_config.priority, -self._critical_path[node_config.node_id], self._order[node_config.node_id])
+
+    def _check_budget(self, usage: UsageTracker) -> Optional[str]:
+        """Returns an error message if the run has exceeded its token or cost budget."""
+        if self.config.max_total_tokens is not None and usage.total_tokens > self.config.max_total_tokens:
+            return f"Token budget exceeded: used {usage.total_tokens} of {self.config.max_total_tokens} tokens"
+        if self.config.max_cost is not None and usage.cost > self.config.max_cost:
+            return f"Cost budget exceeded: used ${usage.cost:.4f} of ${self.config.max_cost:.4f}"
+        return None
+
+    @staticmethod
+    async def _cancel_tasks(running_tasks: dict[asyncio.Task, str]):
+        for task in running_tasks:
+            task.cancel()
+        await asyncio.gather(*running_tasks, return_exceptions=True)
+        running_tasks.clear()
 
     async def _execute_node(
         self,
@@ -250,7 +331,7 @@ class GraphWorkflowExecutor:
         session_id: Optional[str],
         base_session_id: Optional[str],
         force_logging: Optional[bool],
-    ) -> tuple[dict, str]:
+    ) -> tuple[dict, str, Optional[bool]]:
         """
         Execute a single node in the graph workflow.
 
@@ -262,37 +343,51 @@ class GraphWorkflowExecutor:
             force_logging: Whether to force logging
 
         Returns:
-            (dict, str) A tuple of the full output from the node execution and the final string output
+            (dict, str, bool | None) A tuple of the full output from the node execution, the final string
+            output, and for memoized nodes whether the result came from the step result cache
         """
         logger.info(f"Executing node '{node_config.node_id}' ({node_config.name}) with input: {input_text[:200]}...")
 
-        try:
-            if node_config.type == "agent":
-                # Execute the agent using the engine
-                agent_result: AgentRunResult = await self.engine.run_agent(
-                    agent_name=node_config.name,
-                    user_message=input_text,
-                    session_id=f"{session_id}-{node_config.node_id}" if session_id else None,
-                    force_include_history=self.config.include_history,
-                    base_session_id=base_session_id,
-                    force_logging=force_logging,
-                )
-
-                # Check if the agent execution was successful
-                if agent_result.status != "success":
-                    error_detail = agent_result.error_message or f"Agent finished with status: {agent_result.status}"
-                    raise Exception(f"Agent '{node_config.name}' failed: {error_detail}")
+        with workflow_events.node_scope(node_config.node_id):
+            try:
+                if node_config.type == "agent":
+                    cache_key = None
+                    if node_config.memoize:
+                        cache_key, cached = lookup_step_result(self.engine, node_config.name, input_text)
+                        if cached:
+                            return cached["output"], cached["output_text"], True
+
+                    # Execute the agent using the engine
+                    agent_result: AgentRunResult = await self.engine.run_agent(
+                        agent_name=node_config.name,
+                        user_message=input_text,
+                        session_id=f"{session_id}-{node_config.node_id}" if session_id else None,
+                        force_include_history=self.config.include_history,
+                        base_session_id=base_session_id,
+                        force_logging=force_logging,
+                    )
+
+                    # Check if the agent execution was successful
+                    if agent_result.status != "success":
+                        error_detail = (
+                            agent_result.error_message or f"Agent finished with status: {agent_result.status}"
+                        )
+                        raise Exception(f"Agent '{node_config.name}' failed: {error_detail}")
 
-                if agent_result.final_response is None:
-                    raise Exception(f"Agent '{node_config.name}' succeeded but produced no response.")
+                    if agent_result.final_response is None:
+                        raise Exception(f"Agent '{node_config.name}' succeeded but produced no response.")
 
-                # Return the text content from the agent's response
-                return agent_result.model_dump(), (agent_result.final_response.content or "")
+                    # Return the text content from the agent's response
+                    str_result = agent_result.final_response.content or ""
+                    if cache_key:
+                        store_step_result(self.engine, node_config, cache_key, to_jsonable(agent_result), str_result)
+                        return agent_result.model_dump(), str_result, False
+                    return agent_result.model_dump(), str_result, None
 
-            else:
-                # For future extension - other node types like workflows
-                raise ValueError(f"Unsupported node type: {node_config.type}")
+                else:
+                    # For future extension - other node types like workflows
+                    raise ValueError(f"Unsupported node type: {node_config.type}")
 
-        except Exception as e:
-            logger.error(f"Error executing node '{node_config.node_id}': {e}")
-            raise
+            except Exception as e:
+                logger.error(f"Error executing node '{node_config.node_id}': {e}")
+                raise
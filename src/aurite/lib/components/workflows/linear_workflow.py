@@ -2,6 +2,7 @@
 Executor for Linear Sequential Workflows.
 """
 
+import asyncio
 import json
 import logging
 import uuid
@@ -14,7 +15,10 @@ from ....utils.errors import ConfigurationError
 from ...models.api.responses import AgentRunResult, LinearWorkflowExecutionResult, LinearWorkflowStepResult
 
 # Relative imports assuming this file is in src/workflows/
-from ...models.config.components import WorkflowComponent, WorkflowConfig
+from ...models.config.components import WorkflowComponent, WorkflowConfig, WorkflowParallelGroup
+from . import events as workflow_events
+from .checkpoint import WorkflowCheckpoint, to_jsonable
+from .memoization import lookup_step_result, store_step_result
 
 # Import LLM client and Facade for type hinting only
 if TYPE_CHECKING:
@@ -60,14 +64,18 @@ class LinearWorkflowExecutor:
         session_id: Optional[str] = None,
         base_session_id: Optional[str] = None,
         force_logging: Optional[bool] = None,
+        checkpoint: Optional[WorkflowCheckpoint] = None,
     ) -> LinearWorkflowExecutionResult:
         """
-        Executes the configured linear workflow sequentially.
+        Executes the configured linear workflow sequentially. The components of a parallel
+        group run concurrently and their merged outputs are passed on as one step.
 
         Args:
             initial_input: The initial input message for the first agent in the sequence.
             session_id: Optional session ID to use for conversation history tracking.
             base_session_id: The original, user-provided session ID for the workflow.
+            checkpoint: Optional checkpoint to record each completed step in. Steps already
+                recorded in it with an unchanged input are skipped and their output reused.
 
         Returns:
             A LinearWorkflowExecutionResult object containing the final status,
@@ -85,101 +93,96 @@ class LinearWorkflowExecutor:
         current_message: Any = initial_input
 
         try:
-            # Ensure all steps are WorkflowComponent objects
-            processed_workflow: list[WorkflowComponent] = []
+            # Ensure all steps are WorkflowComponent objects or parallel groups of them
+            processed_workflow: list[WorkflowComponent | WorkflowParallelGroup] = []
             for step in self.config.steps:
-                if isinstance(step, str):
+                if isinstance(step, WorkflowParallelGroup):
                     processed_workflow.append(
-                        WorkflowComponent(
-                            name=step,
-                            type=self._infer_component_type(component_name=step),
-                        )
+                        step.model_copy(update={"parallel": [self._as_component(member) for member in step.parallel]})
                     )
                 else:
-                    processed_workflow.append(step)
+                    processed_workflow.append(self._as_component(step))
 
-            for step_index, component in enumerate(processed_workflow):
+            for step_index, step in enumerate(processed_workflow):
                 component_output: Any = None
+                cache_hit: Optional[bool] = None
+                if isinstance(step, WorkflowParallelGroup):
+                    step_name = ", ".join(
+                        member if isinstance(member, str) else member.name for member in step.parallel
+                    )
+                    step_type = "parallel"
+                    step_id = f"{step_index}-parallel"
+                else:
+                    step_name = step.name
+                    step_type = step.type
+                    step_id = f"{step_index}-{step.name}"
                 try:
                     logging.info(
-                        f"Component Workflow: {component.name} ({component.type}) operating with input: {str(current_message)[:200]}..."
+                        f"Component Workflow: {step_name} ({step_type}) operating with input: {str(current_message)[:200]}..."
+                    )
+                    step_input = current_message
+                    restored = checkpoint.lookup(step_id, step_input) if checkpoint else None
+                    workflow_events.emit(
+                        "workflow_step_start",
+                        {"name": step_name, "type": step_type, "step_index": step_index},
+                        node_id=step_id,
                     )
-                    match component.type.lower():
-                        case "agent":
-                            if isinstance(current_message, dict):
-                                current_message = json.dumps(current_message)
-
-                            # The engine is now responsible for handling session ID generation for agent steps.
-                            agent_run_result: AgentRunResult = await self.engine.run_agent(
-                                agent_name=component.name,
-                                user_message=str(current_message),
-                                session_id=f"{session_id}-{step_index}" if session_id else None,
-                                force_include_history=self.config.include_history,
-                                base_session_id=base_session_id,
-                                force_logging=force_logging,
-                            )
-
-                            # Check the status of the agent run
-                            if agent_run_result.status != "success":
-                                error_detail = (
-                                    agent_run_result.error_message
-                                    or f"Agent finished with status: {agent_run_result.status}"
+                    with workflow_events.node_scope(step_id):
+                        if restored:
+                            logger.info(f"Step '{step_name}' unchanged since the checkpoint, reusing its output")
+                            component_output = restored["output"]
+                            current_message = restored["output_text"]
+                        else:
+                            if isinstance(step, WorkflowParallelGroup):
+                                component_output, current_message = await self._run_parallel_group(
+                                    step,
+                                    step_input,
+                                    step_index=step_index,
+                                    session_id=session_id,
+                                    base_session_id=base_session_id,
+                                    force_logging=force_logging,
                                 )
-                                raise Exception(
-                                    f"Agent '{component.name}' failed to execute successfully. Details: {error_detail}"
+                            else:
+                                component_output, current_message, cache_hit = await self._run_component(
+                                    step,
+                                    step_input,
+                                    agent_session_id=f"{session_id}-{step_index}" if session_id else None,
+                                    session_id=session_id,
+                                    base_session_id=base_session_id,
+                                    force_logging=force_logging,
                                 )
 
-                            if agent_run_result.final_response is None:
-                                raise Exception(f"Agent '{component.name}' succeeded but produced no response.")
-
-                            # The output for the step is the full result object for better logging
-                            component_output = agent_run_result.model_dump()
-                            # The input for the next step is the agent's final text response
-                            current_message = agent_run_result.final_response.content
-
-                        case "linear_workflow":
-                            workflow_result = await self.engine.run_linear_workflow(
-                                workflow_name=component.name,
-                                initial_input=current_message,
-                                session_id=session_id,
-                                force_logging=force_logging,
-                            )
-                            if workflow_result.error:
-                                raise Exception(f"Nested workflow '{component.name}' failed: {workflow_result.error}")
-
-                            component_output = workflow_result
-                            current_message = workflow_result.final_output
-
-                        case "custom_workflow":
-                            input_type = await self.engine.get_custom_workflow_input_type(workflow_name=component.name)
-                            if isinstance(current_message, str) and input_type is dict:
-                                current_message = json.loads(current_message)
-                            elif isinstance(current_message, dict) and input_type is str:
-                                current_message = json.dumps(current_message)
-
-                            custom_workflow_output = await self.engine.run_custom_workflow(
-                                workflow_name=component.name,
-                                initial_input=current_message,
-                                session_id=session_id,
-                            )
-                            component_output = custom_workflow_output
-                            current_message = custom_workflow_output
-
-                        case _:
-                            raise ValueError(f"Component type not recognized: {component.type}")
+                            if checkpoint:
+                                checkpoint.record(step_id, step_input, component_output, current_message)
 
                     step_results.append(
                         LinearWorkflowStepResult(
-                            step_name=component.name,
-                            step_type=component.type,
+                            step_name=step_name,
+                            step_type=step_type,
                             result=component_output,
+                            cache_hit=cache_hit,
                         )
                     )
+                    workflow_events.emit(
+                        "workflow_step_end",
+                        {
+                            "name": step_name,
+                            "status": "completed",
+                            "cache_hit": cache_hit,
+                            "restored": bool(restored),
+                        },
+                        node_id=step_id,
+                    )
 
                 except ConfigurationError as e:
                     # Configuration errors should be reported clearly and stop execution immediately
-                    error_msg = f"Configuration error for component '{component.name}': {str(e)}"
+                    error_msg = f"Configuration error for component '{step_name}': {str(e)}"
                     logger.error(error_msg)
+                    workflow_events.emit(
+                        "workflow_step_end",
+                        {"name": step_name, "status": "failed", "error": error_msg},
+                        node_id=step_id,
+                    )
                     return LinearWorkflowExecutionResult(
                         workflow_name=workflow_name,
                         status="failed",
@@ -190,15 +193,20 @@ class LinearWorkflowExecutor:
                     )
                 except Exception as e:
                     logger.error(
-                        f"Error processing component '{component.name}': {e}",
+                        f"Error processing component '{step_name}': {e}",
                         exc_info=True,
                     )
+                    workflow_events.emit(
+                        "workflow_step_end",
+                        {"name": step_name, "status": "failed", "error": str(e)},
+                        node_id=step_id,
+                    )
                     return LinearWorkflowExecutionResult(
                         workflow_name=workflow_name,
                         status="failed",
                         step_results=step_results,
                         final_output=current_message,
-                        error=f"Error processing component '{component.name}': {str(e)}",
+                        error=f"Error processing component '{step_name}': {str(e)}",
                         session_id=session_id,
                     )
 
@@ -222,6 +230,173 @@ class LinearWorkflowExecutor:
                 session_id=session_id,
             )
 
+    def _as_component(self, step: WorkflowComponent | str) -> WorkflowComponent:
+        if isinstance(step, str):
+            return WorkflowComponent(name=step, type=self._infer_component_type(component_name=step))
+        return step
+
+    async def _run_component(
+        self,
+        component: WorkflowComponent,
+        message: Any,
+        agent_session_id: Optional[str],
+        session_id: Optional[str],
+        base_session_id: Optional[str],
+        force_logging: Optional[bool],
+    ) -> tuple[Any, Any, Optional[bool]]:
+        """
+        Runs a single component of the workflow.
+
+        Returns:
+            The full output of the component, the message passed on to the next step,
+            and whether a memoized result was reused (None if the step is not memoized).
+        """
+        match component.type.lower():
+            case "agent":
+                if isinstance(message, dict):
+                    message = json.dumps(message)
+
+                cache_key, cached = (
+                    lookup_step_result(self.engine, component.name, message) if component.memoize else (None, None)
+                )
+                cache_hit = cached is not None if component.memoize else None
+                if cached:
+                    return cached["output"], cached["output_text"], cache_hit
+
+                # The engine is now responsible for handling session ID generation for agent steps.
+                agent_run_result: AgentRunResult = await self.engine.run_agent(
+                    agent_name=component.name,
+                    user_message=str(message),
+                    session_id=agent_session_id,
+                    force_include_history=self.config.include_history,
+                    base_session_id=base_session_id,
+                    force_logging=force_logging,
+                )
+
+                # Check the status of the agent run
+                if agent_run_result.status != "success":
+                    error_detail = (
+                        agent_run_result.error_message or f"Agent finished with status: {agent_run_result.status}"
+                    )
+                    raise Exception(f"Agent '{component.name}' failed to execute successfully. Details: {error_detail}")
+
+                if agent_run_result.final_response is None:
+                    raise Exception(f"Agent '{component.name}' succeeded but produced no response.")
+
+                # The output for the step is the full result object for better logging,
+                # the input for the next step is the agent's final text response
+                output_text = agent_run_result.final_response.content
+                if cache_key:
+                    store_step_result(self.engine, component, cache_key, to_jsonable(agent_run_result), output_text)
+                return agent_run_result.model_dump(), output_text, cache_hit
+
+            case "linear_workflow":
+                workflow_result = await self.engine.run_linear_workflow(
+                    workflow_name=component.name,
+                    initial_input=message,
+                    session_id=session_id,
+                    force_logging=force_logging,
+                )
+                if workflow_result.error:
+                    raise Exception(f"Nested workflow '{component.name}' failed: {workflow_result.error}")
+
+                return workflow_result, workflow_result.final_output, None
+
+            case "custom_workflow":
+                custom_workflow_output = await self._run_custom_workflow(component.name, message, session_id)
+                return custom_workflow_output, custom_workflow_output, None
+
+            case _:
+                raise ValueError(f"Component type not recognized: {component.type}")
+
+    async def _run_custom_workflow(self, workflow_name: str, message: Any, session_id: Optional[str]) -> Any:
+        input_type = await self.engine.get_custom_workflow_input_type(workflow_name=workflow_name)
+        if isinstance(message, str) and input_type is dict:
+            message = json.loads(message)
+        elif isinstance(message, dict) and input_type is str:
+            message = json.dumps(message)
+
+        return await self.engine.run_custom_workflow(
+            workflow_name=workflow_name,
+            initial_input=message,
+            session_id=session_id,
+        )
+
+    async def _run_parallel_group(
+        self,
+        group: WorkflowParallelGroup,
+        message: Any,
+        step_index: int,
+        session_id: Optional[str],
+        base_session_id: Optional[str],
+        force_logging: Optional[bool],
+    ) -> tuple[dict[str, Any], Any]:
+        """
+        Runs the components of a parallel group concurrently, at most `max_concurrency`
+        at a time, all with the same input. If one fails, the others are cancelled.
+
+        Returns:
+            The full outputs keyed by component name, and the merged message passed on to the next step.
+        """
+        components = [self._as_component(member) for member in group.parallel]
+        semaphore = asyncio.Semaphore(group.max_concurrency or len(components))
+
+        async def run_member(member_index: int, component: WorkflowComponent) -> tuple[Any, Any]:
+            async with semaphore:
+                workflow_events.emit(
+                    "workflow_step_start",
+                    {"name": component.name, "type": component.type, "step_index": member_index},
+                    node_id=component.name,
+                )
+                try:
+                    with workflow_events.node_scope(component.name):
+                        output, output_text, cache_hit = await self._run_component(
+                            component,
+                            message,
+                            agent_session_id=f"{session_id}-{step_index}-{member_index}" if session_id else None,
+                            session_id=session_id,
+                            base_session_id=base_session_id,
+                            force_logging=force_logging,
+                        )
+                except Exception as e:
+                    workflow_events.emit(
+                        "workflow_step_end",
+                        {"name": component.name, "status": "failed", "error": str(e)},
+                        node_id=component.name,
+                    )
+                    raise
+                workflow_events.emit(
+                    "workflow_step_end",
+                    {"name": component.name, "status": "completed", "cache_hit": cache_hit, "restored": False},
+                    node_id=component.name,
+                )
+                return output, output_text
+
+        tasks = [asyncio.create_task(run_member(i, component)) for i, component in enumerate(components)]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        outputs = {component.name: output for component, (output, _) in zip(components, results, strict=True)}
+        texts = {component.name: text for component, (_, text) in zip(components, results, strict=True)}
+
+        merged: Any
+        match group.merge:
+            case "json":
+                merged = texts
+            case "concat":
+                merged = group.separator.join(
+                    text if isinstance(text, str) else json.dumps(text, default=str) for text in texts.values()
+                )
+            case "custom":
+                # check_group requires a reducer for the 'custom' merge
+                merged = await self._run_custom_workflow(group.reducer or "", texts, session_id)
+        return outputs, merged
+
     def _infer_component_type(self, component_name: str):
         """Search through the project's defined components to find the type of a component"""
         possible_types = []
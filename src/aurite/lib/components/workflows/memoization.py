@@ -0,0 +1,61 @@
+"""
+Memoization of agent steps in linear and graph workflows.
+
+A step with `memoize: true` is looked up in the engine's step result cache
+before its agent runs. The key covers the agent name, a hash of the agent's
+resolved configuration (including its LLM configuration) and a hash of the
+step's input, so editing the agent or feeding it different input misses the
+cache. Cache errors are logged and treated as misses; they never fail a run.
+"""
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+from ...models.config.components import GraphWorkflowNode, WorkflowComponent
+from ...storage.step_result_cache import step_cache_key
+from .checkpoint import content_hash
+
+if TYPE_CHECKING:
+    from ....execution.aurite_engine import AuriteEngine
+
+logger = logging.getLogger(__name__)
+
+
+def agent_config_hash(engine: "AuriteEngine", agent_name: str) -> str:
+    """Hash of an agent's configuration together with the LLM configuration it resolves to."""
+    agent_config = engine._config_manager.get_config("agent", agent_name) or {}
+    llm_config_id = agent_config.get("llm_config_id") or "default"
+    llm_config = engine._config_manager.get_config("llm", llm_config_id)
+    return content_hash({"agent": agent_config, "llm": llm_config})
+
+
+def lookup_step_result(
+    engine: "AuriteEngine", agent_name: str, step_input: Any
+) -> tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Returns the cache key of an agent step and its cached result, if any.
+    The result holds the step's full `output` and its `output_text`.
+    """
+    key = step_cache_key(agent_name, agent_config_hash(engine, agent_name), content_hash(step_input))
+    try:
+        cached = engine._step_result_cache.get(key)
+    except Exception as e:
+        logger.warning(f"Step result cache lookup failed for '{agent_name}': {e}")
+        cached = None
+    if cached:
+        logger.info(f"Reusing memoized result of agent '{agent_name}'")
+    return key, cached
+
+
+def store_step_result(
+    engine: "AuriteEngine",
+    step: Union[WorkflowComponent, GraphWorkflowNode],
+    key: str,
+    output: Dict[str, Any],
+    output_text: Optional[str],
+):
+    """Stores the result of a memoized agent step under the key returned by `lookup_step_result`."""
+    try:
+        engine._step_result_cache.set(key, {"output": output, "output_text": output_text}, ttl=step.memoize_ttl)
+    except Exception as e:
+        logger.warning(f"Failed to memoize result of '{step.name}': {e}")
@@ -2,8 +2,20 @@
 Initialization file for the aurite.lib.config package.
 """
 
-from .config_manager import ConfigManager
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .config_manager import ConfigManager
 
 __all__ = [
     "ConfigManager",
 ]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "ConfigManager": ".config_manager",
+    },
+)
@@ -2,9 +2,10 @@ import json
 import logging
 import os
 import sys
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import yaml
 from pydantic import ValidationError
@@ -14,6 +15,7 @@ from ..models.api.responses import ComponentCreateResponse
 from ..storage.db.db_manager import StorageManager
 from .config_utils import find_anchor_files
 from .file_manager import FileManager
+from .index_cache import ConfigFileCache, iter_config_files, open_config_file_cache, parse_config_file
 
 if sys.version_info >= (3, 11):
     import tomllib
@@ -172,29 +174,27 @@ class ConfigManager:
         logger.debug("Building component index...")
         self._component_index = {}
 
-        for source_path, context_root in self._config_sources:
-            if not source_path.is_dir():
-                logger.warning(f"Config source path {source_path} is not a directory.")
-                continue
-
-            for config_file in source_path.rglob("*.json"):
-                self._parse_and_index_file(config_file, context_root)
-            for config_file in source_path.rglob("*.yaml"):
-                self._parse_and_index_file(config_file, context_root)
-            for config_file in source_path.rglob("*.yml"):
-                self._parse_and_index_file(config_file, context_root)
-
-    def _parse_and_index_file(self, config_file: Path, context_root: Path):
+        # Files unchanged since a previous run are read from the on-disk cache instead of parsed
+        cache = open_config_file_cache(self.context_paths[0].parent if self.context_paths else None)
+        try:
+            for source_path, context_root in self._config_sources:
+                if not source_path.is_dir():
+                    logger.warning(f"Config source path {source_path} is not a directory.")
+                    continue
+
+                for config_file in iter_config_files(source_path):
+                    self._parse_and_index_file(config_file, context_root, cache)
+        finally:
+            if cache:
+                cache.close()
+
+    def _parse_and_index_file(self, config_file: Path, context_root: Path, cache: Optional[ConfigFileCache] = None):
         """
         Parses a config file containing either a list of components or a single component
         and adds them to the index.
         """
         try:
-            with config_file.open("r", encoding="utf-8") as f:
-                if config_file.suffix == ".json":
-                    content = json.load(f)
-                else:
-                    content = yaml.safe_load(f)
+            content = cache.load(config_file) if cache else parse_config_file(config_file)
         except (IOError, json.JSONDecodeError, yaml.YAMLError) as e:
             logger.error(f"Failed to load or parse config file {config_file}: {e}")
             return
@@ -354,10 +354,18 @@ class ConfigManager:
 
     def refresh(self):
         logger.debug("Refreshing configuration index...")
-        # Preserve llm_validations across refresh
+        # Preserve llm_validations and components registered in memory across refresh
         preserved_validations = self.llm_validations.copy()
+        in_memory_components = [
+            (component_type, config)
+            for component_type, components in self._component_index.items()
+            for config in components.values()
+            if config.get("_source_file") == "in-memory"
+        ]
         self.__init__()
         self.llm_validations = preserved_validations
+        for component_type, config in in_memory_components:
+            self.register_component_in_memory(component_type, config)
 
     def register_component_in_memory(self, component_type: str, config: Dict[str, Any]):
         """
@@ -380,6 +388,41 @@ class ConfigManager:
         self._component_index[component_type][component_id] = config
         logger.debug(f"Programmatically registered '{component_id}' ({component_type}).")
 
+    def unregister_component_in_memory(self, component_type: str, component_id: str) -> bool:
+        """
+        Removes a component registered with `register_component_in_memory`.
+        Components loaded from files or the database are left untouched.
+        """
+        components = self._component_index.get(component_type, {})
+        config = components.get(component_id)
+        if not config or config.get("_source_file") != "in-memory":
+            return False
+
+        del components[component_id]
+        if not components:
+            del self._component_index[component_type]
+        logger.debug(f"Unregistered in-memory component '{component_id}' ({component_type}).")
+        return True
+
+    @contextmanager
+    def ephemeral_component(self, component_type: str, config: Dict[str, Any]) -> Iterator[str]:
+        """
+        Registers a component in memory for the duration of the block and yields its name.
+        Nothing is written to disk or the database, which makes this suitable for
+        short-lived helper components such as the agents used to test MCP servers.
+        """
+        component_id = config.get("name")
+        if not component_id:
+            raise ValueError("Cannot register an ephemeral component without a 'name'.")
+        if component_id in self._component_index.get(component_type, {}):
+            raise ValueError(f"A {component_type} named '{component_id}' is already registered.")
+
+        self.register_component_in_memory(component_type, config)
+        try:
+            yield component_id
+        finally:
+            self.unregister_component_in_memory(component_type, component_id)
+
     def list_config_sources(self) -> List[Dict[str, Any]]:
         """
         List all configuration source directories with context information.
@@ -0,0 +1,136 @@
+"""
+On-disk cache of parsed configuration files.
+
+Building the component index parses every JSON and YAML file of every config
+source, which dominates kernel startup and shell completion on large
+workspaces. The cache stores each file's parsed content in
+`.aurite_cache/index.db` next to the nearest `.aurite` anchor, keyed by its path
+and stat signature (modification time and size). A file is only re-parsed when
+its signature changed, so an unchanged workspace costs a single stat pass.
+Content is stored as JSON. Files whose content JSON cannot reproduce exactly
+(YAML dates or non-string keys) are not cached and are parsed every time.
+The cache is shared by the ConfigManager and the CLI fast loader; set
+AURITE_INDEX_CACHE=false to disable it.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+CONFIG_FILE_SUFFIXES = (".json", ".yaml", ".yml")
+
+# Bumped when the format of the cache changes; older caches are discarded
+SCHEMA_VERSION = 3
+
+
+def parse_config_file(config_file: Path) -> Any:
+    """Parses a JSON or YAML config file. Raises IOError, JSONDecodeError or YAMLError."""
+    with config_file.open("r", encoding="utf-8") as f:
+        if config_file.suffix == ".json":
+            return json.load(f)
+        return yaml.safe_load(f)
+
+
+def iter_config_files(source_path: Path) -> Iterator[Path]:
+    """
+    Yields the config files of a source in indexing order: all JSON files, then YAML, then YML.
+    The directory tree is walked once.
+    """
+    files: Dict[str, List[Path]] = {suffix: [] for suffix in CONFIG_FILE_SUFFIXES}
+    for path in source_path.rglob("*"):
+        if path.suffix in files:
+            files[path.suffix].append(path)
+    for suffix in CONFIG_FILE_SUFFIXES:
+        yield from files[suffix]
+
+
+def _serialize(content: Any) -> Optional[str]:
+    """
+    Returns the content as JSON, or None if loading the JSON would not give it back unchanged,
+    e.g. for YAML dates or mappings with non-string keys (which json.dumps turns into strings).
+    """
+    try:
+        serialized = json.dumps(content)
+    except (TypeError, ValueError):
+        return None
+    return serialized if json.loads(serialized) == content else None
+
+
+class ConfigFileCache:
+    """Parsed config files keyed by path, reused while their stat signature is unchanged."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), timeout=5)
+        with self._conn:
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS config_files")
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS config_files "
+                "(path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, content TEXT NOT NULL)"
+            )
+        self._entries: Dict[str, Tuple[int, int, str]] = {
+            row[0]: (row[1], row[2], row[3])
+            for row in self._conn.execute("SELECT path, mtime_ns, size, content FROM config_files")
+        }
+        self._updates: Dict[str, Tuple[int, int, str]] = {}
+        self._seen: Set[str] = set()
+
+    def load(self, config_file: Path) -> Any:
+        """Returns the parsed content of a config file, parsing it only if it changed since it was cached."""
+        stat = config_file.stat()
+        key = str(config_file.absolute())
+        self._seen.add(key)
+        cached = self._entries.get(key)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            try:
+                return json.loads(cached[2])
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Discarding unreadable cache entry for {config_file}: {e}")
+
+        content = parse_config_file(config_file)
+        serialized = _serialize(content)
+        if serialized is None:
+            # Not cacheable: the file is parsed again next time
+            logger.debug(f"Not caching {config_file}: its content does not round-trip through JSON")
+            self._entries.pop(key, None)
+            return content
+        self._entries[key] = self._updates[key] = (stat.st_mtime_ns, stat.st_size, serialized)
+        return content
+
+    def close(self):
+        """Writes the newly parsed files and forgets files that no longer exist."""
+        try:
+            removed = [(key,) for key in self._entries if key not in self._seen and not os.path.exists(key)]
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO config_files (path, mtime_ns, size, content) VALUES (?, ?, ?, ?)",
+                    [(key, *entry) for key, entry in self._updates.items()],
+                )
+                self._conn.executemany("DELETE FROM config_files WHERE path = ?", removed)
+        except sqlite3.Error as e:
+            logger.debug(f"Could not update the config index cache: {e}")
+        finally:
+            self._conn.close()
+
+
+def open_config_file_cache(context_root: Optional[Path]) -> Optional[ConfigFileCache]:
+    """
+    Opens the config file cache of a project or workspace, or returns None if there is no
+    context, the cache is disabled, or it cannot be opened (e.g. a read-only directory).
+    """
+    if context_root is None or os.getenv("AURITE_INDEX_CACHE", "true").lower() == "false":
+        return None
+    try:
+        return ConfigFileCache(context_root / ".aurite_cache" / "index.db")
+    except (sqlite3.Error, OSError) as e:
+        logger.debug(f"Config index cache unavailable, parsing every file: {e}")
+        return None
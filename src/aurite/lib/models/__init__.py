@@ -1,11 +1,17 @@
 """
 Models Package
 
-Simple approach: Import everything from subpackages and let Python handle the rest.
+Exposes every model of the subpackages. They are imported on first access; the
+API models pull in the OpenAI types, which most config-only callers never need.
 """
 
-# Import all models from subpackages
-from .api import *
-from .config import *
+from typing import TYPE_CHECKING
 
-# Python will automatically make all imported models available
+from ...utils.lazy_imports import lazy_submodules
+
+if TYPE_CHECKING:
+    from .api import *  # noqa: F403
+    from .config import *  # noqa: F403
+
+# Later subpackages took precedence in the former `import *` chain, so they are searched first
+__getattr__ = lazy_submodules(__name__, [".config", ".api"])
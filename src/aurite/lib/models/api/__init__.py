@@ -1,12 +1,17 @@
 """
 API Models
 
-Simple approach: Import everything from submodules and let Python handle the rest.
+Exposes every model of the submodules. They are imported on first access, so
+request models can be used without loading the OpenAI types of the responses.
 """
 
-# Import all models from submodules
-from .requests import *
-from .responses import *
-from .server import *
+from typing import TYPE_CHECKING
 
-# Python will automatically populate __all__ from the imported modules
+from ....utils.lazy_imports import lazy_submodules
+
+if TYPE_CHECKING:
+    from .requests import *  # noqa: F403
+    from .responses import *  # noqa: F403
+    from .server import *  # noqa: F403
+
+__getattr__ = lazy_submodules(__name__, [".requests", ".server", ".responses"])
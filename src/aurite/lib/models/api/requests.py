@@ -25,6 +25,7 @@ class AgentRunRequest(BaseModel):
     messages: Optional[list[dict[str, Any]]] = None
     system_prompt: Optional[str] = None
     session_id: Optional[str] = None
+    include_latency: bool = False  # Add the latency breakdown of the run to the result
 
 
 class WorkflowRunRequest(BaseModel):
@@ -32,6 +33,8 @@ class WorkflowRunRequest(BaseModel):
 
     initial_input: Any
     session_id: Optional[str] = None
+    resume: bool = False  # Skip steps already completed by a previous run of this session
+    resumable: bool = False  # Checkpoint completed steps so a later run can resume (implied by resume)
 
 
 class EvaluationCase(BaseModel):
@@ -81,6 +84,36 @@ class EvaluationRequest(BaseModel):
     evaluation_config_id: Optional[str] = Field(
         default=None, description="ID of the evaluation configuration (used for cache key generation)"
     )
+    # Execution limits, defaulting to the QA tester's configuration
+    max_concurrency: Optional[int] = Field(
+        default=None, ge=1, description="Maximum number of test cases executed at once (default: 10)"
+    )
+    case_timeout: Optional[float] = Field(
+        default=None, gt=0, description="Timeout in seconds for each attempt of a test case (default: 90)"
+    )
+    max_retries: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Retries of a test case that failed on a transient LLM or MCP error, like a rate limit (default: 1)",
+    )
+    # Review LLM batching
+    judge_batch_size: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of test cases the review LLM analyzes in one request (1 sends one request per case)",
+    )
+    judge_batch_max_tokens: int = Field(
+        default=8000, ge=1, description="Approximate prompt token budget of a batched review request"
+    )
+    # Benchmark mode
+    benchmark: bool = Field(
+        default=False,
+        description="Run each test case several times and report latency, token and tool call statistics (bypasses the cache)",
+    )
+    benchmark_iterations: int = Field(default=5, ge=1, description="Measured runs of each test case in benchmark mode")
+    benchmark_warmup: int = Field(
+        default=1, ge=0, description="Unmeasured warm-up runs of each test case before the measured runs"
+    )
 
 
 # --- Component Configuration Request Models ---
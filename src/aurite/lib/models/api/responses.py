@@ -40,6 +40,11 @@ class AgentRunResult(BaseModel):
     session_id: Optional[str] = Field(None, description="The session ID used for this agent run.")
     agent_name: Optional[str] = Field(None, description="The name of the agent that was run.")
     exception: Optional[Any] = Field(None, description="The exception if the agent execution failed.")
+    latency: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Time spent in each phase of the run (config resolution, MCP registration, LLM calls, tool "
+        "calls, session persistence), included when the run was started with include_latency.",
+    )
 
     @property
     def primary_text(self) -> Optional[str]:
@@ -71,6 +76,10 @@ class LinearWorkflowStepResult(BaseModel):
     result: Union[Dict[str, Any], "LinearWorkflowExecutionResult", Any] = Field(
         description="The execution result from the step's component."
     )
+    cache_hit: Optional[bool] = Field(
+        default=None,
+        description="For memoized steps, whether the result was reused from the step result cache.",
+    )
 
 
 class LinearWorkflowExecutionResult(BaseModel):
@@ -112,6 +121,10 @@ class GraphWorkflowNodeResult(BaseModel):
     name: str = Field(description="The name of the component executed in this node")
     type: str = Field(description="The type of the component executed in this node")
     result: Any = Field(description="The result of this node's execution")
+    cache_hit: Optional[bool] = Field(
+        default=None,
+        description="For memoized nodes, whether the result was reused from the step result cache.",
+    )
 
 
 class GraphWorkflowExecutionResult(BaseModel):
@@ -133,6 +146,10 @@ class GraphWorkflowExecutionResult(BaseModel):
 
     session_id: Optional[str] = Field(None, description="The session ID used for this workflow run.")
 
+    usage: Optional[Dict[str, Any]] = Field(
+        None, description="Token usage and cost of the LLM calls made during this workflow run."
+    )
+
     @property
     def final_message(self) -> Optional[str]:
         """
@@ -223,6 +240,7 @@ class ServerDetailedStatus(BaseModel):
     tools: List[str]
     registration_time: Optional[datetime]
     session_active: bool
+    health: Optional[Dict[str, Any]] = None
 
 
 class ServerTestResult(BaseModel):
@@ -244,6 +262,7 @@ class ServerRuntimeInfo(BaseModel):
     transport_type: str
     tools_count: int
     registration_time: datetime
+    health: Optional[Dict[str, Any]] = None
 
 
 # --- Component Creation Response Models ---
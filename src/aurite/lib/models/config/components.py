@@ -32,8 +32,10 @@ __all__ = [
     "HostConfig",
     "LLMConfig",
     "LLMConfigOverrides",
+    "ToolRetrievalConfig",
     "AgentConfig",
     "WorkflowComponent",
+    "WorkflowParallelGroup",
     "WorkflowConfig",
     "CustomWorkflowConfig",
     "BaseCustomWorkflow",
@@ -75,6 +77,26 @@ class ClientConfig(BaseComponentConfig):
     capabilities: List[str] = Field(description="List of capabilities this client provides (e.g., 'tools', 'prompts').")
     timeout: float = Field(default=10.0, description="Default timeout in seconds for client operations.")
     registration_timeout: float = Field(default=30.0, description="Timeout for registering the mcp client")
+    replicas: int = Field(
+        default=1,
+        ge=1,
+        description="Number of sessions to open to this server. For 'stdio' and 'local' transports each replica is "
+        "a separate server process. Tool calls are balanced across replicas by outstanding requests.",
+    )
+    health_check_interval: Optional[float] = Field(
+        default=30.0,
+        description="Seconds between health-check pings to the server. Set to null or 0 to disable pinging.",
+    )
+    max_reconnect_attempts: int = Field(
+        default=5, ge=0, description="Reconnect attempts made when the server's session dies before giving up."
+    )
+    reconnect_backoff: float = Field(
+        default=0.5, ge=0, description="Base delay in seconds for exponential backoff between reconnect attempts."
+    )
+    retry_idempotent_calls: bool = Field(
+        default=True,
+        description="Retry a tool call once after reconnecting if the tool is annotated as read-only or idempotent.",
+    )
     exclude: Optional[List[str]] = Field(
         default=None,
         description="List of component names (prompt, resource, tool) to exclude from this client.",
@@ -197,6 +219,27 @@ class LLMConfigOverrides(BaseModel):
 # --- Agent Configuration ---
 
 
+class ToolRetrievalConfig(BaseModel):
+    """Settings for selecting the most relevant tools for each agent turn."""
+
+    enabled: bool = Field(default=True, description="Whether to send only the most relevant tools to the LLM.")
+    top_k: int = Field(default=8, ge=1, description="Maximum number of retrieved tools sent per turn.")
+    min_score: float = Field(
+        default=0.0, ge=0.0, description="Minimum similarity score for a tool to be considered relevant."
+    )
+    pinned_tools: List[str] = Field(
+        default_factory=list,
+        description="Tools that are always sent, by full name ('server-tool') or tool name.",
+    )
+    query_messages: int = Field(
+        default=3, ge=1, description="Number of recent conversation messages used to build the retrieval query."
+    )
+    fallback_to_all: bool = Field(
+        default=True,
+        description="Send every allowed tool when no tool is relevant to the conversation.",
+    )
+
+
 class AgentConfig(BaseComponentConfig):
     """
     Configuration for an Agent instance.
@@ -215,7 +258,11 @@ class AgentConfig(BaseComponentConfig):
     )
     auto: Optional[bool] = Field(
         default=False,
-        description="If true, an LLM will dynamically select client_ids for the agent at runtime.",
+        description="If true, the most relevant tools from the agent's mcp_servers are selected for each turn at runtime (tool retrieval with default settings).",
+    )
+    tool_retrieval: Optional[ToolRetrievalConfig] = Field(
+        default=None,
+        description="Settings for selecting the most relevant tools per turn instead of sending every tool.",
     )
     # --- LLM Selection ---
     llm_config_id: Optional[str] = Field(default=None, description="ID of the LLMConfig to use for this agent.")
@@ -255,6 +302,50 @@ class AgentConfig(BaseComponentConfig):
 class WorkflowComponent(BaseModel):
     name: str = Field(description="The name of the component in the workflow step.")
     type: Literal["agent", "linear_workflow", "custom_workflow"] = Field(description="The type of the component.")
+    memoize: bool = Field(
+        default=False,
+        description="Reuse the result of a previous run of this agent step when the agent's configuration and the "
+        "step's input are unchanged. Only applies to agent steps.",
+    )
+    memoize_ttl: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="How long, in seconds, a memoized result may be reused. If not set, it does not expire.",
+    )
+
+
+class WorkflowParallelGroup(BaseModel):
+    """
+    A step of a linear workflow made of components that receive the same input and run
+    concurrently. Their outputs are merged into the input of the next step.
+    """
+
+    parallel: List[str | WorkflowComponent] = Field(
+        min_length=1, description="Component names or component objects to run concurrently."
+    )
+    merge: Literal["json", "concat", "custom"] = Field(
+        default="json",
+        description="How the outputs are merged: 'json' builds an object keyed by component name, 'concat' joins "
+        "the text outputs with `separator`, and 'custom' passes the 'json' object to the `reducer` workflow.",
+    )
+    separator: str = Field(default="\n\n", description="Separator between outputs for the 'concat' merge.")
+    reducer: Optional[str] = Field(
+        default=None,
+        description="Name of the custom workflow that reduces the outputs when `merge` is 'custom'. It receives the "
+        "outputs keyed by component name and its return value is the output of the group.",
+    )
+    max_concurrency: Optional[int] = Field(
+        default=None, ge=1, description="Maximum number of components running at the same time. All if not set."
+    )
+
+    @model_validator(mode="after")
+    def check_group(self) -> "WorkflowParallelGroup":
+        if self.merge == "custom" and not self.reducer:
+            raise ValueError("`reducer` is required for the 'custom' merge")
+        names = [step if isinstance(step, str) else step.name for step in self.parallel]
+        if len(set(names)) != len(names):
+            raise ValueError("Components of a parallel group must have unique names")
+        return self
 
 
 class WorkflowConfig(BaseComponentConfig):
@@ -263,8 +354,8 @@ class WorkflowConfig(BaseComponentConfig):
     """
 
     type: Literal["linear_workflow"] = "linear_workflow"
-    steps: List[str | WorkflowComponent] = Field(
-        description="List of component names or component objects to execute in sequence."
+    steps: List[str | WorkflowComponent | WorkflowParallelGroup] = Field(
+        description="List of component names, component objects or parallel groups to execute in sequence."
     )
     include_history: Optional[bool] = Field(
         default=None, description="If set, overrides the include_history setting for all agents in this workflow."
@@ -284,6 +375,21 @@ class GraphWorkflowNode(BaseModel):
     type: Literal["agent"] = Field(
         description="The type of the component."
     )  # Only allow agents for now. Todo: allow other types
+    priority: int = Field(
+        default=0,
+        description="Scheduling priority. When more nodes are ready than may run in parallel, higher-priority "
+        "nodes start first. Ties are broken by the length of the node's longest path to the end of the graph.",
+    )
+    memoize: bool = Field(
+        default=False,
+        description="Reuse the result of a previous run of this agent step when the agent's configuration and the "
+        "step's input are unchanged. Only applies to agent steps.",
+    )
+    memoize_ttl: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="How long, in seconds, a memoized result may be reused. If not set, it does not expire.",
+    )
 
 
 class GraphWorkflowEdge(BaseModel):
@@ -306,6 +412,24 @@ class GraphWorkflowConfig(BaseComponentConfig):
         default=None,
         description="If set, overrides the include_logging setting for all agents in this workflow.",
     )
+    max_parallel: Optional[int] = Field(
+        default=None, ge=1, description="Maximum number of nodes running at the same time. Unlimited if not set."
+    )
+    max_parallel_per_type: Optional[Dict[str, int]] = Field(
+        default=None,
+        description="Maximum number of nodes of a given type (e.g. 'agent') running at the same time.",
+    )
+    max_total_tokens: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Token budget for the whole run. Once exceeded, running nodes are cancelled and the workflow fails.",
+    )
+    max_cost: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Cost budget (USD, as priced by LiteLLM) for the whole run. Once exceeded, running nodes are "
+        "cancelled and the workflow fails.",
+    )
 
 
 # --- Custom Workflow Configuration ---
@@ -319,6 +443,11 @@ class CustomWorkflowConfig(BaseComponentConfig):
     type: Literal["custom_workflow"] = "custom_workflow"
     module_path: Path = Field(description="Resolved absolute path to the Python file containing the workflow class.")
     class_name: str = Field(description="Name of the class within the module that implements the workflow.")
+    reuse_instance: bool = Field(
+        default=False,
+        description="Keep one long-lived instance of the workflow class and reuse it for every run, "
+        "instead of creating a new instance per run. Only enable this for workflows that do not keep per-run state.",
+    )
 
 
 # --- Custom Workflow Configuration ---
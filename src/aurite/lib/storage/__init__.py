@@ -3,7 +3,20 @@
 Storage layer for handling database persistence.
 """
 
-from .db.db_manager import StorageManager
-from .sessions.session_manager import SessionManager
+from typing import TYPE_CHECKING
+
+from ...utils.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .db.db_manager import StorageManager
+    from .sessions.session_manager import SessionManager
 
 __all__ = ["StorageManager", "SessionManager"]
+
+__getattr__ = lazy_exports(
+    __name__,
+    {
+        "StorageManager": ".db.db_manager",
+        "SessionManager": ".sessions.session_manager",
+    },
+)
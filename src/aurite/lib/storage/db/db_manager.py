@@ -15,7 +15,7 @@ from sqlalchemy.orm.session import Session
 
 from .db_connection import create_db_engine, get_db_session
 from .db_models import Base as SQLAlchemyBase
-from .db_models import ComponentDB, QATestResultDB, SessionDB
+from .db_models import ComponentDB, QATestResultDB, SessionDB, StepResultDB, WorkflowCheckpointDB
 
 logger = logging.getLogger(__name__)
 
@@ -744,3 +744,185 @@ class StorageManager:
             except Exception as e:
                 logger.error(f"Failed to delete QA result '{result_id}': {e}", exc_info=True)
                 return False
+
+    def save_workflow_checkpoint(self, checkpoint_id: str, checkpoint_data: Dict[str, Any]) -> bool:
+        """
+        Saves (or replaces) a workflow checkpoint.
+
+        Args:
+            checkpoint_id: Unique identifier of the checkpoint (session and workflow)
+            checkpoint_data: Dictionary containing session_id, workflow_name,
+                workflow_type and the completed steps.
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        if not self._engine:
+            logger.debug("Database not configured. Cannot save workflow checkpoint.")
+            return False
+
+        with get_db_session(engine=self._engine) as db:
+            if not db:
+                logger.error("Failed to get DB session for saving workflow checkpoint")
+                return False
+
+            try:
+                existing = db.get(WorkflowCheckpointDB, checkpoint_id)
+                if existing:
+                    existing.checkpoint = checkpoint_data  # type: ignore[assignment]
+                    existing.last_updated = datetime.utcnow()  # type: ignore[assignment]
+                else:
+                    db.add(
+                        WorkflowCheckpointDB(
+                            checkpoint_id=checkpoint_id,
+                            session_id=checkpoint_data["session_id"],
+                            workflow_name=checkpoint_data["workflow_name"],
+                            workflow_type=checkpoint_data.get("workflow_type", ""),
+                            checkpoint=checkpoint_data,
+                            created_at=datetime.utcnow(),
+                            last_updated=datetime.utcnow(),
+                        )
+                    )
+                return True
+
+            except Exception as e:
+                logger.error(f"Failed to save workflow checkpoint '{checkpoint_id}': {e}", exc_info=True)
+                return False
+
+    def get_workflow_checkpoint(self, checkpoint_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves a workflow checkpoint.
+
+        Args:
+            checkpoint_id: The checkpoint to retrieve
+
+        Returns:
+            The checkpoint dictionary, or None if not found
+        """
+        if not self._engine:
+            return None
+
+        with get_db_session(engine=self._engine) as db:
+            if not db:
+                logger.error("Failed to get DB session for loading workflow checkpoint")
+                return None
+
+            try:
+                checkpoint = db.get(WorkflowCheckpointDB, checkpoint_id)
+                return checkpoint.checkpoint if checkpoint else None  # type: ignore[return-value]
+
+            except Exception as e:
+                logger.error(f"Failed to load workflow checkpoint '{checkpoint_id}': {e}", exc_info=True)
+                return None
+
+    def delete_workflow_checkpoints(self, session_id: str) -> bool:
+        """
+        Deletes all workflow checkpoints recorded for a session.
+
+        Args:
+            session_id: The workflow session ID
+
+        Returns:
+            True if any checkpoint was deleted, False otherwise
+        """
+        if not self._engine:
+            return False
+
+        with get_db_session(engine=self._engine) as db:
+            if not db:
+                logger.error("Failed to get DB session for deleting workflow checkpoints")
+                return False
+
+            try:
+                deleted = (
+                    db.query(WorkflowCheckpointDB)
+                    .filter(WorkflowCheckpointDB.session_id == session_id)
+                    .delete(synchronize_session=False)
+                )
+                return deleted > 0
+
+            except Exception as e:
+                logger.error(f"Failed to delete workflow checkpoints for '{session_id}': {e}", exc_info=True)
+                return False
+
+    def get_step_result(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves a memoized workflow step result.
+
+        Args:
+            key: The step cache key
+
+        Returns:
+            The cached value, or None if not found or expired
+        """
+        if not self._engine:
+            return None
+
+        with get_db_session(engine=self._engine) as db:
+            if not db:
+                logger.error("Failed to get DB session for loading step result")
+                return None
+
+            try:
+                entry = db.get(StepResultDB, key)
+                if not entry:
+                    return None
+                if entry.expires_at and entry.expires_at <= datetime.utcnow():
+                    db.delete(entry)
+                    return None
+                return entry.value  # type: ignore[return-value]
+
+            except Exception as e:
+                logger.error(f"Failed to load step result '{key}': {e}", exc_info=True)
+                return None
+
+    def save_step_result(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> bool:
+        """
+        Saves (or replaces) a memoized workflow step result.
+
+        Args:
+            key: The step cache key
+            value: The JSON-serializable result
+            ttl: Optional time to live in seconds
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        if not self._engine:
+            return False
+
+        expires_at = datetime.utcnow() + timedelta(seconds=ttl) if ttl is not None else None
+        with get_db_session(engine=self._engine) as db:
+            if not db:
+                logger.error("Failed to get DB session for saving step result")
+                return False
+
+            try:
+                db.merge(StepResultDB(key=key, value=value, created_at=datetime.utcnow(), expires_at=expires_at))
+                return True
+
+            except Exception as e:
+                logger.error(f"Failed to save step result '{key}': {e}", exc_info=True)
+                return False
+
+    def clear_step_results(self) -> int:
+        """
+        Deletes all memoized workflow step results.
+
+        Returns:
+            The number of deleted entries
+        """
+        if not self._engine:
+            return 0
+
+        with get_db_session(engine=self._engine) as db:
+            if not db:
+                logger.error("Failed to get DB session for clearing step results")
+                return 0
+
+            try:
+                return db.query(StepResultDB).delete(synchronize_session=False)
+
+            except Exception as e:
+                logger.error(f"Failed to clear step results: {e}", exc_info=True)
+                return 0
@@ -118,6 +118,44 @@ class QATestResultDB(Base):
         return f"<QATestResultDB(result_id='{self.result_id}', evaluation_config_id='{self.evaluation_config_id}', status='{self.status}')>"
 
 
+class WorkflowCheckpointDB(Base):
+    """SQLAlchemy model for storing per-step workflow checkpoints used to resume runs."""
+
+    __tablename__ = "workflow_checkpoints"
+
+    # One checkpoint per (session, workflow) - nested workflows share their parent's session
+    checkpoint_id = Column(String, primary_key=True, index=True)
+    session_id = Column(String, index=True, nullable=False)
+    workflow_name = Column(String, nullable=False)
+    workflow_type = Column(String, nullable=False)  # "linear_workflow" or "graph_workflow"
+
+    # Completed steps keyed by step/node id, with their inputs, outputs and content hashes
+    checkpoint = Column(JSON, nullable=False)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<WorkflowCheckpointDB(checkpoint_id='{self.checkpoint_id}', workflow_name='{self.workflow_name}')>"
+
+
+class StepResultDB(Base):
+    """SQLAlchemy model for memoized workflow step results."""
+
+    __tablename__ = "workflow_step_results"
+
+    # Component name, config hash and input hash of the step
+    key = Column(String, primary_key=True, index=True)
+    value = Column(JSON, nullable=False)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=True, index=True)
+
+    def __repr__(self):
+        return f"<StepResultDB(key='{self.key}')>"
+
+
 # Legacy model - kept for backward compatibility but deprecated
 class AgentHistoryDB(Base):
     """
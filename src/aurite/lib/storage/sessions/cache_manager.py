@@ -2,13 +2,19 @@
 Provides a file-based cache for execution results with in-memory caching.
 """
 
+import hashlib
 import json
 import logging
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from .qa_result_cache import QAResultCache
+
 logger = logging.getLogger(__name__)
 
+# Seconds a cached QA result is kept when no TTL is given (matches EvaluationRequest.cache_ttl).
+DEFAULT_QA_CACHE_TTL = 3600
+
 
 class CacheManager:
     """
@@ -30,6 +36,10 @@ class CacheManager:
         self._result_cache: Dict[str, Dict[str, Any]] = {}
         # Store QA test results cache
         self._qa_result_cache: Dict[str, Dict[str, Any]] = {}
+        # Store workflow checkpoints (kept in a subdirectory so _load_cache skips them)
+        self._checkpoint_cache: Dict[str, Dict[str, Any]] = {}
+        # Cached QA case and evaluation results, opened on first use
+        self._qa_cache: Optional[QAResultCache] = None
         self._load_cache()
 
     def get_cache_dir(self) -> Path:
@@ -133,30 +143,23 @@ class CacheManager:
             logger.error(f"Failed to delete session {session_id}: {e}")
             return False
 
-    def save_qa_case_result(self, cache_key: str, cache_data: Dict[str, Any]):
+    def _get_qa_cache(self) -> QAResultCache:
+        """Get the store of cached QA case and evaluation results."""
+        if self._qa_cache is None:
+            self._qa_cache = QAResultCache(self._cache_dir / "qa_results.db")
+        return self._qa_cache
+
+    def save_qa_case_result(self, cache_key: str, cache_data: Dict[str, Any], ttl: float = DEFAULT_QA_CACHE_TTL):
         """
         Save a QA case result to cache.
 
         Args:
             cache_key: The cache key to store under
             cache_data: The cache data containing result and metadata
+            ttl: Seconds until the entry expires and can be evicted
         """
         logger.debug(f"CacheManager.save_qa_case_result called for cache_key: {cache_key}")
-
-        # Store in memory cache
-        if not hasattr(self, "_qa_case_cache"):
-            self._qa_case_cache = {}
-        self._qa_case_cache[cache_key] = cache_data
-
-        # Save to disk
-        cache_file = self._cache_dir / f"{cache_key}.json"
-        logger.debug(f"Attempting to save QA case result to file: {cache_file.absolute()}")
-        try:
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f, indent=2, default=str)
-            logger.debug(f"Successfully saved QA case result {cache_key} to disk at {cache_file.absolute()}")
-        except Exception as e:
-            logger.error(f"Failed to save QA case result {cache_key} to disk: {e}", exc_info=True)
+        self._get_qa_cache().put(cache_key, cache_data, ttl)
 
     def get_qa_case_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """
@@ -166,27 +169,9 @@ class CacheManager:
             cache_key: The cache key to look up
 
         Returns:
-            Cache data if found, None otherwise
+            Cache data if found and not expired, None otherwise
         """
-        # Check memory cache first
-        if hasattr(self, "_qa_case_cache") and cache_key in self._qa_case_cache:
-            return self._qa_case_cache[cache_key]
-
-        # Try to load from disk if not in memory
-        cache_file = self._cache_dir / f"{cache_key}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
-                # Store in memory cache for future access
-                if not hasattr(self, "_qa_case_cache"):
-                    self._qa_case_cache = {}
-                self._qa_case_cache[cache_key] = data
-                return data
-            except Exception as e:
-                logger.error(f"Failed to load QA case result {cache_key} from disk: {e}")
-
-        return None
+        return self._get_qa_cache().get(cache_key)
 
     def clear_cache(self):
         """
@@ -194,10 +179,8 @@ class CacheManager:
         Files on disk are preserved.
         """
         self._result_cache.clear()
-        # Also clear QA case cache if it exists
-        if hasattr(self, "_qa_case_cache"):
-            self._qa_case_cache.clear()
         self._qa_result_cache.clear()
+        self._checkpoint_cache.clear()
 
     # --- QA Result Caching Methods ---
 
@@ -283,36 +266,17 @@ class CacheManager:
 
     # --- QA Evaluation Result Caching Methods ---
 
-    def _get_qa_evaluation_file(self, cache_key: str) -> Path:
-        """Get the file path for a QA evaluation result."""
-        # Sanitize cache_key to prevent directory traversal
-        safe_cache_key = "".join(c for c in cache_key if c.isalnum() or c in "-_")
-        return self._cache_dir / f"{safe_cache_key}.json"
-
-    def save_qa_evaluation_result(self, cache_key: str, cache_data: Dict[str, Any]):
+    def save_qa_evaluation_result(self, cache_key: str, cache_data: Dict[str, Any], ttl: float = DEFAULT_QA_CACHE_TTL):
         """
         Save a QA evaluation result to cache.
 
         Args:
             cache_key: The cache key to store under
             cache_data: The cache data containing result and metadata
+            ttl: Seconds until the entry expires and can be evicted
         """
         logger.debug(f"CacheManager.save_qa_evaluation_result called for cache_key: {cache_key}")
-
-        # Store in memory cache
-        if not hasattr(self, "_qa_evaluation_cache"):
-            self._qa_evaluation_cache = {}
-        self._qa_evaluation_cache[cache_key] = cache_data
-
-        # Save to disk
-        cache_file = self._get_qa_evaluation_file(cache_key)
-        logger.debug(f"Attempting to save QA evaluation result to file: {cache_file.absolute()}")
-        try:
-            with open(cache_file, "w") as f:
-                json.dump(cache_data, f, indent=2, default=str)
-            logger.debug(f"Successfully saved QA evaluation result {cache_key} to disk at {cache_file.absolute()}")
-        except Exception as e:
-            logger.error(f"Failed to save QA evaluation result {cache_key} to disk: {e}", exc_info=True)
+        self._get_qa_cache().put(cache_key, cache_data, ttl)
 
     def get_qa_evaluation_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """
@@ -322,24 +286,105 @@ class CacheManager:
             cache_key: The cache key to look up
 
         Returns:
-            Cache data if found, None otherwise
+            Cache data if found and not expired, None otherwise
+        """
+        return self._get_qa_cache().get(cache_key)
+
+    def evict_expired_qa_results(self) -> int:
+        """
+        Delete all expired QA case and evaluation results.
+
+        Returns:
+            The number of results deleted.
+        """
+        return self._get_qa_cache().evict_expired()
+
+    # --- Workflow Checkpoint Caching Methods ---
+
+    @staticmethod
+    def _checkpoint_key(value: str) -> str:
+        # Hashed, so distinct IDs never share a file and no ID can escape the directory
+        return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+    def _get_checkpoint_file(self, session_id: str, checkpoint_id: str) -> Path:
+        """Get the file path for a workflow checkpoint, prefixed by its session so they can be deleted together."""
+        file_name = f"{self._checkpoint_key(session_id)}_{self._checkpoint_key(checkpoint_id)}.json"
+        return self._cache_dir / "checkpoints" / file_name
+
+    def get_workflow_checkpoint(self, session_id: str, checkpoint_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves a workflow checkpoint from cache.
+
+        Args:
+            session_id: The workflow session the checkpoint belongs to.
+            checkpoint_id: The unique identifier for the checkpoint.
+
+        Returns:
+            The checkpoint dict, or None if not found.
         """
         # Check memory cache first
-        if hasattr(self, "_qa_evaluation_cache") and cache_key in self._qa_evaluation_cache:
-            return self._qa_evaluation_cache[cache_key]
+        if checkpoint_id in self._checkpoint_cache:
+            return self._checkpoint_cache[checkpoint_id]
 
         # Try to load from disk if not in memory
-        cache_file = self._get_qa_evaluation_file(cache_key)
-        if cache_file.exists():
+        checkpoint_file = self._get_checkpoint_file(session_id, checkpoint_id)
+        if checkpoint_file.exists():
             try:
-                with open(cache_file, "r") as f:
+                with open(checkpoint_file, "r") as f:
                     data = json.load(f)
-                # Store in memory cache for future access
-                if not hasattr(self, "_qa_evaluation_cache"):
-                    self._qa_evaluation_cache = {}
-                self._qa_evaluation_cache[cache_key] = data
+                self._checkpoint_cache[checkpoint_id] = data
                 return data
             except Exception as e:
-                logger.error(f"Failed to load QA evaluation result {cache_key} from disk: {e}")
+                logger.error(f"Failed to load workflow checkpoint {checkpoint_id} from disk: {e}")
 
         return None
+
+    def save_workflow_checkpoint(self, session_id: str, checkpoint_id: str, checkpoint_data: Dict[str, Any]):
+        """
+        Saves a workflow checkpoint to cache, replacing any previous version.
+
+        Args:
+            session_id: The workflow session the checkpoint belongs to.
+            checkpoint_id: The unique identifier for the checkpoint.
+            checkpoint_data: The complete checkpoint data.
+        """
+        # Update memory cache
+        self._checkpoint_cache[checkpoint_id] = checkpoint_data
+
+        # Save to disk
+        checkpoint_file = self._get_checkpoint_file(session_id, checkpoint_id)
+        try:
+            checkpoint_file.parent.mkdir(exist_ok=True)
+            with open(checkpoint_file, "w") as f:
+                json.dump(checkpoint_data, f, indent=2, default=str)
+        except Exception as e:
+            logger.error(f"Failed to save workflow checkpoint {checkpoint_id} to disk: {e}", exc_info=True)
+
+    def delete_workflow_checkpoints(self, session_id: str) -> bool:
+        """
+        Delete all workflow checkpoints of a session from cache and disk.
+
+        Args:
+            session_id: The workflow session ID.
+
+        Returns:
+            True if any checkpoint was deleted, False otherwise.
+        """
+        checkpoint_ids = [
+            checkpoint_id
+            for checkpoint_id, data in self._checkpoint_cache.items()
+            if data.get("session_id") == session_id
+        ]
+        deleted = False
+        for checkpoint_id in checkpoint_ids:
+            del self._checkpoint_cache[checkpoint_id]
+            deleted = True
+
+        checkpoint_dir = self._cache_dir / "checkpoints"
+        try:
+            for checkpoint_file in checkpoint_dir.glob(f"{self._checkpoint_key(session_id)}_*.json"):
+                checkpoint_file.unlink()
+                deleted = True
+        except Exception as e:
+            logger.error(f"Failed to delete workflow checkpoints for {session_id}: {e}")
+        return deleted
@@ -0,0 +1,85 @@
+"""
+Indexed on-disk store for cached QA results.
+
+QA case and evaluation results are cached under content-addressed keys, so an
+unchanged test suite can reuse them and any change to the component or its
+dependencies misses. The store is a single SQLite database,
+`.aurite_cache/qa_results.db`, instead of one JSON file per result: lookups are
+primary key reads, and every entry records when it expires so stale results are
+evicted in bulk by one indexed delete rather than by opening each file.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Minimum number of seconds between two bulk evictions of expired entries.
+EVICTION_INTERVAL = 60.0
+
+
+class QAResultCache:
+    """QA results keyed by cache key, each with an expiry time."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), timeout=5, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS qa_results "
+                "(cache_key TEXT PRIMARY KEY, expires_at REAL NOT NULL, data TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS qa_results_expires_at ON qa_results (expires_at)")
+        self._last_eviction = 0.0
+        self.evict_expired()
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached data for a key, or None if there is none or it expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM qa_results WHERE cache_key = ? AND expires_at > ?", (cache_key, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, cache_key: str, data: Dict[str, Any], ttl: float):
+        """Stores data under a key for `ttl` seconds, replacing any previous entry."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO qa_results (cache_key, expires_at, data) VALUES (?, ?, ?)",
+                (cache_key, now + ttl, json.dumps(data, default=str)),
+            )
+        if now - self._last_eviction >= EVICTION_INTERVAL:
+            self.evict_expired()
+
+    def delete(self, cache_key: str) -> bool:
+        """Removes an entry. Returns True if it existed."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM qa_results WHERE cache_key = ?", (cache_key,))
+        return cursor.rowcount > 0
+
+    def evict_expired(self) -> int:
+        """Deletes every expired entry and returns how many were removed."""
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM qa_results WHERE expires_at <= ?", (now,))
+        self._last_eviction = now
+        if cursor.rowcount:
+            logger.debug(f"Evicted {cursor.rowcount} expired QA results from {self._path}")
+        return cursor.rowcount
+
+    def clear(self):
+        """Deletes every entry."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM qa_results")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
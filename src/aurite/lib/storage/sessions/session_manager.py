@@ -18,7 +18,7 @@ from ...models.api.responses import (
     LinearWorkflowExecutionResult,
     SessionMetadata,
 )
-from .cache_manager import CacheManager
+from .cache_manager import DEFAULT_QA_CACHE_TTL, CacheManager
 
 logger = logging.getLogger(__name__)
 
@@ -347,6 +347,9 @@ class SessionManager:
             # Finally, delete the main session file.
             cache_deleted = self._cache.delete_session(session_id)
 
+            if session_to_delete.is_workflow:
+                self.delete_workflow_checkpoints(session_id)
+
         return db_deleted or cache_deleted
 
     def get_session_metadata(self, session_id: str) -> Optional[SessionMetadata]:
@@ -659,20 +662,23 @@ class SessionManager:
             base_session_id=session_data.get("base_session_id"),
         )
 
-    def save_qa_case_result(self, cache_key: str, cache_data: Dict[str, Any]) -> bool:
+    def save_qa_case_result(
+        self, cache_key: str, cache_data: Dict[str, Any], ttl: float = DEFAULT_QA_CACHE_TTL
+    ) -> bool:
         """
         Save a QA case result to cache.
 
         Args:
             cache_key: The cache key to store under
             cache_data: The cache data containing result and metadata
+            ttl: Seconds until the entry expires and can be evicted
 
         Returns:
             True if saved successfully, False otherwise
         """
         try:
             # Use cache manager to store the QA case result
-            self._cache.save_qa_case_result(cache_key, cache_data)
+            self._cache.save_qa_case_result(cache_key, cache_data, ttl=ttl)
             return True
         except Exception as e:
             logger.error(f"Failed to save QA case result for key {cache_key}: {e}")
@@ -694,20 +700,23 @@ class SessionManager:
             logger.error(f"Failed to get QA case result for key {cache_key}: {e}")
             return None
 
-    def save_qa_evaluation_result(self, cache_key: str, cache_data: Dict[str, Any]) -> bool:
+    def save_qa_evaluation_result(
+        self, cache_key: str, cache_data: Dict[str, Any], ttl: float = DEFAULT_QA_CACHE_TTL
+    ) -> bool:
         """
         Save a QA evaluation result to cache.
 
         Args:
             cache_key: The cache key to store under
             cache_data: The cache data containing result and metadata
+            ttl: Seconds until the entry expires and can be evicted
 
         Returns:
             True if saved successfully, False otherwise
         """
         try:
             # Use cache manager to store the QA evaluation result
-            self._cache.save_qa_evaluation_result(cache_key, cache_data)
+            self._cache.save_qa_evaluation_result(cache_key, cache_data, ttl=ttl)
             return True
         except Exception as e:
             logger.error(f"Failed to save QA evaluation result for key {cache_key}: {e}")
@@ -729,6 +738,89 @@ class SessionManager:
             logger.error(f"Failed to get QA evaluation result for key {cache_key}: {e}")
             return None
 
+    @staticmethod
+    def _checkpoint_id(session_id: str, workflow_name: str) -> str:
+        # Nested workflows run under their parent's session, so the workflow name is part of the key
+        return f"{session_id}__{workflow_name}"
+
+    def save_workflow_checkpoint(self, checkpoint: Dict[str, Any]) -> bool:
+        """
+        Save the checkpoint of a workflow run so it can be resumed.
+
+        Args:
+            checkpoint: Checkpoint data containing at least session_id and workflow_name
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        checkpoint_id = self._checkpoint_id(checkpoint["session_id"], checkpoint["workflow_name"])
+
+        # Save to database if available
+        db_saved = False
+        if self._use_db and self._storage:
+            try:
+                db_saved = self._storage.save_workflow_checkpoint(checkpoint_id, checkpoint)
+            except Exception as e:
+                logger.warning(f"Failed to save workflow checkpoint {checkpoint_id} to database: {e}")
+
+        # Always save to cache for fast access
+        try:
+            self._cache.save_workflow_checkpoint(checkpoint["session_id"], checkpoint_id, checkpoint)
+        except Exception as e:
+            logger.error(f"Failed to save workflow checkpoint {checkpoint_id} to cache: {e}")
+            return db_saved
+
+        return True
+
+    def get_workflow_checkpoint(self, session_id: str, workflow_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the checkpoint of a workflow run.
+
+        Args:
+            session_id: The workflow session ID
+            workflow_name: The name of the workflow
+
+        Returns:
+            Checkpoint data, or None if the run has no checkpoint
+        """
+        checkpoint_id = self._checkpoint_id(session_id, workflow_name)
+
+        # Check cache first for fast access
+        checkpoint = self._cache.get_workflow_checkpoint(session_id, checkpoint_id)
+        if checkpoint:
+            return checkpoint
+
+        # Fall back to database if available
+        if self._use_db and self._storage:
+            try:
+                checkpoint = self._storage.get_workflow_checkpoint(checkpoint_id)
+                if checkpoint:
+                    # Update cache for future access
+                    self._cache.save_workflow_checkpoint(session_id, checkpoint_id, checkpoint)
+                    return checkpoint
+            except Exception as e:
+                logger.warning(f"Failed to get workflow checkpoint {checkpoint_id} from database: {e}")
+
+        return None
+
+    def delete_workflow_checkpoints(self, session_id: str) -> bool:
+        """
+        Delete all workflow checkpoints recorded for a session.
+
+        Args:
+            session_id: The workflow session ID
+
+        Returns:
+            True if any checkpoint was deleted, False otherwise
+        """
+        deleted = self._cache.delete_workflow_checkpoints(session_id)
+        if self._use_db and self._storage:
+            try:
+                deleted = self._storage.delete_workflow_checkpoints(session_id) or deleted
+            except Exception as e:
+                logger.warning(f"Failed to delete workflow checkpoints for {session_id} from database: {e}")
+        return deleted
+
     def _extract_metadata(self, execution_result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extracts metadata from a raw execution result dictionary.
@@ -0,0 +1,160 @@
+"""
+Caches for memoized workflow step results.
+
+Workflow steps with `memoize: true` look up their result here before running
+their agent. Entries are keyed by the component name, a hash of its resolved
+configuration and a hash of its input (see `step_cache_key`), and expire after
+an optional TTL. Three backends are provided: an in-process dictionary, a local
+SQLite file, and the Aurite database through the StorageManager. The backend is
+chosen with the AURITE_STEP_CACHE environment variable ("memory", "sqlite" or "db").
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .db.db_manager import StorageManager
+
+logger = logging.getLogger(__name__)
+
+# Entries kept by the in-memory backend before the least recently used are evicted
+DEFAULT_MAX_MEMORY_ENTRIES = 1024
+
+
+class StepResultCache(ABC):
+    """Interface of the step result cache backends."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached value for the key, or None if it is missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None):
+        """Stores a JSON-serializable value. With a ttl (in seconds) the entry expires after that long."""
+
+    @abstractmethod
+    def clear(self):
+        """Removes every entry."""
+
+
+class InMemoryStepResultCache(StepResultCache):
+    """
+    Keeps step results in memory for the lifetime of the process, evicting the least
+    recently used entries beyond `max_entries`. Values are stored serialized, so callers
+    get a fresh copy that they can modify without changing the cached result.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_MEMORY_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[str, Optional[float]]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return json.loads(value)
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (json.dumps(value, default=str), time.time() + ttl if ttl is not None else None)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class SQLiteStepResultCache(StepResultCache):
+    """Keeps step results in a local SQLite file, so they survive restarts of the CLI or API."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS step_results (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM step_results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= time.time():
+                with self._conn:
+                    self._conn.execute("DELETE FROM step_results WHERE key = ?", (key,))
+                return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None):
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO step_results (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, default=str), expires_at),
+            )
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM step_results")
+
+
+class DatabaseStepResultCache(StepResultCache):
+    """Keeps step results in the Aurite database, shared by every process using it."""
+
+    def __init__(self, storage_manager: "StorageManager"):
+        self._storage = storage_manager
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._storage.get_step_result(key)
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None):
+        self._storage.save_step_result(key, value, ttl)
+
+    def clear(self):
+        self._storage.clear_step_results()
+
+
+def step_cache_key(component_name: str, config_hash: str, input_hash: str) -> str:
+    """The cache key of a step: its component, resolved configuration and input."""
+    return f"{component_name}:{config_hash}:{input_hash}"
+
+
+def create_step_result_cache(
+    storage_manager: Optional["StorageManager"] = None, cache_dir: Optional[Path] = None
+) -> StepResultCache:
+    """
+    Creates the step result cache selected by AURITE_STEP_CACHE. By default the database
+    is used when one is configured, then a SQLite file in the cache directory, then memory.
+    """
+    backend = os.getenv("AURITE_STEP_CACHE", "").lower()
+    has_db = bool(storage_manager and getattr(storage_manager, "_engine", None))
+    if not backend:
+        backend = "db" if has_db else "sqlite" if cache_dir else "memory"
+
+    if backend == "db":
+        if has_db and storage_manager:
+            return DatabaseStepResultCache(storage_manager)
+        logger.warning("AURITE_STEP_CACHE=db but no database is configured. Using an in-memory step cache.")
+    elif backend == "sqlite":
+        return SQLiteStepResultCache((cache_dir or Path(".aurite_cache")) / "step_results.db")
+    elif backend != "memory":
+        logger.warning(f"Unknown AURITE_STEP_CACHE backend '{backend}'. Using an in-memory step cache.")
+    return InMemoryStepResultCache()
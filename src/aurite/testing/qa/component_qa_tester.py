@@ -8,28 +8,36 @@ This module provides a single, unified QA tester that handles all component type
 import asyncio
 import logging
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
 
 from aurite.lib.models.api.requests import EvaluationRequest
 
+from .judge_batcher import JudgeBatcher
+from .qa_benchmark import run_benchmark, summarize_samples
+from .qa_fingerprint import fingerprint_component
 from .qa_models import (
     CaseEvaluationResult,
     ComponentQAConfig,
     QAEvaluationResult,
 )
+from .qa_scheduler import QACaseScheduler, is_transient_error
 from .qa_utils import (
     analyze_expectations,
+    build_mcp_test_agent_config,
     execute_component,
     generate_cache_key,
     generate_evaluation_cache_key,
     get_cached_case_result,
     get_cached_evaluation_result,
+    get_component_name,
     get_llm_client,
     store_cached_case_result,
     store_cached_evaluation_result,
     validate_schema,
 )
+from .shared_evaluation import SharedEvaluation
 
 if TYPE_CHECKING:
     from aurite.execution.aurite_engine import AuriteEngine
@@ -59,12 +67,17 @@ class ComponentQATester:
             component_type="unified",  # This tester handles all types
             default_timeout=90.0,  # Reasonable default for most components
             parallel_execution=True,  # Most components can run in parallel
+            max_concurrency=10,
             max_retries=1,
         )
         self.logger = logging.getLogger(self.__class__.__name__)
 
     async def test_component(
-        self, request: EvaluationRequest, executor: Optional["AuriteEngine"] = None
+        self,
+        request: EvaluationRequest,
+        executor: Optional["AuriteEngine"] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        shared: Optional[SharedEvaluation] = None,
     ) -> QAEvaluationResult:
         """
         Execute QA tests for any component type.
@@ -72,6 +85,9 @@ class ComponentQATester:
         Args:
             request: The QA test request containing test cases and configuration
             executor: Optional AuriteEngine instance for executing the component
+            on_progress: Optional callback receiving a progress event as each test case finishes
+            shared: Optional review LLM client, concurrency budget and component outputs shared
+                with the evaluations of other components
 
         Returns:
             QAEvaluationResult containing the test results
@@ -81,12 +97,22 @@ class ComponentQATester:
 
         self.logger.info(f"Starting QA testing {evaluation_id}")
 
+        if request.benchmark and request.use_cache:
+            # Cached results carry no measurements
+            request = request.model_copy(update={"use_cache": False})
+
+        # Cached results are keyed on a content hash of the component and everything it depends on
+        component_fingerprint = None
+        if request.use_cache or shared:
+            component_fingerprint = self._component_fingerprint(request, executor)
+
         # Check for cached evaluation result first (if caching is enabled and not forced refresh)
         if request.use_cache and not request.force_refresh and request.evaluation_config_id:
             evaluation_cache_key = generate_evaluation_cache_key(
                 evaluation_config_id=request.evaluation_config_id,
                 test_cases=request.test_cases,
                 review_llm=request.review_llm,
+                component_fingerprint=component_fingerprint,
             )
 
             session_manager = None
@@ -111,13 +137,38 @@ class ComponentQATester:
         self.logger.debug("No cached evaluation found, executing component tests")
 
         # Get LLM client for evaluation
-        llm_client = await self._get_llm_client(request, executor)
+        if shared and shared.llm_client:
+            llm_client = shared.llm_client
+        else:
+            llm_client = await self._get_llm_client(request, executor)
+
+        # With batching, the review LLM judges the outputs of several concurrent cases in one request
+        judge = None
+        if request.judge_batch_size > 1:
+            judge = JudgeBatcher(
+                llm_client,
+                component_context=request.component_config or {},
+                max_cases=request.judge_batch_size,
+                max_tokens=request.judge_batch_max_tokens,
+            )
 
-        tasks = [
-            self._evaluate_single_case(case=case, llm_client=llm_client, request=request, executor=executor)
-            for case in request.test_cases
-        ]
-        case_results = await asyncio.gather(*tasks, return_exceptions=True)
+        scheduler = self._create_scheduler(request, on_progress, semaphore=shared.semaphore if shared else None)
+        with self._mcp_test_agent(request, executor) as mcp_test_agent:
+            case_results = await scheduler.run(
+                request.test_cases,
+                lambda case: self._evaluate_single_case(
+                    case=case,
+                    llm_client=llm_client,
+                    request=request,
+                    executor=executor,
+                    judge=judge,
+                    mcp_test_agent=mcp_test_agent,
+                    component_fingerprint=component_fingerprint,
+                    shared=shared,
+                ),
+                case_id=lambda case: str(case.id),
+                passed=lambda result: result.grade == "PASS",
+            )
 
         # Process results and handle any exceptions
         processed_results: Dict[str, CaseEvaluationResult] = {}
@@ -125,7 +176,7 @@ class ComponentQATester:
 
         for case, result in zip(request.test_cases, case_results, strict=False):
             case_id_str = str(case.id)
-            if isinstance(result, Exception):
+            if isinstance(result, BaseException):
                 # Create a failed result for exceptions
                 processed_results[case_id_str] = CaseEvaluationResult(
                     case_id=case_id_str,
@@ -173,6 +224,7 @@ class ComponentQATester:
             started_at=started_at,
             completed_at=completed_at,
             duration_seconds=(completed_at - started_at).total_seconds(),
+            benchmark=self._summarize_benchmark(request, processed_results) if request.benchmark else None,
         )
 
         # Store evaluation result in cache if caching is enabled
@@ -181,6 +233,7 @@ class ComponentQATester:
                 evaluation_config_id=request.evaluation_config_id,
                 test_cases=request.test_cases,
                 review_llm=request.review_llm,
+                component_fingerprint=component_fingerprint,
             )
 
             session_manager = None
@@ -191,16 +244,92 @@ class ComponentQATester:
                 cache_key=evaluation_cache_key,
                 result=evaluation_result,
                 session_manager=session_manager,
+                cache_ttl=request.cache_ttl,
             )
 
         return evaluation_result
 
+    def _summarize_benchmark(
+        self, request: EvaluationRequest, results: Dict[str, CaseEvaluationResult]
+    ) -> Dict[str, Any]:
+        """
+        Summarizes the benchmark samples of all test cases of an evaluation.
+        """
+        samples = [sample for result in results.values() if result.benchmark for sample in result.benchmark["samples"]]
+        return {
+            **summarize_samples(samples),
+            "warmup": request.benchmark_warmup,
+            "benchmarked_cases": sum(1 for result in results.values() if result.benchmark),
+        }
+
+    def max_concurrency(self, request: EvaluationRequest) -> int:
+        """
+        Returns how many test cases of a request may run at once.
+        """
+        if not self.config.parallel_execution:
+            return 1
+        return request.max_concurrency or self.config.max_concurrency
+
+    def _create_scheduler(
+        self,
+        request: EvaluationRequest,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> QACaseScheduler:
+        """
+        Creates the scheduler for the test cases of a request. Limits set on the request
+        take precedence over the tester's configuration, and a shared semaphore over both.
+        """
+        timeout = request.case_timeout if request.case_timeout is not None else self.config.default_timeout
+        if request.benchmark and timeout is not None:
+            # The timeout applies to each run of a benchmarked case
+            timeout *= request.benchmark_iterations + request.benchmark_warmup
+        return QACaseScheduler(
+            max_concurrency=self.max_concurrency(request),
+            timeout=timeout,
+            max_retries=request.max_retries if request.max_retries is not None else self.config.max_retries,
+            retry_backoff=self.config.retry_backoff,
+            on_progress=on_progress,
+            semaphore=semaphore,
+        )
+
+    def _component_fingerprint(self, request: EvaluationRequest, executor: Optional["AuriteEngine"] = None) -> str:
+        """
+        Hashes the resolved component under test, its dependencies and the review LLM.
+        """
+        config_manager = executor._config_manager if executor else None
+        component_type = request.component_type or (request.component_config or {}).get("type", "")
+        return fingerprint_component(
+            component_type, request.component_config, config_manager, review_llm=request.review_llm
+        )
+
+    @contextmanager
+    def _mcp_test_agent(
+        self, request: EvaluationRequest, executor: Optional["AuriteEngine"]
+    ) -> Iterator[Optional[str]]:
+        """
+        Registers the agent that runs the test cases of an MCP server evaluation, in memory and
+        for the duration of the evaluation, and yields its name. Yields None for other requests.
+        """
+        server_name = get_component_name(request)
+        if request.component_type != "mcp_server" or not executor or not server_name or request.run_agent:
+            yield None
+            return
+
+        agent_config = build_mcp_test_agent_config(server_name, request.review_llm)
+        with executor._config_manager.ephemeral_component("agent", agent_config) as agent_name:
+            yield agent_name
+
     async def _evaluate_single_case(
         self,
         case,
         llm_client,
         request: EvaluationRequest,
         executor: Optional["AuriteEngine"] = None,
+        judge: Optional[JudgeBatcher] = None,
+        mcp_test_agent: Optional[str] = None,
+        component_fingerprint: Optional[str] = None,
+        shared: Optional[SharedEvaluation] = None,
     ) -> CaseEvaluationResult:
         """
         Evaluate a single test case for any component type.
@@ -210,6 +339,10 @@ class ComponentQATester:
             llm_client: LLM client for expectation analysis
             request: The overall test request
             executor: Optional AuriteEngine for component execution
+            judge: Optional batcher that analyzes expectations together with other cases
+            mcp_test_agent: Optional name of the agent that runs MCP server test cases
+            component_fingerprint: Optional content hash of the component graph, used in cache keys
+            shared: Optional resources shared with other component evaluations
 
         Returns:
             CaseEvaluationResult for this test case
@@ -227,6 +360,8 @@ class ComponentQATester:
                     evaluation_config_id=request.evaluation_config_id,
                     review_llm=request.review_llm,
                     expectations=case.expectations,
+                    component_fingerprint=component_fingerprint,
+                    case_output=case.output,
                 )
 
                 # Try to get cached result
@@ -250,7 +385,24 @@ class ComponentQATester:
             self.logger.debug(f"No cached result found for case {case.id}, executing component")
 
             # Get the output using the utility function (supports custom execution)
-            output = await execute_component(case, request, executor)
+            benchmark = None
+            if request.benchmark and case.output is None:
+                output, samples = await run_benchmark(
+                    lambda: execute_component(case, request, executor, mcp_test_agent=mcp_test_agent),
+                    iterations=request.benchmark_iterations,
+                    warmup=request.benchmark_warmup,
+                )
+                sample_dicts = [sample.to_dict() for sample in samples]
+                benchmark = {**summarize_samples(sample_dicts), "samples": sample_dicts}
+            elif shared and component_fingerprint and case.output is None:
+                # Identical components run each input once across all evaluations of the request
+                output = await shared.execute(
+                    component_fingerprint,
+                    str(case.input),
+                    lambda: execute_component(case, request, executor, mcp_test_agent=mcp_test_agent),
+                )
+            else:
+                output = await execute_component(case, request, executor, mcp_test_agent=mcp_test_agent)
 
             # Validate schema if provided using utility function
             schema_result = None
@@ -268,6 +420,7 @@ class ComponentQATester:
                         schema_valid=False,
                         schema_errors=schema_result.validation_errors,
                         execution_time=(datetime.utcnow() - start_time).total_seconds(),
+                        benchmark=benchmark,
                     )
                     # Don't cache failed schema validation results
                     return result
@@ -275,7 +428,10 @@ class ComponentQATester:
             # Analyze expectations using utility function with component context
             if case.expectations:
                 component_context = request.component_config or {}
-                expectation_result = await analyze_expectations(case, output, llm_client, component_context)
+                if judge:
+                    expectation_result = await judge.analyze(case, output)
+                else:
+                    expectation_result = await analyze_expectations(case, output, llm_client, component_context)
 
                 grade = "PASS" if not expectation_result.expectations_broken else "FAIL"
 
@@ -288,6 +444,7 @@ class ComponentQATester:
                     expectations_broken=expectation_result.expectations_broken,
                     schema_valid=schema_result.is_valid if schema_result else True,
                     execution_time=(datetime.utcnow() - start_time).total_seconds(),
+                    benchmark=benchmark,
                 )
             else:
                 # No expectations to check, just schema validation
@@ -300,6 +457,7 @@ class ComponentQATester:
                     expectations_broken=[],
                     schema_valid=schema_result.is_valid if schema_result else True,
                     execution_time=(datetime.utcnow() - start_time).total_seconds(),
+                    benchmark=benchmark,
                 )
 
             # Store result in cache if caching is enabled and result is successful
@@ -310,6 +468,8 @@ class ComponentQATester:
                     evaluation_config_id=request.evaluation_config_id,
                     review_llm=request.review_llm,
                     expectations=case.expectations,
+                    component_fingerprint=component_fingerprint,
+                    case_output=case.output,
                 )
 
                 session_manager = None
@@ -320,11 +480,14 @@ class ComponentQATester:
                     cache_key=cache_key,
                     result=result,
                     session_manager=session_manager,
+                    cache_ttl=request.cache_ttl,
                 )
 
             return result
 
         except Exception as e:
+            if is_transient_error(e):
+                raise  # Retried by the scheduler
             self.logger.error(f"Error evaluating {request.component_type} case {case.id}: {e}")
             return CaseEvaluationResult(
                 case_id=str(case.id),
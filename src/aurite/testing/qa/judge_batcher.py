@@ -0,0 +1,93 @@
+"""
+Batching of review LLM calls across concurrently evaluated test cases.
+
+Test cases are evaluated independently, each asking the review LLM whether its
+output meets its expectations. With batching enabled, the JudgeBatcher collects
+the analysis requests of cases that reach the review step at about the same
+time and sends them as a single request, so the system prompt is paid once per
+batch instead of once per case. A batch is sent when it holds `max_cases`
+cases, when the next case would exceed its token budget, or `linger` seconds
+after its first case arrived.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from aurite.lib.components.llm.litellm_client import LiteLLMClient
+
+from .qa_models import ExpectationAnalysisResult
+from .qa_utils import analyze_expectations_batch, estimate_judge_tokens
+
+if TYPE_CHECKING:
+    from aurite.lib.models.api.requests import EvaluationCase
+
+logger = logging.getLogger(__name__)
+
+
+class JudgeBatcher:
+    """Groups the expectation analyses of concurrent test cases into batched review LLM requests."""
+
+    def __init__(
+        self,
+        llm_client: LiteLLMClient,
+        component_context: Optional[Dict[str, Any]] = None,
+        max_cases: int = 10,
+        max_tokens: int = 8000,
+        linger: float = 0.2,
+    ):
+        self.llm_client = llm_client
+        self.component_context = component_context
+        self.max_cases = max_cases
+        self.max_tokens = max_tokens
+        self.linger = linger
+        self._pending: List[Tuple["EvaluationCase", Any, asyncio.Future]] = []
+        self._pending_tokens = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches: Set[asyncio.Task] = set()
+
+    async def analyze(self, case: "EvaluationCase", output: Any) -> ExpectationAnalysisResult:
+        """Analyzes a test case's output as part of the next batch."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        tokens = estimate_judge_tokens(case, output)
+
+        if self._pending and self._pending_tokens + tokens > self.max_tokens:
+            self._flush()
+        self._pending.append((case, output, future))
+        self._pending_tokens += tokens
+
+        if len(self._pending) >= self.max_cases or self._pending_tokens >= self.max_tokens:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # Cases that timed out while waiting for their batch no longer need a result
+        batch = [item for item in self._pending if not item[2].done()]
+        self._pending = []
+        self._pending_tokens = 0
+        if batch:
+            task = asyncio.create_task(self._judge(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _judge(self, batch: List[Tuple["EvaluationCase", Any, asyncio.Future]]):
+        logger.debug(f"Sending a batched review request for {len(batch)} test cases")
+        try:
+            results = await analyze_expectations_batch(
+                [(case, output) for case, output, _ in batch], self.llm_client, self.component_context
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,202 @@
+"""
+Benchmark mode for QA evaluations.
+
+With `benchmark` enabled on an EvaluationRequest, each test case runs its
+component `benchmark_warmup` times without measuring, then
+`benchmark_iterations` times while measuring. Each measured run records its
+end-to-end latency, the time to the first LLM token, the LLM tokens sent and
+received, the number of LLM and tool calls and the time spent per phase (see
+aurite.utils.latency). The last output is graded as usual. Samples are kept on
+each case result and summarized (p50/p95/p99 and means) per case and for the
+whole evaluation, which is persisted with the QA result so that runs can be
+compared later with `compare_benchmarks`.
+"""
+
+import math
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from aurite.lib.components.llm.usage import track_usage
+from aurite.utils.latency import LatencyBreakdown, track_latency
+
+# Metrics shown for each run in a comparison, as (name, path in the benchmark summary).
+COMPARISON_METRICS = (
+    ("latency_p50_ms", ("latency_ms", "p50")),
+    ("latency_p95_ms", ("latency_ms", "p95")),
+    ("latency_p99_ms", ("latency_ms", "p99")),
+    ("ttft_p50_ms", ("ttft_ms", "p50")),
+    ("prompt_tokens_mean", ("tokens", "prompt_mean")),
+    ("completion_tokens_mean", ("tokens", "completion_mean")),
+    ("tool_calls_mean", ("tool_calls_mean",)),
+    ("throughput_per_second", ("throughput_per_second",)),
+)
+
+
+@dataclass
+class BenchmarkSample:
+    """Measurements of one run of a component."""
+
+    latency_ms: float
+    started_at: float
+    ttft_ms: Optional[float] = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    llm_calls: int = 0
+    tool_calls: int = 0
+    phases: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        sample = asdict(self)
+        sample["latency_ms"] = round(self.latency_ms, 3)
+        return sample
+
+
+def _time_to_first_token(breakdown: LatencyBreakdown) -> Optional[float]:
+    """
+    Milliseconds from the start of the run until the first LLM call produced its first token. For
+    non-streamed calls the first token arrives with the whole response.
+    """
+    for phase in ("llm_ttft", "llm_total"):
+        spans = [span for span in breakdown.spans if span.phase == phase]
+        if spans:
+            first = min(spans, key=lambda span: span.start_ms)
+            return round(first.start_ms + first.duration_ms, 3)
+    return None
+
+
+async def measure(run: Callable[[], Awaitable[Any]]) -> Tuple[Any, BenchmarkSample]:
+    """Runs a component once and returns its output with the measurements of the run."""
+    with track_latency() as breakdown, track_usage() as usage:
+        started_at = time.time()
+        start = time.perf_counter()
+        output = await run()
+        latency_ms = (time.perf_counter() - start) * 1000
+
+    sample = BenchmarkSample(
+        latency_ms=latency_ms,
+        started_at=started_at,
+        ttft_ms=_time_to_first_token(breakdown),
+        prompt_tokens=usage.prompt_tokens,
+        completion_tokens=usage.completion_tokens,
+        llm_calls=usage.calls,
+        tool_calls=sum(1 for span in breakdown.spans if span.phase == "tool_call"),
+        phases=breakdown.phase_totals(),
+    )
+    return output, sample
+
+
+async def run_benchmark(
+    run: Callable[[], Awaitable[Any]], iterations: int, warmup: int = 0
+) -> Tuple[Any, List[BenchmarkSample]]:
+    """Runs a component `warmup` times, then `iterations` measured times, and returns the last output."""
+    for _ in range(warmup):
+        await run()
+    output = None
+    samples = []
+    for _ in range(iterations):
+        output, sample = await measure(run)
+        samples.append(sample)
+    return output, samples
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile (0-100) of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return round(ordered[rank - 1], 3)
+
+
+def _distribution(values: List[float]) -> Optional[Dict[str, float]]:
+    if not values:
+        return None
+    return {
+        "p50": _percentile(values, 50),
+        "p95": _percentile(values, 95),
+        "p99": _percentile(values, 99),
+        "mean": round(sum(values) / len(values), 3),
+        "min": round(min(values), 3),
+        "max": round(max(values), 3),
+    }
+
+
+def summarize_samples(samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summarizes benchmark samples (as returned by BenchmarkSample.to_dict). Throughput is the number
+    of measured runs per second of wall time from the start of the first run to the end of the last.
+    """
+    if not samples:
+        return {"iterations": 0}
+
+    count = len(samples)
+    window = max(s["started_at"] + s["latency_ms"] / 1000 for s in samples) - min(s["started_at"] for s in samples)
+    phase_names = sorted({phase for s in samples for phase in s["phases"]})
+    return {
+        "iterations": count,
+        "latency_ms": _distribution([s["latency_ms"] for s in samples]),
+        "ttft_ms": _distribution([s["ttft_ms"] for s in samples if s["ttft_ms"] is not None]),
+        "tokens": {
+            "prompt_total": sum(s["prompt_tokens"] for s in samples),
+            "completion_total": sum(s["completion_tokens"] for s in samples),
+            "prompt_mean": round(sum(s["prompt_tokens"] for s in samples) / count, 3),
+            "completion_mean": round(sum(s["completion_tokens"] for s in samples) / count, 3),
+        },
+        "llm_calls_mean": round(sum(s["llm_calls"] for s in samples) / count, 3),
+        "tool_calls_mean": round(sum(s["tool_calls"] for s in samples) / count, 3),
+        "phases_mean_ms": {
+            phase: round(sum(s["phases"].get(phase, 0.0) for s in samples) / count, 3) for phase in phase_names
+        },
+        "throughput_per_second": round(count / window, 3) if window > 0 else None,
+    }
+
+
+def _metric(summary: Dict[str, Any], path: Tuple[str, ...]) -> Optional[float]:
+    value: Any = summary
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value if isinstance(value, (int, float)) else None
+
+
+def compare_benchmarks(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Builds a comparison report of stored benchmark results.
+
+    Args:
+        results: Stored QA test results (as returned by SessionManager.get_qa_test_result), the
+            first of which is the baseline
+
+    Returns:
+        One row per run with its headline metrics, and for every run after the first the
+        relative change of each metric from the baseline, in percent
+    """
+    runs = []
+    for entry in results:
+        result = entry.get("result", entry)
+        summary = result.get("benchmark") or {}
+        runs.append(
+            {
+                "result_id": entry.get("result_id"),
+                "component_name": result.get("component_name"),
+                "created_at": entry.get("created_at") or result.get("started_at"),
+                "overall_score": result.get("overall_score"),
+                "iterations": summary.get("iterations", 0),
+                **{name: _metric(summary, path) for name, path in COMPARISON_METRICS},
+            }
+        )
+
+    if runs:
+        baseline = runs[0]
+        for run in runs[1:]:
+            run["change_from_baseline_pct"] = {
+                name: round((run[name] - baseline[name]) / baseline[name] * 100, 2)
+                for name, _ in COMPARISON_METRICS
+                if run[name] is not None and baseline[name]
+            }
+
+    return {
+        "baseline": runs[0]["result_id"] if runs else None,
+        "metrics": [name for name, _ in COMPARISON_METRICS],
+        "runs": runs,
+    }
@@ -8,13 +8,15 @@ ComponentQATester for actual test execution.
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Dict, Optional
 
 from aurite.lib.config.config_manager import ConfigManager
 from aurite.lib.models.api.requests import EvaluationRequest
 
 from .component_qa_tester import ComponentQATester
 from .qa_models import QAEvaluationResult
+from .qa_utils import get_llm_client
+from .shared_evaluation import SharedEvaluation
 
 if TYPE_CHECKING:
     from aurite.execution.aurite_engine import AuriteEngine
@@ -43,7 +45,10 @@ class QAEngine:
         self._component_tester = ComponentQATester()
 
     async def evaluate_component(
-        self, request: EvaluationRequest, executor: Optional["AuriteEngine"] = None
+        self,
+        request: EvaluationRequest,
+        executor: Optional["AuriteEngine"] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> Dict[str, QAEvaluationResult]:
         """
         Main entry point for component evaluation.
@@ -55,6 +60,7 @@ class QAEngine:
         Args:
             request: The evaluation request containing test cases
             executor: Optional AuriteEngine for component execution
+            on_progress: Optional callback receiving a progress event as each test case finishes
 
         Returns:
             Dictionary mapping component names to QAEvaluationResult objects
@@ -78,7 +84,7 @@ class QAEngine:
 
         # Handle multiple components if specified
         if request.component_refs and len(request.component_refs) > 1:
-            return await self._evaluate_multiple_components(request, executor)
+            return await self._evaluate_multiple_components(request, executor, on_progress)
 
         # Handle single component (either from component_refs[0] or component_config)
         component_name = None
@@ -120,7 +126,9 @@ class QAEngine:
 
         self.logger.info("QAEngine: Delegating to unified ComponentQATester")
         # Delegate to the unified component tester
-        result = await self._component_tester.test_component(request, executor)
+        result = await self._component_tester.test_component(
+            request, executor, on_progress=_tag_progress(on_progress, component_name)
+        )
 
         self.logger.info(f"QAEngine: Component tester completed with status: {result.status}")
         self.logger.info(f"QAEngine: Overall score: {result.overall_score:.2f}%")
@@ -128,32 +136,29 @@ class QAEngine:
             f"QAEngine: Passed/Failed/Total: {result.passed_cases}/{result.failed_cases}/{result.total_cases}"
         )
 
-        # Save result to storage if we have a session manager
-        if executor and hasattr(executor, "_session_manager") and executor._session_manager:
-            try:
-                # For single component results, save the result
-                # Use component_name as evaluation_config_id if available, otherwise "unknown"
-                config_id = component_name or "unknown"
-                result_id = executor._session_manager.save_qa_test_result(result.model_dump(), config_id)
-                if result_id:
-                    self.logger.info(f"QAEngine: Saved test result with ID: {result_id}")
-                else:
-                    self.logger.warning("QAEngine: Failed to save test result")
-            except Exception as e:
-                self.logger.error(f"QAEngine: Error saving test result: {e}")
+        # Use component_name as evaluation_config_id if available, otherwise "unknown"
+        self._save_result(result, component_name or "unknown", executor)
 
         # Return single result in dictionary format for consistency
         return {component_name or "component": result}
 
     async def _evaluate_multiple_components(
-        self, request: EvaluationRequest, executor: Optional["AuriteEngine"] = None
+        self,
+        request: EvaluationRequest,
+        executor: Optional["AuriteEngine"] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> Dict[str, QAEvaluationResult]:
         """
         Evaluate multiple components in parallel.
 
+        The evaluations share one review LLM client and one concurrency budget, so the number of
+        concurrent test cases stays at the request's limit however many components are compared.
+        Components with identical resolved configurations run each distinct input only once.
+
         Args:
             request: The evaluation request containing test cases and component references
             executor: Optional AuriteEngine for component execution
+            on_progress: Optional callback receiving a progress event as each test case finishes
 
         Returns:
             Dictionary mapping component names to QAEvaluationResult objects
@@ -161,13 +166,25 @@ class QAEngine:
         if not request.component_refs:
             raise ValueError("No component references provided for multi-component evaluation")
 
-        self.logger.info(f"QAEngine: Starting parallel evaluation of {len(request.component_refs)} components")
+        component_names = list(dict.fromkeys(request.component_refs))
+        self.logger.info(f"QAEngine: Starting parallel evaluation of {len(component_names)} components")
+
+        config_manager = executor._config_manager if executor else self.config_manager
+        try:
+            llm_client = await get_llm_client(request.review_llm, config_manager)
+        except ValueError as e:
+            # Each component evaluation reports the error in its result
+            self.logger.warning(f"QAEngine: Could not create the review LLM client: {e}")
+            llm_client = None
+        shared = SharedEvaluation(
+            max_concurrency=self._component_tester.max_concurrency(request), llm_client=llm_client
+        )
 
         # Create individual evaluation tasks for each component
         tasks = []
         component_type = request.component_type or "agent"
 
-        for component_name in request.component_refs:
+        for component_name in component_names:
             # Create a single-component request for each component
             single_request = request.model_copy(deep=True)
             single_request.component_refs = [component_name]
@@ -179,7 +196,9 @@ class QAEngine:
                 continue
 
             # Create task for this component
-            task = self._component_tester.test_component(single_request, executor)
+            task = self._component_tester.test_component(
+                single_request, executor, on_progress=_tag_progress(on_progress, component_name), shared=shared
+            )
             tasks.append((component_name, task))
 
         # Execute all tasks in parallel
@@ -214,10 +233,55 @@ class QAEngine:
                 final_results[component_name] = failed_result
             else:
                 final_results[component_name] = result
+                if isinstance(result, QAEvaluationResult):
+                    self._save_result(result, component_name, executor)
 
+        if shared.deduplicated:
+            self.logger.info(f"QAEngine: Reused {shared.deduplicated} outputs of identical component runs")
         self.logger.info(f"QAEngine: Completed parallel evaluation of {len(final_results)} components")
         return final_results
 
+    def _save_result(self, result: QAEvaluationResult, config_id: str, executor: Optional["AuriteEngine"] = None):
+        """
+        Save an evaluation result to storage if the executor has a session manager.
+        """
+        if not (executor and hasattr(executor, "_session_manager") and executor._session_manager):
+            return
+        try:
+            result_id = executor._session_manager.save_qa_test_result(result.model_dump(), config_id)
+            if result_id:
+                self.logger.info(f"QAEngine: Saved test result with ID: {result_id}")
+            else:
+                self.logger.warning("QAEngine: Failed to save test result")
+        except Exception as e:
+            self.logger.error(f"QAEngine: Error saving test result: {e}")
+
+    async def stream_evaluation(
+        self, request: EvaluationRequest, executor: Optional["AuriteEngine"] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Runs an evaluation and yields a progress event as each test case finishes or is retried,
+        followed by an `evaluation_complete` event carrying the results (or an `error` event).
+        """
+        queue: asyncio.Queue[Optional[Dict[str, Any]]] = asyncio.Queue()
+        task = asyncio.create_task(self.evaluate_component(request, executor, on_progress=queue.put_nowait))
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while (event := await queue.get()) is not None:
+                yield event
+            results = task.result()
+            yield {
+                "type": "evaluation_complete",
+                "data": {name: result.model_dump(mode="json") for name, result in results.items()},
+            }
+        except Exception as e:
+            self.logger.error(f"QAEngine: Error while streaming evaluation: {e}")
+            yield {"type": "error", "data": {"message": str(e)}}
+        finally:
+            # The consumer stopped early (e.g. the client disconnected)
+            if not task.done():
+                task.cancel()
+
     async def evaluate_by_config_id(
         self, evaluation_config_id: str, executor: Optional["AuriteEngine"] = None
     ) -> Dict[str, QAEvaluationResult]:
@@ -249,3 +313,12 @@ class QAEngine:
 
         # Execute the evaluation
         return await self.evaluate_component(request, executor)
+
+
+def _tag_progress(
+    on_progress: Optional[Callable[[Dict[str, Any]], None]], component_name: Optional[str]
+) -> Optional[Callable[[Dict[str, Any]], None]]:
+    """Adds the name of the evaluated component to the progress events of its test cases."""
+    if on_progress is None:
+        return None
+    return lambda event: on_progress({**event, "data": {**event["data"], "component": component_name}})
@@ -0,0 +1,161 @@
+"""
+Content fingerprints of the components under test.
+
+QA results are cached under keys derived from everything that can change a
+component's output. The fingerprint hashes the fully resolved component graph:
+the component's own config, the LLM configs it runs on, the MCP servers it can
+call, and every agent or workflow that a workflow runs, recursively. For stdio
+MCP servers and custom workflows, the content of the server script or workflow
+module is hashed as well, so code changes invalidate cached results even when
+the config stays the same. Bookkeeping fields added by the config index (source
+file, context paths) are ignored, so moving a config to another file does not,
+and so is the name of the component under test: two components configured the
+same way have the same fingerprint.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from aurite.lib.config.config_manager import ConfigManager
+
+logger = logging.getLogger(__name__)
+
+# Fields that do not change what a component does.
+IGNORED_FIELDS = {"description", "validated_at", "evaluation"}
+
+# Component types a workflow step given only by name can refer to, see LinearWorkflowExecutor.
+STEP_TYPES = ("agent", "linear_workflow", "custom_workflow")
+
+
+def _normalize(config: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in config.items() if not key.startswith("_") and key not in IGNORED_FIELDS}
+
+
+def _file_digest(path: Any) -> Optional[str]:
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def _step_references(step: Any) -> List[Tuple[Optional[str], str]]:
+    if isinstance(step, str):
+        return [(None, step)]
+    if isinstance(step, dict) and "parallel" in step:
+        return [ref for member in step["parallel"] for ref in _step_references(member)]
+    if isinstance(step, dict) and step.get("name"):
+        return [(step.get("type"), step["name"])]
+    return []
+
+
+def _references(component_type: str, config: Dict[str, Any]) -> List[Tuple[Optional[str], str]]:
+    """Returns the (type, name) of every component this one uses. A type of None means any step type."""
+    if component_type == "agent":
+        refs: List[Tuple[Optional[str], str]] = [("mcp_server", server) for server in config.get("mcp_servers") or []]
+        if config.get("llm_config_id"):
+            refs.append(("llm", config["llm_config_id"]))
+        return refs
+    if component_type == "linear_workflow":
+        return [ref for step in config.get("steps") or [] for ref in _step_references(step)]
+    if component_type == "graph_workflow":
+        return [(node.get("type", "agent"), node["name"]) for node in config.get("nodes") or [] if node.get("name")]
+    return []
+
+
+def _files(component_type: str, config: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    if component_type == "mcp_server" and config.get("server_path"):
+        return {"server_path": _file_digest(config["server_path"])}
+    if component_type == "custom_workflow" and config.get("module_path"):
+        return {"module_path": _file_digest(config["module_path"])}
+    return {}
+
+
+def resolve_component_graph(
+    component_type: str,
+    component_config: Optional[Dict[str, Any]],
+    config_manager: Optional["ConfigManager"] = None,
+    review_llm: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Resolves a component and everything it depends on.
+
+    Args:
+        component_type: The type of the component under test
+        component_config: Its configuration. The indexed config of the same name takes precedence,
+            since that is the one the engine runs.
+        config_manager: Optional ConfigManager used to look up dependencies. Without one, only
+            the component's own config is resolved.
+        review_llm: Optional review LLM config ID, resolved along with the component
+
+    Returns:
+        A dict of normalized configs and file digests, keyed by the component type for the component
+        itself and by "<type>:<name>" for its dependencies. Dependencies that cannot be found are
+        included as None.
+    """
+    graph: Dict[str, Any] = {}
+    component_config = component_config or {}
+    roots: List[Tuple[Optional[str], str]] = []
+
+    root_name = component_config.get("name", "")
+    root_config = component_config
+    if config_manager and root_name:
+        root_config = config_manager.get_config(component_type, root_name) or component_config
+    root = _normalize(root_config)
+    root.pop("name", None)
+    graph[component_type] = {"config": root, "files": _files(component_type, root_config)}
+    roots.extend(_references(component_type, root_config))
+    if review_llm:
+        roots.append(("llm", review_llm))
+
+    if not config_manager:
+        return graph
+
+    pending = list(roots)
+    while pending:
+        ref_type, name = pending.pop()
+        candidate_types = [ref_type] if ref_type else list(STEP_TYPES)
+        found = False
+        for candidate_type in candidate_types:
+            key = f"{candidate_type}:{name}"
+            if key in graph:
+                found = True
+                continue
+            config = config_manager.get_config(candidate_type, name)
+            if config is None:
+                continue
+            found = True
+            graph[key] = {"config": _normalize(config), "files": _files(candidate_type, config)}
+            pending.extend(_references(candidate_type, config))
+        if not found:
+            graph[f"{ref_type or 'component'}:{name}"] = None
+
+    return graph
+
+
+def fingerprint_component(
+    component_type: str,
+    component_config: Optional[Dict[str, Any]],
+    config_manager: Optional["ConfigManager"] = None,
+    review_llm: Optional[str] = None,
+) -> str:
+    """
+    Computes a content hash of a component and everything it depends on.
+
+    Args:
+        component_type: The type of the component under test
+        component_config: Its configuration
+        config_manager: Optional ConfigManager used to resolve dependencies
+        review_llm: Optional review LLM config ID, hashed along with the component
+
+    Returns:
+        A SHA-256 hex digest that changes whenever any resolved config or file changes
+    """
+    graph = resolve_component_graph(component_type, component_config, config_manager, review_llm)
+    graph_str = json.dumps(graph, sort_keys=True, default=str)
+    fingerprint = hashlib.sha256(graph_str.encode()).hexdigest()
+    logger.debug(f"Fingerprinted {len(graph)} components for {component_type}: {fingerprint[:12]}")
+    return fingerprint
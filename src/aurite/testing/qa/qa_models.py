@@ -40,6 +40,9 @@ class CaseEvaluationResult(BaseModel):
     schema_errors: List[str] = Field(default_factory=list, description="Schema validation errors if any")
     execution_time: Optional[float] = Field(default=None, description="Time taken to execute this test case in seconds")
     error: Optional[str] = Field(default=None, description="Error message if test case execution failed")
+    benchmark: Optional[Dict[str, Any]] = Field(
+        default=None, description="Benchmark statistics and samples of this test case, in benchmark mode"
+    )
 
 
 class QAEvaluationResult(BaseModel):
@@ -63,6 +66,9 @@ class QAEvaluationResult(BaseModel):
     started_at: datetime = Field(description="Timestamp when the evaluation started")
     completed_at: Optional[datetime] = Field(default=None, description="Timestamp when the evaluation completed")
     duration_seconds: Optional[float] = Field(default=None, description="Total duration of the evaluation in seconds")
+    benchmark: Optional[Dict[str, Any]] = Field(
+        default=None, description="Benchmark statistics over all test cases, in benchmark mode"
+    )
 
 
 class ComponentQAConfig(BaseModel):
@@ -71,4 +77,8 @@ class ComponentQAConfig(BaseModel):
     component_type: str = Field(description="Type of component this config applies to")
     default_timeout: float = Field(default=30.0, description="Default timeout for test execution in seconds")
     parallel_execution: bool = Field(default=True, description="Whether test cases can be executed in parallel")
-    max_retries: int = Field(default=0, description="Maximum number of retries for failed test cases")
+    max_retries: int = Field(
+        default=0, description="Maximum number of retries for test cases that failed on a transient LLM or MCP error"
+    )
+    max_concurrency: int = Field(default=10, ge=1, description="Maximum number of test cases executed at once")
+    retry_backoff: float = Field(default=1.0, description="Base delay in seconds of the exponential retry backoff")
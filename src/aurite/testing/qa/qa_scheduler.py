@@ -0,0 +1,161 @@
+"""
+Bounded-concurrency execution of QA test cases.
+
+Each test case runs the component and then the judge LLM, so evaluating every
+case at once opens as many agent runs and LLM calls as there are cases. The
+QACaseScheduler runs at most `max_concurrency` cases at a time, gives each
+attempt a timeout, and retries cases that failed on a transient LLM or MCP
+error (rate limits, provider timeouts, dropped connections) with exponential
+backoff. Progress is reported through an optional callback as cases finish.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar, Union
+
+from aurite.execution.mcp_host.session_supervisor import backoff_delay, is_connection_error
+from aurite.utils.errors import MCPServerTimeoutError
+
+logger = logging.getLogger(__name__)
+
+CaseT = TypeVar("CaseT")
+ResultT = TypeVar("ResultT")
+
+# Upper bound for the delay between two attempts of a case.
+MAX_RETRY_DELAY = 30.0
+
+# LiteLLM and OpenAI exceptions that are worth retrying, matched by name so neither has to be imported.
+TRANSIENT_LLM_ERRORS = {
+    "RateLimitError",
+    "APITimeoutError",
+    "APIConnectionError",
+    "InternalServerError",
+    "ServiceUnavailableError",
+    "Timeout",
+}
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Returns True if the error, or an error it was raised from, is a transient LLM or MCP failure."""
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, (asyncio.TimeoutError, MCPServerTimeoutError)) or is_connection_error(current):
+            return True
+        if any(cls.__name__ in TRANSIENT_LLM_ERRORS for cls in type(current).__mro__):
+            return True
+        current = current.__cause__
+    return False
+
+
+@dataclass
+class QAProgress:
+    """Running totals of an evaluation, sent with every progress event."""
+
+    total: int
+    completed: int = 0
+    passed: int = 0
+    failed: int = 0
+    retries: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "total": self.total,
+            "completed": self.completed,
+            "passed": self.passed,
+            "failed": self.failed,
+            "retries": self.retries,
+        }
+
+
+class QACaseScheduler:
+    """Runs test cases with a concurrency limit, per-attempt timeouts and retries of transient failures."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 10,
+        timeout: Optional[float] = None,
+        max_retries: int = 0,
+        retry_backoff: float = 1.0,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        # A semaphore shared with other schedulers replaces the per-run limit with a common budget
+        self.semaphore = semaphore
+        self.timeout = timeout
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        self.on_progress = on_progress
+
+    async def run(
+        self,
+        cases: Sequence[CaseT],
+        evaluate: Callable[[CaseT], Awaitable[ResultT]],
+        case_id: Callable[[CaseT], str] = str,
+        passed: Callable[[ResultT], bool] = lambda _: True,
+    ) -> List[Union[ResultT, BaseException]]:
+        """
+        Evaluates every case and returns the results in case order. A case that still fails
+        after its retries (or on a non-transient error) has its exception in place of a result.
+        """
+        semaphore = self.semaphore or asyncio.Semaphore(self.max_concurrency)
+        progress = QAProgress(total=len(cases))
+
+        async def run_case(case: CaseT) -> Union[ResultT, BaseException]:
+            async with semaphore:
+                outcome = await self._run_with_retries(case, evaluate, case_id(case), progress)
+            progress.completed += 1
+            success = not isinstance(outcome, BaseException) and passed(outcome)
+            if success:
+                progress.passed += 1
+            else:
+                progress.failed += 1
+            event_data: Dict[str, Any] = {"case_id": case_id(case), "grade": "PASS" if success else "FAIL"}
+            if isinstance(outcome, BaseException):
+                event_data["error"] = str(outcome)
+            self._emit("case_complete", event_data, progress)
+            return outcome
+
+        return list(await asyncio.gather(*(run_case(case) for case in cases)))
+
+    async def _run_with_retries(
+        self,
+        case: CaseT,
+        evaluate: Callable[[CaseT], Awaitable[ResultT]],
+        case_id: str,
+        progress: QAProgress,
+    ) -> Union[ResultT, BaseException]:
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await self._attempt(case, evaluate)
+            except Exception as e:
+                if attempt > self.max_retries or not is_transient_error(e):
+                    return e
+                delay = backoff_delay(attempt, self.retry_backoff, MAX_RETRY_DELAY)
+                progress.retries += 1
+                logger.warning(f"Test case {case_id} failed on attempt {attempt} ({e!r}), retrying in {delay:.1f}s")
+                self._emit("case_retry", {"case_id": case_id, "attempt": attempt, "error": str(e)}, progress)
+                await asyncio.sleep(delay)
+
+    async def _attempt(self, case: CaseT, evaluate: Callable[[CaseT], Awaitable[ResultT]]) -> ResultT:
+        if self.timeout is None:
+            return await evaluate(case)
+        try:
+            return await asyncio.wait_for(evaluate(case), timeout=self.timeout)
+        except asyncio.TimeoutError as e:
+            raise asyncio.TimeoutError(f"Test case timed out after {self.timeout:g} seconds") from e
+
+    def _emit(self, event_type: str, data: Dict[str, Any], progress: QAProgress):
+        if self.on_progress is None:
+            return
+        try:
+            self.on_progress({"type": event_type, "data": {**data, "progress": progress.to_dict()}})
+        except Exception as e:
+            logger.warning(f"QA progress callback failed: {e}")
@@ -6,21 +6,24 @@ including component execution, schema validation, expectation analysis,
 and result processing.
 """
 
+import asyncio
 import hashlib
 import inspect
 import json
 import logging
 import uuid
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import jsonschema
 
 from aurite.lib.components.llm.litellm_client import LiteLLMClient
 from aurite.lib.models.config.components import LLMConfig
 
-from ..runners.agent_runner import AgentRunner
+from ..runners.agent_runner import get_agent_runner
+from .qa_fingerprint import fingerprint_component
 from .qa_models import ExpectationAnalysisResult, SchemaValidationResult
+from .qa_scheduler import is_transient_error
 
 if TYPE_CHECKING:
     from aurite.execution.aurite_engine import AuriteEngine
@@ -30,6 +33,34 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_BATCH_ANALYSIS_FORMAT = """You will receive a JSON list of test cases, each with an "id", the "input" given to the component, the component's "output" and the "expectations" for that output. Review every case on its own: the other cases in the list have no bearing on it.
+
+Format your output as JSON. IMPORTANT: Do not include any other text before or after, and do NOT format it as a code block (```). Return one result per test case, with the case's id. Here is the template:
+{
+"results": [
+{"id": "<test case id>", "analysis": "<your analysis here>", "expectations_broken": ["<broken expectation 1>", "etc"]}
+]
+}"""
+
+BATCH_ANALYSIS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "results": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "analysis": {"type": "string"},
+                    "expectations_broken": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["id", "analysis", "expectations_broken"],
+            },
+        }
+    },
+    "required": ["results"],
+}
+
 
 def generate_cache_key(
     case_input: str,
@@ -37,6 +68,8 @@ def generate_cache_key(
     evaluation_config_id: Optional[str] = None,
     review_llm: Optional[str] = None,
     expectations: Optional[List[str]] = None,
+    component_fingerprint: Optional[str] = None,
+    case_output: Any = None,
 ) -> str:
     """
     Generate a unique cache key for a test case evaluation.
@@ -47,36 +80,29 @@ def generate_cache_key(
         evaluation_config_id: Optional evaluation configuration ID
         review_llm: Optional review LLM configuration ID
         expectations: Optional list of expectations for the test case
+        component_fingerprint: Optional content hash of the resolved component graph (see
+            qa_fingerprint.fingerprint_component). Defaults to a hash of the component config alone.
+        case_output: Optional pre-recorded output of the test case
 
     Returns:
         Unique cache key string
     """
-    if not component_config:
-        component_config = {}
-    # Extract key configuration elements that affect the output
+    if component_fingerprint is None:
+        component_fingerprint = fingerprint_component(
+            (component_config or {}).get("type", ""), component_config, review_llm=review_llm
+        )
     key_data = {
         "input": case_input,
-        "component_name": component_config.get("name"),
-        "component_type": component_config.get("type"),
+        "output": case_output,
+        "component": component_fingerprint,
         "eval_config_id": evaluation_config_id,
         "review_llm": review_llm,
         "expectations": sorted(expectations) if expectations else None,
-        # Include key config settings that affect output
-        "temperature": component_config.get("temperature"),
-        "model": component_config.get("model"),
-        "provider": component_config.get("provider"),
-        "system_prompt": component_config.get("system_prompt"),
-        "tools": sorted(component_config.get("tools", [])),
-        "max_tokens": component_config.get("max_tokens"),
-        # For workflows
-        "steps": component_config.get("steps"),
-        "timeout_seconds": component_config.get("timeout_seconds"),
-        "parallel_execution": component_config.get("parallel_execution"),
     }
 
     # Create hash of the key data
     key_str = json.dumps(key_data, sort_keys=True, default=str)
-    cache_key = f"qa_case_{hashlib.md5(key_str.encode()).hexdigest()}"
+    cache_key = f"qa_case_{hashlib.sha256(key_str.encode()).hexdigest()}"
 
     logger.debug(f"Generated cache key: {cache_key} for input: {case_input[:50]}...")
     return cache_key
@@ -132,6 +158,7 @@ async def store_cached_case_result(
     cache_key: str,
     result: "CaseEvaluationResult",
     session_manager,
+    cache_ttl: int = 3600,
 ) -> bool:
     """
     Store a case evaluation result in the cache.
@@ -140,6 +167,7 @@ async def store_cached_case_result(
         cache_key: The cache key to store under
         result: The CaseEvaluationResult to cache
         session_manager: SessionManager instance for cache access
+        cache_ttl: Time-to-live in seconds, after which the result is evicted
 
     Returns:
         True if stored successfully, False otherwise
@@ -153,7 +181,7 @@ async def store_cached_case_result(
             "cached_at": datetime.utcnow().isoformat(),
         }
 
-        success = session_manager.save_qa_case_result(cache_key, cache_data)
+        success = session_manager.save_qa_case_result(cache_key, cache_data, ttl=cache_ttl)
         if success:
             logger.debug(f"Cached result for key: {cache_key}")
         return success
@@ -167,15 +195,16 @@ def generate_evaluation_cache_key(
     evaluation_config_id: str,
     test_cases: List,
     review_llm: Optional[str] = None,
+    component_fingerprint: Optional[str] = None,
 ) -> str:
     """
     Generate a unique cache key for a complete evaluation.
 
     Args:
         evaluation_config_id: ID of the evaluation configuration
-        component_config: Configuration of the component being tested
         test_cases: List of test cases (for generating consistent hash)
         review_llm: Optional review LLM configuration ID
+        component_fingerprint: Optional content hash of the resolved component graph
 
     Returns:
         Unique cache key string for the evaluation
@@ -186,6 +215,7 @@ def generate_evaluation_cache_key(
         case_data = {
             "input": str(case.input),
             "expectations": sorted(case.expectations) if hasattr(case, "expectations") and case.expectations else None,
+            "output": getattr(case, "output", None),
         }
         test_case_data.append(case_data)
 
@@ -195,12 +225,13 @@ def generate_evaluation_cache_key(
     key_data = {
         "evaluation_config_id": evaluation_config_id,
         "review_llm": review_llm,
+        "component": component_fingerprint,
         "test_cases": test_case_data,
     }
 
     # Create hash of the key data
     key_str = json.dumps(key_data, sort_keys=True, default=str)
-    cache_key = f"qa_eval_{hashlib.md5(key_str.encode()).hexdigest()}"
+    cache_key = f"qa_eval_{hashlib.sha256(key_str.encode()).hexdigest()}"
 
     logger.debug(f"Generated evaluation cache key: {cache_key} for config: {evaluation_config_id}")
     return cache_key
@@ -256,6 +287,7 @@ async def store_cached_evaluation_result(
     cache_key: str,
     result: "QAEvaluationResult",
     session_manager,
+    cache_ttl: int = 3600,
 ) -> bool:
     """
     Store a complete evaluation result in the cache.
@@ -264,6 +296,7 @@ async def store_cached_evaluation_result(
         cache_key: The cache key to store under
         result: The QAEvaluationResult to cache
         session_manager: SessionManager instance for cache access
+        cache_ttl: Time-to-live in seconds, after which the result is evicted
 
     Returns:
         True if stored successfully, False otherwise
@@ -277,7 +310,7 @@ async def store_cached_evaluation_result(
             "cached_at": datetime.utcnow().isoformat(),
         }
 
-        success = session_manager.save_qa_evaluation_result(cache_key, cache_data)
+        success = session_manager.save_qa_evaluation_result(cache_key, cache_data, ttl=cache_ttl)
         if success:
             logger.debug(f"Cached evaluation result for key: {cache_key}")
         return success
@@ -287,10 +320,56 @@ async def store_cached_evaluation_result(
         return False
 
 
+def get_component_name(request: "EvaluationRequest") -> Optional[str]:
+    """
+    Get the name of the component under test.
+
+    Args:
+        request: The QA test request
+
+    Returns:
+        The name from the component config, or the first component reference
+        for multi-component requests
+    """
+    component_name = None
+    if request.component_config:
+        component_name = request.component_config.get("name")
+
+    if not component_name and hasattr(request, "component_refs") and request.component_refs:
+        # For multi-component requests, use the first component name as fallback
+        component_name = request.component_refs[0]
+
+    return component_name
+
+
+def build_mcp_test_agent_config(server_name: str, review_llm: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build the config of a temporary agent that exercises an MCP server's tools.
+
+    Args:
+        server_name: The MCP server under test, which is the agent's only server
+        review_llm: The LLM config the agent runs on
+
+    Returns:
+        An agent config with a unique name
+    """
+    return {
+        "name": f"qa_test_agent_{uuid.uuid4().hex}",
+        "type": "agent",
+        "mcp_servers": [server_name],
+        "llm_config_id": review_llm,
+        "system_prompt": f"""
+            You are an expert test engineer who has been tasked with testing an MCP server named {server_name}. You have access to the tools defined by that server.
+            The user will give you an message which should inform which tool to call. If arguments for the tool are given, use those, and if not generate appropriate arguments yourself.
+            Finally, respond with the information returned by the tool.""",
+    }
+
+
 async def execute_component(
     case: "EvaluationCase",
     request: "EvaluationRequest",
     executor: Optional["AuriteEngine"] = None,
+    mcp_test_agent: Optional[str] = None,
 ) -> Any:
     """
     Generic component execution supporting multiple execution patterns.
@@ -304,6 +383,8 @@ async def execute_component(
         case: The test case to execute
         request: The QA test request containing execution parameters
         executor: Optional AuriteEngine for standard component execution
+        mcp_test_agent: Optional name of an agent already registered to test the MCP server,
+            shared by all cases of an evaluation. Without it, the case registers its own.
 
     Returns:
         The output from the component execution
@@ -323,8 +404,8 @@ async def execute_component(
         run_agent_kwargs = getattr(request, "run_agent_kwargs", {})
 
         if isinstance(run_agent, str):
-            # It's an agent name
-            runner = AgentRunner(run_agent)
+            # It's the path of a file with a run function, loaded once per process
+            runner = get_agent_runner(run_agent)
             return await runner.execute(case.input, **run_agent_kwargs)
         elif inspect.iscoroutinefunction(run_agent):
             # It's an async function
@@ -337,13 +418,7 @@ async def execute_component(
     if not executor:
         raise ValueError(f"Case {case.id}: No output provided and no executor available to run component")
 
-    if request.component_config:
-        component_name = request.component_config.get("name")
-
-    if not component_name and hasattr(request, "component_refs") and request.component_refs:
-        # For multi-component requests, use the first component name as fallback
-        component_name = request.component_refs[0]
-
+    component_name = get_component_name(request)
     if not component_name:
         raise ValueError(f"Case {case.id}: No component name specified for execution")
 
@@ -356,6 +431,9 @@ async def execute_component(
             agent_name=component_name,
             user_message=case.input,
         )
+        if result.exception is not None and is_transient_error(result.exception):
+            # A rate limit or dropped connection says nothing about the agent; let the case be retried
+            raise result.exception
         # Return formatted conversation history for agents
         return _format_agent_conversation_history(result)
 
@@ -376,27 +454,15 @@ async def execute_component(
             initial_input=case.input,
         )
     elif component_type == "mcp_server":
-        # generate an temp agent config with a hardcoded system prompt and access to only that mcp server
-        agent_name = f"qa_test_agent_{uuid.uuid4().hex}"
-        agent_config = {
-            "name": agent_name,
-            "type": "agent",
-            "mcp_servers": [component_name],
-            "llm_config_id": request.review_llm,
-            "system_prompt": f"""
-            You are an expert test engineer who has been tasked with testing an MCP server named {component_name}. You have access to the tools defined by that server.
-            The user will give you an message which should inform which tool to call. If arguments for the tool are given, use those, and if not generate appropriate arguments yourself.
-            Finally, respond with the information returned by the tool.""",
-        }
-        executor._config_manager.create_component(component_type="agent", component_config=agent_config)
-
-        result = await executor.run_agent(
-            agent_name=agent_name,
-            user_message=case.input,
-        )
-
-        # delete the agent
-        executor._config_manager.delete_config(component_type="agent", component_name=agent_name)
+        # Run the case through an in-memory agent with access to only that MCP server
+        if mcp_test_agent:
+            result = await executor.run_agent(agent_name=mcp_test_agent, user_message=case.input)
+        else:
+            agent_config = build_mcp_test_agent_config(component_name, request.review_llm)
+            with executor._config_manager.ephemeral_component("agent", agent_config) as agent_name:
+                result = await executor.run_agent(agent_name=agent_name, user_message=case.input)
+        if result.exception is not None and is_transient_error(result.exception):
+            raise result.exception
 
         # Return formatted conversation history for agents
         return _format_agent_conversation_history(result)
@@ -510,6 +576,73 @@ async def analyze_expectations(
         )
 
 
+def estimate_judge_tokens(case: "EvaluationCase", output: Any) -> int:
+    """Roughly estimates the prompt tokens a test case adds to a review request (about 4 characters per token)."""
+    return (len(str(case.input)) + len(str(output)) + sum(len(e) for e in case.expectations)) // 4 + 20
+
+
+async def analyze_expectations_batch(
+    items: List[Tuple["EvaluationCase", Any]],
+    llm_client: LiteLLMClient,
+    component_context: Optional[Dict[str, Any]] = None,
+) -> List[ExpectationAnalysisResult]:
+    """
+    Use one LLM request to analyze whether the outputs of several test cases meet their expectations.
+
+    Cases whose result is missing or unreadable in the LLM's response are analyzed again
+    one at a time with `analyze_expectations`. Errors of the LLM call itself are raised.
+
+    Args:
+        items: (test case, output) pairs to analyze
+        llm_client: The LLM client to use for analysis
+        component_context: Optional context about the component being tested
+
+    Returns:
+        One ExpectationAnalysisResult per item, in the same order
+    """
+    if len(items) == 1:
+        case, output = items[0]
+        return [await analyze_expectations(case, output, llm_client, component_context)]
+
+    payload = [
+        {"id": str(index), "input": case.input, "output": output, "expectations": case.expectations}
+        for index, (case, output) in enumerate(items)
+    ]
+    analysis_output = await llm_client.create_message(
+        messages=[{"role": "user", "content": json.dumps(payload, default=str, indent=1)}],
+        tools=None,
+        system_prompt_override=_build_analysis_system_prompt(component_context, batched=True),
+        schema=BATCH_ANALYSIS_SCHEMA,
+    )
+
+    results: Dict[str, ExpectationAnalysisResult] = {}
+    try:
+        analysis_json = json.loads(clean_llm_output(analysis_output.content or ""))
+        for entry in analysis_json.get("results", []):
+            broken = entry.get("expectations_broken") if isinstance(entry, dict) else None
+            if isinstance(broken, list):
+                results[str(entry.get("id"))] = ExpectationAnalysisResult(
+                    analysis=entry.get("analysis") or "No analysis provided",
+                    expectations_broken=broken,
+                )
+    except Exception as e:
+        logger.warning(f"Could not parse batched LLM analysis of {len(items)} cases, analyzing them one by one: {e}")
+
+    missing = [index for index in range(len(items)) if str(index) not in results]
+    if missing:
+        if len(missing) < len(items):
+            logger.warning(f"Batched LLM analysis had no result for {len(missing)} of {len(items)} cases")
+        fallback = await asyncio.gather(
+            *(
+                analyze_expectations(items[index][0], items[index][1], llm_client, component_context)
+                for index in missing
+            )
+        )
+        results.update({str(index): result for index, result in zip(missing, fallback, strict=True)})
+
+    return [results[str(index)] for index in range(len(items))]
+
+
 def clean_llm_output(output: str) -> str:
     """
     Clean LLM output to extract JSON.
@@ -625,26 +758,32 @@ def _format_agent_conversation_history(result) -> str:
     return "".join(formatted_output)
 
 
-def _build_analysis_system_prompt(component_context: Optional[Dict[str, Any]] = None) -> str:
+def _build_analysis_system_prompt(component_context: Optional[Dict[str, Any]] = None, batched: bool = False) -> str:
     """
     Build a system prompt for expectation analysis based on component context.
 
     Args:
         component_context: Optional context about the component being tested
+        batched: Whether the prompt is for reviewing a list of test cases in one request
 
     Returns:
         System prompt string for the LLM
     """
     base_prompt = """You are an expert Quality Assurance Engineer. Your job is to review the output from a component and make sure it meets a list of expectations.
-Your output should be your analysis of its performance, and a list of which expectations were broken (if any). These strings should be identical to the original expectation strings.
+Your output should be your analysis of its performance, and a list of which expectations were broken (if any). These strings should be identical to the original expectation strings."""
+
+    if not component_context:
+        if batched:
+            return f"{base_prompt}\n\n{_BATCH_ANALYSIS_FORMAT}"
+        return (
+            base_prompt
+            + """
 
 Format your output as JSON. IMPORTANT: Do not include any other text before or after, and do NOT format it as a code block (```). Here is a template: {
 "analysis": "<your analysis here>",
 "expectations_broken": ["<broken expectation 1>", "<broken expectation 2>", "etc"]
 }"""
-
-    if not component_context:
-        return base_prompt
+        )
 
     # Add component-specific context
     component_type = component_context.get("type", "component")
@@ -677,7 +816,10 @@ Focus on:
         step_names = []
         if isinstance(steps, list):
             for step in steps:
-                if isinstance(step, dict):
+                if isinstance(step, dict) and "parallel" in step:
+                    members = [m.get("name", "unnamed") if isinstance(m, dict) else m for m in step["parallel"]]
+                    step_names.append(f"[{' | '.join(members)}]")
+                elif isinstance(step, dict):
                     step_names.append(step.get("name", "unnamed"))
                 elif isinstance(step, str):
                     step_names.append(step)
@@ -687,7 +829,7 @@ Focus on:
 - Number of Steps: {len(steps)}
 - Step Names: {", ".join(step_names) if step_names else "Not specified"}
 - Timeout: {component_context.get("timeout_seconds", "Not specified")} seconds
-- Parallel Execution: {component_context.get("parallel_execution", False)}
+- Parallel Execution: {any(isinstance(step, dict) and "parallel" in step for step in steps) if isinstance(steps, list) else False}
 
 Focus on:
 1. End-to-End Execution: Did the workflow complete successfully from start to finish?
@@ -697,12 +839,17 @@ Focus on:
 
     context_prompt += f"""
 
-Your job is to review the {component_type}'s output and determine if it meets the specified expectations.
+Your job is to review the {component_type}'s output and determine if it meets the specified expectations."""
+
+    if batched:
+        return f"{context_prompt}\n\n{_BATCH_ANALYSIS_FORMAT}"
+
+    context_prompt += """
 
 Format your output as JSON. IMPORTANT: Do not include any other text before or after, and do NOT format it as a code block (```). Here is the template:
-{{
+{
 "analysis": "<your detailed analysis here>",
 "expectations_broken": ["<broken expectation 1>", "<broken expectation 2>", "etc"]
-}}"""
+}"""
 
     return context_prompt
@@ -0,0 +1,53 @@
+"""
+Resources shared by the component evaluations of a multi-component request.
+
+Comparing several components (e.g. variants of an agent) on the same test
+cases used to run one independent evaluation per component, each with its own
+review LLM client and its own concurrency limit, so the number of concurrent
+agent runs grew with the number of components. A SharedEvaluation is created
+once per request and passed to each component's evaluation: all of them use
+the same review LLM client, draw from one concurrency budget, and components
+whose resolved configuration is identical (same fingerprint, see
+qa_fingerprint) run each distinct input once and share its output.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from aurite.lib.components.llm.litellm_client import LiteLLMClient
+
+logger = logging.getLogger(__name__)
+
+
+class SharedEvaluation:
+    """Review LLM client, concurrency budget and component outputs shared across component evaluations."""
+
+    def __init__(self, max_concurrency: int = 10, llm_client: Optional[LiteLLMClient] = None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.llm_client = llm_client
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.deduplicated = 0
+        self._executions: Dict[Tuple[str, str], asyncio.Future] = {}
+
+    async def execute(self, component_fingerprint: str, case_input: str, run: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Runs a component on an input, or waits for the output of an identical run already started.
+        Failed runs are forgotten, so a retried case runs the component again.
+        """
+        key = (component_fingerprint, case_input)
+        execution = self._executions.get(key)
+        if execution is None:
+            execution = asyncio.ensure_future(run())
+            self._executions[key] = execution
+            execution.add_done_callback(lambda done: self._forget_failed(key, done))
+        else:
+            self.deduplicated += 1
+            logger.debug(f"Reusing the output of an identical component run for input: {case_input[:50]}...")
+        # A case that times out stops waiting without cancelling the run other cases share
+        return await asyncio.shield(execution)
+
+    def _forget_failed(self, key: Tuple[str, str], execution: asyncio.Future):
+        if (execution.cancelled() or execution.exception() is not None) and self._executions.get(key) is execution:
+            del self._executions[key]
@@ -1,4 +1,4 @@
-from .agent_runner import AgentRunner
+from .agent_runner import AgentRunner, clear_agent_runners, get_agent_runner, reload_agent_runner
 from .llm_guard import LLMGuardBasic
 
-__all__ = ["LLMGuardBasic", "AgentRunner"]
+__all__ = ["LLMGuardBasic", "AgentRunner", "get_agent_runner", "reload_agent_runner", "clear_agent_runners"]
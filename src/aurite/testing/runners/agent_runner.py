@@ -1,12 +1,17 @@
 """
 Agent Runner for executing Python functions from file paths.
+
+Importing a run file executes the whole module, including its imports, so
+evaluations get their runners from `get_agent_runner`, which loads each file
+once per process and again only when the file has been modified since.
 """
 
 import importlib.util
 import inspect
 import logging
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -125,3 +130,55 @@ class AgentRunner:
         logger.debug(f"Reloading run function from {self.filepath}")
         self.run_function = None
         self._load_run_function()
+
+
+_runners: Dict[Path, Tuple[int, AgentRunner]] = {}
+_runners_lock = threading.Lock()
+
+
+def _runner_key(filepath: str | Path) -> Tuple[Path, int]:
+    path = Path(filepath).resolve()
+    try:
+        return path, path.stat().st_mtime_ns
+    except FileNotFoundError:
+        logger.error(f"Python file not found: {path}")
+        raise FileNotFoundError(f"Python file not found: {path}") from None
+
+
+def get_agent_runner(filepath: str | Path) -> AgentRunner:
+    """
+    Returns the process-wide AgentRunner of a file, loading the file only if it has not been
+    loaded yet or has been modified since it was. Safe to call from concurrent test cases.
+
+    Args:
+        filepath: Path to the Python file containing the 'run' function.
+    """
+    path, mtime = _runner_key(filepath)
+    with _runners_lock:
+        cached = _runners.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        if cached is not None:
+            logger.info(f"{path} was modified, reloading its run function")
+        # A new runner rather than AgentRunner.reload(), so runs in progress keep their function
+        runner = AgentRunner(path)
+        _runners[path] = (mtime, runner)
+        return runner
+
+
+def reload_agent_runner(filepath: str | Path) -> AgentRunner:
+    """Loads a file again even if it has not been modified, e.g. after a module it imports changed."""
+    path, mtime = _runner_key(filepath)
+    with _runners_lock:
+        runner = AgentRunner(path)
+        _runners[path] = (mtime, runner)
+        return runner
+
+
+def clear_agent_runners(filepath: Optional[str | Path] = None):
+    """Forgets the runner of a file, or of all files, so that the next use loads it again."""
+    with _runners_lock:
+        if filepath is None:
+            _runners.clear()
+        else:
+            _runners.pop(Path(filepath).resolve(), None)
@@ -9,10 +9,15 @@ Note: This is a simplified implementation for the MVP. The full LLM Guard
 integration will be implemented in next phase.
 """
 
+import asyncio
+import hashlib
 import logging
-import re
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+from .pattern_scanner import MultiPatternScanner
 
 
 class LLMGuardBasic:
@@ -40,6 +45,15 @@ class LLMGuardBasic:
         self.fail_fast = config.get("fail_fast", False)
         self.return_scores = config.get("return_scores", True)
 
+        # Off-loop batch scanning configuration
+        self.scan_executor = config.get("scan_executor", "thread")  # "thread" or "process"
+        self.max_workers = config.get("max_workers")  # default: 1 thread, or one process per CPU
+        self.batch_chunk_size = max(1, config.get("batch_chunk_size", 64))
+        self.offload_threshold = config.get("offload_threshold", 20_000)  # characters
+        self.result_cache_size = config.get("result_cache_size", 4096)
+        self._result_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._executor: Optional[Executor] = None
+
         # Initialize basic pattern matching for MVP
         self._init_basic_patterns()
 
@@ -172,32 +186,91 @@ class LLMGuardBasic:
             r"\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln)",
         ]
 
-        # Compile patterns for better performance
-        self.compiled_patterns = {
-            "prompt_injection": [re.compile(pattern, re.IGNORECASE) for pattern in self.prompt_injection_patterns],
-            "toxicity": [re.compile(pattern, re.IGNORECASE) for pattern in self.toxicity_patterns],
-            "secrets": [re.compile(pattern, re.IGNORECASE) for pattern in self.secrets_patterns],
-            "malicious_urls": [re.compile(pattern, re.IGNORECASE) for pattern in self.malicious_url_patterns],
-            "pii": [re.compile(pattern, re.IGNORECASE) for pattern in self.pii_patterns],
-        }
+        # Context markers used to soften severity for legitimate content
+        self.educational_markers = [
+            r"(?:for\s+)?(?:training|educational|learning)\s+purposes",
+            r"(?:help\s+me\s+)?(?:understand|learn|explain)",
+            r"(?:writing|creating)\s+(?:a\s+)?(?:training|educational|cybersecurity)\s+(?:module|course|material)",
+            r"(?:in\s+)?(?:this\s+)?(?:example|scenario|simulation|exercise)",
+            r"(?:for\s+)?(?:research|thesis|study|analysis)",
+            r"(?:how\s+(?:do|does|can))|(?:what\s+(?:is|are))|(?:explain\s+how)",
+            r"(?:best\s+practices|security\s+training|penetration\s+testing)",
+            r"(?:fictional|hypothetical|demo|sample|placeholder)",
+        ]
+
+        self.casual_markers = [
+            r"this\s+is\s+(?:killing|driving\s+me\s+crazy)",
+            r"i\s+(?:hate|love)\s+(?:having\s+to|when)",
+            r"(?:it's\s+)?(?:a\s+)?pain\s+(?:but|to)",
+            r"(?:so\s+)?(?:restrictive|annoying|frustrating)",
+            r"(?:i'm\s+)?(?:dying\s+to|desperate\s+to)",
+        ]
+
+        self.example_markers = [
+            r"(?:this\s+is\s+)?(?:just\s+)?(?:an\s+)?example",
+            r"(?:for\s+)?(?:example|demo|sample|placeholder)",
+            r"(?:replace\s+with|use\s+your|your[_-](?:key|secret|token)[_-]here)",
+            r"(?:documentation|configuration|troubleshooting)",
+            r"(?:fictional|hypothetical|test|demo)",
+            r"(?:format\s+is|typically\s+look\s+like|example\s+format)",
+        ]
+
+        # Compile all scanners into one engine so each text is prefiltered in a single pass
+        self.pattern_engine = MultiPatternScanner(
+            {
+                "prompt_injection": self.prompt_injection_patterns,
+                "toxicity": self.toxicity_patterns,
+                "secrets": self.secrets_patterns,
+                "malicious_urls": self.malicious_url_patterns,
+                "pii": self.pii_patterns,
+                "educational_context": self.educational_markers,
+                "casual_context": self.casual_markers,
+                "example_context": self.example_markers,
+            }
+        )
+        self.compiled_patterns = self.pattern_engine.compiled_patterns
 
     async def scan_input(self, prompt: str) -> Dict[str, Any]:
         """
         Scan input prompt for security threats.
 
+        Large prompts are scanned in the worker pool so the event loop stays responsive.
+
         Args:
             prompt: Input prompt to scan
 
         Returns:
             Dictionary containing scan results
         """
+        if len(prompt) < self.offload_threshold:
+            return self._scan_input_sync(prompt)
+        return (await self.scan_batch([prompt], mode="input"))[0]
+
+    async def scan_output(self, response: str) -> Dict[str, Any]:
+        """
+        Scan output response for security threats.
+
+        Large responses are scanned in the worker pool so the event loop stays responsive.
+
+        Args:
+            response: Output response to scan
+
+        Returns:
+            Dictionary containing scan results
+        """
+        if len(response) < self.offload_threshold:
+            return self._scan_output_sync(response)
+        return (await self.scan_batch([response], mode="output"))[0]
+
+    def _scan_input_sync(self, prompt: str) -> Dict[str, Any]:
+        """Run the enabled input scanners on a prompt (CPU-bound)"""
         start_time = datetime.utcnow()
         results = {"valid": True, "score": 1.0, "threats": [], "scanner_results": {}, "execution_time": 0.0}
 
         try:
             # Run enabled input scanners
             for scanner in self.input_scanners:
-                scanner_result = await self._run_input_scanner(scanner, prompt)
+                scanner_result = self._run_input_scanner(scanner, prompt)
                 results["scanner_results"][scanner] = scanner_result
 
                 if not scanner_result["valid"]:
@@ -227,23 +300,15 @@ class LLMGuardBasic:
 
         return results
 
-    async def scan_output(self, response: str) -> Dict[str, Any]:
-        """
-        Scan output response for security threats.
-
-        Args:
-            response: Output response to scan
-
-        Returns:
-            Dictionary containing scan results
-        """
+    def _scan_output_sync(self, response: str) -> Dict[str, Any]:
+        """Run the enabled output scanners on a response (CPU-bound)"""
         start_time = datetime.utcnow()
         results = {"valid": True, "score": 1.0, "threats": [], "scanner_results": {}, "execution_time": 0.0}
 
         try:
             # Run enabled output scanners
             for scanner in self.output_scanners:
-                scanner_result = await self._run_output_scanner(scanner, response)
+                scanner_result = self._run_output_scanner(scanner, response)
                 results["scanner_results"][scanner] = scanner_result
 
                 if not scanner_result["valid"]:
@@ -273,14 +338,14 @@ class LLMGuardBasic:
 
         return results
 
-    async def _run_input_scanner(self, scanner_name: str, text: str) -> Dict[str, Any]:
+    def _run_input_scanner(self, scanner_name: str, text: str) -> Dict[str, Any]:
         """Run a specific input scanner"""
         if scanner_name == "PromptInjection":
-            return await self._scan_prompt_injection(text)
+            return self._scan_prompt_injection(text)
         elif scanner_name == "Toxicity":
-            return await self._scan_toxicity(text)
+            return self._scan_toxicity(text)
         elif scanner_name == "Secrets":
-            return await self._scan_secrets(text)
+            return self._scan_secrets(text)
         else:
             # Unknown scanner - return safe result
             return {
@@ -290,16 +355,16 @@ class LLMGuardBasic:
                 "details": f"Scanner {scanner_name} not implemented in MVP",
             }
 
-    async def _run_output_scanner(self, scanner_name: str, text: str) -> Dict[str, Any]:
+    def _run_output_scanner(self, scanner_name: str, text: str) -> Dict[str, Any]:
         """Run a specific output scanner"""
         if scanner_name == "Toxicity":
-            return await self._scan_toxicity(text)
+            return self._scan_toxicity(text)
         elif scanner_name == "Sensitive":
-            return await self._scan_sensitive_info(text)
+            return self._scan_sensitive_info(text)
         elif scanner_name == "MaliciousURLs":
-            return await self._scan_malicious_urls(text)
+            return self._scan_malicious_urls(text)
         elif scanner_name == "PII":
-            return await self._scan_pii(text)
+            return self._scan_pii(text)
         else:
             # Unknown scanner - return safe result
             return {
@@ -309,7 +374,7 @@ class LLMGuardBasic:
                 "details": f"Scanner {scanner_name} not implemented in MVP",
             }
 
-    async def _scan_prompt_injection(self, text: str) -> Dict[str, Any]:
+    def _scan_prompt_injection(self, text: str) -> Dict[str, Any]:
         """Context-aware prompt injection detection"""
         threats = []
         matches = []
@@ -317,27 +382,26 @@ class LLMGuardBasic:
         # Check for educational/legitimate context first
         educational_context = self._detect_educational_context(text)
 
-        for pattern in self.compiled_patterns["prompt_injection"]:
-            match = pattern.search(text)
-            if match:
-                # Reduce severity if in educational context
-                severity = "medium" if educational_context else "high"
-
-                matches.append({"pattern": pattern.pattern, "match": match.group(0), "position": match.span()})
-
-                threats.append(
-                    {
-                        "type": "prompt_injection",
-                        "severity": severity,
-                        "description": f"Potential prompt injection detected: '{match.group(0)}'",
-                        "details": {
-                            "pattern": pattern.pattern,
-                            "match": match.group(0),
-                            "position": match.span(),
-                            "educational_context": educational_context,
-                        },
-                    }
-                )
+        for hit in self.pattern_engine.scan("prompt_injection", text, first_only=True):
+            pattern, match = hit.pattern, hit.match
+            # Reduce severity if in educational context
+            severity = "medium" if educational_context else "high"
+
+            matches.append({"pattern": pattern.pattern, "match": match.group(0), "position": match.span()})
+
+            threats.append(
+                {
+                    "type": "prompt_injection",
+                    "severity": severity,
+                    "description": f"Potential prompt injection detected: '{match.group(0)}'",
+                    "details": {
+                        "pattern": pattern.pattern,
+                        "match": match.group(0),
+                        "position": match.span(),
+                        "educational_context": educational_context,
+                    },
+                }
+            )
 
         # Context-aware scoring - more lenient for educational content
         if educational_context:
@@ -360,23 +424,9 @@ class LLMGuardBasic:
 
     def _detect_educational_context(self, text: str) -> bool:
         """Detect if text is in educational/legitimate context"""
-        educational_markers = [
-            r"(?:for\s+)?(?:training|educational|learning)\s+purposes",
-            r"(?:help\s+me\s+)?(?:understand|learn|explain)",
-            r"(?:writing|creating)\s+(?:a\s+)?(?:training|educational|cybersecurity)\s+(?:module|course|material)",
-            r"(?:in\s+)?(?:this\s+)?(?:example|scenario|simulation|exercise)",
-            r"(?:for\s+)?(?:research|thesis|study|analysis)",
-            r"(?:how\s+(?:do|does|can))|(?:what\s+(?:is|are))|(?:explain\s+how)",
-            r"(?:best\s+practices|security\s+training|penetration\s+testing)",
-            r"(?:fictional|hypothetical|demo|sample|placeholder)",
-        ]
+        return self.pattern_engine.search_any("educational_context", text)
 
-        for marker in educational_markers:
-            if re.search(marker, text, re.IGNORECASE):
-                return True
-        return False
-
-    async def _scan_toxicity(self, text: str) -> Dict[str, Any]:
+    def _scan_toxicity(self, text: str) -> Dict[str, Any]:
         """Context-aware toxicity detection"""
         threats = []
         matches = []
@@ -385,30 +435,30 @@ class LLMGuardBasic:
         casual_context = self._detect_casual_context(text)
         educational_context = self._detect_educational_context(text)
 
-        for pattern in self.compiled_patterns["toxicity"]:
-            for match in pattern.finditer(text):
-                # Reduce severity for casual expressions or educational content
-                if casual_context or educational_context:
-                    severity = "low"
-                else:
-                    severity = "medium"
-
-                matches.append({"pattern": pattern.pattern, "match": match.group(0), "position": match.span()})
-
-                threats.append(
-                    {
-                        "type": "toxicity",
-                        "severity": severity,
-                        "description": f"Potentially toxic content detected: '{match.group(0)}'",
-                        "details": {
-                            "pattern": pattern.pattern,
-                            "match": match.group(0),
-                            "position": match.span(),
-                            "casual_context": casual_context,
-                            "educational_context": educational_context,
-                        },
-                    }
-                )
+        for hit in self.pattern_engine.scan("toxicity", text):
+            pattern, match = hit.pattern, hit.match
+            # Reduce severity for casual expressions or educational content
+            if casual_context or educational_context:
+                severity = "low"
+            else:
+                severity = "medium"
+
+            matches.append({"pattern": pattern.pattern, "match": match.group(0), "position": match.span()})
+
+            threats.append(
+                {
+                    "type": "toxicity",
+                    "severity": severity,
+                    "description": f"Potentially toxic content detected: '{match.group(0)}'",
+                    "details": {
+                        "pattern": pattern.pattern,
+                        "match": match.group(0),
+                        "position": match.span(),
+                        "casual_context": casual_context,
+                        "educational_context": educational_context,
+                    },
+                }
+            )
 
         # Context-aware scoring
         if casual_context or educational_context:
@@ -432,20 +482,9 @@ class LLMGuardBasic:
 
     def _detect_casual_context(self, text: str) -> bool:
         """Detect casual/colloquial language context"""
-        casual_markers = [
-            r"this\s+is\s+(?:killing|driving\s+me\s+crazy)",
-            r"i\s+(?:hate|love)\s+(?:having\s+to|when)",
-            r"(?:it's\s+)?(?:a\s+)?pain\s+(?:but|to)",
-            r"(?:so\s+)?(?:restrictive|annoying|frustrating)",
-            r"(?:i'm\s+)?(?:dying\s+to|desperate\s+to)",
-        ]
-
-        for marker in casual_markers:
-            if re.search(marker, text, re.IGNORECASE):
-                return True
-        return False
+        return self.pattern_engine.search_any("casual_context", text)
 
-    async def _scan_secrets(self, text: str) -> Dict[str, Any]:
+    def _scan_secrets(self, text: str) -> Dict[str, Any]:
         """Context-aware secrets detection"""
         threats = []
         matches = []
@@ -453,33 +492,33 @@ class LLMGuardBasic:
         # Check for example/educational context
         example_context = self._detect_example_context(text)
 
-        for pattern in self.compiled_patterns["secrets"]:
-            for match in pattern.finditer(text):
-                # Mask the actual secret value
-                secret_value = match.group(1) if match.groups() else match.group(0)
-                masked_value = secret_value[:3] + "*" * (len(secret_value) - 3)
-
-                # Reduce severity for examples/educational content
-                if example_context:
-                    severity = "medium"
-                else:
-                    severity = "critical"
-
-                matches.append({"pattern": pattern.pattern, "match": masked_value, "position": match.span()})
-
-                threats.append(
-                    {
-                        "type": "secrets",
-                        "severity": severity,
-                        "description": f"Potential secret detected: '{masked_value}'",
-                        "details": {
-                            "pattern": pattern.pattern,
-                            "masked_match": masked_value,
-                            "position": match.span(),
-                            "example_context": example_context,
-                        },
-                    }
-                )
+        for hit in self.pattern_engine.scan("secrets", text):
+            pattern, match = hit.pattern, hit.match
+            # Mask the actual secret value
+            secret_value = match.group(1) if match.groups() else match.group(0)
+            masked_value = secret_value[:3] + "*" * (len(secret_value) - 3)
+
+            # Reduce severity for examples/educational content
+            if example_context:
+                severity = "medium"
+            else:
+                severity = "critical"
+
+            matches.append({"pattern": pattern.pattern, "match": masked_value, "position": match.span()})
+
+            threats.append(
+                {
+                    "type": "secrets",
+                    "severity": severity,
+                    "description": f"Potential secret detected: '{masked_value}'",
+                    "details": {
+                        "pattern": pattern.pattern,
+                        "masked_match": masked_value,
+                        "position": match.span(),
+                        "example_context": example_context,
+                    },
+                }
+            )
 
         # Context-aware scoring
         if example_context:
@@ -502,25 +541,13 @@ class LLMGuardBasic:
 
     def _detect_example_context(self, text: str) -> bool:
         """Detect example/documentation context"""
-        example_markers = [
-            r"(?:this\s+is\s+)?(?:just\s+)?(?:an\s+)?example",
-            r"(?:for\s+)?(?:example|demo|sample|placeholder)",
-            r"(?:replace\s+with|use\s+your|your[_-](?:key|secret|token)[_-]here)",
-            r"(?:documentation|configuration|troubleshooting)",
-            r"(?:fictional|hypothetical|test|demo)",
-            r"(?:format\s+is|typically\s+look\s+like|example\s+format)",
-        ]
-
-        for marker in example_markers:
-            if re.search(marker, text, re.IGNORECASE):
-                return True
-        return False
+        return self.pattern_engine.search_any("example_context", text)
 
-    async def _scan_sensitive_info(self, text: str) -> Dict[str, Any]:
+    def _scan_sensitive_info(self, text: str) -> Dict[str, Any]:
         """Enhanced sensitive information detection combining secrets and PII"""
         # Combine results from both secrets and PII scanning
-        secrets_result = await self._scan_secrets(text)
-        pii_result = await self._scan_pii(text)
+        secrets_result = self._scan_secrets(text)
+        pii_result = self._scan_pii(text)
 
         # Merge threats and take worst score
         all_threats = secrets_result["threats"] + pii_result["threats"]
@@ -537,30 +564,30 @@ class LLMGuardBasic:
             },
         }
 
-    async def _scan_pii(self, text: str) -> Dict[str, Any]:
+    def _scan_pii(self, text: str) -> Dict[str, Any]:
         """Enhanced PII detection for output scanning"""
         threats = []
         matches = []
 
-        for pattern in self.compiled_patterns["pii"]:
-            for match in pattern.finditer(text):
-                # Mask PII values for security
-                pii_value = match.group(1) if match.groups() else match.group(0)
-                if len(pii_value) > 6:
-                    masked_value = pii_value[:3] + "*" * (len(pii_value) - 6) + pii_value[-3:]
-                else:
-                    masked_value = "*" * len(pii_value)
-
-                matches.append({"pattern": pattern.pattern, "match": masked_value, "position": match.span()})
-
-                threats.append(
-                    {
-                        "type": "pii",
-                        "severity": "high",
-                        "description": f"Potential PII detected: '{masked_value}'",
-                        "details": {"pattern": pattern.pattern, "masked_match": masked_value, "position": match.span()},
-                    }
-                )
+        for hit in self.pattern_engine.scan("pii", text):
+            pattern, match = hit.pattern, hit.match
+            # Mask PII values for security
+            pii_value = match.group(1) if match.groups() else match.group(0)
+            if len(pii_value) > 6:
+                masked_value = pii_value[:3] + "*" * (len(pii_value) - 6) + pii_value[-3:]
+            else:
+                masked_value = "*" * len(pii_value)
+
+            matches.append({"pattern": pattern.pattern, "match": masked_value, "position": match.span()})
+
+            threats.append(
+                {
+                    "type": "pii",
+                    "severity": "high",
+                    "description": f"Potential PII detected: '{masked_value}'",
+                    "details": {"pattern": pattern.pattern, "masked_match": masked_value, "position": match.span()},
+                }
+            )
 
         # Calculate score - PII is high severity
         score = max(0.0, 1.0 - (len(matches) * 0.3)) if len(matches) > 0 else 1.0
@@ -572,23 +599,23 @@ class LLMGuardBasic:
             "details": {"matches_found": len(matches), "patterns_checked": len(self.compiled_patterns["pii"])},
         }
 
-    async def _scan_malicious_urls(self, text: str) -> Dict[str, Any]:
+    def _scan_malicious_urls(self, text: str) -> Dict[str, Any]:
         """Basic malicious URL detection"""
         threats = []
         matches = []
 
-        for pattern in self.compiled_patterns["malicious_urls"]:
-            for match in pattern.finditer(text):
-                matches.append({"pattern": pattern.pattern, "match": match.group(0), "position": match.span()})
-
-                threats.append(
-                    {
-                        "type": "malicious_url",
-                        "severity": "high",
-                        "description": f"Potentially malicious URL detected: '{match.group(0)}'",
-                        "details": {"pattern": pattern.pattern, "match": match.group(0), "position": match.span()},
-                    }
-                )
+        for hit in self.pattern_engine.scan("malicious_urls", text):
+            pattern, match = hit.pattern, hit.match
+            matches.append({"pattern": pattern.pattern, "match": match.group(0), "position": match.span()})
+
+            threats.append(
+                {
+                    "type": "malicious_url",
+                    "severity": "high",
+                    "description": f"Potentially malicious URL detected: '{match.group(0)}'",
+                    "details": {"pattern": pattern.pattern, "match": match.group(0), "position": match.span()},
+                }
+            )
 
         # Calculate score based on number of matches
         score = max(0.0, 1.0 - (len(matches) * 0.4))
@@ -624,22 +651,30 @@ class LLMGuardBasic:
         start_time = datetime.utcnow()
 
         try:
+            # Scan user messages as inputs and everything else as outputs, in two batches
+            input_indexes: List[int] = []
+            output_indexes: List[int] = []
             for i, message in enumerate(messages):
-                content = message.get("content", "")
                 role = message.get("role", "unknown")
-
-                # Scan based on message role
-                if role in ["user", "human"]:
-                    scan_result = await self.scan_input(content)
-                elif role in ["assistant", "ai", "system"]:
-                    scan_result = await self.scan_output(content)
+                if role in ["assistant", "ai", "system"]:
+                    output_indexes.append(i)
                 else:
-                    # Unknown role - scan as input for safety
-                    scan_result = await self.scan_input(content)
+                    # User messages and unknown roles are scanned as input for safety
+                    input_indexes.append(i)
+
+            input_results, output_results = await asyncio.gather(
+                self.scan_batch([messages[i].get("content", "") for i in input_indexes], mode="input"),
+                self.scan_batch([messages[i].get("content", "") for i in output_indexes], mode="output"),
+            )
+            scan_results: Dict[int, Dict[str, Any]] = dict(zip(input_indexes, input_results, strict=True))
+            scan_results.update(zip(output_indexes, output_results, strict=True))
+
+            for i, message in enumerate(messages):
+                scan_result = scan_results[i]
 
                 # Add message index and role to result
                 scan_result["message_index"] = i
-                scan_result["message_role"] = role
+                scan_result["message_role"] = message.get("role", "unknown")
                 results["message_results"].append(scan_result)
 
                 # Update overall results
@@ -677,6 +712,100 @@ class LLMGuardBasic:
 
         return results
 
+    async def scan_batch(self, texts: List[str], mode: str = "input") -> List[Dict[str, Any]]:
+        """
+        Scan many texts without blocking the event loop.
+
+        Identical texts are scanned once: results are cached by content hash and
+        shared between duplicates. The remaining texts are split into chunks and
+        scanned concurrently in the worker pool.
+
+        Args:
+            texts: Texts to scan
+            mode: "input" to run the input scanners, "output" to run the output scanners
+
+        Returns:
+            One scan result per text, in the same order as ``texts``
+        """
+        if mode not in ("input", "output"):
+            raise ValueError(f"Invalid scan mode '{mode}'. Expected 'input' or 'output'.")
+
+        keys = [self._result_cache_key(mode, text) for text in texts]
+
+        # Results of this batch, kept here since the bounded cache may evict them before they are read
+        results: Dict[str, Dict[str, Any]] = {}
+        pending: Dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key in results or key in pending:
+                continue
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                pending[key] = text
+
+        if pending:
+            pending_keys = list(pending)
+            chunks = [
+                pending_keys[start : start + self.batch_chunk_size]
+                for start in range(0, len(pending_keys), self.batch_chunk_size)
+            ]
+            # Process workers hold their own guard, so they must not receive a bound method
+            worker = _scan_chunk_in_process if self.scan_executor == "process" else self._scan_chunk
+            executor = self._get_executor()
+            loop = asyncio.get_running_loop()
+            chunk_results = await asyncio.gather(
+                *(loop.run_in_executor(executor, worker, mode, [pending[key] for key in chunk]) for chunk in chunks)
+            )
+            for chunk, chunk_result in zip(chunks, chunk_results, strict=True):
+                for key, result in zip(chunk, chunk_result, strict=True):
+                    results[key] = result
+                    self._cache_result(key, result)
+
+        # Shallow copies so callers can annotate results without touching the cache
+        return [dict(results[key]) for key in keys]
+
+    def _scan_chunk(self, mode: str, texts: List[str]) -> List[Dict[str, Any]]:
+        """Scan a chunk of texts synchronously (runs in a worker)"""
+        scan = self._scan_input_sync if mode == "input" else self._scan_output_sync
+        return [scan(text) for text in texts]
+
+    def _result_cache_key(self, mode: str, text: str) -> str:
+        return f"{mode}:{hashlib.sha256(text.encode('utf-8', errors='surrogatepass')).hexdigest()}"
+
+    def _cache_result(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a scan result, evicting the least recently stored entries when full"""
+        if self.result_cache_size <= 0:
+            return
+        self._result_cache[key] = result
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
+
+    def _get_executor(self) -> Executor:
+        """Lazily create the worker pool used for off-loop scanning"""
+        if self._executor is None:
+            if self.scan_executor == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, initializer=_init_process_worker, initargs=(self.config,)
+                )
+            else:
+                # Regex scanning holds the GIL, so extra threads only add contention with the event loop
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers or 1, thread_name_prefix="llm_guard")
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "LLMGuardBasic":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def get_scanner_info(self) -> Dict[str, Any]:
         """Get information about available scanners and configuration"""
         return {
@@ -684,13 +813,20 @@ class LLMGuardBasic:
             "type": "basic_llm_guard",
             "input_scanners": self.input_scanners,
             "output_scanners": self.output_scanners,
-            "configuration": {"fail_fast": self.fail_fast, "return_scores": self.return_scores},
+            "configuration": {
+                "fail_fast": self.fail_fast,
+                "return_scores": self.return_scores,
+                "scan_executor": self.scan_executor,
+                "batch_chunk_size": self.batch_chunk_size,
+                "result_cache_size": self.result_cache_size,
+            },
             "capabilities": {
                 "prompt_injection_detection": True,
                 "toxicity_detection": True,
                 "secrets_detection": True,
                 "malicious_url_detection": True,
                 "conversation_scanning": True,
+                "batch_scanning": True,
             },
             "limitations": [
                 "Basic pattern matching only",
@@ -699,3 +835,17 @@ class LLMGuardBasic:
                 "Simplified threat scoring",
             ],
         }
+
+
+# Per-process guard used when scanning in a ProcessPoolExecutor
+_process_guard: Optional[LLMGuardBasic] = None
+
+
+def _init_process_worker(config: Dict[str, Any]) -> None:
+    global _process_guard
+    _process_guard = LLMGuardBasic(config)
+
+
+def _scan_chunk_in_process(mode: str, texts: List[str]) -> List[Dict[str, Any]]:
+    assert _process_guard is not None, "Process worker was not initialized"
+    return _process_guard._scan_chunk(mode, texts)
@@ -0,0 +1,201 @@
+"""
+Aurite Security Framework - Multi-Pattern Scanning Engine
+
+This module provides the multi-pattern scanning engine used by LLMGuardBasic.
+Instead of running every compiled regex over the full text, the engine:
+
+1. Extracts the literal substrings each pattern requires in order to match
+   (e.g. ``"jailbreak"`` for ``r"jailbreak"`` or ``{"hate", "kill", ...}`` for
+   ``r"\\b(hate|kill)\\b"``).
+2. Case-folds the text once and checks which of those literals are present,
+   for every pattern group at the same time. The checks are plain substring
+   searches, which run at C speed; a combined ``re.IGNORECASE`` alternation
+   (or a pure-Python Aho-Corasick automaton) is far slower in CPython.
+3. Runs only the patterns whose literals were found (plus the patterns that
+   have no usable literal) to produce the actual matches.
+
+Because the literal prefilter is a necessary condition for each pattern to
+match, the hits returned are identical to running every pattern individually,
+including per-pattern attribution and match order.
+"""
+
+import re
+from dataclasses import dataclass
+from re import _constants as sre_constants  # type: ignore[attr-defined]
+from re import _parser as sre_parse  # type: ignore[attr-defined]
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# Literals shorter than this match too often to be a useful prefilter.
+_MIN_LITERAL_LENGTH = 3
+
+_REPEAT_OPCODES = {
+    sre_constants.MAX_REPEAT,
+    sre_constants.MIN_REPEAT,
+    getattr(sre_constants, "POSSESSIVE_REPEAT", sre_constants.MAX_REPEAT),
+}
+# Non-ASCII characters that re.IGNORECASE treats as equal to an ASCII letter.
+_ASCII_CASE_EQUIVALENTS = {0x130: "i", 0x131: "i", 0x17F: "s", 0x212A: "k"}
+
+_GROUP_OPCODES = {sre_constants.SUBPATTERN, getattr(sre_constants, "ATOMIC_GROUP", sre_constants.SUBPATTERN)}
+
+
+@dataclass(frozen=True)
+class PatternHit:
+    """A single match of a pattern, attributed to its group and index."""
+
+    group: str
+    index: int
+    pattern: re.Pattern
+    match: re.Match
+
+
+def _literal_strength(literals: FrozenSet[str]) -> int:
+    return min(len(literal) for literal in literals)
+
+
+def _required_literals(parsed) -> Optional[FrozenSet[str]]:
+    """
+    Returns a set of literals such that every match of ``parsed`` contains at
+    least one of them, or None if no such set could be derived.
+    """
+    best: Optional[FrozenSet[str]] = None
+    run: List[str] = []
+
+    def consider(candidate: Optional[FrozenSet[str]]) -> None:
+        nonlocal best
+        if candidate and (best is None or _literal_strength(candidate) > _literal_strength(best)):
+            best = candidate
+
+    for op, av in parsed:
+        if op is sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+
+        if run:
+            consider(frozenset(["".join(run)]))
+            run = []
+
+        if op in _GROUP_OPCODES:
+            consider(_required_literals(av[-1]))
+        elif op is sre_constants.BRANCH:
+            alternatives = [_required_literals(alternative) for alternative in av[1]]
+            if all(alternatives):
+                consider(frozenset().union(*alternatives))  # type: ignore[arg-type]
+        elif op in _REPEAT_OPCODES and av[0] >= 1:
+            consider(_required_literals(av[2]))
+
+    if run:
+        consider(frozenset(["".join(run)]))
+    return best
+
+
+def extract_required_literals(pattern: str, flags: int = 0) -> Optional[FrozenSet[str]]:
+    """
+    Derives the prefilter literals for a regex pattern.
+
+    Returns None when the pattern has no literal of at least
+    ``_MIN_LITERAL_LENGTH`` characters that every match must contain, in which
+    case the pattern always has to be evaluated.
+    """
+    try:
+        literals = _required_literals(sre_parse.parse(pattern, flags))
+    except Exception:
+        return None
+    if not literals or _literal_strength(literals) < _MIN_LITERAL_LENGTH:
+        return None
+    if not all(literal.isascii() for literal in literals):
+        return None
+    return literals
+
+
+def fold_case(text: str) -> str:
+    """
+    Folds text so that an ASCII literal matches it with ``re.IGNORECASE``
+    semantics using a plain substring test.
+    """
+    if text.isascii():
+        return text.lower()
+    return text.translate(_ASCII_CASE_EQUIVALENTS).lower()
+
+
+class MultiPatternScanner:
+    """
+    Scans text for several named groups of regex patterns using a single
+    combined literal prefilter pass shared by all groups.
+    """
+
+    def __init__(self, pattern_groups: Dict[str, List[str]], flags: int = re.IGNORECASE):
+        """
+        Args:
+            pattern_groups: Mapping of group name (e.g. ``"secrets"``) to its regex patterns.
+            flags: Regex flags applied to every pattern.
+        """
+        self.flags = flags
+        self.compiled_patterns: Dict[str, List[re.Pattern]] = {
+            group: [re.compile(pattern, flags) for pattern in patterns] for group, patterns in pattern_groups.items()
+        }
+
+        # Per pattern: the (lowercased) literals that gate it, or None if it must always run.
+        self._anchors: Dict[str, List[Optional[FrozenSet[str]]]] = {}
+        for group, patterns in pattern_groups.items():
+            anchors = []
+            for pattern in patterns:
+                literals = extract_required_literals(pattern, flags)
+                anchors.append(frozenset(literal.lower() for literal in literals) if literals else None)
+            self._anchors[group] = anchors
+
+        self._literals: FrozenSet[str] = frozenset(
+            literal for anchors in self._anchors.values() for literal_set in anchors for literal in literal_set or ()
+        )
+        self._last_scan: Tuple[Optional[str], FrozenSet[str]] = (None, frozenset())
+
+    def find_literals(self, text: str) -> FrozenSet[str]:
+        """Returns the (lowercased) prefilter literals present in ``text``."""
+        last_text, last_literals = self._last_scan
+        if last_text is text:
+            return last_literals
+
+        folded = fold_case(text)
+        literals = frozenset(literal for literal in self._literals if literal in folded)
+        # Scanners for the same message share one prefilter pass.
+        self._last_scan = (text, literals)
+        return literals
+
+    def candidate_indexes(self, group: str, text: str) -> List[int]:
+        """Returns the indexes of patterns in ``group`` that may match ``text``."""
+        present = self.find_literals(text)
+        return [
+            index
+            for index, literal_set in enumerate(self._anchors[group])
+            if literal_set is None or not literal_set.isdisjoint(present)
+        ]
+
+    def scan(self, group: str, text: str, first_only: bool = False) -> List[PatternHit]:
+        """
+        Finds all matches for one pattern group.
+
+        Args:
+            group: Name of the pattern group to evaluate.
+            text: Text to scan.
+            first_only: Only report the first match per pattern (``search`` semantics)
+                instead of every non-overlapping match (``finditer`` semantics).
+
+        Returns:
+            Hits ordered by pattern index, then by position.
+        """
+        patterns = self.compiled_patterns[group]
+        hits: List[PatternHit] = []
+        for index in self.candidate_indexes(group, text):
+            pattern = patterns[index]
+            if first_only:
+                match = pattern.search(text)
+                if match:
+                    hits.append(PatternHit(group, index, pattern, match))
+            else:
+                hits.extend(PatternHit(group, index, pattern, match) for match in pattern.finditer(text))
+        return hits
+
+    def search_any(self, group: str, text: str) -> bool:
+        """Returns True if any pattern in ``group`` matches ``text``."""
+        patterns = self.compiled_patterns[group]
+        return any(patterns[index].search(text) for index in self.candidate_indexes(group, text))
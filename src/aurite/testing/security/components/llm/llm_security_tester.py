@@ -59,6 +59,13 @@ class LLMSecurityTester(BaseSecurityTester):
         else:
             self.logger.warning("LLM Guard not configured or disabled")
 
+    async def shutdown(self) -> None:
+        """Shut down the LLM Guard worker pool along with the tester"""
+        if self.llm_guard:
+            # close() waits for running scans and worker processes to finish
+            await asyncio.get_running_loop().run_in_executor(None, self.llm_guard.close)
+        await super().shutdown()
+
     def _initialize_tests(self) -> None:
         """Initialize LLM-specific security tests"""
 
@@ -0,0 +1,162 @@
+"""
+Client mode for `aurite run`.
+
+When an `aurite api` server is running locally for the same project, the CLI
+executes components through its HTTP and server-sent event endpoints instead of
+building its own Aurite kernel. The server's MCP sessions, component index and
+caches are already warm, so a run skips the imports and server start-up of an
+in-process run. The server is only used if it accepts the API key (API_KEY, from
+the environment or the project's .env file); otherwise, and with
+AURITE_CLI_MODE=local, the run happens in-process.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+import httpx
+from dotenv import dotenv_values
+
+from ...lib.config.config_utils import find_anchor_files
+from ..errors import AuriteError, ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+RUNNABLE_TYPES = ["agent", "linear_workflow", "custom_workflow", "graph_workflow"]
+
+
+def _dotenv_api_key(anchors: List[Path]) -> Optional[str]:
+    """Returns API_KEY from the .env file of the nearest project or workspace that sets it."""
+    for anchor in anchors:
+        env_file = anchor.parent / ".env"
+        if env_file.is_file():
+            api_key = dotenv_values(env_file).get("API_KEY")
+            if api_key:
+                return api_key
+    return None
+
+
+class ApiClient:
+    """Runs components through a local Aurite API server."""
+
+    def __init__(self, base_url: str, api_key: Optional[str]):
+        self.base_url = base_url
+        self._headers = {"X-API-Key": api_key} if api_key else {}
+
+    @classmethod
+    def connect(cls, start_dir: Path) -> Optional["ApiClient"]:
+        """
+        Returns a client for the API server on AURITE_API_URL (or localhost:$PORT) if one is
+        running for the same project or workspace as `start_dir` and accepts our API key,
+        otherwise None.
+        """
+        if os.getenv("AURITE_CLI_MODE", "").lower() == "local":
+            return None
+
+        base_url = os.getenv("AURITE_API_URL") or f"http://localhost:{os.getenv('PORT', '8000')}"
+        anchors = find_anchor_files(start_dir)
+        api_key = os.getenv("API_KEY") or _dotenv_api_key(anchors)
+        headers = {"X-API-Key": api_key} if api_key else {}
+        try:
+            # An authenticated endpoint, so a missing or wrong key means an in-process run rather than failed calls
+            response = httpx.get(f"{base_url}/config/context", headers=headers, timeout=0.5)
+        except httpx.HTTPError:
+            return None
+        if response.status_code in (401, 403):
+            logger.debug(f"API server at {base_url} rejected the API key. Running in-process.")
+            return None
+        if response.status_code != 200:
+            return None
+
+        context_root = str(anchors[0].parent) if anchors else None
+        server_root = response.json().get("context_root")
+        if server_root != context_root:
+            logger.debug(f"API server at {base_url} serves '{server_root}', not '{context_root}'. Running in-process.")
+            return None
+        return cls(base_url, api_key)
+
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(base_url=self.base_url, headers=self._headers, timeout=None)
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response):
+        if response.status_code < 400:
+            return
+        try:
+            body = response.json()
+            detail = body.get("detail") or body.get("error", {}).get("message") or body
+        except ValueError:
+            detail = response.text
+        if response.status_code == 404:
+            raise ConfigurationError(str(detail))
+        raise AuriteError(f"API server returned {response.status_code}: {detail}")
+
+    async def _lookup_component(self, client: httpx.AsyncClient, name: str) -> Optional[Dict[str, Any]]:
+        for component_type in RUNNABLE_TYPES:
+            response = await client.get(f"/config/components/{component_type}/{name}")
+            if response.status_code == 404:
+                continue
+            self._raise_for_status(response)
+            return {"name": name, "component_type": component_type, "config": response.json()}
+        return None
+
+    async def find_component(self, name: str) -> Optional[Dict[str, Any]]:
+        """Returns the runnable component named `name` as `{"name", "component_type", "config"}`, if any."""
+        async with self._client() as client:
+            component = await self._lookup_component(client, name)
+            if component is None:
+                # It may have been added since the server loaded its configuration
+                self._raise_for_status(await client.post("/config/refresh"))
+                component = await self._lookup_component(client, name)
+        return component
+
+    async def _stream(self, path: str, payload: Dict[str, Any]) -> AsyncGenerator[Dict[str, Any], None]:
+        async with self._client() as client:
+            async with client.stream("POST", path, json=payload) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    self._raise_for_status(response)
+                async for line in response.aiter_lines():
+                    if line.startswith("data: "):
+                        yield json.loads(line[len("data: ") :])
+
+    def stream_agent(
+        self,
+        agent_name: str,
+        user_message: str,
+        system_prompt: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        return self._stream(
+            f"/execution/agents/{agent_name}/stream",
+            {"user_message": user_message, "system_prompt": system_prompt, "session_id": session_id},
+        )
+
+    def stream_linear_workflow(
+        self, workflow_name: str, initial_input: Any, session_id: Optional[str] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        return self._stream(
+            f"/execution/workflows/linear/{workflow_name}/stream",
+            {"initial_input": initial_input, "session_id": session_id},
+        )
+
+    def stream_graph_workflow(
+        self, workflow_name: str, initial_input: Any, session_id: Optional[str] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        return self._stream(
+            f"/execution/workflows/graph/{workflow_name}/stream",
+            {"initial_input": initial_input, "session_id": session_id},
+        )
+
+    async def run_custom_workflow(
+        self, workflow_name: str, initial_input: Any, session_id: Optional[str] = None
+    ) -> Any:
+        async with self._client() as client:
+            response = await client.post(
+                f"/execution/workflows/custom/{workflow_name}/run",
+                json={"initial_input": initial_input, "session_id": session_id},
+            )
+        self._raise_for_status(response)
+        return response.json()
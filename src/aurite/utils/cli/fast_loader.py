@@ -1,11 +1,17 @@
 import json
 import logging
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import yaml
 
 from aurite.lib.config.config_utils import find_anchor_files
+from aurite.lib.config.index_cache import (
+    ConfigFileCache,
+    iter_config_files,
+    open_config_file_cache,
+    parse_config_file,
+)
 
 try:
     import tomllib
@@ -69,28 +75,27 @@ def list_component_names(component_type: str) -> List[str]:
     if user_config_path.is_dir():
         config_sources.append(user_config_path)
 
-    # Now, perform a shallow parse of files in the sources
-    for source_path in config_sources:
-        for config_file in source_path.rglob("*.json"):
-            _shallow_parse_and_add_names(config_file, component_type, names)
-        for config_file in source_path.rglob("*.yaml"):
-            _shallow_parse_and_add_names(config_file, component_type, names)
-        for config_file in source_path.rglob("*.yml"):
-            _shallow_parse_and_add_names(config_file, component_type, names)
+    # Now, perform a shallow parse of files in the sources, reusing the index cache for unchanged files
+    cache = open_config_file_cache(context_paths[0].parent if context_paths else None)
+    try:
+        for source_path in config_sources:
+            for config_file in iter_config_files(source_path):
+                _shallow_parse_and_add_names(config_file, component_type, names, cache)
+    finally:
+        if cache:
+            cache.close()
 
     return sorted(names)
 
 
-def _shallow_parse_and_add_names(config_file: Path, target_component_type: str, names: set):
+def _shallow_parse_and_add_names(
+    config_file: Path, target_component_type: str, names: set, cache: Optional[ConfigFileCache] = None
+):
     """
     Opens a config file and adds the 'name' of any components of the target type to the set.
     """
     try:
-        with config_file.open("r", encoding="utf-8") as f:
-            if config_file.suffix == ".json":
-                content = json.load(f)
-            else:
-                content = yaml.safe_load(f)
+        content = cache.load(config_file) if cache else parse_config_file(config_file)
     except (IOError, json.JSONDecodeError, yaml.YAMLError):
         return  # Ignore files that can't be parsed
 
@@ -0,0 +1,63 @@
+"""
+Import-time profiling for `aurite --profile-import`.
+
+Each module is imported in a fresh interpreter with `python -X importtime`, so
+the report reflects a cold start. It lists the wall time of every import and
+the third-party packages that contribute most to it.
+"""
+
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+STARTUP_MODULES = [
+    "aurite",
+    "aurite.bin.cli.cli",
+    "aurite.aurite",
+    "aurite.bin.api.api",
+]
+
+
+@dataclass
+class ImportProfile:
+    module: str
+    wall_time: float
+    import_time: float
+    packages: List[Tuple[str, float]] = field(default_factory=list)
+    error: str = ""
+
+
+def _parse_importtime(stderr: str) -> Dict[str, float]:
+    """Cumulative import time, in seconds, of every module in `-X importtime` output."""
+    times: Dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|", 2)
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1_000_000
+    return times
+
+
+def profile_import(module: str, top: int = 8) -> ImportProfile:
+    """Imports `module` in a subprocess and reports its time and heaviest packages."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True
+    )
+    wall_time = time.perf_counter() - start
+
+    if result.returncode != 0:
+        return ImportProfile(module, wall_time, 0.0, error=result.stderr.strip().splitlines()[-1])
+
+    times = _parse_importtime(result.stderr)
+    # A package's own line covers everything its import pulled in
+    packages = [
+        (name, seconds)
+        for name, seconds in times.items()
+        if "." not in name and name != module.split(".")[0] and name not in sys.stdlib_module_names
+    ]
+    packages.sort(key=lambda item: item[1], reverse=True)
+    return ImportProfile(module, wall_time, times.get(module, 0.0), packages[:top])
@@ -0,0 +1,283 @@
+"""
+Load generation for `aurite loadtest`.
+
+Drives a running `aurite api` server with a fixed number of concurrent virtual
+users for a given duration. Users start one after another over the ramp-up
+period, then each sends requests back to back, cycling through the targets:
+agent runs and streams, linear, graph and custom workflow runs and streams,
+and MCP tool calls. The report gives the throughput, latency percentiles and
+error rate of each target, the time to the first event of streams, and two
+measures of event-loop lag: how late the generator's own loop wakes up (if it
+is high, the generator rather than the server is the bottleneck), and the
+latency of the server's trivial `/health` endpoint, which is almost entirely
+time spent waiting for the server's loop.
+"""
+
+import asyncio
+import json
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+# Target kinds, as "<kind>:<name>", and the endpoint each one calls.
+TARGET_PATHS = {
+    "agent": "/execution/agents/{name}/run",
+    "agent_stream": "/execution/agents/{name}/stream",
+    "linear": "/execution/workflows/linear/{name}/run",
+    "linear_stream": "/execution/workflows/linear/{name}/stream",
+    "graph": "/execution/workflows/graph/{name}/run",
+    "graph_stream": "/execution/workflows/graph/{name}/stream",
+    "custom": "/execution/workflows/custom/{name}/run",
+    "tool": "/tools/{name}/call",
+}
+
+# Run statuses of agents ("success") and workflows ("completed") that count as successful requests.
+SUCCESS_STATUSES = ("success", "completed")
+
+LAG_INTERVAL = 0.1
+HEALTH_INTERVAL = 0.5
+
+
+@dataclass
+class LoadTarget:
+    kind: str
+    name: str
+    args: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def parse(cls, spec: str) -> "LoadTarget":
+        """
+        Parses "<kind>:<name>", e.g. "agent:Weather Agent". Tool targets take their arguments as JSON
+        after "=", e.g. 'tool:weather_lookup={"location": "London"}'.
+        """
+        kind, sep, rest = spec.partition(":")
+        if not sep or kind not in TARGET_PATHS or not rest:
+            raise ValueError(f"Invalid target '{spec}'. Expected <kind>:<name> with kind one of {list(TARGET_PATHS)}")
+        name, _, args = rest.partition("=")
+        try:
+            return cls(kind, name.strip(), json.loads(args) if args else {})
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid tool arguments in target '{spec}': {e}") from e
+
+    @property
+    def label(self) -> str:
+        return f"{self.kind}:{self.name}"
+
+    @property
+    def streaming(self) -> bool:
+        return self.kind.endswith("_stream")
+
+    def request(self, message: str) -> tuple[str, Dict[str, Any]]:
+        path = TARGET_PATHS[self.kind].format(name=self.name)
+        if self.kind == "tool":
+            return path, {"args": self.args}
+        if self.kind.startswith("agent"):
+            return path, {"user_message": message}
+        return path, {"initial_input": message}
+
+
+@dataclass
+class LoadTestConfig:
+    targets: List[LoadTarget]
+    base_url: str = "http://localhost:8000"
+    api_key: Optional[str] = None
+    concurrency: int = 10
+    duration: float = 30.0
+    ramp_up: float = 0.0
+    message: str = "What is the weather in London?"
+    timeout: float = 120.0
+    register_servers: List[str] = field(default_factory=list)
+
+
+@dataclass
+class RequestSample:
+    target: str
+    started_at: float
+    latency_ms: float
+    ok: bool
+    status: Optional[int] = None
+    first_event_ms: Optional[float] = None
+    error: Optional[str] = None
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile (0-100) of a non-empty list."""
+    ordered = sorted(values)
+    return round(ordered[max(1, math.ceil(q / 100 * len(ordered))) - 1], 3)
+
+
+def _distribution(values: List[float]) -> Optional[Dict[str, float]]:
+    if not values:
+        return None
+    return {
+        "p50": _percentile(values, 50),
+        "p95": _percentile(values, 95),
+        "p99": _percentile(values, 99),
+        "max": round(max(values), 3),
+    }
+
+
+def _summarize(samples: List[RequestSample], elapsed: float) -> Dict[str, Any]:
+    errors: Dict[str, int] = {}
+    for sample in samples:
+        if not sample.ok:
+            reason = str(sample.status) if sample.status and sample.status >= 400 else (sample.error or "error")
+            errors[reason] = errors.get(reason, 0) + 1
+    failed = sum(errors.values())
+    return {
+        "requests": len(samples),
+        "errors": failed,
+        "error_rate": round(failed / len(samples), 4) if samples else 0.0,
+        "throughput_per_second": round(len(samples) / elapsed, 3) if elapsed > 0 else None,
+        "latency_ms": _distribution([s.latency_ms for s in samples if s.ok]),
+        "first_event_ms": _distribution([s.first_event_ms for s in samples if s.first_event_ms is not None]),
+        "errors_by_reason": errors,
+    }
+
+
+def _run_status_error(response: httpx.Response) -> Optional[str]:
+    """Agent and workflow runs that fail still answer 200, with the outcome in `status`."""
+    try:
+        body = response.json()
+    except ValueError:
+        return None
+    run_status = body.get("status") if isinstance(body, dict) else None
+    if isinstance(run_status, str) and run_status not in SUCCESS_STATUSES:
+        return f"status_{run_status}"
+    return None
+
+
+async def _send(client: httpx.AsyncClient, target: LoadTarget, message: str) -> RequestSample:
+    path, payload = target.request(message)
+    started_at = time.time()
+    start = time.perf_counter()
+    status = None
+    first_event_ms = None
+    error = None
+    try:
+        if target.streaming:
+            async with client.stream("POST", path, json=payload) as response:
+                status = response.status_code
+                if status < 400:
+                    async for line in response.aiter_lines():
+                        if not line.startswith("data: "):
+                            continue
+                        if first_event_ms is None:
+                            first_event_ms = (time.perf_counter() - start) * 1000
+                        event = json.loads(line[len("data: ") :])
+                        if isinstance(event, dict) and event.get("type") == "error":
+                            error = "error_event"
+                else:
+                    await response.aread()
+        else:
+            response = await client.post(path, json=payload)
+            status = response.status_code
+            if status < 400:
+                error = _run_status_error(response)
+    except (httpx.HTTPError, json.JSONDecodeError) as e:
+        error = type(e).__name__
+    latency_ms = (time.perf_counter() - start) * 1000
+    ok = error is None and status is not None and status < 400
+    return RequestSample(target.label, started_at, latency_ms, ok, status, first_event_ms, error)
+
+
+async def _user(
+    index: int, config: LoadTestConfig, client: httpx.AsyncClient, deadline: float, samples: List[RequestSample]
+):
+    if config.concurrency > 1 and config.ramp_up > 0:
+        await asyncio.sleep(config.ramp_up * index / config.concurrency)
+    request_number = index
+    while time.perf_counter() < deadline:
+        target = config.targets[request_number % len(config.targets)]
+        samples.append(await _send(client, target, config.message))
+        request_number += 1
+
+
+async def _monitor_loop_lag(lags: List[float], stop: asyncio.Event):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(LAG_INTERVAL)
+        lags.append(max(0.0, (time.perf_counter() - start - LAG_INTERVAL) * 1000))
+
+
+async def _probe_health(client: httpx.AsyncClient, latencies: List[float], stop: asyncio.Event):
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            await client.get("/health")
+            latencies.append((time.perf_counter() - start) * 1000)
+        except httpx.HTTPError:
+            pass
+        try:
+            await asyncio.wait_for(stop.wait(), HEALTH_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_load_test(config: LoadTestConfig, transport: Optional[httpx.AsyncBaseTransport] = None) -> Dict[str, Any]:
+    """
+    Runs a load test against an Aurite API server.
+
+    Args:
+        config: The targets, concurrency, ramp-up and duration of the test
+        transport: Optional httpx transport, e.g. to drive an ASGI app in-process
+
+    Returns:
+        A report with the settings, overall and per-target statistics, and the event-loop lag of
+        the generator and of the server
+    """
+    if not config.targets:
+        raise ValueError("At least one target is required")
+    if config.concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    headers = {"X-API-Key": config.api_key} if config.api_key else {}
+    limits = httpx.Limits(max_connections=config.concurrency + 1, max_keepalive_connections=config.concurrency + 1)
+    async with httpx.AsyncClient(
+        base_url=config.base_url, headers=headers, timeout=config.timeout, limits=limits, transport=transport
+    ) as client:
+        for server_name in config.register_servers:
+            response = await client.post(f"/tools/register/{server_name}")
+            if response.status_code >= 400:
+                raise RuntimeError(f"Could not register MCP server '{server_name}': {response.text}")
+
+        samples: List[RequestSample] = []
+        loop_lags: List[float] = []
+        health_latencies: List[float] = []
+        stop = asyncio.Event()
+        monitors = [
+            asyncio.create_task(_monitor_loop_lag(loop_lags, stop)),
+            asyncio.create_task(_probe_health(client, health_latencies, stop)),
+        ]
+
+        start = time.perf_counter()
+        deadline = start + config.duration
+        try:
+            await asyncio.gather(*(_user(i, config, client, deadline, samples) for i in range(config.concurrency)))
+        finally:
+            stop.set()
+            await asyncio.gather(*monitors)
+        elapsed = time.perf_counter() - start
+
+    return {
+        "settings": {
+            "base_url": config.base_url,
+            "concurrency": config.concurrency,
+            "duration": config.duration,
+            "ramp_up": config.ramp_up,
+            "targets": [target.label for target in config.targets],
+        },
+        "elapsed_seconds": round(elapsed, 3),
+        "overall": _summarize(samples, elapsed),
+        "targets": {
+            target.label: _summarize([s for s in samples if s.target == target.label], elapsed)
+            for target in config.targets
+        },
+        "event_loop_lag_ms": {
+            "generator": _distribution(loop_lags),
+            "server_health": _distribution(health_latencies),
+        },
+    }
@@ -19,7 +19,9 @@ class RunPresenter:
     def __init__(self, mode: str = "default"):
         self.mode = mode
         self._live: Optional[Live] = None
-        self._full_response = ""
+        # Streamed workflows interleave the output of parallel nodes, so responses are buffered per node
+        self._responses: Dict[Optional[str], str] = {}
+        self._node_id: Optional[str] = None
 
     async def render_stream(self, stream: AsyncGenerator[Dict[str, Any], None], component_info: Dict[str, Any]):
         """
@@ -33,6 +35,7 @@ class RunPresenter:
             async for event in stream:
                 event_type = event.get("type")
                 event_data = event.get("data", {})
+                self._node_id = event.get("node_id")
 
                 # Handle different display modes
                 if self.mode == "debug":
@@ -46,6 +49,8 @@ class RunPresenter:
                         final_output += event_data.get("content", "")
                     elif event_type == "tool_output":
                         final_output = event_data.get("output", "")
+                    elif event_type == "workflow_complete":
+                        final_output = event_data.get("final_output") or event_data.get("error") or ""
 
         finally:
             if self._live and self._live.is_started:
@@ -86,21 +91,21 @@ class RunPresenter:
 
     async def _handle_llm_response(self, data: Dict[str, Any]):
         content = data.get("content", "")
-        self._full_response += content
+        self._responses[self._node_id] = self._responses.get(self._node_id, "") + content
 
     async def _handle_llm_response_stop(self, data: Dict[str, Any]):
-        response_text = Text(self._full_response, "bright_white")
+        response_text = Text(self._responses.pop(self._node_id, ""), "bright_white")
         response_text.no_wrap = False
+        title = "Agent Response" if self._node_id is None else f"Agent Response ({self._node_id})"
 
         console.print(
             Panel(
                 response_text,
-                title="[bold cyan]Agent Response[/bold cyan]",
+                title=f"[bold cyan]{title}[/bold cyan]",
                 border_style="cyan",
                 expand=True,
             )
         )
-        self._full_response = ""  # Reset for next turn
 
     async def _handle_tool_call(self, data: Dict[str, Any]):
         tool_name = data.get("name", "Unknown Tool")
@@ -155,10 +160,25 @@ class RunPresenter:
         console.print(panel)
 
     async def _handle_workflow_step_start(self, data: Dict[str, Any]):
-        console.print(f"[grey50]Running workflow step: [bold]{data.get('name', 'Unnamed')}[/bold]...[/grey50]")
+        console.print(
+            f"[grey50]Running workflow step: [bold]{self._node_id or data.get('name', 'Unnamed')}[/bold]...[/grey50]"
+        )
 
     async def _handle_workflow_step_end(self, data: Dict[str, Any]):
-        console.print(f"[grey50]... finished step: [bold]{data.get('name', 'Unnamed')}[/bold].[/grey50]")
+        status = data.get("status")
+        suffix = f" ({status})" if status and status != "completed" else ""
+        console.print(
+            f"[grey50]... finished step: [bold]{self._node_id or data.get('name', 'Unnamed')}[/bold]{suffix}.[/grey50]"
+        )
+
+    async def _handle_workflow_complete(self, data: Dict[str, Any]):
+        if data.get("status") == "failed":
+            await self._handle_error({"message": data.get("error") or "Workflow failed."})
+            return
+        final_output = data.get("final_output")
+        if not isinstance(final_output, str):
+            final_output = json.dumps(final_output, default=str)
+        await self._handle_tool_output({"name": "Workflow Result", "output": final_output})
 
     async def _handle_unknown(self, data: Dict[str, Any]):
         console.print(f"[dim]Unknown event type received: {data}[/dim]")
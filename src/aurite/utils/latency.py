@@ -0,0 +1,169 @@
+"""
+Latency breakdown of agent runs.
+
+The phases of a run (config resolution, MCP server registration, LLM calls,
+tool calls, session persistence) are wrapped in `timed(phase)`. Every timed
+phase is added to a process-wide histogram, which can be read with
+`get_latency_histograms()` to see where time goes across many runs. Code that
+wants the breakdown of a single operation wraps it in `track_latency()`: every
+phase timed inside that context, including in asyncio tasks started within it,
+is recorded as a span of the returned LatencyBreakdown.
+
+Phases that are not a single block of code, like the time to the first token
+of a streamed LLM response, are reported with `record_latency()`.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+# Upper bounds, in milliseconds, of the histogram buckets; the last bucket is unbounded
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000)
+
+
+@dataclass
+class LatencySpan:
+    """A timed phase: its offset from the start of the breakdown and its duration, in milliseconds."""
+
+    phase: str
+    start_ms: float
+    duration_ms: float
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        span = {"phase": self.phase, "start_ms": round(self.start_ms, 3), "duration_ms": round(self.duration_ms, 3)}
+        if self.attributes:
+            span["attributes"] = self.attributes
+        return span
+
+
+@dataclass
+class LatencyBreakdown:
+    """The phases timed within a `track_latency()` context."""
+
+    started_at: float = field(default_factory=time.perf_counter)
+    spans: List[LatencySpan] = field(default_factory=list)
+    parent: Optional["LatencyBreakdown"] = None
+
+    def add(self, phase: str, started_at: float, duration: float, attributes: Dict[str, Any]):
+        self.spans.append(LatencySpan(phase, (started_at - self.started_at) * 1000, duration * 1000, attributes))
+        if self.parent:
+            self.parent.add(phase, started_at, duration, attributes)
+
+    def phase_totals(self) -> Dict[str, float]:
+        """Total milliseconds per phase. Phases can overlap, e.g. LLM calls run within agent turns."""
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            totals[span.phase] = totals.get(span.phase, 0.0) + span.duration_ms
+        return {phase: round(total, 3) for phase, total in totals.items()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_ms": round((time.perf_counter() - self.started_at) * 1000, 3),
+            "phases": self.phase_totals(),
+            "spans": [span.to_dict() for span in self.spans],
+        }
+
+
+class LatencyHistogram:
+    """Bucketed distribution of the durations recorded for one phase."""
+
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.min_ms = float("inf")
+        self.max_ms = 0.0
+
+    def observe(self, duration_ms: float):
+        self.counts[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, duration_ms)] += 1
+        self.count += 1
+        self.sum_ms += duration_ms
+        self.min_ms = min(self.min_ms, duration_ms)
+        self.max_ms = max(self.max_ms, duration_ms)
+
+    def percentile(self, q: float) -> float:
+        """Estimates the q-th percentile (0-100) as the upper bound of the bucket that contains it."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                bound = HISTOGRAM_BUCKETS_MS[index] if index < len(HISTOGRAM_BUCKETS_MS) else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 3),
+            "mean_ms": round(self.sum_ms / self.count, 3) if self.count else 0.0,
+            "min_ms": round(self.min_ms, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "buckets": {
+                **{f"le_{bound}": count for bound, count in zip(HISTOGRAM_BUCKETS_MS, self.counts[:-1], strict=True)},
+                "le_inf": self.counts[-1],
+            },
+        }
+
+
+_current_breakdown: ContextVar[Optional[LatencyBreakdown]] = ContextVar("aurite_latency_breakdown", default=None)
+_histograms: Dict[str, LatencyHistogram] = {}
+_histograms_lock = threading.Lock()
+
+
+def record_latency(phase: str, started_at: float, duration: float, **attributes: Any):
+    """
+    Records a phase that started at `started_at` (a `time.perf_counter()` value) and took
+    `duration` seconds, in its histogram and in the active breakdown, if any.
+    """
+    with _histograms_lock:
+        histogram = _histograms.get(phase)
+        if histogram is None:
+            histogram = _histograms[phase] = LatencyHistogram()
+        histogram.observe(duration * 1000)
+
+    breakdown = _current_breakdown.get()
+    if breakdown is not None:
+        breakdown.add(phase, started_at, duration, attributes)
+
+
+@contextmanager
+def timed(phase: str, **attributes: Any) -> Iterator[None]:
+    """Times the enclosed block as `phase`, including when it raises."""
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_latency(phase, started_at, time.perf_counter() - started_at, **attributes)
+
+
+@contextmanager
+def track_latency() -> Iterator[LatencyBreakdown]:
+    """Collects the phases timed within the context."""
+    breakdown = LatencyBreakdown(parent=_current_breakdown.get())
+    token = _current_breakdown.set(breakdown)
+    try:
+        yield breakdown
+    finally:
+        _current_breakdown.reset(token)
+
+
+def get_latency_histograms() -> Dict[str, Dict[str, Any]]:
+    """Returns the latency distribution of every phase recorded since startup (or the last reset)."""
+    with _histograms_lock:
+        return {phase: histogram.to_dict() for phase, histogram in sorted(_histograms.items())}
+
+
+def reset_latency_histograms():
+    with _histograms_lock:
+        _histograms.clear()
@@ -0,0 +1,71 @@
+"""
+Deferred imports for package re-exports.
+
+Several packages re-export classes whose modules import LiteLLM, Langfuse,
+SQLAlchemy or the MCP client stack. Importing them eagerly makes every
+`import aurite...` (including each CLI command and shell completion) pay for
+all of it. `lazy_exports` builds a module-level `__getattr__` (PEP 562) that
+imports an export's module the first time the export is accessed, and
+`lazy_submodules` does the same for packages that re-export their submodules
+with `import *`.
+"""
+
+import importlib
+from types import ModuleType
+from typing import Any, Callable, Dict, List
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Returns a `__getattr__` for `package` that resolves each name in `exports` from the
+    (relative) module it maps to, e.g. `{"ConfigManager": ".config_manager"}`.
+    """
+    package_module = importlib.import_module(package)
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(exports[name], package)
+        # A module maps to itself when the export is the module, e.g. `models`
+        value = module if module.__name__.rsplit(".", 1)[-1] == name else getattr(module, name)
+        setattr(package_module, name, value)
+        return value
+
+    return __getattr__
+
+
+def lazy_submodules(package: str, submodules: List[str]) -> Callable[[str], Any]:
+    """
+    Returns a `__getattr__` for `package` that re-exports everything its (relative) submodules
+    export, like `from .submodule import *` for each of them. A name is looked up in the
+    submodules in order, importing each only when it is reached, so list the cheap ones first.
+    `__all__` is the combined exports of all of them, which keeps `import *` working.
+    """
+    package_module = importlib.import_module(package)
+
+    def _exports(module: ModuleType, name: str) -> bool:
+        if "__all__" in module.__dict__:
+            return name in module.__all__
+        # A lazy package itself, look the name up through its own __getattr__
+        return hasattr(module, name)
+
+    def __getattr__(name: str) -> Any:
+        if name == "__all__":
+            names: List[str] = []
+            for submodule in submodules:
+                module = importlib.import_module(submodule, package)
+                try:
+                    names.extend(module.__all__)
+                except AttributeError:
+                    names.extend(name for name in vars(module) if not name.startswith("_"))
+            return names
+        if not name.startswith("_"):
+            for submodule in submodules:
+                module = importlib.import_module(submodule, package)
+                if _exports(module, name):
+                    value = getattr(module, name)
+                    setattr(package_module, name, value)
+                    return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -0,0 +1,69 @@
+"""
+Benchmarks for building the ConfigManager component index and looking up configs.
+
+The project holds 2,000 components spread over 40 files, roughly a large
+workspace. The index cache is disabled so every build parses the files.
+
+Run with:
+    pytest tests/benchmarks/test_config_benchmark.py --benchmark-only
+"""
+
+import json
+
+import pytest
+
+from aurite.lib.config.config_manager import ConfigManager
+
+pytest.importorskip("pytest_benchmark")
+
+FILES = 40
+AGENTS_PER_FILE = 50
+
+
+@pytest.fixture(scope="module")
+def project(tmp_path_factory):
+    root = tmp_path_factory.mktemp("project")
+    (root / ".aurite").write_text('[aurite]\ntype = "project"\ninclude_configs = ["./config"]\n')
+    config_dir = root / "config"
+    config_dir.mkdir()
+    (config_dir / "llms.json").write_text(
+        json.dumps([{"type": "llm", "name": "gpt", "provider": "openai", "model": "gpt-4o"}])
+    )
+    for file_index in range(FILES):
+        agents = [
+            {
+                "type": "agent",
+                "name": f"agent_{file_index}_{i}",
+                "llm_config_id": "gpt",
+                "system_prompt": "You are a helpful assistant. " * 10,
+                "mcp_servers": ["weather_server", "planning_server"],
+            }
+            for i in range(AGENTS_PER_FILE)
+        ]
+        (config_dir / f"agents_{file_index}.json").write_text(json.dumps(agents))
+    return root
+
+
+@pytest.fixture
+def uncached(project, monkeypatch):
+    monkeypatch.chdir(project)
+    monkeypatch.setenv("AURITE_INDEX_CACHE", "false")
+    return project
+
+
+@pytest.mark.benchmark(group="config_manager")
+def test_index_build(benchmark, uncached):
+    config_manager = benchmark.pedantic(ConfigManager, kwargs={"start_dir": uncached}, rounds=5, iterations=1)
+    assert len(config_manager.list_configs("agent")) == FILES * AGENTS_PER_FILE
+
+
+@pytest.mark.benchmark(group="config_manager")
+def test_get_config(benchmark, uncached):
+    config_manager = ConfigManager(start_dir=uncached)
+    names = [f"agent_{file_index}_{i}" for file_index in range(FILES) for i in range(0, AGENTS_PER_FILE, 5)]
+
+    def lookup_all():
+        return [config_manager.get_config("agent", name) for name in names]
+
+    configs = benchmark(lookup_all)
+    assert all(configs)
@@ -0,0 +1,62 @@
+"""
+Benchmarks for GraphWorkflowExecutor scheduling over wide DAGs.
+
+Agents are stubs that return immediately, so the measurement is the executor's
+own overhead: building and verifying the graph, scheduling ready nodes, and
+collecting results.
+
+Run with:
+    pytest tests/benchmarks/test_graph_workflow_benchmark.py --benchmark-only
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from openai.types.chat import ChatCompletionMessage
+
+from aurite.lib.components.workflows.graph_workflow import GraphWorkflowExecutor
+from aurite.lib.models.api.responses import AgentRunResult
+from aurite.lib.models.config.components import GraphWorkflowConfig
+
+pytest.importorskip("pytest_benchmark")
+
+
+class StubEngine:
+    def __init__(self):
+        self._config_manager = Mock()
+        self._config_manager.get_config.return_value = {"name": "agent"}
+
+    async def run_agent(self, agent_name, user_message, **kwargs):
+        return AgentRunResult(
+            status="success",
+            final_response=ChatCompletionMessage(role="assistant", content=f"{agent_name} done"),
+            conversation_history=[],
+        )
+
+
+def _wide_dag(width: int, layers: int) -> GraphWorkflowConfig:
+    """`layers` layers of `width` nodes, each node depending on every node of a small window of the layer above."""
+    nodes = [{"node_id": "root", "name": "root", "type": "agent"}]
+    edges = []
+    previous = ["root"]
+    for layer in range(layers):
+        current = [f"l{layer}_n{i}" for i in range(width)]
+        nodes.extend({"node_id": node, "name": node, "type": "agent"} for node in current)
+        for i, node in enumerate(current):
+            for parent in previous[i % len(previous) : i % len(previous) + 3] or previous[:1]:
+                edges.append({"from": parent, "to": node})
+        previous = current
+    return GraphWorkflowConfig(name="wide", nodes=nodes, edges=edges, max_parallel=50)
+
+
+@pytest.mark.benchmark(group="graph_workflow")
+@pytest.mark.parametrize("width,layers", [(200, 1), (100, 5)])
+def test_execute_wide_dag(benchmark, width, layers):
+    config = _wide_dag(width, layers)
+
+    def run():
+        return asyncio.run(GraphWorkflowExecutor(config, StubEngine()).execute("go"))
+
+    result = benchmark.pedantic(run, rounds=5, iterations=1)
+    assert result.status == "completed"
@@ -0,0 +1,65 @@
+"""
+Benchmarks for LiteLLMClient request building with long conversation histories.
+
+Every LLM call converts the full history and tool list to the provider format,
+so this cost grows with the length of a conversation.
+
+Run with:
+    pytest tests/benchmarks/test_llm_client_benchmark.py --benchmark-only
+"""
+
+import json
+
+import pytest
+
+from aurite.lib.components.llm.litellm_client import LiteLLMClient
+from aurite.lib.models.config.components import LLMConfig
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _history(turns: int):
+    messages = []
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"Question {i}: what changed in the report? " * 5})
+        messages.append(
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": f"call_{i}",
+                        "type": "function",
+                        "function": {"name": "search_reports", "arguments": json.dumps({"query": f"report {i}"})},
+                    }
+                ],
+            }
+        )
+        messages.append({"role": "tool", "tool_call_id": f"call_{i}", "content": "Revenue grew 4%. " * 20})
+        messages.append({"role": "assistant", "content": f"In report {i}, revenue grew 4 percent. " * 5})
+    return messages
+
+
+TOOLS = [
+    {
+        "name": f"tool_{i}",
+        "description": f"Tool number {i}.",
+        "inputSchema": {"type": "object", "properties": {"query": {"type": "string"}}},
+    }
+    for i in range(50)
+]
+
+
+@pytest.fixture(scope="module")
+def client() -> LiteLLMClient:
+    # The mock provider builds requests like any other and does not import LiteLLM
+    return LiteLLMClient(config=LLMConfig(name="bench", provider="mock", model="echo", temperature=0.2))
+
+
+@pytest.mark.benchmark(group="llm_request_params")
+@pytest.mark.parametrize("turns", [10, 250])
+def test_build_request_params(benchmark, client, turns):
+    messages = _history(turns)
+    params = benchmark(client._build_request_params, messages, TOOLS, "You are a financial analyst.")
+    assert len(params["messages"]) == len(messages) + 1
+    assert len(params["tools"]) == len(TOOLS)
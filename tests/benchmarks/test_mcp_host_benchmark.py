@@ -0,0 +1,62 @@
+"""
+Benchmarks for MCPHost.get_formatted_tools with large tool sets.
+
+The host holds 2,000 tools from 40 servers. The agent cases filter them down
+to a few allowed servers, and with tool retrieval also rank them against the
+conversation.
+
+Run with:
+    pytest tests/benchmarks/test_mcp_host_benchmark.py --benchmark-only
+"""
+
+import mcp.types as types
+import pytest
+
+from aurite.execution.mcp_host.mcp_host import MCPHost
+from aurite.lib.models.config.components import AgentConfig
+
+pytest.importorskip("pytest_benchmark")
+
+SERVERS = 40
+TOOLS_PER_SERVER = 50
+TOPICS = ["weather", "calendar", "files", "email", "billing", "search", "maps", "tickets"]
+
+
+@pytest.fixture(scope="module")
+def host() -> MCPHost:
+    host = MCPHost()
+    for server in range(SERVERS):
+        for i in range(TOOLS_PER_SERVER):
+            topic = TOPICS[(server + i) % len(TOPICS)]
+            tool = types.Tool(
+                name=f"server{server}-{topic}_action_{i}",
+                description=f"Performs action {i} on {topic} records for the user.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {"query": {"type": "string"}, "limit": {"type": "integer"}},
+                    "required": ["query"],
+                },
+            )
+            host._tools[tool.name] = tool
+            host._tool_index.add_tool(tool)
+    return host
+
+
+@pytest.mark.benchmark(group="mcp_host_tools")
+def test_all_tools(benchmark, host):
+    tools = benchmark(host.get_formatted_tools)
+    assert len(tools) == SERVERS * TOOLS_PER_SERVER
+
+
+@pytest.mark.benchmark(group="mcp_host_tools")
+def test_agent_filtered_tools(benchmark, host):
+    agent = AgentConfig(name="assistant", mcp_servers=[f"server{i}" for i in range(5)])
+    tools = benchmark(host.get_formatted_tools, agent_config=agent)
+    assert len(tools) == 5 * TOOLS_PER_SERVER
+
+
+@pytest.mark.benchmark(group="mcp_host_tools")
+def test_retrieved_tools(benchmark, host):
+    agent = AgentConfig(name="assistant", mcp_servers=[f"server{i}" for i in range(SERVERS)], auto=True)
+    tools = benchmark(host.get_formatted_tools, agent_config=agent, query="What is the weather forecast for Tokyo?")
+    assert 0 < len(tools) < SERVERS * TOOLS_PER_SERVER
@@ -0,0 +1,86 @@
+"""
+Benchmarks for SessionManager persistence with 10,000 stored sessions.
+
+Uses file-based storage (the default without AURITE_ENABLE_DB), where listing
+sessions reads every session file.
+
+Run with:
+    pytest tests/benchmarks/test_session_benchmark.py --benchmark-only
+"""
+
+import json
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from aurite.lib.storage.sessions.cache_manager import CacheManager
+from aurite.lib.storage.sessions.session_manager import SessionManager
+
+pytest.importorskip("pytest_benchmark")
+
+SESSIONS = 10_000
+
+
+def _agent_result(index: int):
+    return {
+        "status": "success",
+        "agent_name": f"agent_{index % 20}",
+        "conversation_history": [
+            {"role": "user", "content": f"Request {index}"},
+            {"role": "assistant", "content": f"Response {index}"},
+        ],
+    }
+
+
+@pytest.fixture(scope="module")
+def cache_dir(tmp_path_factory):
+    cache_dir = tmp_path_factory.mktemp("sessions")
+    start = datetime(2025, 1, 1)
+    for i in range(SESSIONS):
+        session_id = f"agent-{i:05d}"
+        timestamp = (start + timedelta(minutes=i)).isoformat()
+        session = {
+            "session_id": session_id,
+            "base_session_id": session_id,
+            "execution_result": _agent_result(i),
+            "result_type": "agent",
+            "created_at": timestamp,
+            "last_updated": timestamp,
+            "name": f"agent_{i % 20}",
+            "message_count": 2,
+            "agents_involved": None,
+        }
+        (cache_dir / f"{session_id}.json").write_text(json.dumps(session))
+    return cache_dir
+
+
+@pytest.fixture(scope="module")
+def session_manager(cache_dir) -> SessionManager:
+    return SessionManager(cache_manager=CacheManager(cache_dir=cache_dir), storage_manager=None)
+
+
+@pytest.mark.benchmark(group="session_manager")
+def test_save_result(benchmark, session_manager):
+    def save():
+        session_id = f"agent-new-{uuid.uuid4().hex[:8]}"
+        session_manager._save_result(session_id, _agent_result(0), "agent")
+        return session_id
+
+    session_id = benchmark.pedantic(save, rounds=50, iterations=1)
+    assert session_manager.get_session_result(session_id) is not None
+
+
+@pytest.mark.benchmark(group="session_manager")
+def test_get_sessions_list(benchmark, session_manager):
+    page = benchmark.pedantic(session_manager.get_sessions_list, kwargs={"limit": 50}, rounds=3, iterations=1)
+    assert page["total"] >= SESSIONS
+    assert len(page["sessions"]) == 50
+
+
+@pytest.mark.benchmark(group="session_manager")
+def test_get_sessions_list_by_agent(benchmark, session_manager):
+    page = benchmark.pedantic(
+        session_manager.get_sessions_list, kwargs={"agent_name": "agent_7", "limit": 50}, rounds=3, iterations=1
+    )
+    assert page["total"] >= SESSIONS // 20
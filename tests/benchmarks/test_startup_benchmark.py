@@ -0,0 +1,57 @@
+"""
+Benchmarks for Aurite's startup latency.
+
+Each measurement runs a fresh interpreter, so it covers the cold import cost a
+user pays for `import aurite` and for every CLI invocation. The import checks
+guard against heavy subsystems creeping back into eager imports.
+
+Run with:
+    pytest tests/benchmarks/test_startup_benchmark.py --benchmark-only
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+HEAVY_PACKAGES = ["litellm", "langfuse", "sqlalchemy", "mcp", "networkx", "openai"]
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True)
+
+
+def _loaded_heavy_packages(statement: str) -> list[str]:
+    check = f"{statement}; import sys; print(','.join(p for p in {HEAVY_PACKAGES!r} if p in sys.modules))"
+    return [package for package in _run("-c", check).stdout.strip().split(",") if package]
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import aurite",
+        "import aurite.bin.cli.cli",
+        "from aurite.lib.models.config.components import AgentConfig",
+        "import aurite.utils.cli.fast_loader",
+    ],
+)
+def test_startup_imports_stay_lazy(statement):
+    assert _loaded_heavy_packages(statement) == []
+
+
+def test_lazy_exports_still_resolve():
+    _run("-c", "import aurite; aurite.Aurite; aurite.AgentConfig; aurite.types.AgentRunResult")
+
+
+def test_import_aurite(benchmark):
+    benchmark.pedantic(_run, args=("-c", "import aurite"), rounds=5, iterations=1)
+
+
+def test_import_aurite_kernel(benchmark):
+    benchmark.pedantic(_run, args=("-c", "from aurite import Aurite"), rounds=3, iterations=1)
+
+
+def test_cli_help(benchmark):
+    benchmark.pedantic(_run, args=("-m", "aurite.bin.cli.main", "--help"), rounds=5, iterations=1)
@@ -0,0 +1,106 @@
+"""
+Tests for the latency breakdown of agent runs.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from openai.types.chat import ChatCompletionMessage
+
+from aurite.execution.aurite_engine import AuriteEngine
+from aurite.execution.mcp_host.mcp_host import MCPHost
+from aurite.lib.components.llm.litellm_client import LiteLLMClient
+from aurite.lib.models.config.components import LLMConfig
+from aurite.utils.latency import (
+    LatencyHistogram,
+    get_latency_histograms,
+    reset_latency_histograms,
+    timed,
+    track_latency,
+)
+
+CONFIGS = {
+    ("agent", "writer"): {"name": "writer", "type": "agent", "llm_config_id": "gpt"},
+    ("llm", "gpt"): {"name": "gpt", "type": "llm", "provider": "openai", "model": "gpt-4"},
+}
+
+
+@pytest.fixture(autouse=True)
+def clean_histograms():
+    reset_latency_histograms()
+    yield
+    reset_latency_histograms()
+
+
+@pytest.fixture
+def engine() -> AuriteEngine:
+    config_manager = Mock()
+    config_manager.get_config = Mock(side_effect=lambda component_type, name: CONFIGS.get((component_type, name)))
+    host = Mock(spec=MCPHost)
+    host.get_formatted_tools = Mock(return_value=[])
+    return AuriteEngine(config_manager=config_manager, host_instance=host)
+
+
+def _completion(content: str):
+    message = ChatCompletionMessage(role="assistant", content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")], usage=None)
+
+
+def test_track_latency_collects_nested_phases():
+    with track_latency() as outer:
+        with timed("config_resolution"):
+            pass
+        with track_latency() as inner:
+            with timed("tool_call", tool="weather-lookup"):
+                pass
+
+    assert [span.phase for span in outer.spans] == ["config_resolution", "tool_call"]
+    assert [span.to_dict()["attributes"] for span in inner.spans] == [{"tool": "weather-lookup"}]
+    assert set(outer.to_dict()["phases"]) == {"config_resolution", "tool_call"}
+    assert get_latency_histograms()["tool_call"]["count"] == 1
+
+
+def test_histogram_percentiles_use_bucket_bounds():
+    histogram = LatencyHistogram()
+    for duration_ms in [3, 4, 4, 7, 300]:
+        histogram.observe(duration_ms)
+
+    summary = histogram.to_dict()
+    assert summary["count"] == 5
+    assert summary["p50_ms"] == 5
+    assert summary["p99_ms"] == 300
+    assert summary["buckets"]["le_5"] == 3
+    assert summary["buckets"]["le_500"] == 1
+
+
+@pytest.mark.anyio
+async def test_run_agent_includes_breakdown_when_requested(engine):
+    with patch("litellm.acompletion", new=AsyncMock(return_value=_completion("Hi"))):
+        result = await engine.run_agent("writer", user_message="Hello", include_latency=True)
+        plain = await engine.run_agent("writer", user_message="Hello")
+
+    assert result.status == "success"
+    phases = result.latency["phases"]
+    assert {"config_resolution", "tool_selection", "agent_turn", "llm_total"} <= set(phases)
+    assert result.latency["total_ms"] >= phases["llm_total"]
+    assert plain.latency is None
+    assert get_latency_histograms()["agent_run"]["count"] == 2
+
+
+@pytest.mark.anyio
+async def test_streamed_llm_time_excludes_consumer_time():
+    chunks = [SimpleNamespace(choices=[], usage=None, model=None) for _ in range(3)]
+
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+
+    client = LiteLLMClient(config=LLMConfig(name="gpt", provider="openai", model="gpt-4"))
+    with patch("litellm.acompletion", new=AsyncMock(return_value=stream())), track_latency() as breakdown:
+        async for _ in client.stream_message(messages=[{"role": "user", "content": "Hi"}], tools=None):
+            await asyncio.sleep(0.05)  # e.g. a tool call run by the consumer
+
+    phases = breakdown.phase_totals()
+    assert phases["llm_ttft"] <= phases["llm_total"] < 50
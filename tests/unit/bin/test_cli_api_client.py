@@ -0,0 +1,112 @@
+"""
+Unit tests for the CLI's client mode against a running API server.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from aurite.utils.cli.api_client import ApiClient
+from aurite.utils.errors import ConfigurationError
+
+pytestmark = [pytest.mark.unit]
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / ".aurite").write_text('[aurite]\ntype = "project"\n')
+    return tmp_path
+
+
+def _context(context_root, status_code=200):
+    return Mock(status_code=status_code, json=Mock(return_value={"context_root": context_root}))
+
+
+def test_connect_requires_a_server_for_the_same_project(project, monkeypatch):
+    monkeypatch.delenv("AURITE_CLI_MODE", raising=False)
+    with patch("httpx.get", return_value=_context(str(project))) as get:
+        assert ApiClient.connect(project) is not None
+        assert get.call_args.args[0].endswith("/config/context")
+    with patch("httpx.get", return_value=_context("/somewhere/else")):
+        assert ApiClient.connect(project) is None
+    with patch("httpx.get", side_effect=httpx.ConnectError("refused")):
+        assert ApiClient.connect(project) is None
+
+    monkeypatch.setenv("AURITE_CLI_MODE", "local")
+    with patch("httpx.get", return_value=_context(str(project))) as get:
+        assert ApiClient.connect(project) is None
+        get.assert_not_called()
+
+
+def test_connect_uses_the_project_api_key_and_falls_back_when_rejected(project, monkeypatch):
+    monkeypatch.delenv("AURITE_CLI_MODE", raising=False)
+    monkeypatch.delenv("API_KEY", raising=False)
+    (project / ".env").write_text("API_KEY=from-dotenv\n")
+
+    with patch("httpx.get", return_value=_context(str(project))) as get:
+        client = ApiClient.connect(project)
+    assert get.call_args.kwargs["headers"] == {"X-API-Key": "from-dotenv"}
+    assert client._headers == {"X-API-Key": "from-dotenv"}
+
+    for status_code in (401, 403):
+        with patch("httpx.get", return_value=_context(None, status_code=status_code)):
+            assert ApiClient.connect(project) is None
+
+
+def _client(handler) -> ApiClient:
+    client = ApiClient("http://api", "key")
+    client._client = lambda: httpx.AsyncClient(
+        base_url="http://api", headers=client._headers, transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+@pytest.mark.anyio
+async def test_stream_agent_parses_server_sent_events():
+    events = [{"type": "llm_response", "data": {"content": "hi"}}, {"type": "llm_response_stop", "data": {}}]
+
+    def handler(request):
+        assert request.url.path == "/execution/agents/helper/stream"
+        assert request.headers["X-API-Key"] == "key"
+        assert json.loads(request.content)["user_message"] == "hello"
+        body = "".join(f"data: {json.dumps(event)}\n\n" for event in events)
+        return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+    received = [event async for event in _client(handler).stream_agent("helper", "hello")]
+
+    assert received == events
+
+
+@pytest.mark.anyio
+async def test_find_component_checks_runnable_types_in_order():
+    refreshes = 0
+    on_disk = {"/config/components/linear_workflow/pipeline"}
+    loaded = set(on_disk)
+
+    def handler(request):
+        nonlocal refreshes, loaded
+        if request.url.path == "/config/refresh":
+            refreshes += 1
+            loaded = set(on_disk)
+            return httpx.Response(200, json={})
+        if request.url.path in loaded:
+            return httpx.Response(200, json={"name": request.url.path.rsplit("/", 1)[-1]})
+        return httpx.Response(404, json={"detail": "not found"})
+
+    client = _client(handler)
+
+    component = await client.find_component("pipeline")
+    assert component["component_type"] == "linear_workflow"
+    # Found without refreshing the server's configuration
+    assert refreshes == 0
+    assert await client.find_component("missing") is None
+    assert refreshes == 1
+
+    # Added after the server loaded its configuration
+    on_disk.add("/config/components/agent/new_agent")
+    assert (await client.find_component("new_agent"))["component_type"] == "agent"
+    assert refreshes == 2
+    with pytest.raises(ConfigurationError):
+        await client.run_custom_workflow("missing", "go")
@@ -0,0 +1,115 @@
+"""
+Unit tests for the `aurite loadtest` load generator.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from aurite.utils.cli.load_test import LoadTarget, LoadTestConfig, run_load_test
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_targets_are_parsed_with_tool_arguments():
+    target = LoadTarget.parse('tool:weather_lookup={"location": "London"}')
+    assert (target.kind, target.name, target.args) == ("tool", "weather_lookup", {"location": "London"})
+    assert target.request("ignored") == ("/tools/weather_lookup/call", {"args": {"location": "London"}})
+    assert LoadTarget.parse("agent_stream:Weather Agent").request("hi") == (
+        "/execution/agents/Weather Agent/stream",
+        {"user_message": "hi"},
+    )
+    with pytest.raises(ValueError):
+        LoadTarget.parse("unknown:thing")
+
+
+@pytest.mark.anyio
+async def test_load_test_reports_throughput_latency_and_errors():
+    running = 0
+    peak = 0
+    registered = []
+
+    async def handler(request: httpx.Request):
+        nonlocal running, peak
+        if request.url.path == "/health":
+            return httpx.Response(200, json={"status": "ok"})
+        if request.url.path.startswith("/tools/register/"):
+            registered.append(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={})
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if request.url.path.endswith("/stream"):
+            events = [{"type": "llm_response", "data": {}}, {"type": "llm_response_stop", "data": {}}]
+            body = "".join(f"data: {json.dumps(event)}\n\n" for event in events)
+            return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+        if request.url.path.startswith("/tools/"):
+            return httpx.Response(404, json={"detail": "Tool not found"})
+        return httpx.Response(200, json={"status": "success"})
+
+    config = LoadTestConfig(
+        targets=[
+            LoadTarget.parse("agent:Weather Agent"),
+            LoadTarget.parse("agent_stream:Weather Agent"),
+            LoadTarget.parse("tool:missing"),
+        ],
+        base_url="http://api",
+        concurrency=3,
+        duration=0.3,
+        ramp_up=0.05,
+        register_servers=["weather_server"],
+    )
+    report = await run_load_test(config, transport=httpx.MockTransport(handler))
+
+    assert registered == ["weather_server"]
+    assert peak <= 3
+    overall = report["overall"]
+    assert overall["requests"] > 3
+    assert overall["throughput_per_second"] > 0
+    assert report["targets"]["agent:Weather Agent"]["errors"] == 0
+    assert report["targets"]["agent_stream:Weather Agent"]["first_event_ms"]["p50"] is not None
+    assert report["targets"]["tool:missing"]["error_rate"] == 1.0
+    assert overall["errors_by_reason"] == {"404": report["targets"]["tool:missing"]["requests"]}
+    assert report["event_loop_lag_ms"]["server_health"] is not None
+
+
+@pytest.mark.anyio
+async def test_failed_runs_and_malformed_events_count_as_errors():
+    async def handler(request: httpx.Request):
+        if request.url.path == "/health":
+            return httpx.Response(200, json={"status": "ok"})
+        if request.url.path.endswith("/stream"):
+            body = "data: []\n\ndata: null\n\n" + f"data: {json.dumps({'type': 'error', 'data': {}})}\n\n"
+            return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+        if "/agents/" in request.url.path:
+            return httpx.Response(200, json={"status": "max_iterations_reached"})
+        if "/linear/" in request.url.path:
+            return httpx.Response(200, json={"status": "completed"})
+        return httpx.Response(200, text="plain text")
+
+    config = LoadTestConfig(
+        targets=[
+            LoadTarget.parse("agent:Weather Agent"),
+            LoadTarget.parse("agent_stream:Weather Agent"),
+            LoadTarget.parse("linear:Forecast"),
+            LoadTarget.parse("tool:weather_lookup"),
+        ],
+        base_url="http://api",
+        concurrency=4,
+        duration=0.2,
+        ramp_up=0,
+    )
+    report = await run_load_test(config, transport=httpx.MockTransport(handler))
+
+    targets = report["targets"]
+    assert targets["agent:Weather Agent"]["error_rate"] == 1.0
+    assert targets["agent_stream:Weather Agent"]["error_rate"] == 1.0
+    assert targets["linear:Forecast"]["errors"] == 0
+    assert targets["tool:weather_lookup"]["errors"] == 0
+    assert report["overall"]["errors_by_reason"] == {
+        "status_max_iterations_reached": targets["agent:Weather Agent"]["requests"],
+        "error_event": targets["agent_stream:Weather Agent"]["requests"],
+    }
@@ -0,0 +1,175 @@
+import datetime
+import os
+import pickle
+import sqlite3
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+from aurite.lib.config import index_cache
+from aurite.lib.config.config_manager import ConfigManager
+from aurite.lib.config.index_cache import ConfigFileCache, iter_config_files
+from aurite.utils.cli.fast_loader import list_component_names
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch) -> Path:
+    (tmp_path / ".aurite").write_text('[aurite]\ntype = "project"\ninclude_configs = ["./config"]\n')
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "agents.yaml").write_text("- type: agent\n  name: writer\n  llm_config_id: gpt\n")
+    (config_dir / "llms.json").write_text('[{"type": "llm", "name": "gpt", "provider": "openai", "model": "gpt-4"}]')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("AURITE_INDEX_CACHE", raising=False)
+    return tmp_path
+
+
+def _touch(path: Path, text: str):
+    path.write_text(text)
+    # Make sure the signature changes even on filesystems with coarse timestamps
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_unchanged_files_are_not_reparsed(project, mocker):
+    parse = mocker.spy(index_cache, "parse_config_file")
+
+    first = ConfigManager(start_dir=project).get_all_configs()
+    assert parse.call_count == 2
+    assert (project / ".aurite_cache" / "index.db").is_file()
+
+    second = ConfigManager(start_dir=project).get_all_configs()
+    assert parse.call_count == 2
+    assert second == first
+
+
+def test_changed_and_deleted_files_are_picked_up(project):
+    ConfigManager(start_dir=project)
+    _touch(project / "config" / "agents.yaml", "- type: agent\n  name: editor\n  llm_config_id: gpt\n")
+    (project / "config" / "llms.json").unlink()
+
+    configs = ConfigManager(start_dir=project).get_all_configs()
+
+    assert list(configs["agent"]) == ["editor"]
+    assert "llm" not in configs
+    with sqlite3.connect(project / ".aurite_cache" / "index.db") as conn:
+        paths = [row[0] for row in conn.execute("SELECT path FROM config_files")]
+    assert paths == [str(project / "config" / "agents.yaml")]
+
+
+def test_fast_loader_shares_the_cache(project, mocker):
+    (project / "config" / "legacy.yaml").write_text("agent:\n  - name: legacy\n")
+    ConfigManager(start_dir=project)
+    parse = mocker.spy(index_cache, "parse_config_file")
+
+    assert list_component_names("agent") == ["legacy"]
+    parse.assert_not_called()
+
+
+def test_cache_can_be_disabled(project, monkeypatch):
+    monkeypatch.setenv("AURITE_INDEX_CACHE", "false")
+
+    ConfigManager(start_dir=project)
+
+    assert not (project / ".aurite_cache").exists()
+
+
+def test_iter_config_files_keeps_suffix_priority(tmp_path):
+    for name in ("b.yml", "a.yaml", "nested/c.json", "notes.txt"):
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text("{}")
+
+    assert [path.name for path in iter_config_files(tmp_path)] == ["c.json", "a.yaml", "b.yml"]
+
+
+def test_cache_survives_unreadable_entries(tmp_path):
+    config_file = tmp_path / "broken.yaml"
+    config_file.write_text("key: [unclosed")
+    cache = ConfigFileCache(tmp_path / "index.db")
+
+    with pytest.raises(yaml.YAMLError):
+        cache.load(config_file)
+    cache.close()
+
+
+def test_yaml_types_survive_the_cache(project):
+    (project / "config" / "dated.yaml").write_text(
+        "- type: agent\n  name: planner\n  llm_config_id: gpt\n  created: 2024-01-02\n  schedule:\n    2024-01-02: x\n"
+    )
+
+    first = ConfigManager(start_dir=project).get_config("agent", "planner")
+    second = ConfigManager(start_dir=project).get_config("agent", "planner")
+
+    assert first["created"] == second["created"] == datetime.date(2024, 1, 2)
+    assert first["schedule"] == second["schedule"] == {datetime.date(2024, 1, 2): "x"}
+
+
+def test_content_json_cannot_reproduce_is_not_cached(project, mocker):
+    (project / "config" / "keyed.yaml").write_text("- type: agent\n  name: planner\n  schedule:\n    1: x\n")
+    parse = mocker.spy(index_cache, "parse_config_file")
+
+    ConfigManager(start_dir=project)
+    planner = ConfigManager(start_dir=project).get_config("agent", "planner")
+
+    assert planner["schedule"] == {1: "x"}
+    assert sorted(call.args[0].name for call in parse.call_args_list) == [
+        "agents.yaml",
+        "keyed.yaml",
+        "keyed.yaml",
+        "llms.json",
+    ]
+
+
+def test_cache_entries_are_never_unpickled(tmp_path):
+    config_file = tmp_path / "agents.yaml"
+    config_file.write_text("- type: agent\n  name: writer\n")
+    stat = config_file.stat()
+    ConfigFileCache(tmp_path / "index.db").close()
+    payload = pickle.dumps(SimpleNamespace(name="crafted"))
+    with sqlite3.connect(tmp_path / "index.db") as conn:
+        conn.execute(
+            "INSERT INTO config_files VALUES (?, ?, ?, ?)",
+            (str(config_file.absolute()), stat.st_mtime_ns, stat.st_size, payload),
+        )
+
+    cache = ConfigFileCache(tmp_path / "index.db")
+    assert cache.load(config_file) == [{"type": "agent", "name": "writer"}]
+    cache.close()
+
+
+def test_uncacheable_content_is_returned_and_parsed_again(tmp_path, mocker):
+    config_file = tmp_path / "agents.yaml"
+    config_file.write_text("[]")
+    content = [{"type": "agent", "name": "writer", "hook": lambda: None}]
+    parse = mocker.patch.object(index_cache, "parse_config_file", return_value=content)
+
+    cache = ConfigFileCache(tmp_path / "index.db")
+    assert cache.load(config_file) is content
+    cache.close()
+    cache = ConfigFileCache(tmp_path / "index.db")
+    assert cache.load(config_file) is content
+    cache.close()
+
+    assert parse.call_count == 2
+
+
+def test_caches_from_older_versions_are_discarded(project):
+    db_path = project / ".aurite_cache" / "index.db"
+    db_path.parent.mkdir()
+    agents = project / "config" / "agents.yaml"
+    stat = agents.stat()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE config_files (path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, "
+            "content TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO config_files VALUES (?, ?, ?, ?)",
+            (str(agents), stat.st_mtime_ns, stat.st_size, '[{"type": "agent", "name": "stale"}]'),
+        )
+
+    configs = ConfigManager(start_dir=project).get_all_configs()
+
+    assert list(configs["agent"]) == ["writer"]
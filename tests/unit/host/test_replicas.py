@@ -0,0 +1,159 @@
+"""
+Unit tests for replicated MCP servers and least-outstanding-requests balancing.
+"""
+
+import asyncio
+from contextlib import AsyncExitStack
+
+import mcp.types as types
+import pytest
+
+from aurite.execution.mcp_host import MCPHost
+from aurite.execution.mcp_host.foundation import MessageRouter
+from aurite.lib.models.config.components import ClientConfig
+
+# Mark all tests in this file as 'unit' and 'host'
+pytestmark = [pytest.mark.unit, pytest.mark.host]
+
+
+class SlowSession:
+    """Stand-in for an MCP ClientSession whose tool calls block until released."""
+
+    def __init__(self, release: asyncio.Event):
+        self.release = release
+        self.alive = True
+        self.calls = 0
+
+    async def call_tool(self, name, args):
+        self.calls += 1
+        await self.release.wait()
+        return types.CallToolResult(content=[types.TextContent(type="text", text="ok")])
+
+    async def send_ping(self):
+        if not self.alive:
+            raise ConnectionResetError("process exited")
+        return types.EmptyResult()
+
+
+@pytest.fixture
+def release() -> asyncio.Event:
+    return asyncio.Event()
+
+
+@pytest.fixture
+def sessions():
+    return []
+
+
+@pytest.fixture
+def tool_names():
+    """Names of the tools the server lists on its next connect."""
+    return ["work"]
+
+
+@pytest.fixture
+def host(mocker, release, sessions, tool_names) -> MCPHost:
+    host = MCPHost()
+
+    async def fake_connect(config):
+        session = SlowSession(release)
+        sessions.append(session)
+        return session, AsyncExitStack(), [types.Tool(name=name, inputSchema={"type": "object"}) for name in tool_names]
+
+    mocker.patch.object(host, "_connect", side_effect=fake_connect)
+    return host
+
+
+def _config(replicas: int) -> ClientConfig:
+    return ClientConfig(
+        name="busy",
+        transport_type="stdio",
+        server_path="server.py",
+        capabilities=["tools"],
+        replicas=replicas,
+        health_check_interval=None,
+        reconnect_backoff=0,
+    )
+
+
+@pytest.mark.anyio
+async def test_replicas_share_one_tool_registry(host, sessions):
+    await host.register_client(_config(3))
+
+    assert len(sessions) == 3
+    assert list(host.tools) == ["busy-work"]
+    assert host._sessions["busy"] is sessions[0]
+    assert await host._message_router.get_clients_for_tool("busy-work") == ["busy#0", "busy#1", "busy#2"]
+
+
+@pytest.mark.anyio
+async def test_concurrent_calls_spread_across_replicas(host, release, sessions):
+    await host.register_client(_config(3))
+
+    calls = [asyncio.create_task(host.call_tool("busy-work", {})) for _ in range(6)]
+    while sum(session.calls for session in sessions) < 6:
+        await asyncio.sleep(0)
+    assert [session.calls for session in sessions] == [2, 2, 2]
+
+    release.set()
+    await asyncio.gather(*calls)
+    assert host._outstanding_requests == {"busy#0": 0, "busy#1": 0, "busy#2": 0}
+    assert await host._message_router.get_server_weight("busy#1") == 1.0
+
+
+@pytest.mark.anyio
+async def test_reconnect_replaces_only_dead_replicas(host, sessions):
+    await host.register_client(_config(3))
+    sessions[1].alive = False
+
+    assert await host._supervisor.request_reconnect("busy")
+
+    replicas = host._replica_sessions["busy"]
+    assert replicas[0] is sessions[0]
+    assert replicas[1] is sessions[3]
+    assert replicas[2] is sessions[2]
+
+
+@pytest.mark.anyio
+async def test_reconnecting_first_replica_keeps_weights_and_drops_removed_tools(host, release, sessions, tool_names):
+    await host.register_client(_config(3))
+    calls = [asyncio.create_task(host.call_tool("busy-work", {})) for _ in range(3)]
+    while sum(session.calls for session in sessions) < 3:
+        await asyncio.sleep(0)
+
+    sessions[0].alive = False
+    tool_names[:] = ["rest"]
+    assert await host._supervisor.request_reconnect("busy")
+
+    for replica_id in ("busy#0", "busy#1", "busy#2"):
+        assert await host._message_router.get_server_weight(replica_id) == 0.5
+    assert list(host.tools) == ["busy-rest"]
+    assert await host._message_router.get_clients_for_tool("busy-work") == []
+    assert await host._message_router.get_clients_for_tool("busy-rest") == ["busy#0", "busy#1", "busy#2"]
+
+    release.set()
+    await asyncio.gather(*calls)
+    assert host._outstanding_requests == {"busy#0": 0, "busy#1": 0, "busy#2": 0}
+
+
+@pytest.mark.anyio
+async def test_unregister_removes_replica_routes(host):
+    await host.register_client(_config(2))
+    await host.unregister_client("busy")
+
+    assert await host._message_router.get_clients_for_tool("busy-work") == []
+    assert host._outstanding_requests == {}
+    assert "busy" not in host._replica_sessions
+
+
+@pytest.mark.anyio
+async def test_router_selects_highest_weight_client():
+    router = MessageRouter()
+    for client_id in ("a", "b", "c"):
+        await router.register_server(client_id, {"tools"})
+        await router.register_tool("tool", client_id)
+
+    assert await router.select_client_for_tool("tool") == "a"
+    await router.update_server_weight("a", 0.5)
+    assert await router.select_client_for_tool("tool") == "b"
+    assert await router.select_client_for_tool("missing") is None
@@ -0,0 +1,166 @@
+"""
+Unit tests for MCP session health monitoring and reconnection.
+"""
+
+import asyncio
+from contextlib import AsyncExitStack
+
+import anyio
+import mcp.types as types
+import pytest
+from mcp.shared.exceptions import McpError
+
+from aurite.execution.mcp_host import MCPHost
+from aurite.execution.mcp_host.session_supervisor import backoff_delay, is_connection_error
+from aurite.lib.models.config.components import ClientConfig
+
+# Mark all tests in this file as 'unit' and 'host'
+pytestmark = [pytest.mark.unit, pytest.mark.host]
+
+
+class FakeSession:
+    """Minimal stand-in for an MCP ClientSession."""
+
+    def __init__(self, alive: bool = True):
+        self.alive = alive
+        self.calls = []
+
+    async def call_tool(self, name, args):
+        self.calls.append(name)
+        if not self.alive:
+            raise anyio.ClosedResourceError()
+        return types.CallToolResult(content=[types.TextContent(type="text", text=f"{name} ok")])
+
+    async def send_ping(self):
+        if not self.alive:
+            raise McpError(types.ErrorData(code=types.CONNECTION_CLOSED, message="Connection closed"))
+        return types.EmptyResult()
+
+
+def _tools():
+    return [
+        types.Tool(
+            name="lookup",
+            inputSchema={"type": "object"},
+            annotations=types.ToolAnnotations(readOnlyHint=True),
+        ),
+        types.Tool(name="save", inputSchema={"type": "object"}),
+    ]
+
+
+@pytest.fixture
+def config() -> ClientConfig:
+    return ClientConfig(
+        name="flaky",
+        transport_type="stdio",
+        server_path="server.py",
+        capabilities=["tools"],
+        health_check_interval=None,
+        max_reconnect_attempts=3,
+        reconnect_backoff=0,
+    )
+
+
+@pytest.fixture
+def sessions():
+    return []
+
+
+@pytest.fixture
+def host(mocker, sessions) -> MCPHost:
+    host = MCPHost()
+
+    async def fake_connect(config):
+        session = FakeSession()
+        sessions.append(session)
+        return session, AsyncExitStack(), _tools()
+
+    mocker.patch.object(host, "_connect", side_effect=fake_connect)
+    return host
+
+
+@pytest.mark.anyio
+async def test_idempotent_call_is_retried_after_reconnect(host, config, sessions):
+    await host.register_client(config)
+    sessions[0].alive = False
+
+    result = await host.call_tool("flaky-lookup", {})
+
+    assert result.content[0].text == "lookup ok"
+    assert len(sessions) == 2
+    assert host._tool_to_session["flaky-lookup"] is sessions[1]
+    assert host._sessions["flaky"] is sessions[1]
+    assert set(host.tools) == {"flaky-lookup", "flaky-save"}
+    health = host.get_server_health("flaky")
+    assert health.is_healthy
+    assert health.reconnect_count == 1
+
+
+@pytest.mark.anyio
+async def test_non_idempotent_call_raises_but_server_reconnects(host, config, sessions):
+    await host.register_client(config)
+    sessions[0].alive = False
+
+    with pytest.raises(anyio.ClosedResourceError):
+        await host.call_tool("flaky-save", {})
+
+    await host._supervisor.request_reconnect("flaky")
+    assert sessions[0].calls == ["save"]
+    assert host._tool_to_session["flaky-save"] is sessions[-1]
+    result = await host.call_tool("flaky-save", {})
+    assert result.content[0].text == "save ok"
+
+
+@pytest.mark.anyio
+async def test_concurrent_failures_share_one_reconnect(host, config, sessions):
+    await host.register_client(config)
+    sessions[0].alive = False
+
+    results = await asyncio.gather(*(host.call_tool("flaky-lookup", {}) for _ in range(5)))
+
+    assert all(result.content[0].text == "lookup ok" for result in results)
+    assert len(sessions) == 2
+
+
+@pytest.mark.anyio
+async def test_failed_ping_triggers_reconnect(host, config, sessions):
+    config.health_check_interval = 0.01
+    await host.register_client(config)
+    sessions[0].alive = False
+
+    for _ in range(100):
+        if len(sessions) > 1:
+            break
+        await asyncio.sleep(0.01)
+
+    assert len(sessions) == 2
+    await host.unregister_client("flaky")
+    assert host.get_server_health("flaky") is None
+
+
+@pytest.mark.anyio
+async def test_server_marked_unhealthy_when_reconnect_fails(host, config, sessions):
+    await host.register_client(config)
+    sessions[0].alive = False
+    host._connect.side_effect = ConnectionRefusedError("server down")
+
+    with pytest.raises(anyio.ClosedResourceError):
+        await host.call_tool("flaky-lookup", {})
+
+    health = host.get_server_health("flaky")
+    assert health.status == "unhealthy"
+    assert health.last_error == "server down"
+    assert host._connect.call_count == 1 + config.max_reconnect_attempts
+    # The tool registry is kept so a later reconnect can restore the server
+    assert set(host.tools) == {"flaky-lookup", "flaky-save"}
+
+
+def test_is_connection_error():
+    assert is_connection_error(anyio.BrokenResourceError())
+    assert is_connection_error(McpError(types.ErrorData(code=types.CONNECTION_CLOSED, message="Connection closed")))
+    assert not is_connection_error(McpError(types.ErrorData(code=types.INVALID_PARAMS, message="bad args")))
+    assert not is_connection_error(ValueError("bad input"))
+
+
+def test_backoff_delay_is_capped():
+    assert all(0 <= backoff_delay(attempt, 0.5, max_delay=4.0) <= 4.0 for attempt in range(1, 20))
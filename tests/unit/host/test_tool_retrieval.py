@@ -0,0 +1,126 @@
+"""
+Unit tests for semantic tool retrieval in the MCP Host.
+"""
+
+import mcp.types as types
+import pytest
+
+from aurite.execution.mcp_host import MCPHost
+from aurite.execution.mcp_host.tool_retrieval import ToolIndex, tokenize
+from aurite.lib.models.config.components import AgentConfig, ToolRetrievalConfig
+
+# Mark all tests in this file as 'unit' and 'host'
+pytestmark = [pytest.mark.unit, pytest.mark.host]
+
+TOOL_SPECS = {
+    "weather_server-weather_lookup": ("Get the current weather forecast for a city.", {"city": "City name"}),
+    "weather_server-current_time": ("Get the current time in a timezone.", {"timezone": "IANA timezone"}),
+    "planning_server-save_plan": ("Save a plan to disk.", {"plan_name": "Name", "plan_content": "Markdown"}),
+    "planning_server-list_plans": ("List all saved plans.", {}),
+    "math_server-add": ("Add two numbers together.", {"a": "First number", "b": "Second number"}),
+    "math_server-multiply": ("Multiply two numbers.", {"a": "First number", "b": "Second number"}),
+}
+
+
+def _make_tool(name: str) -> types.Tool:
+    description, properties = TOOL_SPECS[name]
+    tool = types.Tool(
+        name=name,
+        description=description,
+        inputSchema={
+            "type": "object",
+            "properties": {prop: {"type": "string", "description": desc} for prop, desc in properties.items()},
+        },
+    )
+    tool.title = name.split("-", 1)[1]
+    return tool
+
+
+@pytest.fixture
+def host() -> MCPHost:
+    host = MCPHost()
+    for name in TOOL_SPECS:
+        tool = _make_tool(name)
+        host._tools[name] = tool
+        host._tool_index.add_tool(tool)
+    return host
+
+
+def test_tokenize_splits_identifiers():
+    assert tokenize("weather_server-weatherLookup for the City") == ["weather", "server", "weather", "lookup", "city"]
+
+
+def test_tool_index_ranks_relevant_tools_first():
+    index = ToolIndex()
+    for name in TOOL_SPECS:
+        index.add_tool(_make_tool(name))
+
+    assert index.search("What's the weather forecast in Paris?", top_k=1) == ["weather_server-weather_lookup"]
+    assert index.search("multiply 6 by 7", top_k=1) == ["math_server-multiply"]
+    assert index.search("zzz unrelated gibberish") == []
+
+
+def test_tool_index_remove_tool():
+    index = ToolIndex()
+    for name in TOOL_SPECS:
+        index.add_tool(_make_tool(name))
+
+    index.remove_tool("math_server-multiply")
+
+    assert "math_server-multiply" not in index
+    assert "math_server-multiply" not in index.search("multiply numbers", top_k=10)
+
+
+def test_get_formatted_tools_without_retrieval_returns_all(host: MCPHost):
+    agent = AgentConfig(name="agent", mcp_servers=["weather_server", "planning_server", "math_server"])
+
+    tools = host.get_formatted_tools(agent_config=agent, query="weather in Paris")
+
+    assert len(tools) == len(TOOL_SPECS)
+
+
+def test_get_formatted_tools_selects_top_k_and_pinned(host: MCPHost):
+    agent = AgentConfig(
+        name="agent",
+        mcp_servers=["weather_server", "planning_server", "math_server"],
+        tool_retrieval=ToolRetrievalConfig(top_k=1, pinned_tools=["list_plans"]),
+    )
+
+    tools = host.get_formatted_tools(agent_config=agent, query="weather forecast for Paris")
+
+    assert [tool["name"] for tool in tools] == ["weather_server-weather_lookup", "planning_server-list_plans"]
+
+
+def test_get_formatted_tools_keeps_tools_used_in_conversation(host: MCPHost):
+    agent = AgentConfig(
+        name="agent",
+        mcp_servers=["weather_server", "planning_server", "math_server"],
+        tool_retrieval=ToolRetrievalConfig(top_k=1),
+    )
+
+    tools = host.get_formatted_tools(
+        agent_config=agent, query="weather forecast for Paris", pinned_tools=["math_server-add"]
+    )
+
+    assert {tool["name"] for tool in tools} == {"weather_server-weather_lookup", "math_server-add"}
+
+
+def test_get_formatted_tools_respects_allowed_servers(host: MCPHost):
+    agent = AgentConfig(name="agent", mcp_servers=["math_server"], auto=True)
+
+    tools = host.get_formatted_tools(agent_config=agent, query="weather forecast for Paris")
+
+    assert all(tool["name"].startswith("math_server-") for tool in tools)
+
+
+def test_get_formatted_tools_falls_back_to_all_tools(host: MCPHost):
+    agent = AgentConfig(
+        name="agent",
+        mcp_servers=["weather_server", "planning_server", "math_server"],
+        tool_retrieval=ToolRetrievalConfig(top_k=2),
+    )
+
+    assert len(host.get_formatted_tools(agent_config=agent, query="zzz")) == len(TOOL_SPECS)
+
+    agent.tool_retrieval.fallback_to_all = False
+    assert host.get_formatted_tools(agent_config=agent, query="zzz") == []
@@ -0,0 +1,95 @@
+"""
+Tests for the offline mock LLM provider.
+"""
+
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from aurite.execution.aurite_engine import AuriteEngine
+from aurite.execution.mcp_host.mcp_host import MCPHost
+from aurite.lib.components.llm.litellm_client import LiteLLMClient
+from aurite.lib.components.llm.usage import track_usage
+from aurite.lib.models.config.components import LLMConfig
+
+SCRIPT = {
+    "responses": [
+        {"tool_calls": [{"name": "weather_lookup", "arguments": {"location": "London"}}]},
+        "It is sunny in London.",
+    ]
+}
+
+CONFIGS = {
+    ("agent", "forecaster"): {"name": "forecaster", "type": "agent", "llm_config_id": "scripted"},
+    ("llm", "scripted"): {"name": "scripted", "type": "llm", "provider": "mock", "model": "scripted", "mock": SCRIPT},
+}
+
+
+@pytest.fixture
+def engine() -> AuriteEngine:
+    config_manager = Mock()
+    config_manager.get_config = Mock(side_effect=lambda component_type, name: CONFIGS.get((component_type, name)))
+    host = Mock(spec=MCPHost)
+    host.get_formatted_tools = Mock(return_value=[{"name": "weather_lookup", "inputSchema": {"type": "object"}}])
+    host.call_tool = AsyncMock(return_value="Sunny, 22C")
+    return AuriteEngine(config_manager=config_manager, host_instance=host)
+
+
+def _client(model: str, **mock) -> LiteLLMClient:
+    return LiteLLMClient(config=LLMConfig(name="mock", provider="mock", model=model, mock=mock))
+
+
+@pytest.mark.anyio
+async def test_scripted_agent_calls_tools_without_litellm(engine):
+    with patch("litellm.acompletion", new=AsyncMock(side_effect=AssertionError("no provider calls"))):
+        result = await engine.run_agent("forecaster", user_message="Weather in London?")
+        events = [event async for event in engine.stream_agent_run("forecaster", user_message="Weather in London?")]
+
+    assert result.status == "success"
+    assert result.primary_text == "It is sunny in London."
+    assert [event["type"] for event in events if event["type"] in ("tool_call", "llm_response_stop")] == [
+        "tool_call",
+        "llm_response_stop",
+    ]
+    # Once for the run and once for the stream
+    calls = engine._host.call_tool.await_args_list
+    assert [(call.kwargs["name"], call.kwargs["args"]) for call in calls] == [
+        ("weather_lookup", {"location": "London"})
+    ] * 2
+
+
+@pytest.mark.anyio
+async def test_seeded_replies_and_usage_are_reproducible():
+    messages = [{"role": "user", "content": "Summarize the plan"}]
+
+    with track_usage() as usage:
+        first = await _client("lorem", seed=7).create_message(messages, tools=None)
+    second = await _client("lorem", seed=7).create_message(messages, tools=None)
+    other_seed = await _client("lorem", seed=8).create_message(messages, tools=None)
+    echo = await _client("echo").create_message(messages, tools=None)
+
+    assert first.content == second.content != other_seed.content
+    assert len(first.content.split()) == 32
+    assert echo.content == "Summarize the plan"
+    assert usage.calls == 1 and usage.prompt_tokens > 0 and usage.completion_tokens > 0
+
+
+@pytest.mark.anyio
+async def test_streamed_replies_follow_the_latency_profile():
+    client = _client("lorem", response_tokens=8, first_token_ms=50, tokens_per_second=1000, chunk_tokens=2)
+
+    start = time.perf_counter()
+    first_chunk_at = None
+    content = ""
+    async for chunk in client.stream_message([{"role": "user", "content": "Hi"}], tools=None):
+        if first_chunk_at is None:
+            first_chunk_at = time.perf_counter() - start
+        if chunk.choices and chunk.choices[0].delta.content:
+            content += chunk.choices[0].delta.content
+
+    assert first_chunk_at >= 0.05
+    assert len(content.split()) == 8
+    # Streaming and latency do not change the reply
+    reply = await _client("lorem", response_tokens=8).create_message([{"role": "user", "content": "Hi"}], tools=None)
+    assert content == reply.content
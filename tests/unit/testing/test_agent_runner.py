@@ -0,0 +1,67 @@
+"""
+Unit tests for loading run functions once per process.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from aurite.testing.runners.agent_runner import clear_agent_runners, get_agent_runner, reload_agent_runner
+
+RUN_FILE = """
+import builtins
+
+builtins.aurite_test_imports = getattr(builtins, "aurite_test_imports", 0) + 1
+
+
+async def run(input, suffix=""):
+    return "{reply}: " + input + suffix
+"""
+
+
+@pytest.fixture
+def run_file(tmp_path):
+    path = tmp_path / "runner.py"
+    path.write_text(RUN_FILE.format(reply="v1"))
+    yield path
+    clear_agent_runners()
+    import builtins
+
+    if hasattr(builtins, "aurite_test_imports"):
+        del builtins.aurite_test_imports
+
+
+def _imports():
+    import builtins
+
+    return builtins.aurite_test_imports
+
+
+@pytest.mark.anyio
+async def test_run_file_is_imported_once_for_concurrent_cases(run_file):
+    async def case(i):
+        return await get_agent_runner(str(run_file)).execute(f"case {i}", suffix="!")
+
+    outputs = await asyncio.gather(*(case(i) for i in range(50)))
+
+    assert outputs[7] == "v1: case 7!"
+    assert _imports() == 1
+
+
+@pytest.mark.anyio
+async def test_run_file_is_reloaded_when_modified_or_on_request(run_file):
+    runner = get_agent_runner(run_file)
+    run_file.write_text(RUN_FILE.format(reply="v2"))
+    stat = run_file.stat()
+    os.utime(run_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert await get_agent_runner(run_file).execute("hi") == "v2: hi"
+    # The previous runner keeps the function it loaded
+    assert await runner.execute("hi") == "v1: hi"
+    assert _imports() == 2
+
+    reload_agent_runner(run_file)
+    assert _imports() == 3
+    assert get_agent_runner(run_file) is get_agent_runner(run_file)
+    assert _imports() == 3
@@ -0,0 +1,103 @@
+"""
+Unit tests for batched review LLM (LLM-as-judge) expectation analysis.
+"""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from openai.types.chat import ChatCompletionMessage
+
+from aurite.lib.models.api.requests import EvaluationCase, EvaluationRequest
+from aurite.testing.qa.component_qa_tester import ComponentQATester
+from aurite.testing.qa.qa_utils import BATCH_ANALYSIS_SCHEMA, analyze_expectations_batch
+
+
+class FakeJudge:
+    """Review LLM that breaks the expectations of every output containing 'wrong'."""
+
+    def __init__(self, drop_ids=(), garbage=False):
+        self.drop_ids = set(drop_ids)
+        self.garbage = garbage
+        self.batch_sizes = []
+        self.create_message = AsyncMock(side_effect=self._respond)
+
+    async def _respond(self, messages, tools, system_prompt_override=None, schema=None):
+        if schema is None:
+            # Single case request, see analyze_expectations
+            self.batch_sizes.append(1)
+            broken = ["correct"] if "Output: wrong" in messages[0]["content"] else []
+            return ChatCompletionMessage(role="assistant", content=json.dumps(self._result(broken)))
+
+        cases = json.loads(messages[0]["content"])
+        self.batch_sizes.append(len(cases))
+        if self.garbage:
+            return ChatCompletionMessage(role="assistant", content="I could not decide.")
+        results = [
+            {"id": case["id"], **self._result(case["expectations"] if "wrong" in case["output"] else [])}
+            for case in reversed(cases)
+            if case["id"] not in self.drop_ids
+        ]
+        return ChatCompletionMessage(role="assistant", content=json.dumps({"results": results}))
+
+    @staticmethod
+    def _result(broken):
+        return {"analysis": "reviewed", "expectations_broken": broken}
+
+
+def _case(output: str) -> EvaluationCase:
+    return EvaluationCase(input=f"question for {output}", output=output, expectations=["correct"])
+
+
+@pytest.mark.anyio
+async def test_batch_results_map_back_to_their_cases():
+    judge = FakeJudge()
+    items = [(_case(output), output) for output in ["right", "wrong", "right"]]
+
+    results = await analyze_expectations_batch(items, judge)
+
+    assert [result.expectations_broken for result in results] == [[], ["correct"], []]
+    assert judge.batch_sizes == [3]
+    assert judge.create_message.call_args.kwargs["schema"] == BATCH_ANALYSIS_SCHEMA
+
+
+@pytest.mark.anyio
+async def test_missing_and_unparseable_results_fall_back_to_single_calls():
+    items = [(_case(output), output) for output in ["right", "wrong", "right"]]
+
+    partial = FakeJudge(drop_ids={"1"})
+    results = await analyze_expectations_batch(items, partial)
+    assert [result.expectations_broken for result in results] == [[], ["correct"], []]
+    assert partial.batch_sizes == [3, 1]
+
+    garbage = FakeJudge(garbage=True)
+    results = await analyze_expectations_batch(items, garbage)
+    assert [result.expectations_broken for result in results] == [[], ["correct"], []]
+    assert garbage.batch_sizes == [3, 1, 1, 1]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("batch_options", "expected_batches"),
+    [
+        ({}, [1, 1, 1, 1, 1]),
+        ({"judge_batch_size": 3}, [3, 2]),
+        ({"judge_batch_size": 10, "judge_batch_max_tokens": 60}, [2, 2, 1]),
+    ],
+)
+async def test_tester_batches_review_requests(batch_options, expected_batches):
+    judge = FakeJudge()
+    request = EvaluationRequest(
+        component_type="agent",
+        test_cases=[_case(output) for output in ["right", "wrong", "right", "right", "wrong"]],
+        use_cache=False,
+        **batch_options,
+    )
+
+    with patch.object(ComponentQATester, "_get_llm_client", AsyncMock(return_value=judge)):
+        result = await ComponentQATester().test_component(request)
+
+    assert sorted(judge.batch_sizes, reverse=True) == expected_batches
+    assert result.passed_cases == 3
+    grades = [result.case_results[str(case.id)].grade for case in request.test_cases]
+    assert grades == ["PASS", "FAIL", "PASS", "PASS", "FAIL"]
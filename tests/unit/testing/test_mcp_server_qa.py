@@ -0,0 +1,100 @@
+"""
+Unit tests for MCP server evaluations, which run their test cases through an in-memory agent.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from aurite.lib.config.config_manager import ConfigManager
+from aurite.lib.models.api.requests import EvaluationCase, EvaluationRequest
+from aurite.testing.qa.component_qa_tester import ComponentQATester
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / ".aurite").write_text('[aurite]\ntype = "project"\ninclude_configs = ["./config"]\n')
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "servers.json").write_text(
+        '[{"type": "mcp_server", "name": "weather", "transport_type": "stdio", "server_path": "weather.py"}]'
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AURITE_INDEX_CACHE", "false")
+    return tmp_path
+
+
+def _snapshot(project):
+    return {path: path.read_text() for path in project.rglob("*") if path.is_file()}
+
+
+def test_ephemeral_component_lives_only_in_memory(project):
+    config_manager = ConfigManager(start_dir=project)
+    before = _snapshot(project)
+
+    with config_manager.ephemeral_component("agent", {"name": "helper", "mcp_servers": ["weather"]}) as name:
+        assert config_manager.get_config("agent", name)["_source_file"] == "in-memory"
+        with pytest.raises(ValueError):
+            with config_manager.ephemeral_component("agent", {"name": "helper"}):
+                pass
+
+    assert config_manager.get_config("agent", "helper") is None
+    assert not config_manager.unregister_component_in_memory("mcp_server", "weather")
+    assert _snapshot(project) == before
+
+
+@pytest.mark.anyio
+async def test_cases_share_one_in_memory_agent(project):
+    config_manager = ConfigManager(start_dir=project)
+    before = _snapshot(project)
+    agents = []
+
+    async def run_agent(agent_name: str, user_message: str):
+        agents.append(config_manager.get_config("agent", agent_name))
+        return SimpleNamespace(exception=None, conversation_history=[{"role": "assistant", "content": "Sunny"}])
+
+    executor = Mock(_config_manager=config_manager, _session_manager=None)
+    executor.run_agent = AsyncMock(side_effect=run_agent)
+    request = EvaluationRequest(
+        component_type="mcp_server",
+        component_config={"name": "weather"},
+        test_cases=[EvaluationCase(input=f"Weather in city {i}", expectations=[]) for i in range(4)],
+        use_cache=False,
+    )
+
+    with patch.object(ComponentQATester, "_get_llm_client", AsyncMock()):
+        result = await ComponentQATester().test_component(request, executor)
+
+    assert result.passed_cases == 4
+    assert len({agent["name"] for agent in agents}) == 1
+    assert agents[0]["mcp_servers"] == ["weather"]
+    assert config_manager.list_configs("agent") == []
+    assert _snapshot(project) == before
+
+
+@pytest.mark.anyio
+async def test_refresh_during_evaluation_keeps_the_in_memory_agent(project):
+    config_manager = ConfigManager(start_dir=project)
+    agents = []
+
+    async def run_agent(agent_name: str, user_message: str):
+        # E.g. AURITE_CONFIG_FORCE_REFRESH or a /config/refresh request while cases run
+        config_manager.refresh()
+        agents.append(config_manager.get_config("agent", agent_name))
+        return SimpleNamespace(exception=None, conversation_history=[{"role": "assistant", "content": "Sunny"}])
+
+    executor = Mock(_config_manager=config_manager, _session_manager=None)
+    executor.run_agent = AsyncMock(side_effect=run_agent)
+    request = EvaluationRequest(
+        component_type="mcp_server",
+        component_config={"name": "weather"},
+        test_cases=[EvaluationCase(input=f"Weather in city {i}", expectations=[]) for i in range(2)],
+        use_cache=False,
+    )
+
+    with patch.object(ComponentQATester, "_get_llm_client", AsyncMock()):
+        result = await ComponentQATester().test_component(request, executor)
+
+    assert result.passed_cases == 2
+    assert all(agent is not None for agent in agents)
+    assert config_manager.list_configs("agent") == []
@@ -0,0 +1,88 @@
+"""
+Unit tests for evaluating several components in one request.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from aurite.lib.config.config_manager import ConfigManager
+from aurite.lib.models.api.requests import EvaluationCase, EvaluationRequest
+from aurite.testing.qa.qa_engine import QAEngine
+from aurite.testing.qa.shared_evaluation import SharedEvaluation
+
+COMPONENTS = """
+[
+    {"type": "llm", "name": "gpt", "provider": "openai", "model": "gpt-4o"},
+    {"type": "agent", "name": "concise", "llm_config_id": "gpt", "system_prompt": "Be brief."},
+    {"type": "agent", "name": "concise_copy", "llm_config_id": "gpt", "system_prompt": "Be brief."},
+    {"type": "agent", "name": "verbose", "llm_config_id": "gpt", "system_prompt": "Explain in detail."}
+]
+"""
+
+
+@pytest.fixture
+def config_manager(tmp_path, monkeypatch):
+    (tmp_path / ".aurite").write_text('[aurite]\ntype = "project"\ninclude_configs = ["./config"]\n')
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "components.json").write_text(COMPONENTS)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AURITE_INDEX_CACHE", "false")
+    return ConfigManager(start_dir=tmp_path)
+
+
+@pytest.mark.anyio
+async def test_components_share_judge_budget_and_identical_runs(config_manager):
+    running = 0
+    peak = 0
+
+    async def run_agent(agent_name: str, user_message: str):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return SimpleNamespace(exception=None, conversation_history=[{"role": "assistant", "content": agent_name}])
+
+    executor = Mock(_config_manager=config_manager, _session_manager=None)
+    executor.run_agent = AsyncMock(side_effect=run_agent)
+    request = EvaluationRequest(
+        component_type="agent",
+        component_refs=["concise", "concise_copy", "verbose", "verbose"],
+        test_cases=[EvaluationCase(input=f"Question {i}", expectations=[]) for i in range(4)],
+        use_cache=False,
+        max_concurrency=2,
+    )
+
+    get_llm_client = AsyncMock(return_value=Mock())
+    with patch("aurite.testing.qa.qa_engine.get_llm_client", get_llm_client):
+        results = await QAEngine(config_manager).evaluate_component(request, executor)
+
+    assert sorted(results) == ["concise", "concise_copy", "verbose"]
+    assert all(result.passed_cases == 4 for result in results.values())
+    # concise and concise_copy are configured the same way, so they share their runs
+    assert executor.run_agent.await_count == 8
+    assert peak <= 2
+    get_llm_client.assert_awaited_once()
+
+
+@pytest.mark.anyio
+async def test_failed_shared_runs_are_retried():
+    shared = SharedEvaluation(max_concurrency=2)
+    attempts = 0
+
+    async def flaky():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise ConnectionResetError()
+        return "ok"
+
+    with pytest.raises(ConnectionResetError):
+        await shared.execute("fingerprint", "input", flaky)
+    assert await shared.execute("fingerprint", "input", flaky) == "ok"
+    assert await shared.execute("fingerprint", "input", flaky) == "ok"
+    assert attempts == 2
+    assert shared.deduplicated == 1
@@ -0,0 +1,82 @@
+"""
+Unit tests for benchmark mode of QA evaluations.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from aurite.lib.models.api.requests import EvaluationCase, EvaluationRequest
+from aurite.testing.qa.component_qa_tester import ComponentQATester
+from aurite.testing.qa.qa_benchmark import compare_benchmarks, summarize_samples
+
+
+def _sample(latency_ms, started_at, prompt_tokens=100, tool_calls=0):
+    return {
+        "latency_ms": latency_ms,
+        "started_at": started_at,
+        "ttft_ms": latency_ms / 2,
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": 20,
+        "llm_calls": 1,
+        "tool_calls": tool_calls,
+        "phases": {"llm_total": latency_ms / 2},
+    }
+
+
+def test_samples_are_summarized_into_percentiles_and_throughput():
+    samples = [_sample(float(latency), started_at=float(i)) for i, latency in enumerate(range(10, 1010, 10))]
+    summary = summarize_samples(samples)
+
+    assert summary["iterations"] == 100
+    assert summary["latency_ms"]["p50"] == 500
+    assert summary["latency_ms"]["p95"] == 950
+    assert summary["latency_ms"]["p99"] == 990
+    assert summary["ttft_ms"]["p50"] == 250
+    assert summary["tokens"]["prompt_total"] == 10000
+    assert summary["phases_mean_ms"]["llm_total"] == 252.5
+    # 100 runs between the start of the first (0s) and the end of the last (99s + 1s)
+    assert summary["throughput_per_second"] == 1.0
+
+
+def test_comparison_reports_change_from_baseline():
+    baseline = {"result_id": "a", "result": {"benchmark": summarize_samples([_sample(100.0, 0.0)])}}
+    candidate = {"result_id": "b", "result": {"benchmark": summarize_samples([_sample(80.0, 0.0, tool_calls=2)])}}
+
+    report = compare_benchmarks([baseline, candidate])
+
+    assert report["baseline"] == "a"
+    assert "change_from_baseline_pct" not in report["runs"][0]
+    change = report["runs"][1]["change_from_baseline_pct"]
+    assert change["latency_p50_ms"] == -20.0
+    # No tool calls in the baseline, so there is no relative change to report
+    assert "tool_calls_mean" not in change
+
+
+@pytest.mark.anyio
+async def test_benchmark_runs_each_case_after_warmup():
+    async def run_agent(agent_name: str, user_message: str):
+        return SimpleNamespace(exception=None, conversation_history=[{"role": "assistant", "content": "Done"}])
+
+    executor = Mock(_config_manager=None, _session_manager=None)
+    executor.run_agent = AsyncMock(side_effect=run_agent)
+    request = EvaluationRequest(
+        component_type="agent",
+        component_config={"name": "assistant"},
+        test_cases=[EvaluationCase(input=f"Task {i}", expectations=[]) for i in range(2)],
+        benchmark=True,
+        benchmark_iterations=3,
+        benchmark_warmup=1,
+    )
+
+    with patch.object(ComponentQATester, "_get_llm_client", AsyncMock()):
+        result = await ComponentQATester().test_component(request, executor)
+
+    assert executor.run_agent.await_count == 8
+    for case_result in result.case_results.values():
+        assert case_result.benchmark["iterations"] == 3
+        assert len(case_result.benchmark["samples"]) == 3
+    assert result.benchmark["iterations"] == 6
+    assert result.benchmark["warmup"] == 1
+    assert result.benchmark["latency_ms"]["p50"] is not None
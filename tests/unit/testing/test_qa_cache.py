@@ -0,0 +1,107 @@
+"""
+Unit tests for content-addressed QA result caching.
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from aurite.lib.config.config_manager import ConfigManager
+from aurite.lib.models.api.requests import EvaluationCase, EvaluationRequest
+from aurite.lib.storage.sessions.cache_manager import CacheManager
+from aurite.lib.storage.sessions.qa_result_cache import QAResultCache
+from aurite.lib.storage.sessions.session_manager import SessionManager
+from aurite.testing.qa.component_qa_tester import ComponentQATester
+from aurite.testing.qa.qa_fingerprint import fingerprint_component
+
+COMPONENTS = """
+[
+    {"type": "llm", "name": "gpt", "provider": "openai", "model": "gpt-4o", "temperature": 0.2},
+    {"type": "mcp_server", "name": "weather", "transport_type": "stdio", "server_path": "weather.py", "capabilities": ["tools"]},
+    {"type": "agent", "name": "forecaster", "llm_config_id": "gpt", "mcp_servers": ["weather"]},
+    {"type": "linear_workflow", "name": "daily_report", "steps": ["forecaster"]}
+]
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / ".aurite").write_text('[aurite]\ntype = "project"\ninclude_configs = ["./config"]\n')
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "components.json").write_text(COMPONENTS)
+    (tmp_path / "weather.py").write_text("def forecast(city): return 'sunny'\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AURITE_INDEX_CACHE", "false")
+    return tmp_path
+
+
+def _fingerprint(project, component_type="linear_workflow", name="daily_report"):
+    return fingerprint_component(component_type, {"name": name}, ConfigManager(start_dir=project))
+
+
+def test_fingerprint_covers_the_resolved_component_graph(project):
+    components = project / "config" / "components.json"
+    original = _fingerprint(project)
+    assert _fingerprint(project) == original
+
+    # A nested dependency of the workflow: the agent's LLM
+    components.write_text(COMPONENTS.replace('"temperature": 0.2', '"temperature": 0.9'))
+    changed_llm = _fingerprint(project)
+    assert changed_llm != original
+
+    # The code of an MCP server the agent calls
+    (project / "weather.py").write_text("def forecast(city): return 'rainy'\n")
+    assert _fingerprint(project) != changed_llm
+
+    # Where a config lives does not matter
+    components.unlink()
+    (project / "config" / "moved.json").write_text(COMPONENTS)
+    (project / "weather.py").write_text("def forecast(city): return 'sunny'\n")
+    assert _fingerprint(project) == original
+
+
+def test_expired_results_are_evicted_in_bulk(tmp_path):
+    cache = QAResultCache(tmp_path / "qa_results.db")
+    cache.put("fresh", {"result": 1}, ttl=60)
+    cache.put("stale_1", {"result": 2}, ttl=0.01)
+    cache.put("stale_2", {"result": 3}, ttl=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("fresh") == {"result": 1}
+    assert cache.get("stale_1") is None
+    assert cache.evict_expired() == 2
+    cache.close()
+
+
+@pytest.mark.anyio
+async def test_unchanged_suite_is_served_from_the_cache(project):
+    config_manager = ConfigManager(start_dir=project)
+    session_manager = SessionManager(
+        cache_manager=CacheManager(cache_dir=project / ".aurite_cache"), storage_manager=None
+    )
+
+    async def run_agent(agent_name: str, user_message: str):
+        return SimpleNamespace(exception=None, conversation_history=[{"role": "assistant", "content": "Sunny"}])
+
+    executor = Mock(_config_manager=config_manager, _session_manager=session_manager)
+    executor.run_agent = AsyncMock(side_effect=run_agent)
+
+    async def evaluate():
+        request = EvaluationRequest(
+            component_type="agent",
+            component_config={"name": "forecaster"},
+            test_cases=[EvaluationCase(input=f"Weather in city {i}", expectations=[]) for i in range(3)],
+        )
+        with patch.object(ComponentQATester, "_get_llm_client", AsyncMock()):
+            return await ComponentQATester().test_component(request, executor)
+
+    await evaluate()
+    await evaluate()
+    assert executor.run_agent.await_count == 3
+
+    (project / "weather.py").write_text("def forecast(city): return 'rainy'\n")
+    result = await evaluate()
+    assert executor.run_agent.await_count == 6
+    assert result.passed_cases == 3
@@ -0,0 +1,113 @@
+"""
+Unit tests for the bounded-concurrency QA case scheduler.
+"""
+
+import asyncio
+
+import pytest
+
+from aurite.lib.models.api.requests import EvaluationCase, EvaluationRequest
+from aurite.testing.qa.component_qa_tester import ComponentQATester
+from aurite.testing.qa.qa_scheduler import QACaseScheduler, is_transient_error
+from aurite.utils.errors import AgentExecutionError
+
+
+class RateLimitError(Exception):
+    """Stands in for the LiteLLM/OpenAI exception, which is matched by name."""
+
+
+def test_is_transient_error_follows_the_cause_chain():
+    wrapped = AgentExecutionError("agent failed")
+    wrapped.__cause__ = RateLimitError("slow down")
+
+    assert is_transient_error(wrapped)
+    assert is_transient_error(ConnectionResetError())
+    assert not is_transient_error(ValueError("bad input"))
+
+
+@pytest.mark.anyio
+async def test_concurrency_is_bounded():
+    running = 0
+    peak = 0
+
+    async def evaluate(case: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return case * 2
+
+    results = await QACaseScheduler(max_concurrency=3).run(list(range(10)), evaluate)
+
+    assert results == [case * 2 for case in range(10)]
+    assert peak == 3
+
+
+@pytest.mark.anyio
+async def test_only_transient_failures_are_retried():
+    attempts = {"flaky": 0, "broken": 0}
+    events = []
+
+    async def evaluate(case: str) -> str:
+        attempts[case] += 1
+        if case == "flaky" and attempts[case] == 1:
+            raise RateLimitError("slow down")
+        if case == "broken":
+            raise ValueError("bad input")
+        return "ok"
+
+    scheduler = QACaseScheduler(max_retries=2, retry_backoff=0.001, on_progress=events.append)
+    results = await scheduler.run(["flaky", "broken"], evaluate)
+
+    assert results[0] == "ok"
+    assert isinstance(results[1], ValueError)
+    assert attempts == {"flaky": 2, "broken": 1}
+    assert [event["type"] for event in events].count("case_retry") == 1
+    assert events[-1]["data"]["progress"] == {"total": 2, "completed": 2, "passed": 1, "failed": 1, "retries": 1}
+
+
+@pytest.mark.anyio
+async def test_timed_out_cases_fail_after_their_retries():
+    attempts = 0
+
+    async def evaluate(case: str) -> str:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(1)
+        return "late"
+
+    results = await QACaseScheduler(timeout=0.01, max_retries=1, retry_backoff=0.001).run(["slow"], evaluate)
+
+    assert isinstance(results[0], asyncio.TimeoutError)
+    assert "timed out after 0.01 seconds" in str(results[0])
+    assert attempts == 2
+
+
+@pytest.mark.anyio
+async def test_tester_retries_cases_and_reports_progress():
+    calls = []
+
+    async def run_agent(user_input: str) -> str:
+        calls.append(user_input)
+        if calls.count(user_input) == 1 and user_input == "second":
+            raise RateLimitError("slow down")
+        return f"answer to {user_input}"
+
+    request = EvaluationRequest(
+        component_type="agent",
+        test_cases=[EvaluationCase(input=text, expectations=[]) for text in ["first", "second", "third"]],
+        run_agent=run_agent,
+        use_cache=False,
+        max_concurrency=2,
+    )
+    tester = ComponentQATester()
+    tester.config.retry_backoff = 0.001
+    events = []
+
+    result = await tester.test_component(request, on_progress=events.append)
+
+    assert result.status == "success"
+    assert sorted(calls) == ["first", "second", "second", "third"]
+    assert sorted(event["type"] for event in events) == ["case_complete"] * 3 + ["case_retry"]
+    assert events[-1]["data"]["progress"]["passed"] == 3
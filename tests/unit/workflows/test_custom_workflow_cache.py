@@ -0,0 +1,92 @@
+"""
+Unit tests for the CustomWorkflowCache.
+"""
+
+import os
+import textwrap
+
+import pytest
+
+from aurite.lib.components.workflows import CustomWorkflowCache
+from aurite.lib.components.workflows import custom_workflow as custom_workflow_module
+from aurite.lib.models.config.components import CustomWorkflowConfig
+
+pytestmark = [pytest.mark.unit, pytest.mark.orchestration]
+
+WORKFLOW_SOURCE = """
+class GreetingWorkflow:
+    def __init__(self):
+        self.runs = 0
+
+    async def run(self, initial_input, executor, session_id=None):
+        self.runs += 1
+        return "{greeting}, " + initial_input
+
+    def get_input_type(self):
+        return str
+"""
+
+
+def _write_workflow(path, greeting: str, mtime_ns: int):
+    path.write_text(textwrap.dedent(WORKFLOW_SOURCE.format(greeting=greeting)))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def workflow_file(tmp_path):
+    path = tmp_path / "greeting_workflow.py"
+    _write_workflow(path, "Hello", 1_000_000_000_000_000_000)
+    return path
+
+
+def _config(path, reuse_instance: bool = False) -> CustomWorkflowConfig:
+    return CustomWorkflowConfig(
+        name="greeting", module_path=path, class_name="GreetingWorkflow", reuse_instance=reuse_instance
+    )
+
+
+@pytest.mark.anyio
+async def test_module_is_imported_once(workflow_file, mocker):
+    load_spy = mocker.spy(custom_workflow_module, "load_workflow_class")
+    cache = CustomWorkflowCache()
+
+    first = cache.get_executor(_config(workflow_file))
+    second = cache.get_executor(_config(workflow_file))
+
+    assert load_spy.call_count == 1
+    assert type(first.workflow_instance) is type(second.workflow_instance)
+    assert first.workflow_instance is not second.workflow_instance
+    assert await second.execute("world", executor=None) == "Hello, world"
+    assert await second.get_input_type() is str
+
+
+@pytest.mark.anyio
+async def test_changed_module_is_reloaded(workflow_file):
+    cache = CustomWorkflowCache()
+    assert await cache.get_executor(_config(workflow_file)).execute("world", executor=None) == "Hello, world"
+
+    _write_workflow(workflow_file, "Goodbye", 2_000_000_000_000_000_000)
+
+    assert await cache.get_executor(_config(workflow_file)).execute("world", executor=None) == "Goodbye, world"
+    assert len(cache) == 1
+
+
+@pytest.mark.anyio
+async def test_reuse_instance_keeps_one_instance(workflow_file):
+    cache = CustomWorkflowCache()
+
+    for _ in range(3):
+        executor = cache.get_executor(_config(workflow_file, reuse_instance=True))
+        await executor.execute("world", executor=None)
+
+    assert executor.workflow_instance.runs == 3
+
+
+def test_missing_module_raises_and_is_evicted(workflow_file):
+    cache = CustomWorkflowCache()
+    cache.get_executor(_config(workflow_file))
+    workflow_file.unlink()
+
+    with pytest.raises(FileNotFoundError):
+        cache.get_executor(_config(workflow_file))
+    assert len(cache) == 0
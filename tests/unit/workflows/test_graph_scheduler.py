@@ -0,0 +1,147 @@
+"""
+Unit tests for GraphWorkflowExecutor scheduling: concurrency limits, priorities and budgets.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from openai.types.chat import ChatCompletionMessage
+
+from aurite.lib.components.llm.litellm_client import LiteLLMClient
+from aurite.lib.components.llm.usage import record_usage
+from aurite.lib.components.workflows.graph_workflow import GraphWorkflowExecutor
+from aurite.lib.models.api.responses import AgentRunResult
+from aurite.lib.models.config.components import GraphWorkflowConfig, LLMConfig
+
+pytestmark = [pytest.mark.unit, pytest.mark.orchestration]
+
+
+class FakeEngine:
+    """Runs 'agents' that record their start order and peak concurrency."""
+
+    def __init__(self, tokens_per_run: int = 0, fail: str = None):
+        self._config_manager = Mock()
+        self._config_manager.get_config.return_value = {"name": "agent"}
+        self.tokens_per_run = tokens_per_run
+        self.fail = fail
+        self.started = []
+        self.running = 0
+        self.peak = 0
+
+    async def run_agent(self, agent_name, user_message, **kwargs):
+        self.started.append(agent_name)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            if agent_name == self.fail:
+                raise RuntimeError("boom")
+            if self.tokens_per_run:
+                usage = SimpleNamespace(prompt_tokens=0, completion_tokens=0, total_tokens=self.tokens_per_run)
+                record_usage(SimpleNamespace(usage=usage))
+            return AgentRunResult(
+                status="success",
+                final_response=ChatCompletionMessage(role="assistant", content=f"{agent_name} done"),
+                conversation_history=[],
+            )
+        finally:
+            self.running -= 1
+
+
+def _config(nodes, edges=(), **kwargs) -> GraphWorkflowConfig:
+    return GraphWorkflowConfig(
+        name="graph",
+        nodes=[{"node_id": node, "name": node, "type": "agent", **extra} for node, extra in nodes],
+        edges=[{"from": a, "to": b} for a, b in edges],
+        **kwargs,
+    )
+
+
+@pytest.mark.anyio
+async def test_max_parallel_limits_fan_out():
+    engine = FakeEngine()
+    nodes = [("root", {})] + [(f"leaf{i}", {}) for i in range(10)]
+    config = _config(nodes, [("root", f"leaf{i}") for i in range(10)], max_parallel=3)
+
+    result = await GraphWorkflowExecutor(config, engine).execute("go")
+
+    assert result.status == "completed"
+    assert len(result.final_output) == 10
+    assert engine.peak == 3
+
+
+@pytest.mark.anyio
+async def test_max_parallel_per_type():
+    engine = FakeEngine()
+    config = _config([(f"n{i}", {}) for i in range(6)], max_parallel_per_type={"agent": 2})
+
+    result = await GraphWorkflowExecutor(config, engine).execute("go")
+
+    assert result.status == "completed"
+    assert engine.peak == 2
+
+
+@pytest.mark.anyio
+async def test_critical_path_and_priority_order():
+    engine = FakeEngine()
+    nodes = [("short", {}), ("long1", {}), ("long2", {}), ("long3", {}), ("urgent", {"priority": 1})]
+    config = _config(nodes, [("long1", "long2"), ("long2", "long3")], max_parallel=1)
+
+    result = await GraphWorkflowExecutor(config, engine).execute("go")
+
+    assert result.status == "completed"
+    assert engine.started[:2] == ["urgent", "long1"]
+
+
+@pytest.mark.anyio
+async def test_token_budget_stops_graph_early():
+    engine = FakeEngine(tokens_per_run=100)
+    config = _config([("a", {}), ("b", {}), ("c", {})], [("a", "b"), ("b", "c")], max_total_tokens=150)
+
+    result = await GraphWorkflowExecutor(config, engine).execute("go")
+
+    assert result.status == "failed"
+    assert "Token budget exceeded" in result.error
+    assert engine.started == ["a", "b"]
+    assert result.usage["total_tokens"] == 200
+
+
+@pytest.mark.anyio
+async def test_streamed_llm_calls_count_toward_token_budget():
+    class StreamingEngine(FakeEngine):
+        async def run_agent(self, agent_name, user_message, **kwargs):
+            self.started.append(agent_name)
+            client = LiteLLMClient(config=LLMConfig(name="mock", provider="mock", model="lorem"))
+            content = ""
+            async for chunk in client.stream_message([{"role": "user", "content": user_message}], tools=None):
+                if chunk.choices and chunk.choices[0].delta.content:
+                    content += chunk.choices[0].delta.content
+            return AgentRunResult(
+                status="success",
+                final_response=ChatCompletionMessage(role="assistant", content=content),
+                conversation_history=[],
+            )
+
+    engine = StreamingEngine()
+    config = _config([("a", {}), ("b", {})], [("a", "b")], max_total_tokens=10)
+
+    result = await GraphWorkflowExecutor(config, engine).execute("go")
+
+    assert result.status == "failed"
+    assert "Token budget exceeded" in result.error
+    assert engine.started == ["a"]
+    assert result.usage["calls"] == 1 and result.usage["total_tokens"] > 10
+
+
+@pytest.mark.anyio
+async def test_failed_node_cancels_running_nodes():
+    engine = FakeEngine(fail="bad")
+    config = _config([("bad", {}), ("slow", {})])
+
+    result = await GraphWorkflowExecutor(config, engine).execute("go")
+
+    assert result.status == "failed"
+    assert result.error.startswith("Node 'bad' failed")
+    assert engine.running == 0
@@ -0,0 +1,118 @@
+"""
+Unit tests for parallel step groups in linear workflows.
+"""
+
+import asyncio
+
+import pytest
+from openai.types.chat import ChatCompletionMessage
+from pydantic import ValidationError
+
+from aurite.lib.components.workflows import LinearWorkflowExecutor
+from aurite.lib.models.api.responses import AgentRunResult
+from aurite.lib.models.config.components import WorkflowConfig
+
+pytestmark = [pytest.mark.unit, pytest.mark.orchestration]
+
+
+class FakeConfigManager:
+    def get_config(self, component_type, component_id):
+        if component_type == "agent" and component_id in ("a", "b", "c", "summarize"):
+            return {"name": component_id}
+        return None
+
+
+class FakeEngine:
+    def __init__(self, fail: str | None = None):
+        self._config_manager = FakeConfigManager()
+        self.fail = fail
+        self.inputs = {}
+        self.running = 0
+        self.max_running = 0
+        self.cancelled = []
+
+    async def run_agent(self, agent_name, user_message, **kwargs):
+        self.inputs[agent_name] = user_message
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.05 if agent_name == "c" else 0.01)
+        except asyncio.CancelledError:
+            self.cancelled.append(agent_name)
+            raise
+        finally:
+            self.running -= 1
+        if agent_name == self.fail:
+            return AgentRunResult(status="error", error_message="boom", conversation_history=[])
+        return AgentRunResult(
+            status="success",
+            final_response=ChatCompletionMessage(role="assistant", content=f"{agent_name}({user_message})"),
+            conversation_history=[],
+        )
+
+    async def get_custom_workflow_input_type(self, workflow_name):
+        return dict
+
+    async def run_custom_workflow(self, workflow_name, initial_input, session_id=None):
+        return " + ".join(f"{name}={value}" for name, value in sorted(initial_input.items()))
+
+
+def _config(**group) -> WorkflowConfig:
+    return WorkflowConfig(
+        name="fan_out",
+        steps=[{"parallel": ["a", "b", "c"], **group}, "summarize"],
+    )
+
+
+@pytest.mark.anyio
+async def test_group_members_share_input_and_merge_as_json():
+    engine = FakeEngine()
+
+    result = await LinearWorkflowExecutor(_config(), engine).execute("go")
+
+    assert result.status == "completed"
+    assert [engine.inputs[name] for name in ("a", "b", "c")] == ["go", "go", "go"]
+    assert engine.max_running == 3
+    assert result.step_results[0].step_type == "parallel"
+    assert set(result.step_results[0].result) == {"a", "b", "c"}
+    assert engine.inputs["summarize"] == '{"a": "a(go)", "b": "b(go)", "c": "c(go)"}'
+
+
+@pytest.mark.anyio
+async def test_concat_and_custom_merges():
+    engine = FakeEngine()
+    concat = await LinearWorkflowExecutor(_config(merge="concat", separator=" | "), engine).execute("go")
+    assert engine.inputs["summarize"] == "a(go) | b(go) | c(go)"
+    assert concat.status == "completed"
+
+    custom = await LinearWorkflowExecutor(_config(merge="custom", reducer="join"), engine).execute("go")
+    assert engine.inputs["summarize"] == "a=a(go) + b=b(go) + c=c(go)"
+    assert custom.status == "completed"
+
+
+@pytest.mark.anyio
+async def test_max_concurrency_bounds_running_members():
+    engine = FakeEngine()
+
+    await LinearWorkflowExecutor(_config(max_concurrency=2), engine).execute("go")
+
+    assert engine.max_running == 2
+
+
+@pytest.mark.anyio
+async def test_failed_member_cancels_the_group():
+    engine = FakeEngine(fail="a")
+
+    result = await LinearWorkflowExecutor(_config(), engine).execute("go")
+
+    assert result.status == "failed"
+    assert "Agent 'a' failed" in result.error
+    assert engine.cancelled == ["c"]
+    assert "summarize" not in engine.inputs
+
+
+def test_group_validation():
+    with pytest.raises(ValidationError, match="reducer"):
+        _config(merge="custom")
+    with pytest.raises(ValidationError, match="unique"):
+        WorkflowConfig(name="dup", steps=[{"parallel": ["a", {"name": "a", "type": "agent"}]}])
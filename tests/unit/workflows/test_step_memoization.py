@@ -0,0 +1,149 @@
+"""
+Unit tests for memoized workflow steps and the step result cache backends.
+"""
+
+import time
+
+import pytest
+from openai.types.chat import ChatCompletionMessage
+from sqlalchemy import create_engine
+
+from aurite.lib.components.workflows import LinearWorkflowExecutor
+from aurite.lib.components.workflows.graph_workflow import GraphWorkflowExecutor
+from aurite.lib.models.api.responses import AgentRunResult
+from aurite.lib.models.config.components import GraphWorkflowConfig, WorkflowConfig
+from aurite.lib.storage.db.db_manager import StorageManager
+from aurite.lib.storage.step_result_cache import (
+    DatabaseStepResultCache,
+    InMemoryStepResultCache,
+    SQLiteStepResultCache,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.orchestration]
+
+
+class FakeConfigManager:
+    def __init__(self):
+        self.configs = {("agent", name): {"name": name, "llm_config_id": "gpt"} for name in ("a", "b")}
+        self.configs[("llm", "gpt")] = {"name": "gpt", "model": "gpt-4o"}
+
+    def get_config(self, component_type, component_id):
+        return self.configs.get((component_type, component_id))
+
+
+class FakeEngine:
+    def __init__(self, cache):
+        self._config_manager = FakeConfigManager()
+        self._step_result_cache = cache
+        self.runs = []
+
+    async def run_agent(self, agent_name, user_message, **kwargs):
+        self.runs.append(agent_name)
+        return AgentRunResult(
+            status="success",
+            final_response=ChatCompletionMessage(role="assistant", content=f"{user_message} > {agent_name}"),
+            conversation_history=[],
+        )
+
+
+def _linear_config() -> WorkflowConfig:
+    return WorkflowConfig(
+        name="pipeline",
+        steps=[{"name": "a", "type": "agent", "memoize": True}, {"name": "b", "type": "agent"}],
+    )
+
+
+@pytest.mark.anyio
+async def test_linear_memoized_step_is_reused():
+    engine = FakeEngine(InMemoryStepResultCache())
+    executor = LinearWorkflowExecutor(_linear_config(), engine)
+
+    first = await executor.execute("go")
+    second = await executor.execute("go")
+
+    assert engine.runs == ["a", "b", "b"]
+    assert [step.cache_hit for step in first.step_results] == [False, None]
+    assert [step.cache_hit for step in second.step_results] == [True, None]
+    assert second.final_output == "go > a > b"
+
+
+@pytest.mark.anyio
+async def test_changed_input_or_config_misses():
+    engine = FakeEngine(InMemoryStepResultCache())
+    executor = LinearWorkflowExecutor(_linear_config(), engine)
+
+    await executor.execute("go")
+    await executor.execute("stop")
+    engine._config_manager.configs[("llm", "gpt")]["model"] = "gpt-4.1"
+    await executor.execute("go")
+
+    assert engine.runs.count("a") == 3
+
+
+@pytest.mark.anyio
+async def test_graph_memoized_node_is_reused():
+    engine = FakeEngine(InMemoryStepResultCache())
+    config = GraphWorkflowConfig(
+        name="graph",
+        nodes=[
+            {"node_id": "load", "name": "a", "type": "agent", "memoize": True},
+            {"node_id": "answer", "name": "b", "type": "agent"},
+        ],
+        edges=[{"from": "load", "to": "answer"}],
+    )
+    executor = GraphWorkflowExecutor(config, engine)
+
+    first = await executor.execute("go")
+    second = await executor.execute("go")
+
+    assert engine.runs == ["a", "b", "b"]
+    assert first.node_results["load"].cache_hit is False
+    assert second.node_results["load"].cache_hit is True
+    assert second.node_results["answer"].cache_hit is None
+    assert second.final_output == first.final_output
+
+
+@pytest.fixture(params=["memory", "sqlite", "db"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryStepResultCache()
+    if request.param == "sqlite":
+        return SQLiteStepResultCache(tmp_path / "step_results.db")
+    storage = StorageManager(engine=create_engine(f"sqlite:///{tmp_path / 'aurite.db'}"))
+    storage.init_db()
+    return DatabaseStepResultCache(storage)
+
+
+def test_cache_backends_expire_entries(cache):
+    cache.set("forever", {"output_text": "x"})
+    cache.set("short", {"output_text": "y"}, ttl=0.2)
+
+    assert cache.get("short") == {"output_text": "y"}
+    assert cache.get("missing") is None
+
+    time.sleep(0.25)
+    assert cache.get("short") is None
+    assert cache.get("forever") == {"output_text": "x"}
+
+    cache.clear()
+    assert cache.get("forever") is None
+
+
+def test_cache_backends_return_copies(cache):
+    cache.set("step", {"output": {"items": [1]}})
+
+    cache.get("step")["output"]["items"].append(2)
+
+    assert cache.get("step") == {"output": {"items": [1]}}
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = InMemoryStepResultCache(max_entries=2)
+    cache.set("a", {"output_text": "a"})
+    cache.set("b", {"output_text": "b"})
+    cache.get("a")
+    cache.set("c", {"output_text": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"output_text": "a"}
+    assert cache.get("c") == {"output_text": "c"}
@@ -0,0 +1,177 @@
+"""
+Unit tests for workflow checkpoints and resuming linear and graph workflows.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from openai.types.chat import ChatCompletionMessage
+from sqlalchemy import create_engine
+
+from aurite.execution.aurite_engine import AuriteEngine
+from aurite.lib.components.workflows import LinearWorkflowExecutor, WorkflowCheckpoint
+from aurite.lib.components.workflows.graph_workflow import GraphWorkflowExecutor
+from aurite.lib.models.api.responses import AgentRunResult
+from aurite.lib.models.config.components import GraphWorkflowConfig, WorkflowConfig
+from aurite.lib.storage.db.db_manager import StorageManager
+from aurite.lib.storage.sessions.cache_manager import CacheManager
+from aurite.lib.storage.sessions.session_manager import SessionManager
+
+pytestmark = [pytest.mark.unit, pytest.mark.orchestration]
+
+
+class FakeEngine:
+    """Runs 'agents' that append their name to the input, optionally failing once."""
+
+    def __init__(self, fail: str = None):
+        self._config_manager = Mock()
+        self._config_manager.get_config.return_value = {"name": "agent"}
+        self.fail = fail
+        self.runs = []
+
+    async def run_agent(self, agent_name, user_message, **kwargs):
+        self.runs.append(agent_name)
+        if agent_name == self.fail:
+            return AgentRunResult(status="error", error_message="boom", conversation_history=[])
+        return AgentRunResult(
+            status="success",
+            final_response=ChatCompletionMessage(role="assistant", content=f"{user_message} > {agent_name}"),
+            conversation_history=[],
+        )
+
+
+@pytest.fixture
+def session_manager(tmp_path) -> SessionManager:
+    return SessionManager(cache_manager=CacheManager(cache_dir=tmp_path / "cache"), storage_manager=None)
+
+
+def _linear_config() -> WorkflowConfig:
+    return WorkflowConfig(name="pipeline", steps=[{"name": name, "type": "agent"} for name in ("a", "b", "c")])
+
+
+def _checkpoint(session_manager, workflow_type: str, resume: bool = False) -> WorkflowCheckpoint:
+    name = "pipeline" if workflow_type == "linear_workflow" else "graph"
+    return WorkflowCheckpoint(session_manager, "workflow-1", name, workflow_type, resume=resume)
+
+
+@pytest.mark.anyio
+async def test_linear_resume_skips_completed_steps(session_manager):
+    engine = FakeEngine(fail="b")
+    result = await LinearWorkflowExecutor(_linear_config(), engine).execute(
+        "go", checkpoint=_checkpoint(session_manager, "linear_workflow")
+    )
+    assert result.status == "failed"
+
+    engine = FakeEngine()
+    result = await LinearWorkflowExecutor(_linear_config(), engine).execute(
+        "go", checkpoint=_checkpoint(session_manager, "linear_workflow", resume=True)
+    )
+
+    assert result.status == "completed"
+    assert engine.runs == ["b", "c"]
+    assert result.final_output == "go > a > b > c"
+    assert [step.step_name for step in result.step_results] == ["a", "b", "c"]
+
+
+@pytest.mark.anyio
+async def test_linear_resume_reruns_steps_with_changed_input(session_manager):
+    await LinearWorkflowExecutor(_linear_config(), FakeEngine()).execute(
+        "go", checkpoint=_checkpoint(session_manager, "linear_workflow")
+    )
+
+    engine = FakeEngine()
+    result = await LinearWorkflowExecutor(_linear_config(), engine).execute(
+        "stop", checkpoint=_checkpoint(session_manager, "linear_workflow", resume=True)
+    )
+
+    assert engine.runs == ["a", "b", "c"]
+    assert result.final_output == "stop > a > b > c"
+
+
+@pytest.mark.anyio
+async def test_without_resume_previous_checkpoint_is_ignored(session_manager):
+    await LinearWorkflowExecutor(_linear_config(), FakeEngine()).execute(
+        "go", checkpoint=_checkpoint(session_manager, "linear_workflow")
+    )
+
+    engine = FakeEngine()
+    await LinearWorkflowExecutor(_linear_config(), engine).execute(
+        "go", checkpoint=_checkpoint(session_manager, "linear_workflow")
+    )
+
+    assert engine.runs == ["a", "b", "c"]
+
+
+@pytest.mark.anyio
+async def test_graph_resume_skips_completed_nodes(session_manager):
+    config = GraphWorkflowConfig(
+        name="graph",
+        nodes=[{"node_id": node, "name": node, "type": "agent"} for node in ("a", "b", "c")],
+        edges=[{"from": "a", "to": "c"}, {"from": "b", "to": "c"}],
+    )
+    result = await GraphWorkflowExecutor(config, FakeEngine(fail="c")).execute(
+        "go", checkpoint=_checkpoint(session_manager, "graph_workflow")
+    )
+    assert result.status == "failed"
+
+    engine = FakeEngine()
+    result = await GraphWorkflowExecutor(config, engine).execute(
+        "go", checkpoint=_checkpoint(session_manager, "graph_workflow", resume=True)
+    )
+
+    assert result.status == "completed"
+    assert engine.runs == ["c"]
+    assert set(result.node_results) == {"a", "b", "c"}
+
+    # A fully completed graph is restored without running anything
+    engine = FakeEngine()
+    result = await GraphWorkflowExecutor(config, engine).execute(
+        "go", checkpoint=_checkpoint(session_manager, "graph_workflow", resume=True)
+    )
+    assert result.status == "completed"
+    assert engine.runs == []
+
+
+def test_checkpoint_is_persisted_to_database(tmp_path):
+    storage = StorageManager(engine=create_engine(f"sqlite:///{tmp_path / 'aurite.db'}"))
+    storage.init_db()
+    writer = SessionManager(cache_manager=CacheManager(cache_dir=tmp_path / "cache-a"), storage_manager=storage)
+    WorkflowCheckpoint(writer, "workflow-1", "pipeline", "linear_workflow").record("0-a", "go", {"x": 1}, "out")
+
+    # A fresh cache falls back to the database
+    reader = SessionManager(cache_manager=CacheManager(cache_dir=tmp_path / "cache-b"), storage_manager=storage)
+    checkpoint = WorkflowCheckpoint(reader, "workflow-1", "pipeline", "linear_workflow", resume=True)
+    assert checkpoint.lookup("0-a", "go")["output_text"] == "out"
+    assert checkpoint.lookup("0-a", "changed") is None
+
+    assert reader.delete_workflow_checkpoints("workflow-1")
+    assert reader.get_workflow_checkpoint("workflow-1", "pipeline") is None
+
+
+def test_only_resumable_runs_are_checkpointed(tmp_path):
+    engine = AuriteEngine(
+        config_manager=Mock(), host_instance=Mock(), cache_manager=CacheManager(cache_dir=tmp_path / "cache")
+    )
+
+    assert engine._workflow_checkpoint("workflow-1", "pipeline", "linear_workflow", False, False) is None
+    assert engine._workflow_checkpoint("workflow-1", "pipeline", "linear_workflow", False, True) is not None
+    assert engine._workflow_checkpoint("workflow-1", "pipeline", "linear_workflow", True, False) is not None
+    with pytest.raises(ValueError):
+        engine._workflow_checkpoint(None, "pipeline", "linear_workflow", False, True)
+
+
+def test_checkpoint_files_are_hashed_and_deleted_by_session(tmp_path):
+    cache = CacheManager(cache_dir=tmp_path / "cache")
+    cache.save_workflow_checkpoint("s/1", "s/1__pipeline", {"session_id": "s/1", "steps": {"a": 1}})
+    cache.save_workflow_checkpoint("s1", "s1__pipeline", {"session_id": "s1", "steps": {"a": 2}})
+
+    # Fresh caches read from disk; IDs that only differ in stripped characters stay apart
+    reader = CacheManager(cache_dir=tmp_path / "cache")
+    assert reader.get_workflow_checkpoint("s/1", "s/1__pipeline")["steps"] == {"a": 1}
+    assert reader.get_workflow_checkpoint("s1", "s1__pipeline")["steps"] == {"a": 2}
+    assert len(list((tmp_path / "cache" / "checkpoints").iterdir())) == 2
+
+    assert reader.delete_workflow_checkpoints("s/1")
+    reader = CacheManager(cache_dir=tmp_path / "cache")
+    assert reader.get_workflow_checkpoint("s/1", "s/1__pipeline") is None
+    assert reader.get_workflow_checkpoint("s1", "s1__pipeline") is not None
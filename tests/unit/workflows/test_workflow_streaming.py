@@ -0,0 +1,202 @@
+"""
+Unit tests for streaming linear and graph workflow execution events.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from openai.types.chat import ChatCompletionMessage
+
+from aurite.execution.aurite_engine import AuriteEngine
+from aurite.execution.mcp_host.mcp_host import MCPHost
+from aurite.lib.components.agent.agent import Agent
+from aurite.lib.components.llm.usage import track_usage
+from aurite.lib.components.workflows import events as workflow_events
+from aurite.lib.models.api.responses import AgentRunResult
+from aurite.lib.models.config.components import AgentConfig, LLMConfig
+
+pytestmark = [pytest.mark.unit, pytest.mark.orchestration]
+
+CONFIGS = {
+    ("linear_workflow", "pipeline"): {
+        "name": "pipeline",
+        "type": "linear_workflow",
+        "steps": [{"name": "a", "type": "agent"}, {"name": "b", "type": "agent"}],
+    },
+    ("graph_workflow", "fan"): {
+        "name": "fan",
+        "type": "graph_workflow",
+        "nodes": [{"node_id": node, "name": node, "type": "agent"} for node in ("a", "b")],
+        "edges": [],
+    },
+    ("agent", "a"): {"name": "a"},
+    ("agent", "b"): {"name": "b"},
+}
+
+
+@pytest.fixture
+def engine() -> AuriteEngine:
+    config_manager = Mock()
+    config_manager.get_config.side_effect = lambda component_type, component_id: CONFIGS.get(
+        (component_type, component_id)
+    )
+    engine = AuriteEngine(config_manager=config_manager, host_instance=Mock())
+
+    async def fake_run_agent(agent_name, user_message, **kwargs):
+        # Stands in for an agent run through its streaming path
+        for token in (agent_name, "!"):
+            workflow_events.forward({"type": "llm_response", "data": {"content": token}})
+            await asyncio.sleep(0)
+        return AgentRunResult(
+            status="success",
+            final_response=ChatCompletionMessage(role="assistant", content=f"{agent_name}!"),
+            conversation_history=[],
+        )
+
+    engine.run_agent = fake_run_agent
+    return engine
+
+
+@pytest.mark.anyio
+async def test_linear_workflow_streams_step_and_token_events(engine):
+    events = [event async for event in engine.stream_linear_workflow("pipeline", "go")]
+
+    assert [(event["type"], event["node_id"]) for event in events[:4]] == [
+        ("workflow_step_start", "0-a"),
+        ("llm_response", "0-a"),
+        ("llm_response", "0-a"),
+        ("workflow_step_end", "0-a"),
+    ]
+    assert events[4]["node_id"] == "1-b"
+    assert events[-1]["type"] == "workflow_complete"
+    assert events[-1]["data"]["final_output"] == "b!"
+
+
+@pytest.mark.anyio
+async def test_graph_workflow_multiplexes_parallel_nodes(engine):
+    events = [event async for event in engine.stream_graph_workflow("fan", "go")]
+
+    tokens = {"a": "", "b": ""}
+    for event in events:
+        if event["type"] == "llm_response":
+            tokens[event["node_id"]] += event["data"]["content"]
+    assert tokens == {"a": "a!", "b": "b!"}
+    # Both nodes started before either finished
+    types = [event["type"] for event in events]
+    assert types.index("workflow_step_end") > max(i for i, t in enumerate(types) if t == "workflow_step_start")
+    assert events[-1]["data"]["final_output"] == {"a": "a!", "b": "b!"}
+
+
+@pytest.mark.anyio
+async def test_events_arrive_before_the_workflow_finishes(engine):
+    release = asyncio.Event()
+    original = engine.run_agent
+
+    async def blocking_run_agent(agent_name, user_message, **kwargs):
+        await release.wait()
+        return await original(agent_name, user_message, **kwargs)
+
+    engine.run_agent = blocking_run_agent
+    stream = engine.stream_linear_workflow("pipeline", "go")
+
+    first = await asyncio.wait_for(stream.__anext__(), timeout=1)
+    assert first["type"] == "workflow_step_start"
+
+    release.set()
+    remaining = [event async for event in stream]
+    assert remaining[-1]["type"] == "workflow_complete"
+
+
+@pytest.mark.anyio
+async def test_missing_workflow_ends_stream_with_error(engine):
+    events = [event async for event in engine.stream_linear_workflow("missing", "go")]
+
+    assert len(events) == 1
+    assert events[0]["type"] == "error"
+    assert "not found" in events[0]["data"]["message"]
+
+
+@pytest.mark.anyio
+async def test_agent_streaming_run_returns_result():
+    agent = Agent(
+        agent_config=AgentConfig(name="a"),
+        base_llm_config=LLMConfig(name="llm", provider="openai", model="gpt-4"),
+        host_instance=Mock(),
+        initial_messages=[{"role": "user", "content": "hi"}],
+    )
+
+    async def fake_stream():
+        yield {"type": "llm_response", "data": {"content": "hello"}}
+        agent.conversation_history.append({"role": "assistant", "content": "hello"})
+        yield {"type": "llm_response_stop", "data": {"status": "success", "reason": "message_complete"}}
+
+    agent.stream_conversation = fake_stream
+    received = []
+
+    result = await agent.run_conversation_streaming(received.append)
+
+    assert [event["type"] for event in received] == ["llm_response", "llm_response_stop"]
+    assert result.status == "success"
+    assert result.final_response.content == "hello"
+
+
+def _scripted_engine(agent: dict, responses: list) -> AuriteEngine:
+    """An engine whose single-step workflow runs `agent` on a scripted mock LLM."""
+    configs = {
+        ("linear_workflow", "single"): {
+            "name": "single",
+            "type": "linear_workflow",
+            "steps": [{"name": agent["name"], "type": "agent"}],
+        },
+        ("agent", agent["name"]): {"type": "agent", "llm_config_id": "scripted", **agent},
+        ("llm", "scripted"): {
+            "name": "scripted",
+            "type": "llm",
+            "provider": "mock",
+            "model": "scripted",
+            "mock": {"responses": responses},
+        },
+    }
+    config_manager = Mock()
+    config_manager.get_config.side_effect = lambda component_type, name: configs.get((component_type, name))
+    host = Mock(spec=MCPHost)
+    host.get_formatted_tools = Mock(return_value=[{"name": "lookup", "inputSchema": {"type": "object"}}])
+    host.call_tool = AsyncMock(side_effect=lambda name, args, **kwargs: f"{args['city']}: sunny")
+    return AuriteEngine(config_manager=config_manager, host_instance=host)
+
+
+@pytest.mark.anyio
+async def test_streamed_workflow_agent_runs_parallel_tool_calls():
+    tool_calls = [{"name": "lookup", "arguments": {"city": city}} for city in ("London", "Paris")]
+    engine = _scripted_engine({"name": "forecaster"}, [{"tool_calls": tool_calls}, "Both sunny."])
+
+    with track_usage() as usage:
+        events = [event async for event in engine.stream_linear_workflow("single", "Weather?")]
+
+    assert [event["data"]["input"] for event in events if event["type"] == "tool_call"] == [
+        {"city": "London"},
+        {"city": "Paris"},
+    ]
+    assert [event["data"]["output"] for event in events if event["type"] == "tool_output"] == [
+        "London: sunny",
+        "Paris: sunny",
+    ]
+    assert engine._host.call_tool.await_count == 2
+    assert events[-1]["type"] == "workflow_complete"
+    assert events[-1]["data"]["final_output"] == "Both sunny."
+    assert usage.calls == 2
+
+
+@pytest.mark.anyio
+async def test_streamed_workflow_agent_validates_response_schema():
+    agent = {
+        "name": "reporter",
+        "config_validation_schema": {"type": "object", "required": ["ok"]},
+    }
+    engine = _scripted_engine(agent, ["not json", '{"ok": true}'])
+
+    events = [event async for event in engine.stream_linear_workflow("single", "Report")]
+
+    assert events[-1]["type"] == "workflow_complete"
+    assert events[-1]["data"]["final_output"] == '{"ok": true}'